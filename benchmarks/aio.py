@@ -0,0 +1,70 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Throughput of tgcrypto.aio against loop.run_in_executor, with many concurrent calls in flight.
+
+Usage: python -m benchmarks.aio
+"""
+
+import asyncio
+import os
+import time
+
+import tgcrypto
+import tgcrypto.aio
+
+SIZES = [1024, 64 * 1024, 1024 * 1024]
+TOTAL = 64 * 1024 * 1024
+CONCURRENCY = 32
+
+
+async def bench(call, size):
+    count = max(TOTAL // size, CONCURRENCY)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+
+    return count * size / (time.perf_counter() - start) / 1024 / 1024
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    key = os.urandom(32)
+    iv = os.urandom(32)
+
+    # Benchmark the pool itself, not the inline path
+    tgcrypto.aio.set_inline_threshold(0)
+
+    print(f"{'size':>10}{'executor MB/s':>16}{'aio MB/s':>12}{'speedup':>10}")
+
+    for size in SIZES:
+        data = os.urandom(size)
+
+        executor = await bench(lambda: loop.run_in_executor(None, tgcrypto.ige256_encrypt, data, key, iv), size)
+        native = await bench(lambda: tgcrypto.aio.ige256_encrypt(data, key, iv), size)
+
+        print(f"{size:>10}{executor:>16.1f}{native:>12.1f}{native / executor:>9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Per-call cost of the C-API extension against the CFFI binding, the one used on PyPy.
+
+On PyPy the C-API extension is only reachable through cpyext, so this is where the CFFI binding is expected to win for
+small messages. Each binding runs in its own child interpreter, selected with TGCRYPTO_BINDING. On CPython the CFFI
+module must be built first with python tgcrypto/_cffi_build.py.
+
+Usage: pypy3 -m benchmarks.bindings
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+SIZES = [16, 64, 256, 1024, 4096, 65536]
+# Enough calls for the PyPy JIT to warm up before the measured rounds
+WARMUP = 20_000
+
+
+def bench(size, func, *args):
+    number = max(1000, 1_000_000 // max(size, 256))
+    timeit.timeit(lambda: func(*args), number=WARMUP)
+
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=5)) / number * 1e9
+
+
+def run_child():
+    import tgcrypto
+
+    key, ige_iv, auth_key, auth_key_id = os.urandom(32), os.urandom(32), os.urandom(256), os.urandom(8)
+    cbc_iv, ctr_iv, state = bytearray(os.urandom(16)), bytearray(os.urandom(16)), bytearray(1)
+    ige = tgcrypto.IGE256(key)
+    rows = []
+
+    for size in SIZES:
+        data = os.urandom(size)
+        out = bytearray(size)
+
+        for name, func, args in (
+            ("ige256_encrypt", tgcrypto.ige256_encrypt, (data, key, ige_iv)),
+            ("ige256_encrypt_into", tgcrypto.ige256_encrypt_into, (data, key, ige_iv, out)),
+            ("IGE256.encrypt", ige.encrypt, (data, ige_iv)),
+            ("ctr256_encrypt", tgcrypto.ctr256_encrypt, (data, key, ctr_iv, state)),
+            ("cbc256_encrypt", tgcrypto.cbc256_encrypt, (data, key, cbc_iv)),
+            ("mtproto2_encrypt", tgcrypto.mtproto2_encrypt, (auth_key, auth_key_id, data, True)),
+        ):
+            rows.append({"function": name, "size": size, "ns": bench(size, func, *args)})
+
+    json.dump({"binding": tgcrypto._binding.__name__.rsplit(".", 1)[-1], "rows": rows}, sys.stdout)
+
+
+def run_binding(binding):
+    env = dict(os.environ, TGCRYPTO_BINDING=binding)
+    command = [sys.executable, "-m", "benchmarks.bindings", "--child"]
+
+    return json.loads(subprocess.run(command, env=env, stdout=subprocess.PIPE, check=True).stdout)
+
+
+def main():
+    if "--child" in sys.argv:
+        run_child()
+        return
+
+    capi = run_binding("capi")["rows"]
+
+    try:
+        cffi = run_binding("cffi")["rows"]
+    except subprocess.CalledProcessError:
+        sys.exit("The CFFI binding is not available, build it with: python tgcrypto/_cffi_build.py")
+
+    print(f"{platform.python_implementation()} {platform.python_version()}\n")
+    print(f"{'function':<22}{'size':>8}{'capi ns':>12}{'cffi ns':>12}{'speedup':>10}")
+
+    for a, b in zip(capi, cffi):
+        print(f"{a['function']:<22}{a['size']:>8}{a['ns']:>12.0f}{b['ns']:>12.0f}{a['ns'] / b['ns']:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
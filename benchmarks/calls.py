@@ -0,0 +1,63 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Per-call cost of the module functions for the small payloads MTProto service messages are made of.
+
+Usage: python -m benchmarks.calls
+"""
+
+import os
+import timeit
+
+import tgcrypto
+
+SIZES = [16, 32, 64, 128, 256]
+NUMBER = 100_000
+
+
+def bench(func, *args, **kwargs):
+    return min(timeit.repeat(lambda: func(*args, **kwargs), number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    key = os.urandom(32)
+    ige_iv = os.urandom(32)
+    cbc_iv = bytearray(os.urandom(16))
+    ctr_iv = bytearray(os.urandom(16))
+    state = bytearray(1)
+
+    print(f"{'function':<28}{'size':>8}{'ns/call':>10}")
+
+    for size in SIZES:
+        data = os.urandom(size)
+        out = bytearray(size)
+
+        rows = [
+            ("ige256_encrypt", bench(tgcrypto.ige256_encrypt, data, key, ige_iv)),
+            ("ige256_encrypt (keywords)", bench(tgcrypto.ige256_encrypt, data=data, key=key, iv=ige_iv)),
+            ("ige256_encrypt_into", bench(tgcrypto.ige256_encrypt_into, data, key, ige_iv, out)),
+            ("ctr256_encrypt", bench(tgcrypto.ctr256_encrypt, data, key, ctr_iv, state)),
+            ("cbc256_encrypt", bench(tgcrypto.cbc256_encrypt, data, key, cbc_iv)),
+        ]
+
+        for name, ns in rows:
+            print(f"{name:<28}{size:>8}{ns:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Verification of CDN file parts: ctr256_decrypt_verify against ctr256_decrypt_at followed by hashlib, the way
+Pyrogram checks the hashes of upload.getCdnFileHashes, single-threaded and with one thread per CPU.
+
+Usage: python -m benchmarks.cdn
+"""
+
+import hashlib
+import os
+import timeit
+
+import tgcrypto
+
+CHUNK = 128 * 1024
+SIZES = [128 * 1024, 512 * 1024, 1024 * 1024]
+
+
+def separate(data, key, iv, offset, hashes):
+    plain = tgcrypto.ctr256_decrypt_at(data, key, iv, offset)
+
+    for i, expected in enumerate(hashes):
+        if hashlib.sha256(plain[i * CHUNK:(i + 1) * CHUNK]).digest() != expected:
+            raise ValueError("Hash mismatch")
+
+    return plain
+
+
+def bench(func, data, key, iv, hashes):
+    number = max(10, 64 * 1024 * 1024 // len(data))
+
+    return len(data) * number / min(timeit.repeat(lambda: func(data, key, iv, 0, hashes), number=number, repeat=5)) / 1e6
+
+
+def main():
+    print(f"backend: {tgcrypto.backend()}")
+    print(f"{'size':>8}{'threads':>9}{'separate MB/s':>15}{'fused MB/s':>12}{'speedup':>10}")
+
+    try:
+        for size in SIZES:
+            key, iv, plain = os.urandom(32), os.urandom(16), os.urandom(size)
+            data = tgcrypto.ctr256_encrypt_at(plain, key, iv, 0)
+            hashes = [hashlib.sha256(plain[i:i + CHUNK]).digest() for i in range(0, size, CHUNK)]
+
+            for threads in (1, 0):
+                tgcrypto.set_threads(threads)
+                separate_mbs = bench(separate, data, key, iv, hashes)
+                fused_mbs = bench(tgcrypto.ctr256_decrypt_verify, data, key, iv, hashes)
+                label = threads or "cpus"
+
+                print(f"{size:>8}{label:>9}{separate_mbs:>15.0f}{fused_mbs:>12.0f}{fused_mbs / separate_mbs:>9.2f}x")
+    finally:
+        tgcrypto.set_threads(0)
+
+
+if __name__ == "__main__":
+    main()
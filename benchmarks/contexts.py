@@ -0,0 +1,62 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Per-call cost of the stateless IGE/CBC functions against the reusable key schedule contexts.
+
+Usage: python -m benchmarks.contexts
+"""
+
+import os
+import timeit
+
+import tgcrypto
+
+SIZES = [64, 128, 256, 512, 1024]
+NUMBER = 20_000
+
+
+def bench(func, *args):
+    return min(timeit.repeat(lambda: func(*args), number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    key = os.urandom(32)
+    ige = tgcrypto.IGE256(key)
+    cbc = tgcrypto.CBC256(key)
+
+    print(f"{'mode':<16}{'size':>8}{'function ns':>14}{'context ns':>14}{'saved':>10}")
+
+    for size in SIZES:
+        data = os.urandom(size)
+        ige_iv = os.urandom(32)
+        cbc_iv = os.urandom(16)
+
+        rows = [
+            ("ige256_encrypt", bench(tgcrypto.ige256_encrypt, data, key, ige_iv), bench(ige.encrypt, data, ige_iv)),
+            ("ige256_decrypt", bench(tgcrypto.ige256_decrypt, data, key, ige_iv), bench(ige.decrypt, data, ige_iv)),
+            ("cbc256_encrypt", bench(tgcrypto.cbc256_encrypt, data, key, bytearray(cbc_iv)), bench(cbc.encrypt, data, cbc_iv)),
+            ("cbc256_decrypt", bench(tgcrypto.cbc256_decrypt, data, key, bytearray(cbc_iv)), bench(cbc.decrypt, data, cbc_iv)),
+        ]
+
+        for name, function_ns, context_ns in rows:
+            saved = (1 - context_ns / function_ns) * 100
+            print(f"{name:<16}{size:>8}{function_ns:>14.0f}{context_ns:>14.0f}{saved:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
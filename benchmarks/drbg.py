@@ -0,0 +1,48 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""random_bytes() against os.urandom for padding and nonce sized requests.
+
+Usage: python -m benchmarks.drbg
+"""
+
+import os
+import timeit
+
+import tgcrypto
+
+SIZES = [12, 16, 32, 64, 1024, 65536]
+
+
+def bench(func, size):
+    number = max(1000, 2_000_000 // max(size, 64))
+    return min(timeit.repeat(lambda: func(size), number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    print(f"{'size':>8}{'os.urandom ns':>16}{'tgcrypto ns':>16}{'speedup':>10}")
+
+    for size in SIZES:
+        urandom_ns = bench(os.urandom, size)
+        tgcrypto_ns = bench(tgcrypto.random_bytes, size)
+
+        print(f"{size:>8}{urandom_ns:>16.0f}{tgcrypto_ns:>16.0f}{urandom_ns / tgcrypto_ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Native factorize() against the pure Python Pollard-Brent used by Pyrogram to create auth keys.
+
+Usage: python -m benchmarks.factorize
+"""
+
+import random
+import time
+from math import gcd
+
+import tgcrypto
+
+# 63-bit pq values as found in resPQ
+PQ = [
+    0x17ED48941A08F981, 0x61F867A523768EC3, 0x363E58846D9B733F, 0x4D006F8FAE767E4B,
+    0x6908E9FDC061A01F, 0x54796975EB663C6B, 0x60A6C6DCAD00DB15, 0x4B565FB09352F625
+]
+ROUNDS = 5
+
+
+# pyrogram/crypto/prime.py
+def decompose(pq: int) -> int:
+    if pq % 2 == 0:
+        return 2
+
+    y, c, m = random.randint(1, pq - 1), random.randint(1, pq - 1), random.randint(1, pq - 1)
+    g = r = q = 1
+    x = ys = 0
+
+    while g == 1:
+        x = y
+
+        for i in range(r):
+            y = (pow(y, 2, pq) + c) % pq
+
+        k = 0
+
+        while k < r and g == 1:
+            ys = y
+
+            for i in range(min(m, r - k)):
+                y = (pow(y, 2, pq) + c) % pq
+                q = q * (abs(x - y)) % pq
+
+            g = gcd(q, pq)
+            k += m
+
+        r *= 2
+
+    if g == pq:
+        while True:
+            ys = (pow(ys, 2, pq) + c) % pq
+            g = gcd(abs(x - ys), pq)
+
+            if g > 1:
+                break
+
+    return g
+
+
+def bench(func):
+    start = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        for pq in PQ:
+            func(pq)
+
+    return (time.perf_counter() - start) / (ROUNDS * len(PQ)) * 1e6
+
+
+def main():
+    random.seed(0)
+
+    python_us = bench(decompose)
+    native_us = bench(tgcrypto.factorize)
+
+    print(f"{'implementation':<16}{'us/pq':>12}")
+    print(f"{'python':<16}{python_us:>12.1f}")
+    print(f"{'tgcrypto':<16}{native_us:>12.1f}")
+    print(f"\n{python_us / native_us:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
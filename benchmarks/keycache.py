@@ -0,0 +1,58 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Stateless calls repeating the same key, with the key schedule cache enabled and disabled.
+
+Usage: python -m benchmarks.keycache
+"""
+
+import os
+import timeit
+
+import tgcrypto
+
+SIZES = [16, 64, 1024, 65536]
+
+
+def bench(func, size):
+    key, iv, data = os.urandom(32), os.urandom(32), os.urandom(size)
+    number = max(1000, 2_000_000 // max(size, 64))
+
+    return min(timeit.repeat(lambda: func(data, key, iv), number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    size = tgcrypto.get_key_cache_size()
+
+    print(f"{'function':>16}{'size':>8}{'uncached ns':>14}{'cached ns':>12}{'speedup':>10}")
+
+    try:
+        for func in (tgcrypto.ige256_encrypt, tgcrypto.ige256_decrypt):
+            for n in SIZES:
+                tgcrypto.set_key_cache_size(0)
+                uncached_ns = bench(func, n)
+                tgcrypto.set_key_cache_size(size or 16)
+                cached_ns = bench(func, n)
+
+                print(f"{func.__name__:>16}{n:>8}{uncached_ns:>14.0f}{cached_ns:>12.0f}{uncached_ns / cached_ns:>9.2f}x")
+    finally:
+        tgcrypto.set_key_cache_size(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Receiving abridged frames over the obfuscated transport: ObfuscatedCodec against the per-packet recv and
+ctr256_decrypt calls of a pure Python transport. Reads come from memory, so only the user space work is measured.
+
+Usage: python -m benchmarks.obfuscated
+"""
+
+import os
+import time
+
+import tgcrypto
+
+SIZES = [64, 1024, 16384, 524288]
+READ_SIZE = 65536
+STREAM_SIZE = 8 * 1024 * 1024
+
+
+class Stream:
+    # Hands out the bytes of data READ_SIZE at most at a time, like a socket
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def recv(self, size):
+        chunk = self.data[self.position:self.position + min(size, READ_SIZE)]
+        self.position += len(chunk)
+
+        return bytes(chunk)
+
+    def recv_into(self, view):
+        size = min(len(view), READ_SIZE, len(self.data) - self.position)
+        view[:size] = self.data[self.position:self.position + size]
+        self.position += size
+
+        return size
+
+
+def python_transport(stream, key, iv):
+    # Each read allocates, and so does each decryption
+    iv, state = bytearray(iv), bytearray(1)
+
+    def recv(size):
+        data = b""
+
+        while len(data) < size:
+            chunk = stream.recv(size - len(data))
+
+            if not chunk:
+                return None
+
+            data += chunk
+
+        return data
+
+    while True:
+        length = recv(1)
+
+        if length is None:
+            return
+
+        length = tgcrypto.ctr256_decrypt(length, key, iv, state)
+
+        if length == b"\x7f":
+            length = tgcrypto.ctr256_decrypt(recv(3), key, iv, state)
+
+        tgcrypto.ctr256_decrypt(recv(int.from_bytes(length, "little") * 4), key, iv, state)
+
+
+def codec_transport(stream, codec):
+    while codec.recv_into(stream) is not None:
+        pass
+
+
+def stream_for(codec, size):
+    # Frames of the given size sent by the server to this codec, and the key and IV they are encrypted with
+    header = codec.header[8:56][::-1]
+    key, iv = header[:32], header[32:48]
+
+    prefix = bytes([size // 4]) if size // 4 < 0x7f else b"\x7f" + (size // 4).to_bytes(3, "little")
+    frames = (prefix + os.urandom(size)) * max(1, STREAM_SIZE // size)
+
+    return tgcrypto.ctr256_encrypt(frames, key, bytearray(iv), bytearray(1)), key, iv
+
+
+def elapsed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'frame size':>10}{'python MB/s':>14}{'codec MB/s':>13}{'speedup':>10}")
+
+    for size in SIZES:
+        python_s = codec_s = float("inf")
+
+        for _ in range(5):
+            codec = tgcrypto.ObfuscatedCodec()
+            data, key, iv = stream_for(codec, size)
+
+            python_s = min(python_s, elapsed(python_transport, Stream(data), key, iv))
+            codec_s = min(codec_s, elapsed(codec_transport, Stream(data), codec))
+
+        python_mbs = len(data) / python_s / 1e6
+        codec_mbs = len(data) / codec_s / 1e6
+
+        print(f"{size:>10}{python_mbs:>14.0f}{codec_mbs:>13.0f}{codec_mbs / python_mbs:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
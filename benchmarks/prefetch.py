@@ -0,0 +1,70 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Per-frame latency of CTR streams with and without keystream prefetching, refilled between frames as done while the
+connection is idle. The refills are not timed.
+
+Usage: python -m benchmarks.prefetch
+"""
+
+import os
+import time
+
+import tgcrypto
+
+SIZES = [64, 256, 1024, 4096]
+FRAMES = 20000
+
+
+def percentiles(send, refill, size):
+    data = os.urandom(size)
+    clock = time.perf_counter_ns
+    samples = []
+
+    for _ in range(FRAMES):
+        refill()
+        start = clock()
+        send(data)
+        samples.append(clock() - start)
+
+    samples.sort()
+
+    return samples[len(samples) // 2], samples[len(samples) * 99 // 100]
+
+
+def main():
+    print(f"backend: {tgcrypto.backend()}")
+    print(f"{'stream':>24}{'size':>6}{'p50 ns':>9}{'p99 ns':>9}{'prefetch p50':>14}{'prefetch p99':>14}")
+
+    for size in SIZES:
+        key, iv = os.urandom(32), os.urandom(16)
+        ctr, prefetched_ctr = tgcrypto.AES256CTR(key, iv), tgcrypto.AES256CTR(key, iv, prefetch=size)
+        # Room for the frame and its length prefix
+        codec, prefetched_codec = tgcrypto.ObfuscatedCodec(), tgcrypto.ObfuscatedCodec(prefetch=size + 4)
+
+        for name, send, prefetched_send, refill in (
+            ("AES256CTR.update", ctr.update, prefetched_ctr.update, prefetched_ctr.refill),
+            ("ObfuscatedCodec.encode", codec.encode, prefetched_codec.encode, prefetched_codec.refill)
+        ):
+            p50, p99 = percentiles(send, lambda: None, size)
+            prefetch_p50, prefetch_p99 = percentiles(prefetched_send, refill, size)
+
+            print(f"{name:>24}{size:>6}{p50:>9}{p99:>9}{prefetch_p50:>14}{prefetch_p99:>14}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Throughput of every mode, from 16 B to 64 MiB, on every available backend and thread count.
+
+Each backend runs in its own interpreter, as the choice is made at import time. OpenSSL, through the cryptography
+package, is measured alongside when installed. Results can be saved as JSON and two saved runs compared, which exits
+with status 1 when a measurement got slower than the threshold.
+
+Usage:
+    python -m benchmarks.suite [--quick] [--json results.json]
+    python -m benchmarks.suite --compare old.json new.json [--threshold 5]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import timeit
+
+SIZES = [16, 256, 4 * 1024, 64 * 1024, 1024 ** 2, 16 * 1024 ** 2, 64 * 1024 ** 2]
+QUICK_SIZES = [16, 256, 4 * 1024, 64 * 1024, 1024 ** 2]
+
+FUNCTIONS = [
+    "ige256_encrypt", "ige256_decrypt",
+    "ctr256_encrypt", "ctr256_decrypt",
+    "cbc256_encrypt", "cbc256_decrypt"
+]
+
+# Functions split across threads by the extension itself, measured at the largest size for each set_threads() value
+THREADED_FUNCTIONS = ["ctr256_encrypt", "cbc256_decrypt"]
+
+# Message size for the scaling of concurrent calls made from Python threads, each releasing the GIL
+CONCURRENT_SIZE = 64 * 1024
+
+MIN_TIME = 0.2
+REPEAT = 3
+
+
+def thread_counts():
+    cpus = os.cpu_count() or 1
+
+    return sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+
+def measure(func, *args):
+    """Best time of a single call, in seconds."""
+    timer = timeit.Timer("f(*a)", globals={"f": func, "a": args})
+    number = 1
+
+    while timer.timeit(number) < MIN_TIME / 10:
+        number *= 10
+
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def arguments(name, size):
+    data = os.urandom(size)
+    key = os.urandom(32)
+
+    if name.startswith("ige"):
+        return data, key, os.urandom(32)
+
+    if name.startswith("ctr"):
+        return data, key, bytearray(os.urandom(16)), bytes(1)
+
+    return data, key, bytearray(os.urandom(16))
+
+
+def result(backend, name, size, threads, seconds):
+    return {
+        "backend": backend,
+        "function": name,
+        "size": size,
+        "threads": threads,
+        "ns_per_call": seconds * 1e9,
+        "mb_per_s": size / seconds / 1024 ** 2
+    }
+
+
+def concurrent(func, args, size, threads):
+    """Seconds per call of each thread when threads call func at the same time."""
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def worker(index):
+        barrier.wait()
+
+        while not stop.is_set():
+            func(*args)
+            counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+
+    for w in workers:
+        w.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(MIN_TIME * REPEAT)
+    stop.set()
+
+    for w in workers:
+        w.join()
+
+    return (time.perf_counter() - start) / (sum(counts) or 1) * threads
+
+
+def run_tgcrypto(sizes):
+    import tgcrypto
+
+    backend = tgcrypto.backend()
+    results = []
+
+    tgcrypto.set_threads(1)
+
+    for name in FUNCTIONS:
+        for size in sizes:
+            results.append(result(backend, name, size, 1, measure(getattr(tgcrypto, name), *arguments(name, size))))
+
+    for name in THREADED_FUNCTIONS:
+        for threads in thread_counts()[1:]:
+            tgcrypto.set_threads(threads)
+            seconds = measure(getattr(tgcrypto, name), *arguments(name, sizes[-1]))
+            results.append(result(backend, name, sizes[-1], threads, seconds))
+
+    tgcrypto.set_threads(1)
+
+    for threads in thread_counts():
+        args = arguments("ige256_encrypt", CONCURRENT_SIZE)
+        seconds = concurrent(tgcrypto.ige256_encrypt, args, CONCURRENT_SIZE, threads)
+        results.append(result(backend, "ige256_encrypt (concurrent)", CONCURRENT_SIZE, threads, seconds))
+
+    tgcrypto.set_threads(0)
+
+    return results
+
+
+def run_openssl(sizes):
+    try:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    except ImportError:
+        return []
+
+    def crypt(mode, encrypt):
+        def call(data, key, iv, *_):
+            cipher = Cipher(algorithms.AES(key), mode(bytes(iv)))
+            context = cipher.encryptor() if encrypt else cipher.decryptor()
+
+            return context.update(data) + context.finalize()
+
+        return call
+
+    # OpenSSL has no IGE mode
+    functions = {
+        "ctr256_encrypt": crypt(modes.CTR, True),
+        "ctr256_decrypt": crypt(modes.CTR, False),
+        "cbc256_encrypt": crypt(modes.CBC, True),
+        "cbc256_decrypt": crypt(modes.CBC, False)
+    }
+
+    return [
+        result("openssl", name, size, 1, measure(func, *arguments(name, size)))
+        for name, func in functions.items()
+        for size in sizes
+    ]
+
+
+def run_backend(backend, quick):
+    """Runs this script in a child interpreter for the given backend, None being the default one."""
+    env = dict(os.environ)
+    env.pop("TGCRYPTO_BACKEND", None)
+
+    if backend is not None:
+        env["TGCRYPTO_BACKEND"] = backend
+
+    command = [sys.executable, "-m", "benchmarks.suite", "--child"] + (["--quick"] if quick else [])
+
+    return json.loads(subprocess.run(command, env=env, stdout=subprocess.PIPE, check=True).stdout)
+
+
+def run(quick):
+    results = run_backend(None, quick)
+    seen = {results[0]["backend"]}
+
+    # Forcing a backend the CPU lacks falls back to another one, which is then measured only once
+    for backend in ("ssse3", "portable"):
+        if backend not in seen:
+            extra = run_backend(backend, quick)
+
+            if extra[0]["backend"] not in seen:
+                seen.add(extra[0]["backend"])
+                results += extra
+
+    results += run_openssl(QUICK_SIZES if quick else SIZES)
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results
+    }
+
+
+def key(row):
+    return row["backend"], row["function"], row["size"], row["threads"]
+
+
+def format_size(size):
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024 or unit == "MiB":
+            return f"{size:g} {unit}"
+
+        size /= 1024
+
+
+def report(results):
+    print(f"{'backend':<10}{'function':<30}{'size':>10}{'threads':>9}{'ns/call':>14}{'MB/s':>10}")
+
+    for row in results:
+        print(
+            f"{row['backend']:<10}{row['function']:<30}{format_size(row['size']):>10}{row['threads']:>9}"
+            f"{row['ns_per_call']:>14.0f}{row['mb_per_s']:>10.1f}"
+        )
+
+
+def compare(old, new, threshold):
+    """Prints the throughput change of each measurement found in both runs, returns the number of regressions."""
+    before = {key(row): row for row in old["results"]}
+    regressions = 0
+
+    print(f"{'backend':<10}{'function':<30}{'size':>10}{'threads':>9}{'old MB/s':>11}{'new MB/s':>11}{'change':>9}")
+
+    for row in new["results"]:
+        if key(row) not in before:
+            continue
+
+        old_mbps, new_mbps = before[key(row)]["mb_per_s"], row["mb_per_s"]
+        change = (new_mbps / old_mbps - 1) * 100
+        regressed = change < -threshold
+        regressions += regressed
+
+        print(
+            f"{row['backend']:<10}{row['function']:<30}{format_size(row['size']):>10}{row['threads']:>9}"
+            f"{old_mbps:>11.1f}{new_mbps:>11.1f}{change:>8.1f}%{' !' if regressed else ''}"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="stop at 1 MiB")
+    parser.add_argument("--json", metavar="PATH", help="save the results as JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two saved runs")
+    parser.add_argument("--threshold", type=float, default=5, help="slowdown, in percent, counted as a regression")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        json.dump(run_tgcrypto(QUICK_SIZES if args.quick else SIZES), sys.stdout)
+        return
+
+    if args.compare:
+        with open(args.compare[0]) as old, open(args.compare[1]) as new:
+            regressions = compare(json.load(old), json.load(new), args.threshold)
+
+        print(f"\n{regressions} regression(s) above {args.threshold:g}%")
+        sys.exit(1 if regressions else 0)
+
+    results = run(args.quick)
+    report(results["results"])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
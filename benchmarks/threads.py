@@ -0,0 +1,116 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Throughput of concurrent small-message encryption by thread count.
+
+On a free-threaded build (python3.13t) the module does not enable the GIL, so throughput should grow with the thread
+count up to the number of cores. On a regular build the per-call work is too short to benefit from releasing the GIL
+and throughput stays flat.
+
+Both the IGE256 objects and the stateless ige256_encrypt are measured, the latter with the key cache on (its default)
+and off. Each thread uses its own key, the cache being split into independently locked shards it should scale like
+the objects do.
+
+Usage: python -m benchmarks.threads
+"""
+
+import os
+import sys
+import threading
+import time
+
+import tgcrypto
+
+SIZE = 1024
+DURATION = 1.0
+
+
+def worker(barrier, stop, counts, index, stateless):
+    key = os.urandom(32)
+    iv = os.urandom(32)
+    data = os.urandom(SIZE)
+    ige = tgcrypto.IGE256(key)
+    encrypt = (lambda: tgcrypto.ige256_encrypt(data, key, iv)) if stateless else (lambda: ige.encrypt(data, iv))
+    count = 0
+
+    barrier.wait()
+
+    while not stop.is_set():
+        for _ in range(100):
+            encrypt()
+
+        count += 100
+
+    counts[index] = count
+
+
+def run(threads, stateless=False):
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+    workers = [
+        threading.Thread(target=worker, args=(barrier, stop, counts, i, stateless))
+        for i in range(threads)
+    ]
+
+    for w in workers:
+        w.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(DURATION)
+    stop.set()
+
+    for w in workers:
+        w.join()
+
+    return sum(counts) * SIZE / (time.perf_counter() - start) / 1024 ** 2
+
+
+def table(title, counts, **kwargs):
+    print(f"\n{title}")
+    print(f"{'threads':>8}{'MB/s':>10}{'scaling':>10}")
+
+    baseline = None
+
+    for threads in counts:
+        mbps = run(threads, **kwargs)
+        baseline = baseline or mbps
+        print(f"{threads:>8}{mbps:>10.1f}{mbps / baseline:>9.2f}x")
+
+
+def main():
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus * 2 + 1)))
+    size = tgcrypto.get_key_cache_size()
+
+    print(f"GIL enabled: {gil}, CPUs: {cpus}, {SIZE} bytes messages")
+
+    table("IGE256(key).encrypt", counts)
+    table(f"ige256_encrypt, key cache of {size}", counts, stateless=True)
+
+    tgcrypto.set_key_cache_size(0)
+
+    try:
+        table("ige256_encrypt, key cache off", counts, stateless=True)
+    finally:
+        tgcrypto.set_key_cache_size(size)
+
+if __name__ == "__main__":
+    main()
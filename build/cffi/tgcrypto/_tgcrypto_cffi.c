@@ -0,0 +1,4048 @@
+#define _CFFI_
+
+/* We try to define Py_LIMITED_API before including Python.h.
+
+   Mess: we can only define it if Py_DEBUG, Py_TRACE_REFS and
+   Py_REF_DEBUG are not defined.  This is a best-effort approximation:
+   we can learn about Py_DEBUG from pyconfig.h, but it is unclear if
+   the same works for the other two macros.  Py_DEBUG implies them,
+   but not the other way around.
+
+   The implementation is messy (issue #350): on Windows, with _MSC_VER,
+   we have to define Py_LIMITED_API even before including pyconfig.h.
+   In that case, we guess what pyconfig.h will do to the macros above,
+   and check our guess after the #include.
+
+   Note that on Windows, with CPython 3.x, you need >= 3.5 and virtualenv
+   version >= 16.0.0.  With older versions of either, you don't get a
+   copy of PYTHON3.DLL in the virtualenv.  We can't check the version of
+   CPython *before* we even include pyconfig.h.  ffi.set_source() puts
+   a ``#define _CFFI_NO_LIMITED_API'' at the start of this file if it is
+   running on Windows < 3.5, as an attempt at fixing it, but that's
+   arguably wrong because it may not be the target version of Python.
+   Still better than nothing I guess.  As another workaround, you can
+   remove the definition of Py_LIMITED_API here.
+
+   See also 'py_limited_api' in cffi/setuptools_ext.py.
+*/
+#if !defined(_CFFI_USE_EMBEDDING) && !defined(Py_LIMITED_API)
+#  ifdef _MSC_VER
+#    if !defined(_DEBUG) && !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+
+#    include <pyconfig.h>
+     /* sanity-check: Py_LIMITED_API will cause crashes if any of these
+        are also defined.  Normally, the Python file PC/pyconfig.h does not
+        cause any of these to be defined, with the exception that _DEBUG
+        causes Py_DEBUG.  Double-check that. */
+#    ifdef Py_LIMITED_API
+#      if defined(Py_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_TRACE_REFS)
+#        error "pyconfig.h unexpectedly defines Py_TRACE_REFS, but Py_LIMITED_API is set"
+#      endif
+#      if defined(Py_REF_DEBUG)
+#        error "pyconfig.h unexpectedly defines Py_REF_DEBUG, but Py_LIMITED_API is set"
+#      endif
+#    endif
+#  else
+#    include <pyconfig.h>
+#    if !defined(Py_DEBUG) && !defined(Py_TRACE_REFS) && !defined(Py_REF_DEBUG) && !defined(_CFFI_NO_LIMITED_API)
+#      if !defined(Py_GIL_DISABLED)
+#        define Py_LIMITED_API
+#      else
+#        define Py_LIMITED_API 0x030f0000
+#      endif
+#    endif
+#  endif
+#endif
+
+#include <Python.h>
+#ifdef __cplusplus
+extern "C" {
+#endif
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+/* This part is from file 'cffi/parse_c_type.h'.  It is copied at the
+   beginning of C sources generated by CFFI's ffi.set_source(). */
+
+typedef void *_cffi_opcode_t;
+
+#define _CFFI_OP(opcode, arg)   (_cffi_opcode_t)(opcode | (((uintptr_t)(arg)) << 8))
+#define _CFFI_GETOP(cffi_opcode)    ((unsigned char)(uintptr_t)cffi_opcode)
+#define _CFFI_GETARG(cffi_opcode)   (((intptr_t)cffi_opcode) >> 8)
+
+#define _CFFI_OP_PRIMITIVE       1
+#define _CFFI_OP_POINTER         3
+#define _CFFI_OP_ARRAY           5
+#define _CFFI_OP_OPEN_ARRAY      7
+#define _CFFI_OP_STRUCT_UNION    9
+#define _CFFI_OP_ENUM           11
+#define _CFFI_OP_FUNCTION       13
+#define _CFFI_OP_FUNCTION_END   15
+#define _CFFI_OP_NOOP           17
+#define _CFFI_OP_BITFIELD       19
+#define _CFFI_OP_TYPENAME       21
+#define _CFFI_OP_CPYTHON_BLTN_V 23   // varargs
+#define _CFFI_OP_CPYTHON_BLTN_N 25   // noargs
+#define _CFFI_OP_CPYTHON_BLTN_O 27   // O  (i.e. a single arg)
+#define _CFFI_OP_CONSTANT       29
+#define _CFFI_OP_CONSTANT_INT   31
+#define _CFFI_OP_GLOBAL_VAR     33
+#define _CFFI_OP_DLOPEN_FUNC    35
+#define _CFFI_OP_DLOPEN_CONST   37
+#define _CFFI_OP_GLOBAL_VAR_F   39
+#define _CFFI_OP_EXTERN_PYTHON  41
+
+#define _CFFI_PRIM_VOID          0
+#define _CFFI_PRIM_BOOL          1
+#define _CFFI_PRIM_CHAR          2
+#define _CFFI_PRIM_SCHAR         3
+#define _CFFI_PRIM_UCHAR         4
+#define _CFFI_PRIM_SHORT         5
+#define _CFFI_PRIM_USHORT        6
+#define _CFFI_PRIM_INT           7
+#define _CFFI_PRIM_UINT          8
+#define _CFFI_PRIM_LONG          9
+#define _CFFI_PRIM_ULONG        10
+#define _CFFI_PRIM_LONGLONG     11
+#define _CFFI_PRIM_ULONGLONG    12
+#define _CFFI_PRIM_FLOAT        13
+#define _CFFI_PRIM_DOUBLE       14
+#define _CFFI_PRIM_LONGDOUBLE   15
+
+#define _CFFI_PRIM_WCHAR        16
+#define _CFFI_PRIM_INT8         17
+#define _CFFI_PRIM_UINT8        18
+#define _CFFI_PRIM_INT16        19
+#define _CFFI_PRIM_UINT16       20
+#define _CFFI_PRIM_INT32        21
+#define _CFFI_PRIM_UINT32       22
+#define _CFFI_PRIM_INT64        23
+#define _CFFI_PRIM_UINT64       24
+#define _CFFI_PRIM_INTPTR       25
+#define _CFFI_PRIM_UINTPTR      26
+#define _CFFI_PRIM_PTRDIFF      27
+#define _CFFI_PRIM_SIZE         28
+#define _CFFI_PRIM_SSIZE        29
+#define _CFFI_PRIM_INT_LEAST8   30
+#define _CFFI_PRIM_UINT_LEAST8  31
+#define _CFFI_PRIM_INT_LEAST16  32
+#define _CFFI_PRIM_UINT_LEAST16 33
+#define _CFFI_PRIM_INT_LEAST32  34
+#define _CFFI_PRIM_UINT_LEAST32 35
+#define _CFFI_PRIM_INT_LEAST64  36
+#define _CFFI_PRIM_UINT_LEAST64 37
+#define _CFFI_PRIM_INT_FAST8    38
+#define _CFFI_PRIM_UINT_FAST8   39
+#define _CFFI_PRIM_INT_FAST16   40
+#define _CFFI_PRIM_UINT_FAST16  41
+#define _CFFI_PRIM_INT_FAST32   42
+#define _CFFI_PRIM_UINT_FAST32  43
+#define _CFFI_PRIM_INT_FAST64   44
+#define _CFFI_PRIM_UINT_FAST64  45
+#define _CFFI_PRIM_INTMAX       46
+#define _CFFI_PRIM_UINTMAX      47
+#define _CFFI_PRIM_FLOATCOMPLEX 48
+#define _CFFI_PRIM_DOUBLECOMPLEX 49
+#define _CFFI_PRIM_CHAR16       50
+#define _CFFI_PRIM_CHAR32       51
+
+#define _CFFI__NUM_PRIM         52
+#define _CFFI__UNKNOWN_PRIM           (-1)
+#define _CFFI__UNKNOWN_FLOAT_PRIM     (-2)
+#define _CFFI__UNKNOWN_LONG_DOUBLE    (-3)
+
+#define _CFFI__IO_FILE_STRUCT         (-1)
+
+
+struct _cffi_global_s {
+    const char *name;
+    void *address;
+    _cffi_opcode_t type_op;
+    void *size_or_direct_fn;  // OP_GLOBAL_VAR: size, or 0 if unknown
+                              // OP_CPYTHON_BLTN_*: addr of direct function
+};
+
+struct _cffi_getconst_s {
+    unsigned long long value;
+    const struct _cffi_type_context_s *ctx;
+    int gindex;
+};
+
+struct _cffi_struct_union_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_STRUCT_UNION
+    int flags;               // _CFFI_F_* flags below
+    size_t size;
+    int alignment;
+    int first_field_index;   // -> _cffi_fields array
+    int num_fields;
+};
+#define _CFFI_F_UNION         0x01   // is a union, not a struct
+#define _CFFI_F_CHECK_FIELDS  0x02   // complain if fields are not in the
+                                     // "standard layout" or if some are missing
+#define _CFFI_F_PACKED        0x04   // for CHECK_FIELDS, assume a packed struct
+#define _CFFI_F_EXTERNAL      0x08   // in some other ffi.include()
+#define _CFFI_F_OPAQUE        0x10   // opaque
+
+struct _cffi_field_s {
+    const char *name;
+    size_t field_offset;
+    size_t field_size;
+    _cffi_opcode_t field_type_op;
+};
+
+struct _cffi_enum_s {
+    const char *name;
+    int type_index;          // -> _cffi_types, on a OP_ENUM
+    int type_prim;           // _CFFI_PRIM_xxx
+    const char *enumerators; // comma-delimited string
+};
+
+struct _cffi_typename_s {
+    const char *name;
+    int type_index;   /* if opaque, points to a possibly artificial
+                         OP_STRUCT which is itself opaque */
+};
+
+struct _cffi_type_context_s {
+    _cffi_opcode_t *types;
+    const struct _cffi_global_s *globals;
+    const struct _cffi_field_s *fields;
+    const struct _cffi_struct_union_s *struct_unions;
+    const struct _cffi_enum_s *enums;
+    const struct _cffi_typename_s *typenames;
+    int num_globals;
+    int num_struct_unions;
+    int num_enums;
+    int num_typenames;
+    const char *const *includes;
+    int num_types;
+    int flags;      /* future extension */
+};
+
+struct _cffi_parse_info_s {
+    const struct _cffi_type_context_s *ctx;
+    _cffi_opcode_t *output;
+    unsigned int output_size;
+    size_t error_location;
+    const char *error_message;
+};
+
+struct _cffi_externpy_s {
+    const char *name;
+    size_t size_of_result;
+    void *reserved1, *reserved2;
+};
+
+#ifdef _CFFI_INTERNAL
+static int parse_c_type(struct _cffi_parse_info_s *info, const char *input);
+static int search_in_globals(const struct _cffi_type_context_s *ctx,
+                             const char *search, size_t search_len);
+static int search_in_struct_unions(const struct _cffi_type_context_s *ctx,
+                                   const char *search, size_t search_len);
+#endif
+
+/* this block of #ifs should be kept exactly identical between
+   c/_cffi_backend.c, cffi/vengine_cpy.py, cffi/vengine_gen.py
+   and cffi/_cffi_include.h */
+#if defined(_MSC_VER)
+# include <malloc.h>   /* for alloca() */
+# if _MSC_VER < 1600   /* MSVC < 2010 */
+   typedef __int8 int8_t;
+   typedef __int16 int16_t;
+   typedef __int32 int32_t;
+   typedef __int64 int64_t;
+   typedef unsigned __int8 uint8_t;
+   typedef unsigned __int16 uint16_t;
+   typedef unsigned __int32 uint32_t;
+   typedef unsigned __int64 uint64_t;
+   typedef __int8 int_least8_t;
+   typedef __int16 int_least16_t;
+   typedef __int32 int_least32_t;
+   typedef __int64 int_least64_t;
+   typedef unsigned __int8 uint_least8_t;
+   typedef unsigned __int16 uint_least16_t;
+   typedef unsigned __int32 uint_least32_t;
+   typedef unsigned __int64 uint_least64_t;
+   typedef __int8 int_fast8_t;
+   typedef __int16 int_fast16_t;
+   typedef __int32 int_fast32_t;
+   typedef __int64 int_fast64_t;
+   typedef unsigned __int8 uint_fast8_t;
+   typedef unsigned __int16 uint_fast16_t;
+   typedef unsigned __int32 uint_fast32_t;
+   typedef unsigned __int64 uint_fast64_t;
+   typedef __int64 intmax_t;
+   typedef unsigned __int64 uintmax_t;
+# else
+#  include <stdint.h>
+# endif
+# if _MSC_VER < 1800   /* MSVC < 2013 */
+#  ifndef __cplusplus
+    typedef unsigned char _Bool;
+#  endif
+# endif
+# define _cffi_float_complex_t   _Fcomplex    /* include <complex.h> for it */
+# define _cffi_double_complex_t  _Dcomplex    /* include <complex.h> for it */
+#else
+# include <stdint.h>
+# if (defined (__SVR4) && defined (__sun)) || defined(_AIX) || defined(__hpux)
+#  include <alloca.h>
+# endif
+# define _cffi_float_complex_t   float _Complex
+# define _cffi_double_complex_t  double _Complex
+#endif
+
+#ifdef __GNUC__
+# define _CFFI_UNUSED_FN  __attribute__((unused))
+#else
+# define _CFFI_UNUSED_FN  /* nothing */
+#endif
+
+#ifdef __cplusplus
+# ifndef _Bool
+   typedef bool _Bool;   /* semi-hackish: C++ has no _Bool; bool is builtin */
+# endif
+#endif
+
+/**********  CPython-specific section  **********/
+#ifndef PYPY_VERSION
+
+
+#define _cffi_from_c_double PyFloat_FromDouble
+#define _cffi_from_c_float PyFloat_FromDouble
+#define _cffi_from_c_long PyLong_FromLong
+#define _cffi_from_c_ulong PyLong_FromUnsignedLong
+#define _cffi_from_c_longlong PyLong_FromLongLong
+#define _cffi_from_c_ulonglong PyLong_FromUnsignedLongLong
+#define _cffi_from_c__Bool PyBool_FromLong
+
+#define _cffi_to_c_double PyFloat_AsDouble
+#define _cffi_to_c_float PyFloat_AsDouble
+
+#define _cffi_from_c_int(x, type)                                        \
+    (((type)-1) > 0 ? /* unsigned */                                     \
+        (sizeof(type) < sizeof(long) ?                                   \
+            PyLong_FromLong((long)x) :                                   \
+         sizeof(type) == sizeof(long) ?                                  \
+            PyLong_FromUnsignedLong((unsigned long)x) :                  \
+            PyLong_FromUnsignedLongLong((unsigned long long)x)) :        \
+        (sizeof(type) <= sizeof(long) ?                                  \
+            PyLong_FromLong((long)x) :                                   \
+            PyLong_FromLongLong((long long)x)))
+
+#define _cffi_to_c_int(o, type)                                          \
+    ((type)(                                                             \
+     sizeof(type) == 1 ? (((type)-1) > 0 ? (type)_cffi_to_c_u8(o)        \
+                                         : (type)_cffi_to_c_i8(o)) :     \
+     sizeof(type) == 2 ? (((type)-1) > 0 ? (type)_cffi_to_c_u16(o)       \
+                                         : (type)_cffi_to_c_i16(o)) :    \
+     sizeof(type) == 4 ? (((type)-1) > 0 ? (type)_cffi_to_c_u32(o)       \
+                                         : (type)_cffi_to_c_i32(o)) :    \
+     sizeof(type) == 8 ? (((type)-1) > 0 ? (type)_cffi_to_c_u64(o)       \
+                                         : (type)_cffi_to_c_i64(o)) :    \
+     (Py_FatalError("unsupported size for type " #type), (type)0)))
+
+#define _cffi_to_c_i8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[1])
+#define _cffi_to_c_u8                                                    \
+                 ((int(*)(PyObject *))_cffi_exports[2])
+#define _cffi_to_c_i16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[3])
+#define _cffi_to_c_u16                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[4])
+#define _cffi_to_c_i32                                                   \
+                 ((int(*)(PyObject *))_cffi_exports[5])
+#define _cffi_to_c_u32                                                   \
+                 ((unsigned int(*)(PyObject *))_cffi_exports[6])
+#define _cffi_to_c_i64                                                   \
+                 ((long long(*)(PyObject *))_cffi_exports[7])
+#define _cffi_to_c_u64                                                   \
+                 ((unsigned long long(*)(PyObject *))_cffi_exports[8])
+#define _cffi_to_c_char                                                  \
+                 ((int(*)(PyObject *))_cffi_exports[9])
+#define _cffi_from_c_pointer                                             \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[10])
+#define _cffi_to_c_pointer                                               \
+    ((char *(*)(PyObject *, struct _cffi_ctypedescr *))_cffi_exports[11])
+#define _cffi_get_struct_layout                                          \
+    not used any more
+#define _cffi_restore_errno                                              \
+    ((void(*)(void))_cffi_exports[13])
+#define _cffi_save_errno                                                 \
+    ((void(*)(void))_cffi_exports[14])
+#define _cffi_from_c_char                                                \
+    ((PyObject *(*)(char))_cffi_exports[15])
+#define _cffi_from_c_deref                                               \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[16])
+#define _cffi_to_c                                                       \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[17])
+#define _cffi_from_c_struct                                              \
+    ((PyObject *(*)(char *, struct _cffi_ctypedescr *))_cffi_exports[18])
+#define _cffi_to_c_wchar_t                                               \
+    ((_cffi_wchar_t(*)(PyObject *))_cffi_exports[19])
+#define _cffi_from_c_wchar_t                                             \
+    ((PyObject *(*)(_cffi_wchar_t))_cffi_exports[20])
+#define _cffi_to_c_long_double                                           \
+    ((long double(*)(PyObject *))_cffi_exports[21])
+#define _cffi_to_c__Bool                                                 \
+    ((_Bool(*)(PyObject *))_cffi_exports[22])
+#define _cffi_prepare_pointer_call_argument                              \
+    ((Py_ssize_t(*)(struct _cffi_ctypedescr *,                           \
+                    PyObject *, char **))_cffi_exports[23])
+#define _cffi_convert_array_from_object                                  \
+    ((int(*)(char *, struct _cffi_ctypedescr *, PyObject *))_cffi_exports[24])
+#define _CFFI_CPIDX  25
+#define _cffi_call_python                                                \
+    ((void(*)(struct _cffi_externpy_s *, char *))_cffi_exports[_CFFI_CPIDX])
+#define _cffi_to_c_wchar3216_t                                           \
+    ((int(*)(PyObject *))_cffi_exports[26])
+#define _cffi_from_c_wchar3216_t                                         \
+    ((PyObject *(*)(int))_cffi_exports[27])
+#define _CFFI_NUM_EXPORTS 28
+
+struct _cffi_ctypedescr;
+
+static void *_cffi_exports[_CFFI_NUM_EXPORTS];
+
+#define _cffi_type(index)   (                           \
+    assert((((uintptr_t)_cffi_types[index]) & 1) == 0), \
+    (struct _cffi_ctypedescr *)_cffi_types[index])
+
+static PyObject *_cffi_init(const char *module_name, Py_ssize_t version,
+                            const struct _cffi_type_context_s *ctx)
+{
+    PyObject *module, *o_arg, *new_module;
+    void *raw[] = {
+        (void *)module_name,
+        (void *)version,
+        (void *)_cffi_exports,
+        (void *)ctx,
+    };
+
+    module = PyImport_ImportModule("_cffi_backend");
+    if (module == NULL)
+        goto failure;
+
+    o_arg = PyLong_FromVoidPtr((void *)raw);
+    if (o_arg == NULL)
+        goto failure;
+
+    new_module = PyObject_CallMethod(
+        module, (char *)"_init_cffi_1_0_external_module", (char *)"O", o_arg);
+
+    Py_DECREF(o_arg);
+    Py_DECREF(module);
+    return new_module;
+
+  failure:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+#ifdef HAVE_WCHAR_H
+typedef wchar_t _cffi_wchar_t;
+#else
+typedef uint16_t _cffi_wchar_t;   /* same random pick as _cffi_backend.c */
+#endif
+
+_CFFI_UNUSED_FN static uint16_t _cffi_to_c_char16_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return (uint16_t)_cffi_to_c_wchar_t(o);
+    else
+        return (uint16_t)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char16_t(uint16_t x)
+{
+    if (sizeof(_cffi_wchar_t) == 2)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+_CFFI_UNUSED_FN static int _cffi_to_c_char32_t(PyObject *o)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return (int)_cffi_to_c_wchar_t(o);
+    else
+        return (int)_cffi_to_c_wchar3216_t(o);
+}
+
+_CFFI_UNUSED_FN static PyObject *_cffi_from_c_char32_t(unsigned int x)
+{
+    if (sizeof(_cffi_wchar_t) == 4)
+        return _cffi_from_c_wchar_t((_cffi_wchar_t)x);
+    else
+        return _cffi_from_c_wchar3216_t((int)x);
+}
+
+union _cffi_union_alignment_u {
+    unsigned char m_char;
+    unsigned short m_short;
+    unsigned int m_int;
+    unsigned long m_long;
+    unsigned long long m_longlong;
+    float m_float;
+    double m_double;
+    long double m_longdouble;
+};
+
+struct _cffi_freeme_s {
+    struct _cffi_freeme_s *next;
+    union _cffi_union_alignment_u alignment;
+};
+
+_CFFI_UNUSED_FN static int
+_cffi_convert_array_argument(struct _cffi_ctypedescr *ctptr, PyObject *arg,
+                             char **output_data, Py_ssize_t datasize,
+                             struct _cffi_freeme_s **freeme)
+{
+    char *p;
+    if (datasize < 0)
+        return -1;
+
+    p = *output_data;
+    if (p == NULL) {
+        struct _cffi_freeme_s *fp = (struct _cffi_freeme_s *)PyObject_Malloc(
+            offsetof(struct _cffi_freeme_s, alignment) + (size_t)datasize);
+        if (fp == NULL)
+            return -1;
+        fp->next = *freeme;
+        *freeme = fp;
+        p = *output_data = (char *)&fp->alignment;
+    }
+    memset((void *)p, 0, (size_t)datasize);
+    return _cffi_convert_array_from_object(p, ctptr, arg);
+}
+
+_CFFI_UNUSED_FN static void
+_cffi_free_array_arguments(struct _cffi_freeme_s *freeme)
+{
+    do {
+        void *p = (void *)freeme;
+        freeme = freeme->next;
+        PyObject_Free(p);
+    } while (freeme != NULL);
+}
+
+/**********  end CPython-specific section  **********/
+#else
+_CFFI_UNUSED_FN
+static void (*_cffi_call_python_org)(struct _cffi_externpy_s *, char *);
+# define _cffi_call_python  _cffi_call_python_org
+#endif
+
+
+#define _cffi_array_len(array)   (sizeof(array) / sizeof((array)[0]))
+
+#define _cffi_prim_int(size, sign)                                      \
+    ((size) == 1 ? ((sign) ? _CFFI_PRIM_INT8  : _CFFI_PRIM_UINT8)  :    \
+     (size) == 2 ? ((sign) ? _CFFI_PRIM_INT16 : _CFFI_PRIM_UINT16) :    \
+     (size) == 4 ? ((sign) ? _CFFI_PRIM_INT32 : _CFFI_PRIM_UINT32) :    \
+     (size) == 8 ? ((sign) ? _CFFI_PRIM_INT64 : _CFFI_PRIM_UINT64) :    \
+     _CFFI__UNKNOWN_PRIM)
+
+#define _cffi_prim_float(size)                                          \
+    ((size) == sizeof(float) ? _CFFI_PRIM_FLOAT :                       \
+     (size) == sizeof(double) ? _CFFI_PRIM_DOUBLE :                     \
+     (size) == sizeof(long double) ? _CFFI__UNKNOWN_LONG_DOUBLE :       \
+     _CFFI__UNKNOWN_FLOAT_PRIM)
+
+#define _cffi_check_int(got, got_nonpos, expected)      \
+    ((got_nonpos) == (expected <= 0) &&                 \
+     (got) == (unsigned long long)expected)
+
+#ifdef MS_WIN32
+# define _cffi_stdcall  __stdcall
+#else
+# define _cffi_stdcall  /* nothing */
+#endif
+
+#ifdef __cplusplus
+}
+#endif
+
+/************************************************************/
+
+
+    #include "binding.h"
+    #include "cdn256.h"
+    #include "drbg.h"
+    #include "factorize.h"
+    #include "filemap.h"
+    #include "keycache.h"
+    #include "mtproto2.h"
+    #include "obfuscated.h"
+    #include "parallel.h"
+    #include "stats.h"
+    
+
+/************************************************************/
+
+static void *_cffi_types[] = {
+/*  0 */ _CFFI_OP(_CFFI_OP_FUNCTION, 3), // char const *()(void)
+/*  1 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  2 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(char const *)
+/*  3 */ _CFFI_OP(_CFFI_OP_POINTER, 236), // char const *
+/*  4 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  5 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(char const *, filemap *)
+/*  6 */ _CFFI_OP(_CFFI_OP_NOOP, 3),
+/*  7 */ _CFFI_OP(_CFFI_OP_POINTER, 237), // filemap *
+/*  8 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/*  9 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(char const *, size_t, filemap const *, filemap *)
+/* 10 */ _CFFI_OP(_CFFI_OP_NOOP, 3),
+/* 11 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28), // size_t
+/* 12 */ _CFFI_OP(_CFFI_OP_POINTER, 237), // filemap const *
+/* 13 */ _CFFI_OP(_CFFI_OP_NOOP, 7),
+/* 14 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 15 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(filemap const *, size_t, uint8_t *, size_t)
+/* 16 */ _CFFI_OP(_CFFI_OP_NOOP, 12),
+/* 17 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 18 */ _CFFI_OP(_CFFI_OP_POINTER, 24), // uint8_t *
+/* 19 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 20 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 21 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(obfuscated_codec *, uint8_t *, uint8_t, uint8_t *, size_t)
+/* 22 */ _CFFI_OP(_CFFI_OP_POINTER, 240), // obfuscated_codec *
+/* 23 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 24 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 18), // uint8_t
+/* 25 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 26 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 27 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 28 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(obfuscated_codec *, uint8_t const *, size_t *, size_t *)
+/* 29 */ _CFFI_OP(_CFFI_OP_NOOP, 22),
+/* 30 */ _CFFI_OP(_CFFI_OP_POINTER, 24), // uint8_t const *
+/* 31 */ _CFFI_OP(_CFFI_OP_POINTER, 11), // size_t *
+/* 32 */ _CFFI_OP(_CFFI_OP_NOOP, 31),
+/* 33 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 34 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(uint64_t, uint64_t *, uint64_t *)
+/* 35 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24), // uint64_t
+/* 36 */ _CFFI_OP(_CFFI_OP_POINTER, 35), // uint64_t *
+/* 37 */ _CFFI_OP(_CFFI_OP_NOOP, 36),
+/* 38 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 39 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(uint8_t *, size_t)
+/* 40 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 41 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 42 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 43 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(uint8_t const *, size_t, uint8_t const *, size_t)
+/* 44 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 45 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 46 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 47 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 48 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 49 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(uint8_t const *, uint8_t *, size_t, uint8_t const *, uint8_t const *, uint64_t, uint8_t const *, size_t, size_t *)
+/* 50 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 51 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 52 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 53 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 54 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 55 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24),
+/* 56 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 57 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 58 */ _CFFI_OP(_CFFI_OP_NOOP, 31),
+/* 59 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 60 */ _CFFI_OP(_CFFI_OP_FUNCTION, 66), // int()(uint8_t const *, uint8_t const *, uint8_t const *, size_t, uint8_t *, int, int)
+/* 61 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 62 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 63 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 64 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 65 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 66 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7), // int
+/* 67 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 68 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 69 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(binding_ctr *)
+/* 70 */ _CFFI_OP(_CFFI_OP_POINTER, 233), // binding_ctr *
+/* 71 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 72 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(obfuscated_codec *)
+/* 73 */ _CFFI_OP(_CFFI_OP_NOOP, 22),
+/* 74 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 75 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(obfuscated_codec *, uint8_t *)
+/* 76 */ _CFFI_OP(_CFFI_OP_NOOP, 22),
+/* 77 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 78 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 79 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(obfuscated_codec const *, size_t)
+/* 80 */ _CFFI_OP(_CFFI_OP_POINTER, 240), // obfuscated_codec const *
+/* 81 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 82 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 83 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(size_t)
+/* 84 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 85 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 86 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(size_t, size_t)
+/* 87 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 88 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 89 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 90 */ _CFFI_OP(_CFFI_OP_FUNCTION, 11), // size_t()(void)
+/* 91 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 92 */ _CFFI_OP(_CFFI_OP_FUNCTION, 190), // uint32_t()(void)
+/* 93 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 94 */ _CFFI_OP(_CFFI_OP_FUNCTION, 35), // uint64_t()(void)
+/* 95 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 96 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_ctr *, uint64_t)
+/* 97 */ _CFFI_OP(_CFFI_OP_NOOP, 70),
+/* 98 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24),
+/* 99 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 100 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_ctr *, uint8_t const *, uint8_t *, size_t)
+/* 101 */ _CFFI_OP(_CFFI_OP_NOOP, 70),
+/* 102 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 103 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 104 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 105 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 106 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_ctr *, uint8_t const *, uint8_t const *, uint8_t *, size_t)
+/* 107 */ _CFFI_OP(_CFFI_OP_NOOP, 70),
+/* 108 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 109 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 110 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 111 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 112 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 113 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_schedule *, uint8_t const *)
+/* 114 */ _CFFI_OP(_CFFI_OP_POINTER, 234), // binding_schedule *
+/* 115 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 116 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 117 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_schedule const *, uint8_t const *, uint8_t *, size_t, uint8_t const *, int)
+/* 118 */ _CFFI_OP(_CFFI_OP_POINTER, 234), // binding_schedule const *
+/* 119 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 120 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 121 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 122 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 123 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 124 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 125 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_stream *)
+/* 126 */ _CFFI_OP(_CFFI_OP_POINTER, 235), // binding_stream *
+/* 127 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 128 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_stream *, uint8_t const *, size_t, uint8_t *, size_t)
+/* 129 */ _CFFI_OP(_CFFI_OP_NOOP, 126),
+/* 130 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 131 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 132 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 133 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 134 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 135 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_stream *, uint8_t const *, uint8_t *, size_t)
+/* 136 */ _CFFI_OP(_CFFI_OP_NOOP, 126),
+/* 137 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 138 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 139 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 140 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 141 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(binding_stream *, uint8_t const *, uint8_t const *, int, int)
+/* 142 */ _CFFI_OP(_CFFI_OP_NOOP, 126),
+/* 143 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 144 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 145 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 146 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 147 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 148 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(filemap *)
+/* 149 */ _CFFI_OP(_CFFI_OP_NOOP, 7),
+/* 150 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 151 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(ige256_job *, uint8_t const * const *, uint32_t(*)[60], size_t, int)
+/* 152 */ _CFFI_OP(_CFFI_OP_POINTER, 238), // ige256_job *
+/* 153 */ _CFFI_OP(_CFFI_OP_POINTER, 30), // uint8_t const * const *
+/* 154 */ _CFFI_OP(_CFFI_OP_POINTER, 243), // uint32_t(*)[60]
+/* 155 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 156 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 157 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 158 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(int)
+/* 159 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 160 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 161 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(int, int, size_t, uint64_t)
+/* 162 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 163 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 164 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 165 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24),
+/* 166 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 167 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(int, int, stats_counters *)
+/* 168 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 169 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 170 */ _CFFI_OP(_CFFI_OP_POINTER, 241), // stats_counters *
+/* 171 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 172 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(keycache_counters *)
+/* 173 */ _CFFI_OP(_CFFI_OP_POINTER, 239), // keycache_counters *
+/* 174 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 175 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(obfuscated_codec *, uint8_t *, size_t)
+/* 176 */ _CFFI_OP(_CFFI_OP_NOOP, 22),
+/* 177 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 178 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 179 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 180 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(obfuscated_codec *, uint8_t const *, size_t, uint8_t *)
+/* 181 */ _CFFI_OP(_CFFI_OP_NOOP, 22),
+/* 182 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 183 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 184 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 185 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 186 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(size_t)
+/* 187 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 188 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 189 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint32_t)
+/* 190 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 22), // uint32_t
+/* 191 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 192 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint8_t const *, uint8_t *, size_t)
+/* 193 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 194 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 195 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 196 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 197 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint8_t const *, uint8_t *, size_t, uint8_t const *, uint8_t *, int)
+/* 198 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 199 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 200 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 201 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 202 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 203 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 204 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 205 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint8_t const *, uint8_t *, size_t, uint8_t const *, uint8_t *, uint8_t *, int)
+/* 206 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 207 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 208 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 209 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 210 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 211 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 212 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 213 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 214 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint8_t const *, uint8_t *, size_t, uint8_t const *, uint8_t const *, int)
+/* 215 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 216 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 217 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 218 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 219 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 220 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 221 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 222 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(uint8_t const *, uint8_t *, size_t, uint8_t const *, uint8_t const *, uint64_t, int)
+/* 223 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 224 */ _CFFI_OP(_CFFI_OP_NOOP, 18),
+/* 225 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 28),
+/* 226 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 227 */ _CFFI_OP(_CFFI_OP_NOOP, 30),
+/* 228 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 24),
+/* 229 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 7),
+/* 230 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 231 */ _CFFI_OP(_CFFI_OP_FUNCTION, 247), // void()(void)
+/* 232 */ _CFFI_OP(_CFFI_OP_FUNCTION_END, 0),
+/* 233 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 0), // binding_ctr
+/* 234 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 1), // binding_schedule
+/* 235 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 2), // binding_stream
+/* 236 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 2), // char
+/* 237 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 3), // filemap
+/* 238 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 4), // ige256_job
+/* 239 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 5), // keycache_counters
+/* 240 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 6), // obfuscated_codec
+/* 241 */ _CFFI_OP(_CFFI_OP_STRUCT_UNION, 7), // stats_counters
+/* 242 */ _CFFI_OP(_CFFI_OP_POINTER, 190), // uint32_t const *
+/* 243 */ _CFFI_OP(_CFFI_OP_ARRAY, 190), // uint32_t[60]
+/* 244 */ (_cffi_opcode_t)(60),
+/* 245 */ _CFFI_OP(_CFFI_OP_ARRAY, 35), // uint64_t[_cffi_array_len(((stats_counters *)0)->sizes)]
+/* 246 */ (_cffi_opcode_t)(_cffi_array_len(((stats_counters *)0)->sizes)),
+/* 247 */ _CFFI_OP(_CFFI_OP_PRIMITIVE, 0), // void
+};
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_binding_ctr(binding_ctr *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+}
+struct _cffi_align_typedef_binding_ctr { char x; binding_ctr y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_binding_schedule(binding_schedule *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+}
+struct _cffi_align_typedef_binding_schedule { char x; binding_schedule y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_binding_stream(binding_stream *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->buffered) | 0);  /* check that 'binding_stream.buffered' is an integer */
+}
+struct _cffi_align_typedef_binding_stream { char x; binding_stream y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_filemap(filemap *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { uint8_t * *tmp = &p->data; (void)tmp; }
+  (void)((p->size) | 0);  /* check that 'filemap.size' is an integer */
+}
+struct _cffi_align_typedef_filemap { char x; filemap y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_ige256_job(ige256_job *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  { uint8_t const * *tmp = &p->in; (void)tmp; }
+  { uint8_t * *tmp = &p->out; (void)tmp; }
+  (void)((p->length) | 0);  /* check that 'ige256_job.length' is an integer */
+  { uint32_t const * *tmp = &p->expandedKey; (void)tmp; }
+  { uint8_t const * *tmp = &p->iv; (void)tmp; }
+}
+struct _cffi_align_typedef_ige256_job { char x; ige256_job y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_keycache_counters(keycache_counters *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->size) | 0);  /* check that 'keycache_counters.size' is an integer */
+  (void)((p->entries) | 0);  /* check that 'keycache_counters.entries' is an integer */
+  (void)((p->hits) | 0);  /* check that 'keycache_counters.hits' is an integer */
+  (void)((p->misses) | 0);  /* check that 'keycache_counters.misses' is an integer */
+}
+struct _cffi_align_typedef_keycache_counters { char x; keycache_counters y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_obfuscated_codec(obfuscated_codec *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->end) | 0);  /* check that 'obfuscated_codec.end' is an integer */
+}
+struct _cffi_align_typedef_obfuscated_codec { char x; obfuscated_codec y; };
+
+_CFFI_UNUSED_FN
+static void _cffi_checkfld_typedef_stats_counters(stats_counters *p)
+{
+  /* only to generate compile-time warnings or errors */
+  (void)p;
+  (void)((p->calls) | 0);  /* check that 'stats_counters.calls' is an integer */
+  (void)((p->bytes) | 0);  /* check that 'stats_counters.bytes' is an integer */
+  (void)((p->ns) | 0);  /* check that 'stats_counters.ns' is an integer */
+  { uint64_t *tmp = &p->sizes[0]; (void)tmp; }
+}
+struct _cffi_align_typedef_stats_counters { char x; stats_counters y; };
+
+static char const * _cffi_d_aes256_backend(void)
+{
+  return aes256_backend();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_aes256_backend(PyObject *self, PyObject *noarg)
+{
+  char const * result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = aes256_backend(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_pointer((char *)result, _cffi_type(3));
+  return pyresult;
+}
+#else
+#  define _cffi_f_aes256_backend _cffi_d_aes256_backend
+#endif
+
+static void _cffi_d_binding_cbc256(uint8_t const * x0, uint8_t * x1, size_t x2, uint8_t const * x3, uint8_t * x4, int x5)
+{
+  binding_cbc256(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_cbc256(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  uint8_t const * x3;
+  uint8_t * x4;
+  int x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "binding_cbc256", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, int);
+  if (x5 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_cbc256(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_cbc256 _cffi_d_binding_cbc256
+#endif
+
+static int _cffi_d_binding_cdn256(uint8_t const * x0, uint8_t * x1, size_t x2, uint8_t const * x3, uint8_t const * x4, uint64_t x5, uint8_t const * x6, size_t x7, size_t * x8)
+{
+  return binding_cdn256(x0, x1, x2, x3, x4, x5, x6, x7, x8);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_cdn256(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  uint8_t const * x3;
+  uint8_t const * x4;
+  uint64_t x5;
+  uint8_t const * x6;
+  size_t x7;
+  size_t * x8;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+  PyObject *arg7;
+  PyObject *arg8;
+
+  if (!PyArg_UnpackTuple(args, "binding_cdn256", 9, 9, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6, &arg7, &arg8))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, uint64_t);
+  if (x5 == (uint64_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg6, (char **)&x6);
+  if (datasize != 0) {
+    x6 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg6, (char **)&x6,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x7 = _cffi_to_c_int(arg7, size_t);
+  if (x7 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(31), arg8, (char **)&x8);
+  if (datasize != 0) {
+    x8 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(31), arg8, (char **)&x8,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = binding_cdn256(x0, x1, x2, x3, x4, x5, x6, x7, x8); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_binding_cdn256 _cffi_d_binding_cdn256
+#endif
+
+static void _cffi_d_binding_ctr256(uint8_t const * x0, uint8_t * x1, size_t x2, uint8_t const * x3, uint8_t * x4, uint8_t * x5, int x6)
+{
+  binding_ctr256(x0, x1, x2, x3, x4, x5, x6);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr256(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  uint8_t const * x3;
+  uint8_t * x4;
+  uint8_t * x5;
+  int x6;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr256", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg5, (char **)&x5);
+  if (datasize != 0) {
+    x5 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg5, (char **)&x5,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x6 = _cffi_to_c_int(arg6, int);
+  if (x6 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr256(x0, x1, x2, x3, x4, x5, x6); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr256 _cffi_d_binding_ctr256
+#endif
+
+static void _cffi_d_binding_ctr256_at(uint8_t const * x0, uint8_t * x1, size_t x2, uint8_t const * x3, uint8_t const * x4, uint64_t x5, int x6)
+{
+  binding_ctr256_at(x0, x1, x2, x3, x4, x5, x6);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr256_at(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  uint8_t const * x3;
+  uint8_t const * x4;
+  uint64_t x5;
+  int x6;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr256_at", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, uint64_t);
+  if (x5 == (uint64_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x6 = _cffi_to_c_int(arg6, int);
+  if (x6 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr256_at(x0, x1, x2, x3, x4, x5, x6); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr256_at _cffi_d_binding_ctr256_at
+#endif
+
+static void _cffi_d_binding_ctr_drbg(uint8_t const * x0, uint8_t * x1, size_t x2)
+{
+  binding_ctr_drbg(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr_drbg(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr_drbg", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr_drbg(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr_drbg _cffi_d_binding_ctr_drbg
+#endif
+
+static void _cffi_d_binding_ctr_init(binding_ctr * x0, uint8_t const * x1, uint8_t const * x2, uint8_t * x3, size_t x4)
+{
+  binding_ctr_init(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr_init(PyObject *self, PyObject *args)
+{
+  binding_ctr * x0;
+  uint8_t const * x1;
+  uint8_t const * x2;
+  uint8_t * x3;
+  size_t x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr_init", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_ctr *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr_init(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr_init _cffi_d_binding_ctr_init
+#endif
+
+static size_t _cffi_d_binding_ctr_refill(binding_ctr * x0)
+{
+  return binding_ctr_refill(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr_refill(PyObject *self, PyObject *arg0)
+{
+  binding_ctr * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_ctr *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = binding_ctr_refill(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_binding_ctr_refill _cffi_d_binding_ctr_refill
+#endif
+
+static void _cffi_d_binding_ctr_seek(binding_ctr * x0, uint64_t x1)
+{
+  binding_ctr_seek(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr_seek(PyObject *self, PyObject *args)
+{
+  binding_ctr * x0;
+  uint64_t x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr_seek", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_ctr *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, uint64_t);
+  if (x1 == (uint64_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr_seek(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr_seek _cffi_d_binding_ctr_seek
+#endif
+
+static void _cffi_d_binding_ctr_update(binding_ctr * x0, uint8_t const * x1, uint8_t * x2, size_t x3)
+{
+  binding_ctr_update(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ctr_update(PyObject *self, PyObject *args)
+{
+  binding_ctr * x0;
+  uint8_t const * x1;
+  uint8_t * x2;
+  size_t x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "binding_ctr_update", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(70), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_ctr *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(70), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ctr_update(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ctr_update _cffi_d_binding_ctr_update
+#endif
+
+static void _cffi_d_binding_ige256(uint8_t const * x0, uint8_t * x1, size_t x2, uint8_t const * x3, uint8_t const * x4, int x5)
+{
+  binding_ige256(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ige256(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t * x1;
+  size_t x2;
+  uint8_t const * x3;
+  uint8_t const * x4;
+  int x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "binding_ige256", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, int);
+  if (x5 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ige256(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ige256 _cffi_d_binding_ige256
+#endif
+
+static void _cffi_d_binding_ige256_many(ige256_job * x0, uint8_t const * const * x1, uint32_t(* x2)[60], size_t x3, int x4)
+{
+  binding_ige256_many(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_ige256_many(PyObject *self, PyObject *args)
+{
+  ige256_job * x0;
+  uint8_t const * const * x1;
+  uint32_t(* x2)[60];
+  size_t x3;
+  int x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "binding_ige256_many", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(152), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (ige256_job *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(152), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(153), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const * const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(153), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(154), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint32_t(*)[60])alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(154), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, int);
+  if (x4 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_ige256_many(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_ige256_many _cffi_d_binding_ige256_many
+#endif
+
+static void _cffi_d_binding_init(void)
+{
+  binding_init();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_init(PyObject *self, PyObject *noarg)
+{
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_init(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_init _cffi_d_binding_init
+#endif
+
+static int _cffi_d_binding_mtproto2(uint8_t const * x0, uint8_t const * x1, uint8_t const * x2, size_t x3, uint8_t * x4, int x5, int x6)
+{
+  return binding_mtproto2(x0, x1, x2, x3, x4, x5, x6);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_mtproto2(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  uint8_t const * x1;
+  uint8_t const * x2;
+  size_t x3;
+  uint8_t * x4;
+  int x5;
+  int x6;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+  PyObject *arg6;
+
+  if (!PyArg_UnpackTuple(args, "binding_mtproto2", 7, 7, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5, &arg6))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, int);
+  if (x5 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x6 = _cffi_to_c_int(arg6, int);
+  if (x6 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = binding_mtproto2(x0, x1, x2, x3, x4, x5, x6); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_binding_mtproto2 _cffi_d_binding_mtproto2
+#endif
+
+static void _cffi_d_binding_obfuscated_decode(obfuscated_codec * x0, uint8_t * x1, size_t x2)
+{
+  binding_obfuscated_decode(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_obfuscated_decode(PyObject *self, PyObject *args)
+{
+  obfuscated_codec * x0;
+  uint8_t * x1;
+  size_t x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "binding_obfuscated_decode", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_obfuscated_decode(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_obfuscated_decode _cffi_d_binding_obfuscated_decode
+#endif
+
+static void _cffi_d_binding_obfuscated_encode(obfuscated_codec * x0, uint8_t const * x1, size_t x2, uint8_t * x3)
+{
+  binding_obfuscated_encode(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_obfuscated_encode(PyObject *self, PyObject *args)
+{
+  obfuscated_codec * x0;
+  uint8_t const * x1;
+  size_t x2;
+  uint8_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "binding_obfuscated_encode", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_obfuscated_encode(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_obfuscated_encode _cffi_d_binding_obfuscated_encode
+#endif
+
+static int _cffi_d_binding_obfuscated_init(obfuscated_codec * x0, uint8_t * x1, uint8_t x2, uint8_t * x3, size_t x4)
+{
+  return binding_obfuscated_init(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_obfuscated_init(PyObject *self, PyObject *args)
+{
+  obfuscated_codec * x0;
+  uint8_t * x1;
+  uint8_t x2;
+  uint8_t * x3;
+  size_t x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "binding_obfuscated_init", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, uint8_t);
+  if (x2 == (uint8_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = binding_obfuscated_init(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_binding_obfuscated_init _cffi_d_binding_obfuscated_init
+#endif
+
+static int _cffi_d_binding_overlaps(uint8_t const * x0, size_t x1, uint8_t const * x2, size_t x3)
+{
+  return binding_overlaps(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_overlaps(PyObject *self, PyObject *args)
+{
+  uint8_t const * x0;
+  size_t x1;
+  uint8_t const * x2;
+  size_t x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "binding_overlaps", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = binding_overlaps(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_binding_overlaps _cffi_d_binding_overlaps
+#endif
+
+static void _cffi_d_binding_schedule_cbc256(binding_schedule const * x0, uint8_t const * x1, uint8_t * x2, size_t x3, uint8_t const * x4, int x5)
+{
+  binding_schedule_cbc256(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_schedule_cbc256(PyObject *self, PyObject *args)
+{
+  binding_schedule const * x0;
+  uint8_t const * x1;
+  uint8_t * x2;
+  size_t x3;
+  uint8_t const * x4;
+  int x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "binding_schedule_cbc256", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(118), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_schedule const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(118), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, int);
+  if (x5 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_schedule_cbc256(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_schedule_cbc256 _cffi_d_binding_schedule_cbc256
+#endif
+
+static void _cffi_d_binding_schedule_ige256(binding_schedule const * x0, uint8_t const * x1, uint8_t * x2, size_t x3, uint8_t const * x4, int x5)
+{
+  binding_schedule_ige256(x0, x1, x2, x3, x4, x5);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_schedule_ige256(PyObject *self, PyObject *args)
+{
+  binding_schedule const * x0;
+  uint8_t const * x1;
+  uint8_t * x2;
+  size_t x3;
+  uint8_t const * x4;
+  int x5;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+  PyObject *arg5;
+
+  if (!PyArg_UnpackTuple(args, "binding_schedule_ige256", 6, 6, &arg0, &arg1, &arg2, &arg3, &arg4, &arg5))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(118), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_schedule const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(118), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg4, (char **)&x4);
+  if (datasize != 0) {
+    x4 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg4, (char **)&x4,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x5 = _cffi_to_c_int(arg5, int);
+  if (x5 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_schedule_ige256(x0, x1, x2, x3, x4, x5); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_schedule_ige256 _cffi_d_binding_schedule_ige256
+#endif
+
+static void _cffi_d_binding_schedule_init(binding_schedule * x0, uint8_t const * x1)
+{
+  binding_schedule_init(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_schedule_init(PyObject *self, PyObject *args)
+{
+  binding_schedule * x0;
+  uint8_t const * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "binding_schedule_init", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(114), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_schedule *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(114), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_schedule_init(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_schedule_init _cffi_d_binding_schedule_init
+#endif
+
+static void _cffi_d_binding_set_stats(int x0)
+{
+  binding_set_stats(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_set_stats(PyObject *self, PyObject *arg0)
+{
+  int x0;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_set_stats(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_set_stats _cffi_d_binding_set_stats
+#endif
+
+static void _cffi_d_binding_stream_chunk(binding_stream * x0, uint8_t const * x1, uint8_t * x2, size_t x3)
+{
+  binding_stream_chunk(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_stream_chunk(PyObject *self, PyObject *args)
+{
+  binding_stream * x0;
+  uint8_t const * x1;
+  uint8_t * x2;
+  size_t x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "binding_stream_chunk", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(126), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_stream *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(126), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_stream_chunk(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_stream_chunk _cffi_d_binding_stream_chunk
+#endif
+
+static void _cffi_d_binding_stream_clear(binding_stream * x0)
+{
+  binding_stream_clear(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_stream_clear(PyObject *self, PyObject *arg0)
+{
+  binding_stream * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(126), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_stream *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(126), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_stream_clear(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_stream_clear _cffi_d_binding_stream_clear
+#endif
+
+static void _cffi_d_binding_stream_init(binding_stream * x0, uint8_t const * x1, uint8_t const * x2, int x3, int x4)
+{
+  binding_stream_init(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_stream_init(PyObject *self, PyObject *args)
+{
+  binding_stream * x0;
+  uint8_t const * x1;
+  uint8_t const * x2;
+  int x3;
+  int x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "binding_stream_init", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(126), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_stream *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(126), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, int);
+  if (x3 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x4 = _cffi_to_c_int(arg4, int);
+  if (x4 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_stream_init(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_stream_init _cffi_d_binding_stream_init
+#endif
+
+static void _cffi_d_binding_stream_update(binding_stream * x0, uint8_t const * x1, size_t x2, uint8_t * x3, size_t x4)
+{
+  binding_stream_update(x0, x1, x2, x3, x4);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_binding_stream_update(PyObject *self, PyObject *args)
+{
+  binding_stream * x0;
+  uint8_t const * x1;
+  size_t x2;
+  uint8_t * x3;
+  size_t x4;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+  PyObject *arg4;
+
+  if (!PyArg_UnpackTuple(args, "binding_stream_update", 5, 5, &arg0, &arg1, &arg2, &arg3, &arg4))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(126), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (binding_stream *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(126), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x4 = _cffi_to_c_int(arg4, size_t);
+  if (x4 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { binding_stream_update(x0, x1, x2, x3, x4); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_binding_stream_update _cffi_d_binding_stream_update
+#endif
+
+static size_t _cffi_d_cdn256_hash_count(size_t x0, size_t x1)
+{
+  return cdn256_hash_count(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_cdn256_hash_count(PyObject *self, PyObject *args)
+{
+  size_t x0;
+  size_t x1;
+  size_t result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "cdn256_hash_count", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, size_t);
+  if (x0 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = cdn256_hash_count(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_cdn256_hash_count _cffi_d_cdn256_hash_count
+#endif
+
+static int _cffi_d_drbg_generate(uint8_t * x0, size_t x1)
+{
+  return drbg_generate(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_drbg_generate(PyObject *self, PyObject *args)
+{
+  uint8_t * x0;
+  size_t x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "drbg_generate", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = drbg_generate(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_drbg_generate _cffi_d_drbg_generate
+#endif
+
+static int _cffi_d_factorize(uint64_t x0, uint64_t * x1, uint64_t * x2)
+{
+  return factorize(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_factorize(PyObject *self, PyObject *args)
+{
+  uint64_t x0;
+  uint64_t * x1;
+  uint64_t * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "factorize", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, uint64_t);
+  if (x0 == (uint64_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(36), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint64_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(36), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = factorize(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_factorize _cffi_d_factorize
+#endif
+
+static void _cffi_d_filemap_close(filemap * x0)
+{
+  filemap_close(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_filemap_close(PyObject *self, PyObject *arg0)
+{
+  filemap * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(7), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (filemap *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(7), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { filemap_close(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_filemap_close _cffi_d_filemap_close
+#endif
+
+static int _cffi_d_filemap_open_read(char const * x0, filemap * x1)
+{
+  return filemap_open_read(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_filemap_open_read(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  filemap * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "filemap_open_read", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(3), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(3), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(7), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (filemap *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(7), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = filemap_open_read(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_filemap_open_read _cffi_d_filemap_open_read
+#endif
+
+static int _cffi_d_filemap_open_write(char const * x0, size_t x1, filemap const * x2, filemap * x3)
+{
+  return filemap_open_write(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_filemap_open_write(PyObject *self, PyObject *args)
+{
+  char const * x0;
+  size_t x1;
+  filemap const * x2;
+  filemap * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "filemap_open_write", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(3), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(3), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(12), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (filemap const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(12), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(7), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (filemap *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(7), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = filemap_open_write(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_filemap_open_write _cffi_d_filemap_open_write
+#endif
+
+static int _cffi_d_filemap_read(filemap const * x0, size_t x1, uint8_t * x2, size_t x3)
+{
+  return filemap_read(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_filemap_read(PyObject *self, PyObject *args)
+{
+  filemap const * x0;
+  size_t x1;
+  uint8_t * x2;
+  size_t x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "filemap_read", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(12), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (filemap const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(12), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x3 = _cffi_to_c_int(arg3, size_t);
+  if (x3 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = filemap_read(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_filemap_read _cffi_d_filemap_read
+#endif
+
+static int _cffi_d_filemap_remove(char const * x0)
+{
+  return filemap_remove(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_filemap_remove(PyObject *self, PyObject *arg0)
+{
+  char const * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(3), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (char const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(3), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = filemap_remove(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_filemap_remove _cffi_d_filemap_remove
+#endif
+
+static void _cffi_d_keycache_clear(void)
+{
+  keycache_clear();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_keycache_clear(PyObject *self, PyObject *noarg)
+{
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { keycache_clear(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_keycache_clear _cffi_d_keycache_clear
+#endif
+
+static void _cffi_d_keycache_get(keycache_counters * x0)
+{
+  keycache_get(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_keycache_get(PyObject *self, PyObject *arg0)
+{
+  keycache_counters * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(173), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (keycache_counters *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(173), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { keycache_get(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_keycache_get _cffi_d_keycache_get
+#endif
+
+static size_t _cffi_d_keycache_get_size(void)
+{
+  return keycache_get_size();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_keycache_get_size(PyObject *self, PyObject *noarg)
+{
+  size_t result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = keycache_get_size(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_keycache_get_size _cffi_d_keycache_get_size
+#endif
+
+static void _cffi_d_keycache_set_size(size_t x0)
+{
+  keycache_set_size(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_keycache_set_size(PyObject *self, PyObject *arg0)
+{
+  size_t x0;
+
+  x0 = _cffi_to_c_int(arg0, size_t);
+  if (x0 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { keycache_set_size(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_keycache_set_size _cffi_d_keycache_set_size
+#endif
+
+static size_t _cffi_d_mtproto2_packet_size(size_t x0)
+{
+  return mtproto2_packet_size(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_mtproto2_packet_size(PyObject *self, PyObject *arg0)
+{
+  size_t x0;
+  size_t result;
+  PyObject *pyresult;
+
+  x0 = _cffi_to_c_int(arg0, size_t);
+  if (x0 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = mtproto2_packet_size(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_mtproto2_packet_size _cffi_d_mtproto2_packet_size
+#endif
+
+static size_t _cffi_d_obfuscated_compact(obfuscated_codec * x0, uint8_t * x1)
+{
+  return obfuscated_compact(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_obfuscated_compact(PyObject *self, PyObject *args)
+{
+  obfuscated_codec * x0;
+  uint8_t * x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "obfuscated_compact", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(18), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(18), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = obfuscated_compact(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_obfuscated_compact _cffi_d_obfuscated_compact
+#endif
+
+static size_t _cffi_d_obfuscated_frame_size(obfuscated_codec const * x0, size_t x1)
+{
+  return obfuscated_frame_size(x0, x1);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_obfuscated_frame_size(PyObject *self, PyObject *args)
+{
+  obfuscated_codec const * x0;
+  size_t x1;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+
+  if (!PyArg_UnpackTuple(args, "obfuscated_frame_size", 2, 2, &arg0, &arg1))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(80), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(80), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  x1 = _cffi_to_c_int(arg1, size_t);
+  if (x1 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = obfuscated_frame_size(x0, x1); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_obfuscated_frame_size _cffi_d_obfuscated_frame_size
+#endif
+
+static int _cffi_d_obfuscated_next(obfuscated_codec * x0, uint8_t const * x1, size_t * x2, size_t * x3)
+{
+  return obfuscated_next(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_obfuscated_next(PyObject *self, PyObject *args)
+{
+  obfuscated_codec * x0;
+  uint8_t const * x1;
+  size_t * x2;
+  size_t * x3;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  int result;
+  PyObject *pyresult;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "obfuscated_next", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(30), arg1, (char **)&x1);
+  if (datasize != 0) {
+    x1 = ((size_t)datasize) <= 640 ? (uint8_t const *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(30), arg1, (char **)&x1,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(31), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(31), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(31), arg3, (char **)&x3);
+  if (datasize != 0) {
+    x3 = ((size_t)datasize) <= 640 ? (size_t *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(31), arg3, (char **)&x3,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = obfuscated_next(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, int);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_obfuscated_next _cffi_d_obfuscated_next
+#endif
+
+static size_t _cffi_d_obfuscated_refill(obfuscated_codec * x0)
+{
+  return obfuscated_refill(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_obfuscated_refill(PyObject *self, PyObject *arg0)
+{
+  obfuscated_codec * x0;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  size_t result;
+  PyObject *pyresult;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(22), arg0, (char **)&x0);
+  if (datasize != 0) {
+    x0 = ((size_t)datasize) <= 640 ? (obfuscated_codec *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(22), arg0, (char **)&x0,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = obfuscated_refill(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  pyresult = _cffi_from_c_int(result, size_t);
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  return pyresult;
+}
+#else
+#  define _cffi_f_obfuscated_refill _cffi_d_obfuscated_refill
+#endif
+
+static uint32_t _cffi_d_parallel_get_threads(void)
+{
+  return parallel_get_threads();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_parallel_get_threads(PyObject *self, PyObject *noarg)
+{
+  uint32_t result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = parallel_get_threads(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, uint32_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_parallel_get_threads _cffi_d_parallel_get_threads
+#endif
+
+static void _cffi_d_parallel_set_threads(uint32_t x0)
+{
+  parallel_set_threads(x0);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_parallel_set_threads(PyObject *self, PyObject *arg0)
+{
+  uint32_t x0;
+
+  x0 = _cffi_to_c_int(arg0, uint32_t);
+  if (x0 == (uint32_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { parallel_set_threads(x0); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_parallel_set_threads _cffi_d_parallel_set_threads
+#endif
+
+static void _cffi_d_stats_get(int x0, int x1, stats_counters * x2)
+{
+  stats_get(x0, x1, x2);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_stats_get(PyObject *self, PyObject *args)
+{
+  int x0;
+  int x1;
+  stats_counters * x2;
+  Py_ssize_t datasize;
+  struct _cffi_freeme_s *large_args_free = NULL;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+
+  if (!PyArg_UnpackTuple(args, "stats_get", 3, 3, &arg0, &arg1, &arg2))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  datasize = _cffi_prepare_pointer_call_argument(
+      _cffi_type(170), arg2, (char **)&x2);
+  if (datasize != 0) {
+    x2 = ((size_t)datasize) <= 640 ? (stats_counters *)alloca((size_t)datasize) : NULL;
+    if (_cffi_convert_array_argument(_cffi_type(170), arg2, (char **)&x2,
+            datasize, &large_args_free) < 0)
+      return NULL;
+  }
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { stats_get(x0, x1, x2); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  if (large_args_free != NULL) _cffi_free_array_arguments(large_args_free);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_stats_get _cffi_d_stats_get
+#endif
+
+static void _cffi_d_stats_record(int x0, int x1, size_t x2, uint64_t x3)
+{
+  stats_record(x0, x1, x2, x3);
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_stats_record(PyObject *self, PyObject *args)
+{
+  int x0;
+  int x1;
+  size_t x2;
+  uint64_t x3;
+  PyObject *arg0;
+  PyObject *arg1;
+  PyObject *arg2;
+  PyObject *arg3;
+
+  if (!PyArg_UnpackTuple(args, "stats_record", 4, 4, &arg0, &arg1, &arg2, &arg3))
+    return NULL;
+
+  x0 = _cffi_to_c_int(arg0, int);
+  if (x0 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x1 = _cffi_to_c_int(arg1, int);
+  if (x1 == (int)-1 && PyErr_Occurred())
+    return NULL;
+
+  x2 = _cffi_to_c_int(arg2, size_t);
+  if (x2 == (size_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  x3 = _cffi_to_c_int(arg3, uint64_t);
+  if (x3 == (uint64_t)-1 && PyErr_Occurred())
+    return NULL;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { stats_record(x0, x1, x2, x3); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_stats_record _cffi_d_stats_record
+#endif
+
+static void _cffi_d_stats_reset(void)
+{
+  stats_reset();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_stats_reset(PyObject *self, PyObject *noarg)
+{
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { stats_reset(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+#else
+#  define _cffi_f_stats_reset _cffi_d_stats_reset
+#endif
+
+static uint64_t _cffi_d_stats_start(void)
+{
+  return stats_start();
+}
+#ifndef PYPY_VERSION
+static PyObject *
+_cffi_f_stats_start(PyObject *self, PyObject *noarg)
+{
+  uint64_t result;
+  PyObject *pyresult;
+
+  Py_BEGIN_ALLOW_THREADS
+  _cffi_restore_errno();
+  { result = stats_start(); }
+  _cffi_save_errno();
+  Py_END_ALLOW_THREADS
+
+  (void)self; /* unused */
+  (void)noarg; /* unused */
+  pyresult = _cffi_from_c_int(result, uint64_t);
+  return pyresult;
+}
+#else
+#  define _cffi_f_stats_start _cffi_d_stats_start
+#endif
+
+static int _cffi_const_BINDING_CBC(unsigned long long *o)
+{
+  int n = (BINDING_CBC) <= 0;
+  *o = (unsigned long long)((BINDING_CBC) | 0);  /* check that BINDING_CBC is an integer */
+  return n;
+}
+
+static int _cffi_const_BINDING_CTR(unsigned long long *o)
+{
+  int n = (BINDING_CTR) <= 0;
+  *o = (unsigned long long)((BINDING_CTR) | 0);  /* check that BINDING_CTR is an integer */
+  return n;
+}
+
+static int _cffi_const_BINDING_IGE(unsigned long long *o)
+{
+  int n = (BINDING_IGE) <= 0;
+  *o = (unsigned long long)((BINDING_IGE) | 0);  /* check that BINDING_IGE is an integer */
+  return n;
+}
+
+static int _cffi_const_CDN256_DEFAULT_CHUNK(unsigned long long *o)
+{
+  int n = (CDN256_DEFAULT_CHUNK) <= 0;
+  *o = (unsigned long long)((CDN256_DEFAULT_CHUNK) | 0);  /* check that CDN256_DEFAULT_CHUNK is an integer */
+  return n;
+}
+
+static int _cffi_const_CDN256_HASH_SIZE(unsigned long long *o)
+{
+  int n = (CDN256_HASH_SIZE) <= 0;
+  *o = (unsigned long long)((CDN256_HASH_SIZE) | 0);  /* check that CDN256_HASH_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_CDN256_OK(unsigned long long *o)
+{
+  int n = (CDN256_OK) <= 0;
+  *o = (unsigned long long)((CDN256_OK) | 0);  /* check that CDN256_OK is an integer */
+  return n;
+}
+
+static int _cffi_const_CTR256_MAX_PREFETCH(unsigned long long *o)
+{
+  int n = (CTR256_MAX_PREFETCH) <= 0;
+  *o = (unsigned long long)((CTR256_MAX_PREFETCH) | 0);  /* check that CTR256_MAX_PREFETCH is an integer */
+  return n;
+}
+
+static int _cffi_const_DRBG_MAX_REQUEST(unsigned long long *o)
+{
+  int n = (DRBG_MAX_REQUEST) <= 0;
+  *o = (unsigned long long)((DRBG_MAX_REQUEST) | 0);  /* check that DRBG_MAX_REQUEST is an integer */
+  return n;
+}
+
+static int _cffi_const_DRBG_SEED_SIZE(unsigned long long *o)
+{
+  int n = (DRBG_SEED_SIZE) <= 0;
+  *o = (unsigned long long)((DRBG_SEED_SIZE) | 0);  /* check that DRBG_SEED_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_EXPANDED_KEY_SIZE(unsigned long long *o)
+{
+  int n = (EXPANDED_KEY_SIZE) <= 0;
+  *o = (unsigned long long)((EXPANDED_KEY_SIZE) | 0);  /* check that EXPANDED_KEY_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_FACTORIZE_NOT_COMPOSITE(unsigned long long *o)
+{
+  int n = (FACTORIZE_NOT_COMPOSITE) <= 0;
+  *o = (unsigned long long)((FACTORIZE_NOT_COMPOSITE) | 0);  /* check that FACTORIZE_NOT_COMPOSITE is an integer */
+  return n;
+}
+
+static int _cffi_const_FACTORIZE_NOT_SEMIPRIME(unsigned long long *o)
+{
+  int n = (FACTORIZE_NOT_SEMIPRIME) <= 0;
+  *o = (unsigned long long)((FACTORIZE_NOT_SEMIPRIME) | 0);  /* check that FACTORIZE_NOT_SEMIPRIME is an integer */
+  return n;
+}
+
+static int _cffi_const_FILEMAP_SAME_FILE(unsigned long long *o)
+{
+  int n = (FILEMAP_SAME_FILE) <= 0;
+  *o = (unsigned long long)((FILEMAP_SAME_FILE) | 0);  /* check that FILEMAP_SAME_FILE is an integer */
+  return n;
+}
+
+static int _cffi_const_FILEMAP_TRUNCATED(unsigned long long *o)
+{
+  int n = (FILEMAP_TRUNCATED) <= 0;
+  *o = (unsigned long long)((FILEMAP_TRUNCATED) | 0);  /* check that FILEMAP_TRUNCATED is an integer */
+  return n;
+}
+
+static int _cffi_const_KEYCACHE_MAX_SIZE(unsigned long long *o)
+{
+  int n = (KEYCACHE_MAX_SIZE) <= 0;
+  *o = (unsigned long long)((KEYCACHE_MAX_SIZE) | 0);  /* check that KEYCACHE_MAX_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_MTPROTO2_AUTH_KEY_ID_MISMATCH(unsigned long long *o)
+{
+  int n = (MTPROTO2_AUTH_KEY_ID_MISMATCH) <= 0;
+  *o = (unsigned long long)((MTPROTO2_AUTH_KEY_ID_MISMATCH) | 0);  /* check that MTPROTO2_AUTH_KEY_ID_MISMATCH is an integer */
+  return n;
+}
+
+static int _cffi_const_MTPROTO2_HEADER_SIZE(unsigned long long *o)
+{
+  int n = (MTPROTO2_HEADER_SIZE) <= 0;
+  *o = (unsigned long long)((MTPROTO2_HEADER_SIZE) | 0);  /* check that MTPROTO2_HEADER_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_MTPROTO2_MSG_KEY_MISMATCH(unsigned long long *o)
+{
+  int n = (MTPROTO2_MSG_KEY_MISMATCH) <= 0;
+  *o = (unsigned long long)((MTPROTO2_MSG_KEY_MISMATCH) | 0);  /* check that MTPROTO2_MSG_KEY_MISMATCH is an integer */
+  return n;
+}
+
+static int _cffi_const_MTPROTO2_OK(unsigned long long *o)
+{
+  int n = (MTPROTO2_OK) <= 0;
+  *o = (unsigned long long)((MTPROTO2_OK) | 0);  /* check that MTPROTO2_OK is an integer */
+  return n;
+}
+
+static int _cffi_const_MTPROTO2_RANDOM_ERROR(unsigned long long *o)
+{
+  int n = (MTPROTO2_RANDOM_ERROR) <= 0;
+  *o = (unsigned long long)((MTPROTO2_RANDOM_ERROR) | 0);  /* check that MTPROTO2_RANDOM_ERROR is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_ABRIDGED(unsigned long long *o)
+{
+  int n = (OBFUSCATED_ABRIDGED) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_ABRIDGED) | 0);  /* check that OBFUSCATED_ABRIDGED is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_BUFFER_SIZE(unsigned long long *o)
+{
+  int n = (OBFUSCATED_BUFFER_SIZE) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_BUFFER_SIZE) | 0);  /* check that OBFUSCATED_BUFFER_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_HEADER_SIZE(unsigned long long *o)
+{
+  int n = (OBFUSCATED_HEADER_SIZE) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_HEADER_SIZE) | 0);  /* check that OBFUSCATED_HEADER_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_INTERMEDIATE(unsigned long long *o)
+{
+  int n = (OBFUSCATED_INTERMEDIATE) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_INTERMEDIATE) | 0);  /* check that OBFUSCATED_INTERMEDIATE is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_MAX_FRAME(unsigned long long *o)
+{
+  int n = (OBFUSCATED_MAX_FRAME) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_MAX_FRAME) | 0);  /* check that OBFUSCATED_MAX_FRAME is an integer */
+  return n;
+}
+
+static int _cffi_const_OBFUSCATED_MIN_BUFFER_SIZE(unsigned long long *o)
+{
+  int n = (OBFUSCATED_MIN_BUFFER_SIZE) <= 0;
+  *o = (unsigned long long)((OBFUSCATED_MIN_BUFFER_SIZE) | 0);  /* check that OBFUSCATED_MIN_BUFFER_SIZE is an integer */
+  return n;
+}
+
+static int _cffi_const_STATS_BUCKETS(unsigned long long *o)
+{
+  int n = (STATS_BUCKETS) <= 0;
+  *o = (unsigned long long)((STATS_BUCKETS) | 0);  /* check that STATS_BUCKETS is an integer */
+  return n;
+}
+
+static int _cffi_const_STATS_MTPROTO2(unsigned long long *o)
+{
+  int n = (STATS_MTPROTO2) <= 0;
+  *o = (unsigned long long)((STATS_MTPROTO2) | 0);  /* check that STATS_MTPROTO2 is an integer */
+  return n;
+}
+
+static const struct _cffi_global_s _cffi_globals[] = {
+  { "BINDING_CBC", (void *)_cffi_const_BINDING_CBC, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "BINDING_CTR", (void *)_cffi_const_BINDING_CTR, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "BINDING_IGE", (void *)_cffi_const_BINDING_IGE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CDN256_DEFAULT_CHUNK", (void *)_cffi_const_CDN256_DEFAULT_CHUNK, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CDN256_HASH_SIZE", (void *)_cffi_const_CDN256_HASH_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CDN256_OK", (void *)_cffi_const_CDN256_OK, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "CTR256_MAX_PREFETCH", (void *)_cffi_const_CTR256_MAX_PREFETCH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "DRBG_MAX_REQUEST", (void *)_cffi_const_DRBG_MAX_REQUEST, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "DRBG_SEED_SIZE", (void *)_cffi_const_DRBG_SEED_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "EXPANDED_KEY_SIZE", (void *)_cffi_const_EXPANDED_KEY_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "FACTORIZE_NOT_COMPOSITE", (void *)_cffi_const_FACTORIZE_NOT_COMPOSITE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "FACTORIZE_NOT_SEMIPRIME", (void *)_cffi_const_FACTORIZE_NOT_SEMIPRIME, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "FILEMAP_SAME_FILE", (void *)_cffi_const_FILEMAP_SAME_FILE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "FILEMAP_TRUNCATED", (void *)_cffi_const_FILEMAP_TRUNCATED, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "KEYCACHE_MAX_SIZE", (void *)_cffi_const_KEYCACHE_MAX_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "MTPROTO2_AUTH_KEY_ID_MISMATCH", (void *)_cffi_const_MTPROTO2_AUTH_KEY_ID_MISMATCH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "MTPROTO2_HEADER_SIZE", (void *)_cffi_const_MTPROTO2_HEADER_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "MTPROTO2_MSG_KEY_MISMATCH", (void *)_cffi_const_MTPROTO2_MSG_KEY_MISMATCH, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "MTPROTO2_OK", (void *)_cffi_const_MTPROTO2_OK, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "MTPROTO2_RANDOM_ERROR", (void *)_cffi_const_MTPROTO2_RANDOM_ERROR, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_ABRIDGED", (void *)_cffi_const_OBFUSCATED_ABRIDGED, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_BUFFER_SIZE", (void *)_cffi_const_OBFUSCATED_BUFFER_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_HEADER_SIZE", (void *)_cffi_const_OBFUSCATED_HEADER_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_INTERMEDIATE", (void *)_cffi_const_OBFUSCATED_INTERMEDIATE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_MAX_FRAME", (void *)_cffi_const_OBFUSCATED_MAX_FRAME, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "OBFUSCATED_MIN_BUFFER_SIZE", (void *)_cffi_const_OBFUSCATED_MIN_BUFFER_SIZE, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "STATS_BUCKETS", (void *)_cffi_const_STATS_BUCKETS, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "STATS_MTPROTO2", (void *)_cffi_const_STATS_MTPROTO2, _CFFI_OP(_CFFI_OP_CONSTANT_INT, -1), (void *)0 },
+  { "aes256_backend", (void *)_cffi_f_aes256_backend, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 0), (void *)_cffi_d_aes256_backend },
+  { "binding_cbc256", (void *)_cffi_f_binding_cbc256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 197), (void *)_cffi_d_binding_cbc256 },
+  { "binding_cdn256", (void *)_cffi_f_binding_cdn256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 49), (void *)_cffi_d_binding_cdn256 },
+  { "binding_ctr256", (void *)_cffi_f_binding_ctr256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 205), (void *)_cffi_d_binding_ctr256 },
+  { "binding_ctr256_at", (void *)_cffi_f_binding_ctr256_at, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 222), (void *)_cffi_d_binding_ctr256_at },
+  { "binding_ctr_drbg", (void *)_cffi_f_binding_ctr_drbg, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 192), (void *)_cffi_d_binding_ctr_drbg },
+  { "binding_ctr_init", (void *)_cffi_f_binding_ctr_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 106), (void *)_cffi_d_binding_ctr_init },
+  { "binding_ctr_refill", (void *)_cffi_f_binding_ctr_refill, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 69), (void *)_cffi_d_binding_ctr_refill },
+  { "binding_ctr_seek", (void *)_cffi_f_binding_ctr_seek, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 96), (void *)_cffi_d_binding_ctr_seek },
+  { "binding_ctr_update", (void *)_cffi_f_binding_ctr_update, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 100), (void *)_cffi_d_binding_ctr_update },
+  { "binding_ige256", (void *)_cffi_f_binding_ige256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 214), (void *)_cffi_d_binding_ige256 },
+  { "binding_ige256_many", (void *)_cffi_f_binding_ige256_many, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 151), (void *)_cffi_d_binding_ige256_many },
+  { "binding_init", (void *)_cffi_f_binding_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 231), (void *)_cffi_d_binding_init },
+  { "binding_mtproto2", (void *)_cffi_f_binding_mtproto2, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 60), (void *)_cffi_d_binding_mtproto2 },
+  { "binding_obfuscated_decode", (void *)_cffi_f_binding_obfuscated_decode, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 175), (void *)_cffi_d_binding_obfuscated_decode },
+  { "binding_obfuscated_encode", (void *)_cffi_f_binding_obfuscated_encode, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 180), (void *)_cffi_d_binding_obfuscated_encode },
+  { "binding_obfuscated_init", (void *)_cffi_f_binding_obfuscated_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 21), (void *)_cffi_d_binding_obfuscated_init },
+  { "binding_overlaps", (void *)_cffi_f_binding_overlaps, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 43), (void *)_cffi_d_binding_overlaps },
+  { "binding_schedule_cbc256", (void *)_cffi_f_binding_schedule_cbc256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 117), (void *)_cffi_d_binding_schedule_cbc256 },
+  { "binding_schedule_ige256", (void *)_cffi_f_binding_schedule_ige256, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 117), (void *)_cffi_d_binding_schedule_ige256 },
+  { "binding_schedule_init", (void *)_cffi_f_binding_schedule_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 113), (void *)_cffi_d_binding_schedule_init },
+  { "binding_set_stats", (void *)_cffi_f_binding_set_stats, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 158), (void *)_cffi_d_binding_set_stats },
+  { "binding_stream_chunk", (void *)_cffi_f_binding_stream_chunk, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 135), (void *)_cffi_d_binding_stream_chunk },
+  { "binding_stream_clear", (void *)_cffi_f_binding_stream_clear, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 125), (void *)_cffi_d_binding_stream_clear },
+  { "binding_stream_init", (void *)_cffi_f_binding_stream_init, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 141), (void *)_cffi_d_binding_stream_init },
+  { "binding_stream_update", (void *)_cffi_f_binding_stream_update, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 128), (void *)_cffi_d_binding_stream_update },
+  { "cdn256_hash_count", (void *)_cffi_f_cdn256_hash_count, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 86), (void *)_cffi_d_cdn256_hash_count },
+  { "drbg_generate", (void *)_cffi_f_drbg_generate, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 39), (void *)_cffi_d_drbg_generate },
+  { "factorize", (void *)_cffi_f_factorize, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 34), (void *)_cffi_d_factorize },
+  { "filemap_close", (void *)_cffi_f_filemap_close, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 148), (void *)_cffi_d_filemap_close },
+  { "filemap_open_read", (void *)_cffi_f_filemap_open_read, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 5), (void *)_cffi_d_filemap_open_read },
+  { "filemap_open_write", (void *)_cffi_f_filemap_open_write, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 9), (void *)_cffi_d_filemap_open_write },
+  { "filemap_read", (void *)_cffi_f_filemap_read, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 15), (void *)_cffi_d_filemap_read },
+  { "filemap_remove", (void *)_cffi_f_filemap_remove, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 2), (void *)_cffi_d_filemap_remove },
+  { "keycache_clear", (void *)_cffi_f_keycache_clear, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 231), (void *)_cffi_d_keycache_clear },
+  { "keycache_get", (void *)_cffi_f_keycache_get, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 172), (void *)_cffi_d_keycache_get },
+  { "keycache_get_size", (void *)_cffi_f_keycache_get_size, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 90), (void *)_cffi_d_keycache_get_size },
+  { "keycache_set_size", (void *)_cffi_f_keycache_set_size, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 186), (void *)_cffi_d_keycache_set_size },
+  { "mtproto2_packet_size", (void *)_cffi_f_mtproto2_packet_size, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 83), (void *)_cffi_d_mtproto2_packet_size },
+  { "obfuscated_compact", (void *)_cffi_f_obfuscated_compact, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 75), (void *)_cffi_d_obfuscated_compact },
+  { "obfuscated_frame_size", (void *)_cffi_f_obfuscated_frame_size, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 79), (void *)_cffi_d_obfuscated_frame_size },
+  { "obfuscated_next", (void *)_cffi_f_obfuscated_next, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 28), (void *)_cffi_d_obfuscated_next },
+  { "obfuscated_refill", (void *)_cffi_f_obfuscated_refill, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 72), (void *)_cffi_d_obfuscated_refill },
+  { "parallel_get_threads", (void *)_cffi_f_parallel_get_threads, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 92), (void *)_cffi_d_parallel_get_threads },
+  { "parallel_set_threads", (void *)_cffi_f_parallel_set_threads, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_O, 189), (void *)_cffi_d_parallel_set_threads },
+  { "stats_get", (void *)_cffi_f_stats_get, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 167), (void *)_cffi_d_stats_get },
+  { "stats_record", (void *)_cffi_f_stats_record, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_V, 161), (void *)_cffi_d_stats_record },
+  { "stats_reset", (void *)_cffi_f_stats_reset, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 231), (void *)_cffi_d_stats_reset },
+  { "stats_start", (void *)_cffi_f_stats_start, _CFFI_OP(_CFFI_OP_CPYTHON_BLTN_N, 94), (void *)_cffi_d_stats_start },
+};
+
+static const struct _cffi_field_s _cffi_fields[] = {
+  { "buffered", offsetof(binding_stream, buffered),
+                sizeof(((binding_stream *)0)->buffered),
+                _CFFI_OP(_CFFI_OP_NOOP, 24) },
+  { "data", offsetof(filemap, data),
+            sizeof(((filemap *)0)->data),
+            _CFFI_OP(_CFFI_OP_NOOP, 18) },
+  { "size", offsetof(filemap, size),
+            sizeof(((filemap *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "in", offsetof(ige256_job, in),
+          sizeof(((ige256_job *)0)->in),
+          _CFFI_OP(_CFFI_OP_NOOP, 30) },
+  { "out", offsetof(ige256_job, out),
+           sizeof(((ige256_job *)0)->out),
+           _CFFI_OP(_CFFI_OP_NOOP, 18) },
+  { "length", offsetof(ige256_job, length),
+              sizeof(((ige256_job *)0)->length),
+              _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "expandedKey", offsetof(ige256_job, expandedKey),
+                   sizeof(((ige256_job *)0)->expandedKey),
+                   _CFFI_OP(_CFFI_OP_NOOP, 242) },
+  { "iv", offsetof(ige256_job, iv),
+          sizeof(((ige256_job *)0)->iv),
+          _CFFI_OP(_CFFI_OP_NOOP, 30) },
+  { "size", offsetof(keycache_counters, size),
+            sizeof(((keycache_counters *)0)->size),
+            _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "entries", offsetof(keycache_counters, entries),
+               sizeof(((keycache_counters *)0)->entries),
+               _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "hits", offsetof(keycache_counters, hits),
+            sizeof(((keycache_counters *)0)->hits),
+            _CFFI_OP(_CFFI_OP_NOOP, 35) },
+  { "misses", offsetof(keycache_counters, misses),
+              sizeof(((keycache_counters *)0)->misses),
+              _CFFI_OP(_CFFI_OP_NOOP, 35) },
+  { "end", offsetof(obfuscated_codec, end),
+           sizeof(((obfuscated_codec *)0)->end),
+           _CFFI_OP(_CFFI_OP_NOOP, 11) },
+  { "calls", offsetof(stats_counters, calls),
+             sizeof(((stats_counters *)0)->calls),
+             _CFFI_OP(_CFFI_OP_NOOP, 35) },
+  { "bytes", offsetof(stats_counters, bytes),
+             sizeof(((stats_counters *)0)->bytes),
+             _CFFI_OP(_CFFI_OP_NOOP, 35) },
+  { "ns", offsetof(stats_counters, ns),
+          sizeof(((stats_counters *)0)->ns),
+          _CFFI_OP(_CFFI_OP_NOOP, 35) },
+  { "sizes", offsetof(stats_counters, sizes),
+             sizeof(((stats_counters *)0)->sizes),
+             _CFFI_OP(_CFFI_OP_NOOP, 245) },
+};
+
+static const struct _cffi_struct_union_s _cffi_struct_unions[] = {
+  { "$binding_ctr", 233, 0,
+    sizeof(binding_ctr), offsetof(struct _cffi_align_typedef_binding_ctr, y), 0, 0 },
+  { "$binding_schedule", 234, 0,
+    sizeof(binding_schedule), offsetof(struct _cffi_align_typedef_binding_schedule, y), 0, 0 },
+  { "$binding_stream", 235, 0,
+    sizeof(binding_stream), offsetof(struct _cffi_align_typedef_binding_stream, y), 0, 1 },
+  { "$filemap", 237, 0,
+    sizeof(filemap), offsetof(struct _cffi_align_typedef_filemap, y), 1, 2 },
+  { "$ige256_job", 238, _CFFI_F_CHECK_FIELDS,
+    sizeof(ige256_job), offsetof(struct _cffi_align_typedef_ige256_job, y), 3, 5 },
+  { "$keycache_counters", 239, _CFFI_F_CHECK_FIELDS,
+    sizeof(keycache_counters), offsetof(struct _cffi_align_typedef_keycache_counters, y), 8, 4 },
+  { "$obfuscated_codec", 240, 0,
+    sizeof(obfuscated_codec), offsetof(struct _cffi_align_typedef_obfuscated_codec, y), 12, 1 },
+  { "$stats_counters", 241, 0,
+    sizeof(stats_counters), offsetof(struct _cffi_align_typedef_stats_counters, y), 13, 4 },
+};
+
+static const struct _cffi_typename_s _cffi_typenames[] = {
+  { "binding_ctr", 233 },
+  { "binding_schedule", 234 },
+  { "binding_stream", 235 },
+  { "filemap", 237 },
+  { "filemap_char", 236 },
+  { "ige256_job", 238 },
+  { "keycache_counters", 239 },
+  { "obfuscated_codec", 240 },
+  { "stats_counters", 241 },
+};
+
+static const struct _cffi_type_context_s _cffi_type_context = {
+  _cffi_types,
+  _cffi_globals,
+  _cffi_fields,
+  _cffi_struct_unions,
+  NULL,  /* no enums */
+  _cffi_typenames,
+  77,  /* num_globals */
+  8,  /* num_struct_unions */
+  0,  /* num_enums */
+  9,  /* num_typenames */
+  NULL,  /* no includes */
+  248,  /* num_types */
+  0,  /* flags */
+};
+
+#ifdef __GNUC__
+#  pragma GCC visibility push(default)  /* for -fvisibility= */
+#endif
+
+#ifdef PYPY_VERSION
+PyMODINIT_FUNC
+_cffi_pypyinit__tgcrypto_cffi(const void *p[])
+{
+    p[0] = (const void *)0x2601;
+    p[1] = &_cffi_type_context;
+    return NULL;
+}
+#  ifdef _MSC_VER
+     PyMODINIT_FUNC
+     PyInit__tgcrypto_cffi(void) { return NULL; }
+#  endif
+#else
+PyMODINIT_FUNC
+PyInit__tgcrypto_cffi(void)
+{
+  return _cffi_init("tgcrypto._tgcrypto_cffi", 0x2601, &_cffi_type_context);
+}
+#endif
+
+#ifdef __GNUC__
+#  pragma GCC visibility pop
+#endif
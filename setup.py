@@ -16,11 +16,19 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import platform
+
 from setuptools import setup, Extension, find_packages
 
 with open("README.md", encoding="utf-8") as f:
     readme = f.read()
 
+extra = {}
+
+# PyPy reaches the C-API extension through cpyext only, so the CFFI binding is built alongside it
+if platform.python_implementation() == "PyPy":
+    extra.update(setup_requires=["cffi>=1.12"], cffi_modules=["tgcrypto/_cffi_build.py:ffi"])
+
 setup(
     name="TgCrypto",
     version="1.2.5",
@@ -69,14 +77,29 @@ setup(
     zip_safe=False,
     ext_modules=[
         Extension(
-            "tgcrypto",
+            "tgcrypto._tgcrypto",
             sources=[
                 "tgcrypto/tgcrypto.c",
                 "tgcrypto/aes256.c",
+                "tgcrypto/aesni256.c",
+                "tgcrypto/ssse3256.c",
                 "tgcrypto/ige256.c",
                 "tgcrypto/ctr256.c",
-                "tgcrypto/cbc256.c"
+                "tgcrypto/cbc256.c",
+                "tgcrypto/parallel.c",
+                "tgcrypto/sha256.c",
+                "tgcrypto/urandom.c",
+                "tgcrypto/drbg.c",
+                "tgcrypto/mtproto2.c",
+                "tgcrypto/factorize.c",
+                "tgcrypto/filemap.c",
+                "tgcrypto/pool.c",
+                "tgcrypto/stats.c",
+                "tgcrypto/keycache.c",
+                "tgcrypto/obfuscated.c",
+                "tgcrypto/cdn256.c"
             ]
         )
-    ]
+    ],
+    **extra
 )
@@ -0,0 +1,187 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import threading
+import unittest
+
+import tgcrypto
+import tgcrypto.aio
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestAio(unittest.TestCase):
+    DATA_SIZE = 256 * 1024
+
+    def setUp(self):
+        self.threshold = tgcrypto.aio.get_inline_threshold()
+
+    def tearDown(self):
+        tgcrypto.aio.set_inline_threshold(self.threshold)
+
+    def check_all(self, size):
+        data = os.urandom(size)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+
+        async def main():
+            self.assertEqual(await tgcrypto.aio.ige256_encrypt(data, key, iv), tgcrypto.ige256_encrypt(data, key, iv))
+            self.assertEqual(await tgcrypto.aio.ige256_decrypt(data, key, iv), tgcrypto.ige256_decrypt(data, key, iv))
+
+            self.assertEqual(
+                await tgcrypto.aio.ctr256_encrypt(data, key, bytearray(iv[:16]), bytes(1)),
+                tgcrypto.ctr256_encrypt(data, key, bytearray(iv[:16]), bytes(1))
+            )
+            self.assertEqual(
+                await tgcrypto.aio.ctr256_decrypt(data, key, bytearray(iv[:16]), bytes(1)),
+                tgcrypto.ctr256_decrypt(data, key, bytearray(iv[:16]), bytes(1))
+            )
+
+            self.assertEqual(
+                await tgcrypto.aio.cbc256_encrypt(data, key, bytearray(iv[:16])),
+                tgcrypto.cbc256_encrypt(data, key, bytearray(iv[:16]))
+            )
+            self.assertEqual(
+                await tgcrypto.aio.cbc256_decrypt(data, key, bytearray(iv[:16])),
+                tgcrypto.cbc256_decrypt(data, key, bytearray(iv[:16]))
+            )
+
+        run(main())
+
+    def test_aio_pool(self):
+        tgcrypto.aio.set_inline_threshold(0)
+        self.check_all(self.DATA_SIZE)
+
+    def test_aio_inline(self):
+        tgcrypto.aio.set_inline_threshold(self.DATA_SIZE * 2)
+        self.check_all(self.DATA_SIZE)
+
+    def test_aio_concurrent(self):
+        tgcrypto.aio.set_inline_threshold(0)
+        items = [(os.urandom(16 * (i + 1) * 64), os.urandom(32), os.urandom(32)) for i in range(64)]
+
+        async def main():
+            return await asyncio.gather(*(tgcrypto.aio.ige256_encrypt(*item) for item in items))
+
+        self.assertEqual(run(main()), [tgcrypto.ige256_encrypt(*item) for item in items])
+
+    def test_aio_updates_iv(self):
+        tgcrypto.aio.set_inline_threshold(0)
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        sync_iv, aio_iv = bytearray(iv), bytearray(iv)
+        sync_state, aio_state = bytearray(1), bytearray(1)
+
+        tgcrypto.ctr256_encrypt(data[:-1], key, sync_iv, sync_state)
+        run(tgcrypto.aio.ctr256_encrypt(data[:-1], key, aio_iv, aio_state))
+
+        self.assertEqual(aio_iv, sync_iv)
+        self.assertEqual(aio_state, sync_state)
+
+    def test_aio_loops_in_threads(self):
+        tgcrypto.aio.set_inline_threshold(0)
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+        expected = tgcrypto.ige256_encrypt(data, key, iv)
+        results = []
+
+        async def main():
+            return await asyncio.gather(*(tgcrypto.aio.ige256_encrypt(data, key, iv) for _ in range(8)))
+
+        threads = [threading.Thread(target=lambda: results.extend(run(main()))) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [expected] * 32)
+
+    def test_aio_cancelled(self):
+        tgcrypto.aio.set_inline_threshold(0)
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+
+        async def main():
+            task = asyncio.ensure_future(tgcrypto.aio.ige256_encrypt(data, key, iv))
+            await asyncio.sleep(0)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return await tgcrypto.aio.ige256_encrypt(data, key, iv)
+
+        self.assertEqual(run(main()), tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_aio_closed_loop(self):
+        if tgcrypto.aio._binding._completion_fd() is None:
+            self.skipTest("requires the worker pool")
+
+        tgcrypto.aio.set_inline_threshold(0)
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+        errors = []
+
+        closed = asyncio.new_event_loop()
+        orphan = closed.create_future()
+        closed.close()
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+            # The completion of a closed loop's job is skipped, the ones drained along with it still resolve
+            tgcrypto.aio._watch(loop)
+            tgcrypto.aio._binding._submit("ige256_encrypt", orphan, data, key, iv)
+
+            return await tgcrypto.aio.ige256_encrypt(data, key, iv)
+
+        self.assertEqual(run(main()), tgcrypto.ige256_encrypt(data, key, iv))
+        self.assertEqual(errors, [])
+        self.assertFalse(orphan.done())
+
+    def test_aio_invalid_args(self):
+        tgcrypto.aio.set_inline_threshold(0)
+
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 16 bytes"):
+            run(tgcrypto.aio.ige256_encrypt(os.urandom(17), os.urandom(32), os.urandom(32)))
+
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 16 bytes"):
+            run(tgcrypto.aio.cbc256_encrypt(os.urandom(16), os.urandom(32), os.urandom(32)))
+
+        with self.assertRaisesRegex(ValueError, r"State value must be in the range \[0, 15\]"):
+            run(tgcrypto.aio.ctr256_encrypt(os.urandom(16), os.urandom(32), os.urandom(16), bytes([16])))
+
+    def test_aio_inline_threshold_negative(self):
+        with self.assertRaisesRegex(ValueError, r"Inline threshold must not be negative"):
+            tgcrypto.aio.set_inline_threshold(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import platform
+import subprocess
+import sys
+import unittest
+
+import tgcrypto
+
+SCRIPT = """
+import random
+
+import tgcrypto
+
+key = bytes(range(32))
+iv = bytes(range(32, 64))
+data = bytes(range(256)) * 4
+
+print(tgcrypto.backend())
+print(tgcrypto.ige256_encrypt(data, key, iv).hex())
+print(tgcrypto.ige256_decrypt(data, key, iv).hex())
+print(tgcrypto.ctr256_encrypt(data, key, bytearray(iv[:16]), bytes(1)).hex())
+print(tgcrypto.cbc256_encrypt(data, key, bytearray(iv[:16])).hex())
+print(tgcrypto.cbc256_decrypt(data, key, bytearray(iv[:16])).hex())
+
+# Key schedules of random keys, and block counts that do not fill the interleaved rounds
+rng = random.Random(0)
+
+for blocks in range(1, 20):
+    key = bytes(rng.getrandbits(8) for _ in range(32))
+    data = bytes(rng.getrandbits(8) for _ in range(blocks * 16))
+
+    print(tgcrypto.ige256_decrypt(data, key, iv).hex())
+    print(tgcrypto.ctr256_encrypt(data, key, bytearray(iv[:16]), bytes(1)).hex())
+    print(tgcrypto.cbc256_decrypt(data, key, bytearray(iv[:16])).hex())
+"""
+
+X86 = platform.machine().lower() in ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+def run(backend):
+    path = os.path.dirname(os.path.dirname(os.path.abspath(tgcrypto.__file__)))
+    env = dict(os.environ, PYTHONPATH=path)
+    env.pop("TGCRYPTO_BACKEND", None)
+
+    if backend is not None:
+        env["TGCRYPTO_BACKEND"] = backend
+
+    return subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=path,
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True
+    ).stdout.split()
+
+
+class TestBackend(unittest.TestCase):
+    def test_backend_name(self):
+        self.assertIn(tgcrypto.backend(), ("aesni", "ssse3", "portable"))
+
+    def test_backend_forced_portable(self):
+        self.assertEqual(run("portable")[0], "portable")
+
+    @unittest.skipUnless(X86, "SSSE3 is only available on x86")
+    def test_backend_forced_ssse3(self):
+        self.assertEqual(run("ssse3")[0], "ssse3")
+
+    def test_backend_unknown_falls_back(self):
+        self.assertIn(run("unknown")[0], ("aesni", "ssse3", "portable"))
+
+    def test_backends_agree(self):
+        self.assertEqual(run(None)[1:], run("portable")[1:])
+        self.assertEqual(run("ssse3")[1:], run("portable")[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
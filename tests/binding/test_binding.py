@@ -0,0 +1,201 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import importlib.util
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import tgcrypto
+from tgcrypto import _tgcrypto
+
+if importlib.util.find_spec("tgcrypto._tgcrypto_cffi") is not None:
+    from tgcrypto import _cffi
+else:
+    _cffi = None
+
+PATH = os.path.dirname(os.path.dirname(os.path.abspath(tgcrypto.__file__)))
+
+
+@unittest.skipIf(_cffi is None, "the CFFI binding is not built")
+class TestBindingSelection(unittest.TestCase):
+    def binding(self, value):
+        result = subprocess.run(
+            [sys.executable, "-c", "import tgcrypto; print(tgcrypto._binding.__name__)"],
+            cwd=PATH,
+            env=dict(os.environ, PYTHONPATH=PATH, TGCRYPTO_BINDING=value),
+            stdout=subprocess.PIPE,
+            check=True,
+            universal_newlines=True
+        )
+
+        return result.stdout.strip()
+
+    def test_capi(self):
+        self.assertEqual(self.binding("capi"), "tgcrypto._tgcrypto")
+
+    def test_cffi(self):
+        self.assertEqual(self.binding("cffi"), "tgcrypto._cffi")
+
+    def test_default(self):
+        expected = "tgcrypto._cffi" if sys.implementation.name == "pypy" else "tgcrypto._tgcrypto"
+        self.assertEqual(self.binding(""), expected)
+
+    def test_same_names(self):
+        names = {name for name in dir(_tgcrypto) if not name.startswith("_")}
+        self.assertEqual(set(_cffi.__all__), names)
+
+
+@unittest.skipIf(_cffi is None, "the CFFI binding is not built")
+class TestBindingParity(unittest.TestCase):
+    # Both bindings are loaded side by side and must give the same results for the same inputs
+
+    def test_stateless(self):
+        # CBC writes the last block back into the IV, so each call gets a fresh copy
+        key, iv32, iv16 = os.urandom(32), os.urandom(32), os.urandom(16)
+
+        for size in (16, 64, 1024, 1024 * 1024 + 16):
+            data = os.urandom(size)
+
+            for name, args in (
+                ("ige256_encrypt", (data, key, iv32)),
+                ("ige256_decrypt", (data, key, iv32)),
+                ("cbc256_encrypt", (data, key, iv16)),
+                ("cbc256_decrypt", (data, key, iv16)),
+                ("ctr256_encrypt_at", (data, key, iv16, 12345)),
+            ):
+                with self.subTest(name=name, size=size):
+                    self.assertEqual(
+                        getattr(_cffi, name)(*(bytearray(arg) if arg is iv16 else arg for arg in args)),
+                        getattr(_tgcrypto, name)(*(bytearray(arg) if arg is iv16 else arg for arg in args))
+                    )
+
+    def test_ctr_state(self):
+        key, iv = os.urandom(32), os.urandom(16)
+        ivs, states = [bytearray(iv), bytearray(iv)], [bytearray(1), bytearray(1)]
+
+        for size in (1, 15, 16, 33, 4096):
+            data = os.urandom(size)
+
+            self.assertEqual(
+                _cffi.ctr256_encrypt(data, key, ivs[0], states[0]),
+                _tgcrypto.ctr256_encrypt(data, key, ivs[1], states[1])
+            )
+            self.assertEqual(ivs[0], ivs[1])
+            self.assertEqual(states[0], states[1])
+
+    def test_into_memoryview(self):
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+        buffer = bytearray(96)
+
+        self.assertEqual(_cffi.ige256_encrypt_into(data, key, iv, memoryview(buffer)[16:80]), 64)
+        self.assertEqual(bytes(buffer[16:80]), _tgcrypto.ige256_encrypt(data, key, iv))
+        self.assertEqual(buffer[:16] + buffer[80:], bytearray(32))
+
+    def test_many(self):
+        items = [(os.urandom(16 * n), os.urandom(32), os.urandom(32)) for n in range(1, 10)]
+
+        self.assertEqual(_cffi.ige256_encrypt_many(items), _tgcrypto.ige256_encrypt_many(items))
+        self.assertEqual(_cffi.ige256_decrypt_many(items), _tgcrypto.ige256_decrypt_many(items))
+
+    def test_contexts(self):
+        key, iv32, iv16 = os.urandom(32), os.urandom(32), os.urandom(16)
+        data = os.urandom(1000)
+        streams = [(module.AES256IGE(key, iv32), module.AES256CBC(key, iv16), module.AES256CTR(key, iv16))
+                   for module in (_cffi, _tgcrypto)]
+
+        for a, b in zip(*streams):
+            self.assertEqual(a.update(data[:7]) + a.update(data[7:992]), b.update(data[:992]))
+
+        self.assertEqual(_cffi.IGE256(key).decrypt(data[:992], iv32), _tgcrypto.IGE256(key).decrypt(data[:992], iv32))
+        self.assertEqual(_cffi.CBC256(key).encrypt(data[:992], iv16), _tgcrypto.CBC256(key).encrypt(data[:992], iv16))
+
+    def test_cbc_iv(self):
+        key, data = os.urandom(32), os.urandom(64)
+        iv = os.urandom(16)
+        ivs = [bytearray(iv), bytearray(iv)]
+
+        self.assertEqual(_cffi.cbc256_encrypt(data, key, ivs[0]), _tgcrypto.cbc256_encrypt(data, key, ivs[1]))
+        self.assertEqual(ivs[0], ivs[1])
+
+    def test_mtproto2(self):
+        auth_key, auth_key_id = os.urandom(256), os.urandom(8)
+        payload = os.urandom(28) + struct.pack("<I", 100) + os.urandom(100)
+
+        for encrypt, decrypt in ((_cffi, _tgcrypto), (_tgcrypto, _cffi)):
+            packet = encrypt.mtproto2_encrypt(auth_key, auth_key_id, payload, True)
+            self.assertEqual(decrypt.mtproto2_decrypt(auth_key, auth_key_id, packet, False)[:len(payload)], payload)
+
+    def test_factorize(self):
+        self.assertEqual(_cffi.factorize(0x17ED48941A08F981), _tgcrypto.factorize(0x17ED48941A08F981))
+
+    def test_file(self):
+        key, iv = os.urandom(32), os.urandom(16)
+
+        with tempfile.TemporaryDirectory() as directory:
+            src, a, b = (os.path.join(directory, name) for name in ("src", "a", "b"))
+
+            with open(src, "wb") as f:
+                f.write(os.urandom(100000))
+
+            self.assertEqual(_cffi.encrypt_file("ctr", src, a, key, iv, chunk_size=4096), 100000)
+            _tgcrypto.encrypt_file("ctr", src, b, key, iv)
+
+            with open(a, "rb") as f, open(b, "rb") as g:
+                self.assertEqual(f.read(), g.read())
+
+            with self.assertRaises(FileNotFoundError):
+                _cffi.encrypt_file("ctr", os.path.join(directory, "missing"), a, key, iv)
+
+    def test_errors(self):
+        key, iv = os.urandom(32), os.urandom(32)
+
+        for name, args, kwargs in (
+            ("ige256_encrypt", (b"", key, iv), {}),
+            ("ige256_encrypt", (os.urandom(15), key, iv), {}),
+            ("ige256_encrypt", (os.urandom(16), key), {}),
+            ("ige256_encrypt", (os.urandom(16), key), {"nonce": iv}),
+            ("ige256_encrypt", (os.urandom(16), key), {"data": iv}),
+            ("ige256_encrypt", (1, 2, 3), {}),
+            ("ige256_encrypt_into", (os.urandom(16), key, iv, bytes(16)), {}),
+            ("ige256_encrypt_into", (os.urandom(32), key, iv, bytearray(16)), {}),
+            ("ctr256_encrypt", (os.urandom(16), key, iv[:16], b"\x10"), {}),
+            ("ctr256_encrypt_at", (os.urandom(16), key, iv[:16], -1), {}),
+            ("ctr256_encrypt_at", (os.urandom(16), key, iv[:16], 1 << 64), {}),
+            ("mtproto2_decrypt", (os.urandom(256), os.urandom(8), os.urandom(40), True), {}),
+            ("factorize", (7,), {}),
+            ("random_bytes", (-1,), {}),
+            ("set_threads", (-1,), {}),
+        ):
+            with self.subTest(name=name, args=len(args), kwargs=list(kwargs)):
+                errors = []
+
+                for module in (_cffi, _tgcrypto):
+                    with self.assertRaises(Exception) as context:
+                        getattr(module, name)(*args, **kwargs)
+
+                    errors.append((type(context.exception), str(context.exception)))
+
+                self.assertEqual(errors[0], errors[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
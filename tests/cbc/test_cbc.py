@@ -221,5 +221,191 @@ class TestCBC256Random(unittest.TestCase):
         )
 
 
+class TestCBC256Context(unittest.TestCase):
+    def test_cbc256_context_matches_functions(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 64) * 16)
+            key = os.urandom(32)
+            iv = os.urandom(16)
+
+            cbc = tgcrypto.CBC256(key)
+            encrypted = cbc.encrypt(data, iv)
+
+            self.assertEqual(encrypted, tgcrypto.cbc256_encrypt(data, key, bytearray(iv)))
+            self.assertEqual(cbc.decrypt(encrypted, iv), data)
+
+    def test_cbc256_context_keeps_iv(self):
+        iv = bytearray(os.urandom(16))
+        iv_copy = iv.copy()
+
+        tgcrypto.CBC256(os.urandom(32)).encrypt(os.urandom(64), iv)
+
+        self.assertEqual(iv, iv_copy)
+
+    def test_cbc256_context_invalid_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.CBC256(os.urandom(31))
+
+    def test_cbc256_context_empty_data(self):
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.CBC256(os.urandom(32)).encrypt(b"", os.urandom(16))
+
+    def test_cbc256_context_invalid_data_size(self):
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 16 bytes"):
+            tgcrypto.CBC256(os.urandom(32)).decrypt(os.urandom(15), os.urandom(16))
+
+    def test_cbc256_context_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 16 bytes"):
+            tgcrypto.CBC256(os.urandom(32)).encrypt(os.urandom(16), os.urandom(15))
+
+
+class TestCBC256Threads(unittest.TestCase):
+    DATA_SIZE = 4 * 1024 * 1024 + 16 * 7
+
+    def tearDown(self):
+        tgcrypto.set_threads(0)
+
+    def test_cbc256_decrypt_threads(self):
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        tgcrypto.set_threads(1)
+        serial_iv = bytearray(iv)
+        serial = tgcrypto.cbc256_decrypt(data, key, serial_iv)
+
+        for threads in (2, 3, 8):
+            tgcrypto.set_threads(threads)
+            threaded_iv = bytearray(iv)
+
+            self.assertEqual(tgcrypto.cbc256_decrypt(data, key, threaded_iv), serial)
+            self.assertEqual(threaded_iv, serial_iv)
+
+    def test_cbc256_decrypt_threads_roundtrip(self):
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        tgcrypto.set_threads(4)
+        cbc = tgcrypto.CBC256(key)
+
+        self.assertEqual(cbc.decrypt(cbc.encrypt(data, iv), iv), data)
+
+    def test_set_threads(self):
+        tgcrypto.set_threads(3)
+        self.assertEqual(tgcrypto.get_threads(), 3)
+
+        tgcrypto.set_threads(threads=2)
+        self.assertEqual(tgcrypto.get_threads(), 2)
+
+        tgcrypto.set_threads(0)
+        self.assertGreaterEqual(tgcrypto.get_threads(), 1)
+
+    def test_set_threads_negative(self):
+        with self.assertRaisesRegex(ValueError, r"Threads count must not be negative"):
+            tgcrypto.set_threads(-1)
+
+
+class TestCBC256Into(unittest.TestCase):
+    def test_cbc256_encrypt_into(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        out = bytearray(len(data))
+
+        self.assertEqual(tgcrypto.cbc256_encrypt_into(data, key, bytearray(iv), out), len(data))
+        self.assertEqual(out, tgcrypto.cbc256_encrypt(data, key, bytearray(iv)))
+
+    def test_cbc256_in_place(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        buffer = bytearray(data)
+
+        tgcrypto.cbc256_encrypt_into(buffer, key, bytearray(iv), buffer)
+        self.assertEqual(buffer, tgcrypto.cbc256_encrypt(data, key, bytearray(iv)))
+
+        tgcrypto.cbc256_decrypt_into(buffer, key, bytearray(iv), buffer)
+        self.assertEqual(buffer, data)
+
+    def test_cbc256_in_place_threads(self):
+        data = os.urandom(4 * 1024 * 1024)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        buffer = bytearray(tgcrypto.cbc256_encrypt(data, key, bytearray(iv)))
+
+        tgcrypto.set_threads(4)
+
+        try:
+            tgcrypto.cbc256_decrypt_into(buffer, key, bytearray(iv), buffer)
+        finally:
+            tgcrypto.set_threads(0)
+
+        self.assertEqual(buffer, data)
+
+    def test_cbc256_context_into(self):
+        data = os.urandom(1024)
+        iv = os.urandom(16)
+        cbc = tgcrypto.CBC256(os.urandom(32))
+        out = bytearray(len(data))
+
+        self.assertEqual(cbc.encrypt_into(data, iv, out), len(data))
+        self.assertEqual(cbc.decrypt(out, iv), data)
+
+    def test_cbc256_into_small_buffer(self):
+        with self.assertRaisesRegex(ValueError, r"Output buffer must be at least as large as data"):
+            tgcrypto.cbc256_decrypt_into(os.urandom(32), os.urandom(32), os.urandom(16), bytearray(16))
+
+
+class TestAES256CBC(unittest.TestCase):
+    def test_aes256cbc_matches_cbc256(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 64) * 16)
+            key = os.urandom(32)
+            iv = os.urandom(16)
+            cut = random.randint(0, len(data))
+
+            encryptor = tgcrypto.AES256CBC(key, iv)
+            encrypted = encryptor.update(data[:cut]) + encryptor.update(data[cut:]) + encryptor.finalize()
+
+            self.assertEqual(encrypted, tgcrypto.cbc256_encrypt(data, key, bytearray(iv)))
+
+            decryptor = tgcrypto.AES256CBC(key, iv, encrypt=False)
+            decrypted = decryptor.update(encrypted[:cut]) + decryptor.update(encrypted[cut:]) + decryptor.finalize()
+
+            self.assertEqual(decrypted, data)
+
+    def test_aes256cbc_keeps_iv(self):
+        iv = bytearray(os.urandom(16))
+        copy = iv.copy()
+
+        tgcrypto.AES256CBC(os.urandom(32), iv).update(os.urandom(64))
+
+        self.assertEqual(iv, copy)
+
+    def test_aes256cbc_decrypt_threads(self):
+        data = os.urandom(4 * 1024 * 1024)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        encrypted = tgcrypto.cbc256_encrypt(data, key, bytearray(iv))
+
+        try:
+            tgcrypto.set_threads(4)
+            cbc = tgcrypto.AES256CBC(key, iv, encrypt=False)
+
+            self.assertEqual(cbc.update(encrypted[:3]) + cbc.update(encrypted[3:]), data)
+        finally:
+            tgcrypto.set_threads(0)
+
+    def test_aes256cbc_invalid_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.AES256CBC(os.urandom(31), os.urandom(16))
+
+    def test_aes256cbc_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 16 bytes"):
+            tgcrypto.AES256CBC(os.urandom(32), os.urandom(32))
+
+
 if __name__ == "__main__":
     unittest.main()
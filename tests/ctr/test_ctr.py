@@ -16,6 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import hashlib
 import os
 import random
 import unittest
@@ -166,6 +167,18 @@ class TestCTR256Input(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, r"State value must be in the range \[0, 15\]"):
             tgcrypto.ctr256_decrypt(os.urandom(8), os.urandom(32), os.urandom(16), bytes([16]))
 
+    def test_ctr256_keywords(self):
+        data, key, iv = os.urandom(64), os.urandom(32), os.urandom(16)
+        encrypted = tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1))
+
+        self.assertEqual(tgcrypto.ctr256_encrypt(data=data, key=key, iv=bytearray(iv), state=bytes(1)), encrypted)
+        self.assertEqual(tgcrypto.ctr256_decrypt(encrypted, key, state=bytes(1), iv=bytearray(iv)), data)
+        self.assertEqual(tgcrypto.ctr256_decrypt_at(encrypted, key, iv, offset=0), data)
+
+    def test_ctr256_decrypt_unexpected_keyword(self):
+        with self.assertRaisesRegex(TypeError, r"ctr256_decrypt\(\) got an unexpected keyword argument 'counter'"):
+            tgcrypto.ctr256_decrypt(os.urandom(16), os.urandom(32), bytearray(16), counter=bytes(1))
+
 
 class TestCTR256Random(unittest.TestCase):
     DATA_MAX_SIZE = 1024
@@ -216,5 +229,488 @@ class TestCTR256Random(unittest.TestCase):
         )
 
 
+class TestAES256CTR(unittest.TestCase):
+    # https://csrc.nist.gov/CSRC/media/Projects/Cryptographic-Standards-and-Guidelines/documents/examples/AES_CTR.pdf
+
+    KEY = bytes.fromhex("603DEB1015CA71BE2B73AEF0857D77811F352C073B6108D72D9810A30914DFF4")
+    IV = bytes.fromhex("F0F1F2F3F4F5F6F7F8F9FAFBFCFDFEFF")
+
+    PLAINTEXT = bytes.fromhex(
+        "6BC1BEE22E409F96E93D7E117393172AAE2D8A571E03AC9C9EB76FAC45AF8E51"
+        "30C81C46A35CE411E5FBC1191A0A52EFF69F2445DF4F9B17AD2B417BE66C3710"
+    )
+
+    CIPHERTEXT = bytes.fromhex(
+        "601EC313775789A5B7A7F504BBF3D228F443E3CA4D62B59ACA84E990CACAF5C5"
+        "2B0930DAA23DE94CE87017BA2D84988DDFC9C58DB67AADA613C2DD08457941A6"
+    )
+
+    def test_aes256ctr_update(self):
+        self.assertEqual(tgcrypto.AES256CTR(self.KEY, self.IV).update(self.PLAINTEXT), self.CIPHERTEXT)
+
+    def test_aes256ctr_update_chunks(self):
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV)
+        chunks = [self.PLAINTEXT[i:i + 7] for i in range(0, len(self.PLAINTEXT), 7)]
+
+        self.assertEqual(b"".join(ctr.update(chunk) for chunk in chunks), self.CIPHERTEXT)
+
+    def test_aes256ctr_update_into(self):
+        out = bytearray(len(self.CIPHERTEXT))
+
+        self.assertEqual(tgcrypto.AES256CTR(self.KEY, self.IV).update_into(self.CIPHERTEXT, out), len(out))
+        self.assertEqual(out, self.PLAINTEXT)
+
+    def test_aes256ctr_update_empty(self):
+        self.assertEqual(tgcrypto.AES256CTR(self.KEY, self.IV).update(b""), b"")
+
+    def test_aes256ctr_matches_ctr256(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 1024))
+            key = os.urandom(32)
+            iv = os.urandom(16)
+
+            ctr = tgcrypto.AES256CTR(key, iv)
+            cut = random.randint(0, len(data))
+
+            self.assertEqual(
+                ctr.update(data[:cut]) + ctr.update(data[cut:]),
+                tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1))
+            )
+
+    def test_aes256ctr_bulk_matches_bytewise(self):
+        data = os.urandom(4096 + 7)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        ctr = tgcrypto.AES256CTR(key, iv)
+        bytewise = b"".join(ctr.update(data[i:i + 1]) for i in range(len(data)))
+
+        self.assertEqual(tgcrypto.AES256CTR(key, iv).update(data), bytewise)
+
+    def test_aes256ctr_seek(self):
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV)
+        ctr.update(self.PLAINTEXT[:50])
+
+        for offset in (0, 5, 16, 37, 63):
+            ctr.seek(offset)
+            self.assertEqual(ctr.update(self.PLAINTEXT[offset:]), self.CIPHERTEXT[offset:])
+
+    def test_aes256ctr_seek_negative(self):
+        with self.assertRaisesRegex(ValueError, r"Offset must not be negative"):
+            tgcrypto.AES256CTR(self.KEY, self.IV).seek(-1)
+
+    def test_aes256ctr_invalid_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.AES256CTR(os.urandom(31), os.urandom(16))
+
+    def test_aes256ctr_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 16 bytes"):
+            tgcrypto.AES256CTR(os.urandom(32), os.urandom(15))
+
+    def test_aes256ctr_update_into_small_buffer(self):
+        with self.assertRaisesRegex(ValueError, r"Output buffer must be at least as large as data"):
+            tgcrypto.AES256CTR(os.urandom(32), os.urandom(16)).update_into(os.urandom(16), bytearray(15))
+
+
+class TestAES256CTRPrefetch(unittest.TestCase):
+    KEY = TestAES256CTR.KEY
+    IV = TestAES256CTR.IV
+    PLAINTEXT = TestAES256CTR.PLAINTEXT
+    CIPHERTEXT = TestAES256CTR.CIPHERTEXT
+
+    def test_aes256ctr_prefetch_nist(self):
+        chunks = [self.PLAINTEXT[i:i + 7] for i in range(0, len(self.PLAINTEXT), 7)]
+
+        for prefetch in (1, 16, 40, 64, 1000):
+            ctr = tgcrypto.AES256CTR(self.KEY, self.IV, prefetch)
+            ctr.refill()
+            result = b""
+
+            for chunk in chunks:
+                result += ctr.update(chunk)
+                ctr.refill()
+
+            self.assertEqual(result, self.CIPHERTEXT)
+
+    def test_aes256ctr_prefetch_matches_ctr256(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 4096))
+            key = os.urandom(32)
+            iv = os.urandom(16)
+
+            ctr = tgcrypto.AES256CTR(key, iv, prefetch=random.randint(1, 1024))
+            result = b""
+            position = 0
+
+            while position < len(data):
+                if random.random() < 0.5:
+                    ctr.refill()
+
+                size = random.randint(1, 300)
+                result += ctr.update(data[position:position + size])
+                position += size
+
+            self.assertEqual(result, tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1)))
+
+    def test_aes256ctr_prefetch_refill(self):
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV, 100)
+
+        self.assertEqual(ctr.refill(), 100)
+        self.assertEqual(ctr.refill(), 0)
+
+        ctr.update(bytes(30))
+        self.assertEqual(ctr.refill(), 30)
+
+        ctr.update(bytes(130))
+        self.assertEqual(ctr.refill(), 100)
+
+    def test_aes256ctr_prefetch_disabled(self):
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV)
+
+        self.assertEqual(ctr.refill(), 0)
+        self.assertEqual(ctr.update(self.PLAINTEXT), self.CIPHERTEXT)
+
+    def test_aes256ctr_prefetch_seek(self):
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV, 48)
+        ctr.refill()
+        ctr.update(self.PLAINTEXT[:20])
+
+        for offset in (0, 5, 16, 37, 63):
+            ctr.refill()
+            ctr.seek(offset)
+            self.assertEqual(ctr.update(self.PLAINTEXT[offset:]), self.CIPHERTEXT[offset:])
+
+    def test_aes256ctr_prefetch_large(self):
+        # Past the prefetched keystream, large updates are split across threads as usual
+        data = os.urandom(4 * 1024 * 1024 + 5)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        ctr = tgcrypto.AES256CTR(key, iv, 1000)
+        ctr.refill()
+
+        self.assertEqual(ctr.update(data), tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1)))
+
+    def test_aes256ctr_prefetch_update_into(self):
+        data = os.urandom(1000)
+        buffer = bytearray(data)
+
+        ctr = tgcrypto.AES256CTR(self.KEY, self.IV, 512)
+        ctr.refill()
+        ctr.update_into(buffer, buffer)
+
+        self.assertEqual(buffer, tgcrypto.AES256CTR(self.KEY, self.IV).update(data))
+
+    def test_aes256ctr_prefetch_invalid(self):
+        for prefetch in (-1, 16 * 1024 * 1024 + 1):
+            with self.assertRaisesRegex(ValueError, r"Prefetch size must be in the range \[0, 16777216\]"):
+                tgcrypto.AES256CTR(self.KEY, self.IV, prefetch)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.AES256CTR(self.KEY, self.IV, "16")
+
+
+class TestCTR256At(unittest.TestCase):
+    def test_ctr256_decrypt_at(self):
+        data = os.urandom(4096 + 7)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        encrypted = tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1))
+
+        for _ in range(100):
+            start = random.randint(0, len(data) - 1)
+            end = random.randint(start + 1, len(data))
+
+            self.assertEqual(tgcrypto.ctr256_decrypt_at(encrypted[start:end], key, iv, start), data[start:end])
+            self.assertEqual(tgcrypto.ctr256_encrypt_at(data[start:end], key, iv, start), encrypted[start:end])
+
+    def test_ctr256_decrypt_at_keeps_iv(self):
+        iv = bytearray(os.urandom(16))
+        copy = iv.copy()
+
+        tgcrypto.ctr256_decrypt_at(os.urandom(100), os.urandom(32), iv, 1000)
+
+        self.assertEqual(iv, copy)
+
+    def test_ctr256_decrypt_at_cdn(self):
+        # CDN parts put the block index, offset / 16, into the last 4 bytes of the IV
+        data = os.urandom(4 * 128 * 1024)
+        key = os.urandom(32)
+        iv = os.urandom(12) + bytes(4)
+
+        encrypted = tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1))
+
+        for offset in range(0, len(data), 128 * 1024):
+            part_iv = iv[:12] + (offset // 16).to_bytes(4, "big")
+            part = encrypted[offset:offset + 128 * 1024]
+
+            self.assertEqual(
+                tgcrypto.ctr256_decrypt_at(part, key, iv, offset),
+                tgcrypto.ctr256_decrypt(part, key, bytearray(part_iv), bytes(1))
+            )
+
+    def test_ctr256_decrypt_at_counter_carry(self):
+        data = os.urandom(64)
+        key = os.urandom(32)
+        iv = bytes(4) + b"\xff" * 12
+
+        for offset in (17, 2 ** 40 + 3, 2 ** 64 - 16):
+            counter = ((int.from_bytes(iv, "big") + offset // 16) % 2 ** 128).to_bytes(16, "big")
+
+            self.assertEqual(
+                tgcrypto.ctr256_decrypt_at(data, key, iv, offset),
+                tgcrypto.ctr256_decrypt(data, key, bytearray(counter), bytes([offset % 16]))
+            )
+
+    def test_ctr256_decrypt_at_invalid_offset(self):
+        with self.assertRaisesRegex(ValueError, r"Offset must not be negative"):
+            tgcrypto.ctr256_decrypt_at(os.urandom(16), os.urandom(32), os.urandom(16), -1)
+
+        with self.assertRaisesRegex(OverflowError, r"Offset must fit in 64 bits"):
+            tgcrypto.ctr256_decrypt_at(os.urandom(16), os.urandom(32), os.urandom(16), 2 ** 64)
+
+        with self.assertRaisesRegex(TypeError, r"Offset must be an integer"):
+            tgcrypto.ctr256_decrypt_at(os.urandom(16), os.urandom(32), os.urandom(16), 1.0)
+
+    def test_ctr256_decrypt_at_empty_data(self):
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.ctr256_decrypt_at(b"", os.urandom(32), os.urandom(16), 0)
+
+
+def cdn_part(size, offset, chunk=128 * 1024):
+    data = os.urandom(size)
+    key = os.urandom(32)
+    iv = os.urandom(16)
+    hashes = [hashlib.sha256(data[i:i + chunk]).digest() for i in range(0, size, chunk)]
+
+    return data, tgcrypto.ctr256_encrypt_at(data, key, iv, offset), key, iv, hashes
+
+
+class TestCTR256DecryptVerify(unittest.TestCase):
+    def tearDown(self):
+        tgcrypto.set_threads(0)
+
+    def test_ctr256_decrypt_verify(self):
+        for size, offset, chunk in ((1, 0, 128 * 1024), (1000, 5, 100), (256 * 1024, 512 * 1024, 128 * 1024)):
+            data, encrypted, key, iv, hashes = cdn_part(size, offset, chunk)
+
+            self.assertEqual(tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, offset, hashes, chunk), data)
+            self.assertEqual(tgcrypto.ctr256_decrypt_at(encrypted, key, iv, offset), data)
+
+    def test_ctr256_decrypt_verify_default_chunk(self):
+        data, encrypted, key, iv, hashes = cdn_part(3 * 128 * 1024 + 16, 1024 * 1024)
+
+        self.assertEqual(len(hashes), 4)
+        self.assertEqual(tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 1024 * 1024, hashes), data)
+
+    def test_ctr256_decrypt_verify_into(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 5, 100)
+        out = bytearray(1000)
+
+        self.assertEqual(tgcrypto.ctr256_decrypt_verify_into(encrypted, key, iv, 5, hashes, out, hash_chunk=100), 1000)
+        self.assertEqual(out, data)
+
+    def test_ctr256_decrypt_verify_keywords(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 5, 100)
+        out = bytearray(1000)
+
+        self.assertEqual(
+            tgcrypto.ctr256_decrypt_verify(data=encrypted, key=key, iv=iv, offset=5, hashes=hashes, hash_chunk=100), data
+        )
+        self.assertEqual(
+            tgcrypto.ctr256_decrypt_verify_into(encrypted, key, iv, 5, hashes=hashes, out=out, hash_chunk=100), 1000
+        )
+        self.assertEqual(out, data)
+
+        with self.assertRaisesRegex(TypeError, r"ctr256_decrypt_verify\(\) got an unexpected keyword argument 'chunk'"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 5, hashes, chunk=100)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 5)
+
+    def test_ctr256_decrypt_verify_in_place(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 5, 100)
+        buf = bytearray(encrypted)
+
+        tgcrypto.ctr256_decrypt_verify_into(buf, key, iv, 5, hashes, buf, 100)
+
+        self.assertEqual(buf, data)
+
+    def test_ctr256_decrypt_verify_mismatch(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 5, 100)
+
+        for index, expected in ((0, r"\[5, 105\)"), (4, r"\[405, 505\)"), (9, r"\[905, 1005\)")):
+            bad = list(hashes)
+            bad[index] = bytes(32)
+
+            with self.assertRaisesRegex(ValueError, r"Hash mismatch for bytes " + expected):
+                tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 5, bad, 100)
+
+    def test_ctr256_decrypt_verify_first_mismatch(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 0, 100)
+        tampered = bytearray(encrypted)
+        tampered[350] ^= 1
+        tampered[750] ^= 1
+
+        with self.assertRaisesRegex(ValueError, r"Hash mismatch for bytes \[300, 400\)"):
+            tgcrypto.ctr256_decrypt_verify(bytes(tampered), key, iv, 0, hashes, 100)
+
+    def test_ctr256_decrypt_verify_threads(self):
+        data, encrypted, key, iv, hashes = cdn_part(4 * 1024 * 1024 + 7, 128 * 1024)
+        tampered = bytearray(encrypted)
+        tampered[3 * 1024 * 1024 + 1] ^= 1
+
+        for threads in (1, 2, 3, 8):
+            tgcrypto.set_threads(threads)
+
+            self.assertEqual(tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 128 * 1024, hashes), data)
+
+            with self.assertRaisesRegex(ValueError, r"Hash mismatch for bytes \[3276800, 3407872\)"):
+                tgcrypto.ctr256_decrypt_verify(bytes(tampered), key, iv, 128 * 1024, hashes)
+
+    def test_ctr256_decrypt_verify_invalid_hashes(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 0, 100)
+
+        with self.assertRaisesRegex(ValueError, r"Hashes count must be exactly 10"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 0, hashes[:-1], 100)
+
+        with self.assertRaisesRegex(ValueError, r"Hash size must be exactly 32 bytes"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 0, hashes[:-1] + [bytes(31)], 100)
+
+        with self.assertRaisesRegex(TypeError, r"Hashes must be a sequence of 32-byte digests"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 0, 1, 100)
+
+    def test_ctr256_decrypt_verify_invalid_args(self):
+        data, encrypted, key, iv, hashes = cdn_part(1000, 0, 100)
+
+        with self.assertRaisesRegex(ValueError, r"Hash chunk size must be greater than 0"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, 0, hashes, 0)
+
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.ctr256_decrypt_verify(b"", key, iv, 0, [], 100)
+
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key[:31], iv, 0, hashes, 100)
+
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 16 bytes"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv[:15], 0, hashes, 100)
+
+        with self.assertRaisesRegex(ValueError, r"Offset must not be negative"):
+            tgcrypto.ctr256_decrypt_verify(encrypted, key, iv, -1, hashes, 100)
+
+        with self.assertRaisesRegex(ValueError, r"Output buffer must be at least as large as data"):
+            tgcrypto.ctr256_decrypt_verify_into(encrypted, key, iv, 0, hashes, bytearray(999), 100)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ctr256_decrypt_verify_into(encrypted, key, iv, 0, hashes, bytes(1000), 100)
+
+
+class TestCTR256Threads(unittest.TestCase):
+    DATA_SIZE = 4 * 1024 * 1024 + 7
+
+    def tearDown(self):
+        tgcrypto.set_threads(0)
+
+    def test_ctr256_threads(self):
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        for state in (0, 1, 15):
+            tgcrypto.set_threads(1)
+            serial_iv = bytearray(iv)
+            serial_state = bytearray([state])
+            serial = tgcrypto.ctr256_encrypt(data, key, serial_iv, serial_state)
+
+            for threads in (2, 3, 8):
+                tgcrypto.set_threads(threads)
+                threaded_iv = bytearray(iv)
+                threaded_state = bytearray([state])
+
+                self.assertEqual(tgcrypto.ctr256_encrypt(data, key, threaded_iv, threaded_state), serial)
+                self.assertEqual(threaded_iv, serial_iv)
+                self.assertEqual(threaded_state, serial_state)
+
+    def test_ctr256_threads_counter_carry(self):
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = bytes(8) + b"\xff" * 8
+
+        tgcrypto.set_threads(1)
+        serial = tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1))
+
+        tgcrypto.set_threads(4)
+        self.assertEqual(tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytes(1)), serial)
+
+    def test_ctr256_context_threads(self):
+        data = os.urandom(self.DATA_SIZE)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+
+        tgcrypto.set_threads(1)
+        serial = tgcrypto.AES256CTR(key, iv)
+        expected = serial.update(data[:5]) + serial.update(data[5:]) + serial.update(data[:33])
+
+        tgcrypto.set_threads(4)
+        threaded = tgcrypto.AES256CTR(key, iv)
+        result = threaded.update(data[:5]) + threaded.update(data[5:]) + threaded.update(data[:33])
+
+        self.assertEqual(result, expected)
+
+
+class TestCTR256Into(unittest.TestCase):
+    def test_ctr256_encrypt_into(self):
+        data = os.urandom(1000)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        out = bytearray(len(data))
+
+        self.assertEqual(tgcrypto.ctr256_encrypt_into(data, key, bytearray(iv), bytearray(1), out), len(data))
+        self.assertEqual(out, tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytearray(1)))
+
+    def test_ctr256_in_place(self):
+        data = os.urandom(1000)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        buffer = bytearray(data)
+
+        tgcrypto.ctr256_encrypt_into(buffer, key, bytearray(iv), bytearray(1), buffer)
+        self.assertEqual(buffer, tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytearray(1)))
+
+        tgcrypto.ctr256_decrypt_into(buffer, key, bytearray(iv), bytearray(1), buffer)
+        self.assertEqual(buffer, data)
+
+    def test_ctr256_into_updates_iv_and_state(self):
+        data = os.urandom(1000)
+        key = os.urandom(32)
+        iv = bytearray(os.urandom(16))
+        state = bytearray(1)
+        expected_iv = iv.copy()
+        expected_state = state.copy()
+
+        tgcrypto.ctr256_encrypt_into(data, key, iv, state, bytearray(len(data)))
+        tgcrypto.ctr256_encrypt(data, key, expected_iv, expected_state)
+
+        self.assertEqual((iv, state), (expected_iv, expected_state))
+
+    def test_aes256ctr_update_into_in_place(self):
+        data = os.urandom(1000)
+        key = os.urandom(32)
+        iv = os.urandom(16)
+        buffer = bytearray(data)
+
+        tgcrypto.AES256CTR(key, iv).update_into(buffer, buffer)
+        self.assertEqual(buffer, tgcrypto.AES256CTR(key, iv).update(data))
+
+    def test_ctr256_into_partial_overlap(self):
+        buffer = bytearray(48)
+
+        with self.assertRaisesRegex(ValueError, r"Output buffer must not partially overlap data"):
+            tgcrypto.ctr256_encrypt_into(
+                memoryview(buffer)[:32], os.urandom(32), os.urandom(16), bytearray(1), memoryview(buffer)[1:]
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,150 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+
+import tgcrypto
+
+# pq values as found in resPQ, 63 bits made of a 31-bit and a 32-bit prime. The first one is from the MTProto docs
+CORPUS = [
+    (0x17ED48941A08F981, 1229739323, 1402015859),
+    (0x61F867A523768EC3, 1666088731, 4237173113),
+    (0x363E58846D9B733F, 1119279191, 3492121433),
+    (0x4D006F8FAE767E4B, 1676122313, 3310353523),
+    (0x6908E9FDC061A01F, 2138484833, 3539214463),
+    (0x54796975EB663C6B, 2038358449, 2986232539),
+    (0x60A6C6DCAD00DB15, 1759877123, 3957362951),
+    (0x4B565FB09352F625, 1307770423, 4151058563),
+    (0x45EFE9D28FAC4489, 1643460167, 3066398383),
+    (0x590D9013108E1C6F, 1776892123, 3611329789),
+    (0x5672415B95CFF33F, 1457096033, 4275018911),
+    (0x44E9F25C900032F7, 1417430353, 3503358407),
+    (0x567C274AF162EFD9, 1711942943, 3640249351),
+    (0x370836E7CD1F41FD, 1553510279, 2552593243),
+    (0x63BA0A621D8AEF91, 1795143457, 4003060337),
+    (0x43C695B8B2EB1E0B, 1849013627, 2641276081),
+    (0x64738E1A1EECE6B9, 1771868719, 4085113751),
+]
+
+
+def is_prime(n):
+    if n < 2:
+        return False
+
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        x = pow(a, d, n)
+
+        if x in (1, n - 1):
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % n
+
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def random_prime(rng, bits):
+    while True:
+        n = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+        if is_prime(n):
+            return n
+
+
+class TestFactorize(unittest.TestCase):
+    def test_factorize_corpus(self):
+        for pq, p, q in CORPUS:
+            self.assertEqual(tgcrypto.factorize(pq), (p, q))
+
+    def test_factorize_random(self):
+        rng = random.Random(0)
+
+        for bits in (8, 16, 24, 31, 32):
+            for _ in range(100):
+                p, q = sorted((random_prime(rng, bits), random_prime(rng, bits)))
+                self.assertEqual(tgcrypto.factorize(p * q), (p, q))
+
+    def test_factorize_64_bits(self):
+        p, q = 4294967279, 4294967291
+
+        self.assertEqual(tgcrypto.factorize(p * q), (p, q))
+        self.assertEqual(tgcrypto.factorize(q * q), (q, q))
+
+    def test_factorize_small(self):
+        primes = [n for n in range(2, 5000) if is_prime(n)]
+        semiprimes = {p * q: (p, q) for i, p in enumerate(primes) for q in primes[i:] if p * q < 5000}
+
+        for n in range(4, 5000):
+            if n in semiprimes:
+                self.assertEqual(tgcrypto.factorize(n), semiprimes[n])
+            elif not is_prime(n):
+                with self.assertRaisesRegex(ValueError, r"PQ must be a product of two primes"):
+                    tgcrypto.factorize(n)
+
+    def test_factorize_small_factor(self):
+        p = 9223372036854775783  # Largest 63-bit prime
+
+        self.assertEqual(tgcrypto.factorize(2 * p), (2, p))
+        self.assertEqual(tgcrypto.factorize(3 * 6148914691236517199), (3, 6148914691236517199))
+
+    def test_factorize_not_semiprime(self):
+        for n in (8, 30, 15000000105, 1229739323 * 1402015859 * 3, 2 ** 63):
+            with self.assertRaisesRegex(ValueError, r"PQ must be a product of two primes"):
+                tgcrypto.factorize(n)
+
+    def test_factorize_prime(self):
+        for n in (2, 3, 5, 1000000007, 18446744073709551557):
+            with self.assertRaisesRegex(ValueError, r"PQ must be a composite number"):
+                tgcrypto.factorize(n)
+
+    def test_factorize_too_small(self):
+        for n in (0, 1):
+            with self.assertRaisesRegex(ValueError, r"PQ must be a composite number"):
+                tgcrypto.factorize(n)
+
+    def test_factorize_negative(self):
+        with self.assertRaisesRegex(ValueError, r"PQ must not be negative"):
+            tgcrypto.factorize(-15)
+
+    def test_factorize_overflow(self):
+        with self.assertRaisesRegex(OverflowError, r"PQ must fit in 64 bits"):
+            tgcrypto.factorize(2 ** 64)
+
+    def test_factorize_invalid_type(self):
+        with self.assertRaisesRegex(TypeError, r"PQ must be an integer"):
+            tgcrypto.factorize(b"\x17\xed\x48\x94\x1a\x08\xf9\x81")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pathlib
+import random
+import shutil
+import signal
+import tempfile
+import unittest
+
+import tgcrypto
+
+
+class TestCryptFile(unittest.TestCase):
+    DATA_SIZE = 3 * 1024 * 1024 + 16 * 5
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.src = os.path.join(self.directory, "src")
+        self.dst = os.path.join(self.directory, "dst")
+
+        self.data = os.urandom(self.DATA_SIZE)
+        self.key = os.urandom(32)
+
+        with open(self.src, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        tgcrypto.set_threads(0)
+        shutil.rmtree(self.directory)
+
+    def read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def write(self, path, data):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def test_encrypt_file_ige(self):
+        iv = os.urandom(32)
+
+        self.assertEqual(tgcrypto.encrypt_file("ige", self.src, self.dst, self.key, iv), self.DATA_SIZE)
+        self.assertEqual(self.read(self.dst), tgcrypto.ige256_encrypt(self.data, self.key, iv))
+
+    def test_crypt_file_keywords(self):
+        iv = os.urandom(16)
+
+        self.assertEqual(
+            tgcrypto.encrypt_file(mode="ctr", src_path=self.src, dst_path=self.dst, key=self.key, iv=iv, chunk_size=4096),
+            self.DATA_SIZE
+        )
+        self.assertEqual(self.read(self.dst), tgcrypto.ctr256_encrypt(self.data, self.key, bytearray(iv), bytes(1)))
+
+        with self.assertRaisesRegex(TypeError, r"decrypt_file\(\) argument 1 must be str, not int"):
+            tgcrypto.decrypt_file(1, self.src, self.dst, self.key, iv)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.decrypt_file("ctr", self.src, self.dst, self.key)
+
+    def test_encrypt_file_ctr(self):
+        iv = os.urandom(16)
+
+        self.assertEqual(tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, iv), self.DATA_SIZE)
+        self.assertEqual(self.read(self.dst), tgcrypto.ctr256_encrypt(self.data, self.key, bytearray(iv), bytes(1)))
+
+    def test_encrypt_file_cbc(self):
+        iv = os.urandom(16)
+
+        self.assertEqual(tgcrypto.encrypt_file("cbc", self.src, self.dst, self.key, iv), self.DATA_SIZE)
+        self.assertEqual(self.read(self.dst), tgcrypto.cbc256_encrypt(self.data, self.key, bytearray(iv)))
+
+    def test_decrypt_file(self):
+        for mode, iv_size in (("ige", 32), ("ctr", 16), ("cbc", 16)):
+            iv = os.urandom(iv_size)
+            out = os.path.join(self.directory, "out")
+
+            tgcrypto.encrypt_file(mode, self.src, self.dst, self.key, iv)
+            tgcrypto.decrypt_file(mode, self.dst, out, self.key, iv)
+
+            self.assertEqual(self.read(out), self.data, mode)
+
+    def test_crypt_file_chunks(self):
+        for mode, iv_size in (("ige", 32), ("ctr", 16), ("cbc", 16)):
+            iv = os.urandom(iv_size)
+
+            tgcrypto.encrypt_file(mode, self.src, self.dst, self.key, iv)
+            expected = self.read(self.dst)
+
+            for chunk_size in (16, 16 * random.randint(2, 1000), 1024 * 1024):
+                tgcrypto.encrypt_file(mode, self.src, self.dst, self.key, iv, chunk_size=chunk_size)
+                self.assertEqual(self.read(self.dst), expected, (mode, chunk_size))
+
+    def test_crypt_file_threads(self):
+        iv = os.urandom(16)
+
+        tgcrypto.set_threads(1)
+        tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, iv)
+        expected = self.read(self.dst)
+
+        tgcrypto.set_threads(4)
+        tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, iv)
+        self.assertEqual(self.read(self.dst), expected)
+
+    def test_crypt_file_overwrites_dst(self):
+        self.write(self.dst, os.urandom(self.DATA_SIZE * 2))
+
+        tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, bytes(16))
+
+        self.assertEqual(os.path.getsize(self.dst), self.DATA_SIZE)
+
+    def test_crypt_file_path_like(self):
+        iv = os.urandom(16)
+        tgcrypto.encrypt_file("ctr", pathlib.Path(self.src), pathlib.Path(self.dst), self.key, iv)
+
+        self.assertEqual(self.read(self.dst), tgcrypto.ctr256_encrypt(self.data, self.key, bytearray(iv), bytes(1)))
+
+    def test_crypt_file_same_file(self):
+        with self.assertRaisesRegex(ValueError, r"Source and destination must be different files"):
+            tgcrypto.encrypt_file("ctr", self.src, self.src, self.key, bytes(16))
+
+        self.assertEqual(self.read(self.src), self.data)
+
+    @unittest.skipUnless(hasattr(signal, "setitimer"), "requires signal.setitimer")
+    def test_crypt_file_interrupted(self):
+        def interrupt(signum, frame):
+            raise KeyboardInterrupt
+
+        handler = signal.signal(signal.SIGALRM, interrupt)
+
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.01)
+
+            with self.assertRaises(KeyboardInterrupt):
+                tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, bytes(16), chunk_size=16)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+
+        self.assertFalse(os.path.exists(self.dst))
+
+    @unittest.skipUnless(hasattr(signal, "setitimer"), "requires signal.setitimer")
+    def test_crypt_file_truncated_src(self):
+        def truncate(signum, frame):
+            os.truncate(self.src, 0)
+
+        handler = signal.signal(signal.SIGALRM, truncate)
+
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.01)
+
+            with self.assertRaisesRegex(OSError, r"Source file was truncated while being read"):
+                tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, bytes(16), chunk_size=16)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+
+        self.assertFalse(os.path.exists(self.dst))
+
+    def test_crypt_file_missing_src(self):
+        with self.assertRaises(FileNotFoundError):
+            tgcrypto.encrypt_file("ctr", os.path.join(self.directory, "missing"), self.dst, self.key, bytes(16))
+
+    def test_crypt_file_empty_src(self):
+        self.write(self.src, b"")
+
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, bytes(16))
+
+    def test_crypt_file_invalid_data_size(self):
+        self.write(self.src, os.urandom(17))
+
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 16 bytes"):
+            tgcrypto.encrypt_file("cbc", self.src, self.dst, self.key, bytes(16))
+
+    def test_crypt_file_invalid_mode(self):
+        with self.assertRaisesRegex(ValueError, r"Mode must be one of 'ige', 'ctr' or 'cbc'"):
+            tgcrypto.encrypt_file("ecb", self.src, self.dst, self.key, bytes(16))
+
+    def test_crypt_file_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 32 bytes"):
+            tgcrypto.encrypt_file("ige", self.src, self.dst, self.key, bytes(16))
+
+    def test_crypt_file_invalid_chunk_size(self):
+        with self.assertRaisesRegex(ValueError, r"Chunk size must be a positive multiple of 16 bytes"):
+            tgcrypto.encrypt_file("ctr", self.src, self.dst, self.key, bytes(16), chunk_size=100)
+
+
+if __name__ == "__main__":
+    unittest.main()
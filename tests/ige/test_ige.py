@@ -66,6 +66,26 @@ class TestIGE256Input(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, r"IV size must be exactly 32 bytes"):
             tgcrypto.ige256_decrypt(os.urandom(16), os.urandom(32), os.urandom(31))
 
+    def test_ige256_keywords(self):
+        data, key, iv = os.urandom(64), os.urandom(32), os.urandom(32)
+        encrypted = tgcrypto.ige256_encrypt(data, key, iv)
+
+        self.assertEqual(tgcrypto.ige256_encrypt(data=data, key=key, iv=iv), encrypted)
+        self.assertEqual(tgcrypto.ige256_encrypt(data, iv=iv, key=key), encrypted)
+        self.assertEqual(tgcrypto.ige256_decrypt(encrypted, key, iv=iv), data)
+
+    def test_ige256_encrypt_unexpected_keyword(self):
+        with self.assertRaisesRegex(TypeError, r"ige256_encrypt\(\) got an unexpected keyword argument 'nonce'"):
+            tgcrypto.ige256_encrypt(os.urandom(16), os.urandom(32), nonce=os.urandom(32))
+
+    def test_ige256_encrypt_duplicate_argument(self):
+        with self.assertRaisesRegex(TypeError, r"argument for ige256_encrypt\(\) given by name \('data'\) and position \(1\)"):
+            tgcrypto.ige256_encrypt(os.urandom(16), os.urandom(32), data=os.urandom(16))
+
+    def test_ige256_encrypt_into_readonly_out(self):
+        with self.assertRaisesRegex(TypeError, r"argument 4 must be read-write bytes-like object, not bytes"):
+            tgcrypto.ige256_encrypt_into(os.urandom(16), os.urandom(32), os.urandom(32), bytes(16))
+
 
 class TestIGE256Random(unittest.TestCase):
     DATA_CHUNK_MAX_SIZE = 64
@@ -111,5 +131,252 @@ class TestIGE256Random(unittest.TestCase):
         )
 
 
+class TestIGE256Context(unittest.TestCase):
+    def test_ige256_context_matches_functions(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 64) * 16)
+            key = os.urandom(32)
+            iv = os.urandom(32)
+
+            ige = tgcrypto.IGE256(key)
+            encrypted = ige.encrypt(data, iv)
+
+            self.assertEqual(encrypted, tgcrypto.ige256_encrypt(data, key, iv))
+            self.assertEqual(ige.decrypt(encrypted, iv), data)
+
+    def test_ige256_context_reuse(self):
+        key = os.urandom(32)
+        ige = tgcrypto.IGE256(key)
+
+        for _ in range(10):
+            data = os.urandom(64)
+            iv = os.urandom(32)
+
+            self.assertEqual(ige.decrypt(ige.encrypt(data, iv), iv), data)
+
+    def test_ige256_context_invalid_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.IGE256(os.urandom(31))
+
+    def test_ige256_context_empty_data(self):
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.IGE256(os.urandom(32)).encrypt(b"", os.urandom(32))
+
+    def test_ige256_context_invalid_data_size(self):
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 16 bytes"):
+            tgcrypto.IGE256(os.urandom(32)).decrypt(os.urandom(15), os.urandom(32))
+
+    def test_ige256_context_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 32 bytes"):
+            tgcrypto.IGE256(os.urandom(32)).encrypt(os.urandom(16), os.urandom(31))
+
+
+class TestIGE256Into(unittest.TestCase):
+    def test_ige256_encrypt_into(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+        out = bytearray(len(data))
+
+        self.assertEqual(tgcrypto.ige256_encrypt_into(data, key, iv, out), len(data))
+        self.assertEqual(out, tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_ige256_in_place(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+        buffer = bytearray(data)
+
+        tgcrypto.ige256_encrypt_into(buffer, key, iv, buffer)
+        self.assertEqual(buffer, tgcrypto.ige256_encrypt(data, key, iv))
+
+        tgcrypto.ige256_decrypt_into(buffer, key, iv, buffer)
+        self.assertEqual(buffer, data)
+
+    def test_ige256_into_memoryview(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+        out = bytearray(len(data) + 32)
+
+        tgcrypto.ige256_encrypt_into(data, key, iv, memoryview(out)[16:-16])
+        self.assertEqual(out[16:-16], tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_ige256_context_into(self):
+        data = os.urandom(1024)
+        iv = os.urandom(32)
+        ige = tgcrypto.IGE256(os.urandom(32))
+        buffer = bytearray(data)
+
+        self.assertEqual(ige.encrypt_into(buffer, iv, buffer), len(data))
+        self.assertEqual(ige.decrypt(buffer, iv), data)
+
+    def test_ige256_into_small_buffer(self):
+        with self.assertRaisesRegex(ValueError, r"Output buffer must be at least as large as data"):
+            tgcrypto.ige256_encrypt_into(os.urandom(32), os.urandom(32), os.urandom(32), bytearray(31))
+
+    def test_ige256_into_partial_overlap(self):
+        buffer = bytearray(48)
+
+        with self.assertRaisesRegex(ValueError, r"Output buffer must not partially overlap data"):
+            tgcrypto.ige256_encrypt_into(memoryview(buffer)[:32], os.urandom(32), os.urandom(32), memoryview(buffer)[16:])
+
+    def test_ige256_into_readonly_buffer(self):
+        with self.assertRaises(TypeError):
+            tgcrypto.ige256_encrypt_into(os.urandom(32), os.urandom(32), os.urandom(32), bytes(32))
+
+
+class TestIGE256Many(unittest.TestCase):
+    @staticmethod
+    def random_items(count):
+        return [
+            (os.urandom(random.randint(1, 64) * 16), os.urandom(32), os.urandom(32))
+            for _ in range(count)
+        ]
+
+    def test_ige256_encrypt_many(self):
+        items = self.random_items(50)
+
+        self.assertEqual(
+            tgcrypto.ige256_encrypt_many(items),
+            [tgcrypto.ige256_encrypt(data, key, iv) for data, key, iv in items]
+        )
+
+    def test_ige256_decrypt_many(self):
+        items = self.random_items(50)
+
+        self.assertEqual(
+            tgcrypto.ige256_decrypt_many(items),
+            [tgcrypto.ige256_decrypt(data, key, iv) for data, key, iv in items]
+        )
+
+    def test_ige256_many_in_place(self):
+        items = [(bytearray(data), key, iv) for data, key, iv in self.random_items(20)]
+        expected = [tgcrypto.ige256_encrypt(data, key, iv) for data, key, iv in items]
+
+        lengths = tgcrypto.ige256_encrypt_many(items, out=[data for data, _, _ in items])
+
+        self.assertEqual(lengths, [len(data) for data in expected])
+        self.assertEqual([bytes(data) for data, _, _ in items], expected)
+
+    def test_ige256_many_empty(self):
+        self.assertEqual(tgcrypto.ige256_encrypt_many([]), [])
+
+    def test_ige256_many_invalid_item(self):
+        with self.assertRaisesRegex(TypeError, r"Items must be a sequence of \(data, key, iv\) tuples"):
+            tgcrypto.ige256_encrypt_many([[os.urandom(16), os.urandom(32), os.urandom(32)]])
+
+    def test_ige256_many_invalid_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Key size must be exactly 32 bytes"):
+            tgcrypto.ige256_encrypt_many(self.random_items(3) + [(os.urandom(16), os.urandom(31), os.urandom(32))])
+
+    def test_ige256_many_out_count(self):
+        with self.assertRaisesRegex(ValueError, r"Out must contain exactly one buffer per item"):
+            tgcrypto.ige256_encrypt_many(self.random_items(2), out=[bytearray(1024)])
+
+    def test_ige256_many_keywords(self):
+        items = self.random_items(5)
+        expected = tgcrypto.ige256_encrypt_many(items)
+
+        self.assertEqual(tgcrypto.ige256_encrypt_many(items=items), expected)
+        self.assertEqual(tgcrypto.ige256_encrypt_many(items, out=None), expected)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ige256_encrypt_many()
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ige256_encrypt_many(items, None, None)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ige256_encrypt_many(items, outs=None)
+
+
+class TestAES256IGE(unittest.TestCase):
+    def chunks(self, data):
+        i = 0
+
+        while i < len(data):
+            n = random.randint(0, 100)
+            yield data[i:i + n]
+            i += n
+
+    def test_aes256ige_matches_ige256(self):
+        for _ in range(100):
+            data = os.urandom(random.randint(1, 64) * 16)
+            key = os.urandom(32)
+            iv = os.urandom(32)
+
+            encryptor = tgcrypto.AES256IGE(key, iv)
+            encrypted = b"".join(encryptor.update(chunk) for chunk in self.chunks(data)) + encryptor.finalize()
+
+            self.assertEqual(encrypted, tgcrypto.ige256_encrypt(data, key, iv))
+
+            decryptor = tgcrypto.AES256IGE(key, iv, encrypt=False)
+            decrypted = b"".join(decryptor.update(chunk) for chunk in self.chunks(encrypted)) + decryptor.finalize()
+
+            self.assertEqual(decrypted, data)
+
+    def test_aes256ige_parts(self):
+        data = os.urandom(4 * 512 * 1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+
+        ige = tgcrypto.AES256IGE(key, iv)
+        parts = [ige.update(data[i:i + 512 * 1024]) for i in range(0, len(data), 512 * 1024)]
+
+        self.assertEqual(b"".join(parts), tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_aes256ige_update_into(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+
+        ige = tgcrypto.AES256IGE(key, iv)
+        out = bytearray(1024)
+
+        self.assertEqual(ige.update_into(data[:10], out), 0)
+        self.assertEqual(ige.update_into(data[10:], out), 1024)
+        self.assertEqual(out, tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_aes256ige_update_into_in_place(self):
+        data = os.urandom(1024)
+        key = os.urandom(32)
+        iv = os.urandom(32)
+
+        ige = tgcrypto.AES256IGE(key, iv)
+        ige.update(data[:7])
+
+        # The 7 buffered bytes come first, so the output needs 7 bytes more room than the input
+        buffer = bytearray(data[7:] + bytes(7))
+
+        self.assertEqual(ige.update_into(memoryview(buffer)[:1017], buffer), 1024)
+        self.assertEqual(buffer, tgcrypto.ige256_encrypt(data, key, iv))
+
+    def test_aes256ige_update_into_small_buffer(self):
+        ige = tgcrypto.AES256IGE(os.urandom(32), os.urandom(32))
+        ige.update(os.urandom(8))
+
+        with self.assertRaisesRegex(ValueError, r"Output buffer must be at least 16 bytes"):
+            ige.update_into(os.urandom(8), bytearray(15))
+
+    def test_aes256ige_finalize_incomplete_block(self):
+        ige = tgcrypto.AES256IGE(os.urandom(32), os.urandom(32))
+        ige.update(os.urandom(17))
+
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 16 bytes"):
+            ige.finalize()
+
+    def test_aes256ige_finalized(self):
+        ige = tgcrypto.AES256IGE(os.urandom(32), os.urandom(32))
+        ige.finalize()
+
+        with self.assertRaisesRegex(ValueError, r"Context was already finalized"):
+            ige.update(os.urandom(16))
+
+    def test_aes256ige_invalid_iv_size(self):
+        with self.assertRaisesRegex(ValueError, r"IV size must be exactly 32 bytes"):
+            tgcrypto.AES256IGE(os.urandom(32), os.urandom(16))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,206 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import threading
+import unittest
+
+import tgcrypto
+
+DEFAULT_SIZE = 16
+MAX_SIZE = 4096
+
+
+class TestKeyCache(unittest.TestCase):
+    def setUp(self):
+        tgcrypto.set_key_cache_size(DEFAULT_SIZE)
+        tgcrypto.clear_key_cache()
+
+    tearDown = setUp
+
+    def counters(self):
+        stats = tgcrypto.key_cache_stats()
+        return stats["hits"], stats["misses"]
+
+    def test_default_size(self):
+        self.assertEqual(tgcrypto.get_key_cache_size(), DEFAULT_SIZE)
+        self.assertEqual(tgcrypto.key_cache_stats(), {"size": DEFAULT_SIZE, "entries": 0, "hits": 0, "misses": 0})
+
+    def test_set_size(self):
+        for size in (0, 1, 100, MAX_SIZE):
+            tgcrypto.set_key_cache_size(size)
+            self.assertEqual(tgcrypto.get_key_cache_size(), size)
+
+        tgcrypto.set_key_cache_size(size=8)
+        self.assertEqual(tgcrypto.get_key_cache_size(), 8)
+
+    def test_invalid_size(self):
+        for size in (-1, MAX_SIZE + 1):
+            with self.assertRaisesRegex(ValueError, r"Key cache size must be in the range \[0, 4096\]"):
+                tgcrypto.set_key_cache_size(size)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.set_key_cache_size("16")
+
+    def test_hit(self):
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+
+        first = tgcrypto.ige256_encrypt(data, key, iv)
+        self.assertEqual(self.counters(), (0, 1))
+
+        self.assertEqual(tgcrypto.ige256_encrypt(data, key, iv), first)
+        self.assertEqual(self.counters(), (1, 1))
+
+    def test_directions(self):
+        # Encryption and decryption schedules are cached separately, CTR only ever needs the encryption one
+        key, iv, data = os.urandom(32), os.urandom(16), os.urandom(64)
+
+        tgcrypto.cbc256_encrypt(data, key, iv)
+        tgcrypto.cbc256_decrypt(data, key, iv)
+        self.assertEqual(self.counters(), (0, 2))
+
+        tgcrypto.ctr256_encrypt(data, key, bytearray(iv), bytearray(1))
+        tgcrypto.ctr256_decrypt_at(data, key, iv, 16)
+        self.assertEqual(self.counters(), (2, 2))
+        self.assertEqual(tgcrypto.key_cache_stats()["entries"], 1)
+
+    def test_shared(self):
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+
+        tgcrypto.ige256_encrypt(data, key, iv)
+        tgcrypto.ige256_encrypt_many([(data, key, iv)] * 3)
+        tgcrypto.ige256_encrypt_into(data, key, iv, bytearray(64))
+
+        self.assertEqual(self.counters(), (4, 1))
+
+    def test_lru(self):
+        tgcrypto.set_key_cache_size(2)
+        a, b, c = (os.urandom(32) for _ in range(3))
+        iv, data = os.urandom(32), os.urandom(16)
+
+        for key in (a, b, a, c):
+            tgcrypto.ige256_encrypt(data, key, iv)
+
+        # c evicted b, the least recently used
+        self.assertEqual(self.counters(), (1, 3))
+
+        tgcrypto.ige256_encrypt(data, a, iv)
+        self.assertEqual(self.counters(), (2, 3))
+
+        tgcrypto.ige256_encrypt(data, b, iv)
+        self.assertEqual(self.counters(), (2, 4))
+        self.assertEqual(tgcrypto.key_cache_stats()["entries"], 2)
+
+    def test_eviction_results(self):
+        tgcrypto.set_key_cache_size(3)
+        keys = [os.urandom(32) for _ in range(8)]
+        iv, data = os.urandom(32), os.urandom(256)
+        expected = [tgcrypto.IGE256(key).encrypt(data, iv) for key in keys]
+
+        for _ in range(4):
+            for key, result in zip(keys, expected):
+                self.assertEqual(tgcrypto.ige256_encrypt(data, key, iv), result)
+
+        self.assertEqual(tgcrypto.key_cache_stats()["entries"], 3)
+
+    def test_sharded(self):
+        # Large caches are split into shards, which together still hold up to the size set
+        tgcrypto.set_key_cache_size(MAX_SIZE)
+        keys = [os.urandom(32) for _ in range(256)]
+        iv, data = os.urandom(32), os.urandom(16)
+
+        for _ in range(2):
+            for key in keys:
+                self.assertEqual(tgcrypto.ige256_encrypt(data, key, iv), tgcrypto.IGE256(key).encrypt(data, iv))
+
+        self.assertEqual(self.counters(), (256, 256))
+        self.assertEqual(tgcrypto.key_cache_stats()["entries"], 256)
+
+    def test_sharded_bounded(self):
+        keys = [os.urandom(32) for _ in range(256)]
+        iv, data = os.urandom(32), os.urandom(16)
+
+        for key in keys:
+            tgcrypto.ige256_encrypt(data, key, iv)
+
+        self.assertEqual(tgcrypto.key_cache_stats()["entries"], DEFAULT_SIZE)
+
+    def test_disabled(self):
+        tgcrypto.set_key_cache_size(0)
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+
+        for _ in range(3):
+            self.assertEqual(tgcrypto.ige256_decrypt(data, key, iv), tgcrypto.IGE256(key).decrypt(data, iv))
+
+        self.assertEqual(tgcrypto.key_cache_stats(), {"size": 0, "entries": 0, "hits": 0, "misses": 0})
+
+    def test_resize_empties(self):
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+
+        tgcrypto.ige256_encrypt(data, key, iv)
+        tgcrypto.set_key_cache_size(DEFAULT_SIZE)
+        tgcrypto.ige256_encrypt(data, key, iv)
+
+        self.assertEqual(self.counters(), (0, 2))
+
+    def test_clear(self):
+        key, iv, data = os.urandom(32), os.urandom(32), os.urandom(64)
+
+        tgcrypto.ige256_encrypt(data, key, iv)
+        tgcrypto.ige256_encrypt(data, key, iv)
+        tgcrypto.clear_key_cache()
+
+        self.assertEqual(tgcrypto.key_cache_stats(), {"size": DEFAULT_SIZE, "entries": 0, "hits": 0, "misses": 0})
+
+    def test_mtproto2_bypasses(self):
+        auth_key = os.urandom(256)
+
+        tgcrypto.mtproto2_encrypt(auth_key, os.urandom(8), os.urandom(32), True)
+
+        self.assertEqual(self.counters(), (0, 0))
+
+    def test_threads(self):
+        tgcrypto.set_key_cache_size(4)
+        keys = [os.urandom(32) for _ in range(8)]
+        iv, data = os.urandom(16), os.urandom(1024)
+        expected = [tgcrypto.CBC256(key).decrypt(data, iv) for key in keys]
+        errors = []
+
+        def worker(offset):
+            for i in range(500):
+                j = (i + offset) % len(keys)
+
+                if tgcrypto.cbc256_decrypt(data, keys[j], bytearray(iv)) != expected[j]:
+                    errors.append(j)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+        hits, misses = self.counters()
+        self.assertEqual(hits + misses, 8 * 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
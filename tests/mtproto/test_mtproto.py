@@ -0,0 +1,146 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import random
+import struct
+import unittest
+from hashlib import sha256
+
+import tgcrypto
+
+
+# Reference implementation, as found in Pyrogram
+def kdf(auth_key: bytes, msg_key: bytes, outgoing: bool) -> tuple:
+    x = 0 if outgoing else 8
+
+    sha256_a = sha256(msg_key + auth_key[x: x + 36]).digest()
+    sha256_b = sha256(auth_key[x + 40:x + 76] + msg_key).digest()
+
+    aes_key = sha256_a[:8] + sha256_b[8:24] + sha256_a[24:32]
+    aes_iv = sha256_b[:8] + sha256_a[8:24] + sha256_b[24:32]
+
+    return aes_key, aes_iv
+
+
+def pack(data: bytes, auth_key: bytes, auth_key_id: bytes, outgoing: bool = True) -> bytes:
+    x = 0 if outgoing else 8
+
+    data += os.urandom(-(len(data) + 12) % 16 + 12)
+    msg_key = sha256(auth_key[88 + x: 88 + x + 32] + data).digest()[8:24]
+    aes_key, aes_iv = kdf(auth_key, msg_key, outgoing)
+
+    return auth_key_id + msg_key + tgcrypto.ige256_encrypt(data, aes_key, aes_iv)
+
+
+def message(body: bytes) -> bytes:
+    return os.urandom(28) + struct.pack("<I", len(body)) + body
+
+
+class TestMTProto2(unittest.TestCase):
+    def setUp(self):
+        self.auth_key = os.urandom(256)
+        self.auth_key_id = sha256(self.auth_key).digest()[-8:]
+
+    def test_mtproto2_decrypt_reference(self):
+        for length in range(0, 1024, 4):
+            data = message(os.urandom(length))
+            packet = pack(data, self.auth_key, self.auth_key_id, outgoing=False)
+
+            plaintext = tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, packet, True)
+
+            self.assertEqual(plaintext[:len(data)], data)
+            self.assertEqual(len(plaintext), len(packet) - 24)
+
+    def test_mtproto2_encrypt_reference(self):
+        for length in range(0, 1024, 4):
+            data = message(os.urandom(length))
+            packet = tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, data, True)
+
+            msg_key = packet[8:24]
+            aes_key, aes_iv = kdf(self.auth_key, msg_key, True)
+            plaintext = tgcrypto.ige256_decrypt(packet[24:], aes_key, aes_iv)
+
+            self.assertEqual(packet[:8], self.auth_key_id)
+            self.assertEqual(plaintext[:len(data)], data)
+            self.assertIn(len(plaintext) - len(data), range(12, 28))
+            self.assertEqual(sha256(self.auth_key[88:120] + plaintext).digest()[8:24], msg_key)
+
+    def test_mtproto2_roundtrip(self):
+        for _ in range(100):
+            data = message(os.urandom(random.randint(0, 4096) * 4))
+            is_client = random.random() < 0.5
+
+            packet = tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, data, is_client)
+            plaintext = tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, packet, not is_client)
+
+            self.assertEqual(plaintext[:len(data)], data)
+
+    def test_mtproto2_random_padding(self):
+        data = message(b"")
+
+        self.assertNotEqual(
+            tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, data, True),
+            tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, data, True)
+        )
+
+    def test_mtproto2_decrypt_wrong_direction(self):
+        packet = tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, message(b"body"), True)
+
+        with self.assertRaisesRegex(ValueError, r"Msg key mismatch"):
+            tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, packet, True)
+
+    def test_mtproto2_decrypt_tampered(self):
+        packet = bytearray(tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, message(b"body"), False))
+        packet[-1] ^= 1
+
+        with self.assertRaisesRegex(ValueError, r"Msg key mismatch"):
+            tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, packet, True)
+
+    def test_mtproto2_decrypt_auth_key_id_mismatch(self):
+        packet = tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, message(b"body"), False)
+
+        with self.assertRaisesRegex(ValueError, r"Auth key id mismatch"):
+            tgcrypto.mtproto2_decrypt(self.auth_key, os.urandom(8), packet, True)
+
+    def test_mtproto2_decrypt_length_mismatch(self):
+        data = os.urandom(28) + struct.pack("<I", 1000) + os.urandom(16)
+        packet = pack(data, self.auth_key, self.auth_key_id, outgoing=False)
+
+        with self.assertRaisesRegex(ValueError, r"Message length mismatch"):
+            tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, packet, True)
+
+    def test_mtproto2_decrypt_invalid_packet_size(self):
+        with self.assertRaisesRegex(ValueError, r"Packet size must be 24 bytes plus a multiple of 16 bytes"):
+            tgcrypto.mtproto2_decrypt(self.auth_key, self.auth_key_id, os.urandom(24 + 17), True)
+
+    def test_mtproto2_invalid_auth_key_size(self):
+        with self.assertRaisesRegex(ValueError, r"Auth key size must be exactly 256 bytes"):
+            tgcrypto.mtproto2_encrypt(os.urandom(255), self.auth_key_id, message(b""), True)
+
+    def test_mtproto2_invalid_auth_key_id_size(self):
+        with self.assertRaisesRegex(ValueError, r"Auth key id size must be exactly 8 bytes"):
+            tgcrypto.mtproto2_encrypt(self.auth_key, os.urandom(7), message(b""), True)
+
+    def test_mtproto2_encrypt_empty_data(self):
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            tgcrypto.mtproto2_encrypt(self.auth_key, self.auth_key_id, b"", True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,323 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import socket
+import threading
+import unittest
+
+import tgcrypto
+
+TAGS = {"abridged": b"\xef" * 4, "intermediate": b"\xee" * 4}
+
+
+def prefix(protocol, length):
+    if protocol == "intermediate":
+        return length.to_bytes(4, "little")
+
+    if length // 4 < 0x7f:
+        return bytes([length // 4])
+
+    return b"\x7f" + (length // 4).to_bytes(3, "little")
+
+
+class Server:
+    # The other side of the connection, deriving both streams from the init header the way Telegram does
+    def __init__(self, header, protocol):
+        key, iv = header[8:40], header[40:56]
+        reversed_ = header[8:56][::-1]
+
+        self.protocol = protocol
+        self.decryptor = tgcrypto.AES256CTR(key, iv)
+        self.encryptor = tgcrypto.AES256CTR(reversed_[:32], reversed_[32:48])
+        self.init = self.decryptor.update(header)
+
+    def recv(self, data):
+        return self.decryptor.update(data)
+
+    def send(self, *payloads):
+        return b"".join(self.encryptor.update(prefix(self.protocol, len(p)) + p) for p in payloads)
+
+
+class TestObfuscatedCodec(unittest.TestCase):
+    def receive(self, codec, data, step):
+        # Feeds data at most step bytes at a time, as separate socket reads would
+        frames = []
+        position = 0
+
+        while position < len(data):
+            view = codec.recv_buffer()
+            chunk = data[position:position + min(step, len(view))]
+            view[:len(chunk)] = chunk
+            position += len(chunk)
+            frames += [bytes(frame) for frame in codec.feed(len(chunk))]
+
+        return frames
+
+    def test_header(self):
+        for protocol, tag in TAGS.items():
+            codec = tgcrypto.ObfuscatedCodec(protocol)
+            header = codec.header
+            init = Server(header, protocol).init
+
+            self.assertEqual(len(header), 64)
+            self.assertEqual(init[56:60], tag)
+            self.assertNotEqual(header[0], 0xef)
+            self.assertNotEqual(header[4:8], bytes(4))
+            self.assertNotIn(header[:4], (b"HEAD", b"POST", b"GET ", b"OPTI", b"\x16\x03\x01\x02", b"\xdd" * 4, b"\xee" * 4))
+
+    def test_header_random(self):
+        self.assertNotEqual(tgcrypto.ObfuscatedCodec().header, tgcrypto.ObfuscatedCodec().header)
+
+    def test_default_protocol(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        self.assertEqual(Server(codec.header, "abridged").init[56:60], TAGS["abridged"])
+
+    def test_encode(self):
+        for protocol in TAGS:
+            codec = tgcrypto.ObfuscatedCodec(protocol)
+            server = Server(codec.header, protocol)
+
+            # The long abridged prefix starts at 127 words
+            for size in (4, 504, 508, 1024, 64 * 1024):
+                data = os.urandom(size)
+                self.assertEqual(server.recv(codec.encode(data)), prefix(protocol, size) + data)
+
+    def test_encode_prefetch(self):
+        for protocol in TAGS:
+            codec = tgcrypto.ObfuscatedCodec(protocol, prefetch=256)
+            server = Server(codec.header, protocol)
+
+            self.assertEqual(codec.refill(), 256)
+
+            for size in (4, 64, 200, 508, 4096, 12):
+                data = os.urandom(size)
+                self.assertEqual(server.recv(codec.encode(data)), prefix(protocol, size) + data)
+                self.assertLessEqual(codec.refill(), 256)
+
+    def test_encode_prefetch_disabled(self):
+        self.assertEqual(tgcrypto.ObfuscatedCodec().refill(), 0)
+
+    def test_encode_keywords(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        server = Server(codec.header, "abridged")
+        data = bytearray(os.urandom(16))
+
+        self.assertEqual(server.recv(codec.encode(data=data)), b"\x04" + data)
+        self.assertEqual(server.recv(codec.encode(memoryview(data))), b"\x04" + data)
+
+    def test_encode_invalid(self):
+        codec = tgcrypto.ObfuscatedCodec()
+
+        with self.assertRaisesRegex(ValueError, r"Data must not be empty"):
+            codec.encode(b"")
+
+        with self.assertRaisesRegex(ValueError, r"Data size must match a multiple of 4 bytes"):
+            codec.encode(bytes(6))
+
+        with self.assertRaisesRegex(ValueError, r"Data size must be at most 16777216 bytes"):
+            codec.encode(bytes(16 * 1024 * 1024 + 4))
+
+        with self.assertRaises(TypeError):
+            codec.encode("data")
+
+    def test_feed(self):
+        for protocol in TAGS:
+            payloads = [os.urandom(size) for size in (4, 200, 508, 1000, 4096, 8, 100000)]
+
+            for step in (1, 7, 1000, 300000):
+                codec = tgcrypto.ObfuscatedCodec(protocol)
+                server = Server(codec.header, protocol)
+
+                self.assertEqual(self.receive(codec, server.send(*payloads), step), payloads)
+
+    def test_frames_are_views(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        server = Server(codec.header, "abridged")
+        data = server.send(b"abcd", b"efghijkl")
+
+        codec.recv_buffer()[:len(data)] = data
+        frames = codec.feed(len(data))
+
+        self.assertEqual([type(frame) for frame in frames], [memoryview, memoryview])
+        self.assertEqual([frame.tobytes() for frame in frames], [b"abcd", b"efghijkl"])
+
+    def test_frames_released(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        server = Server(codec.header, "abridged")
+        data = server.send(b"abcd")
+
+        codec.recv_buffer()[:len(data)] = data
+        frame, = codec.feed(len(data))
+        codec.recv_buffer()
+
+        with self.assertRaises(ValueError):
+            bytes(frame)
+
+    def test_grow(self):
+        codec = tgcrypto.ObfuscatedCodec(buffer_size=64)
+        server = Server(codec.header, "abridged")
+        payloads = [os.urandom(size) for size in (40, 10000, 4, 1 << 20)]
+
+        self.assertEqual(self.receive(codec, server.send(*payloads), 60), payloads)
+
+    def test_grow_exported(self):
+        # A slice taken from a frame keeps it exported, the received bytes move to a new buffer to grow
+        codec = tgcrypto.ObfuscatedCodec(buffer_size=64)
+        server = Server(codec.header, "abridged")
+        data = server.send(b"abcd", bytes(1000))
+
+        codec.recv_buffer()[:64] = data[:64]
+        frame, = codec.feed(64)
+        part = frame[1:]
+
+        self.assertEqual(self.receive(codec, data[64:], 1000), [bytes(1000)])
+        self.assertEqual(len(part), 3)
+
+    def test_exported_frame_dropped(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        server = Server(codec.header, "abridged")
+        data = server.send(b"abcd")
+        payloads = [os.urandom(size) for size in (8, 400)]
+
+        codec.recv_buffer()[:len(data)] = data
+        frame, = codec.feed(len(data))
+        part = frame[:2]
+
+        self.assertEqual(self.receive(codec, server.send(*payloads), 1000), payloads)
+        self.assertEqual(len(part), 2)
+
+    def test_recv_into_threads(self):
+        codec = tgcrypto.ObfuscatedCodec(buffer_size=1024)
+        server = Server(codec.header, "abridged")
+        payloads = [os.urandom(4 * (i % 300 + 1)) for i in range(400)]
+        frames, errors = [], []
+        a, b = socket.socketpair()
+
+        def run():
+            try:
+                while True:
+                    received = codec.recv_into(b)
+
+                    if received is None:
+                        break
+
+                    frames.extend(bytes(frame) for frame in received)
+            except Exception as e:
+                errors.append(e)
+
+        with a, b:
+            threads = [threading.Thread(target=run) for _ in range(4)]
+
+            for thread in threads:
+                thread.start()
+
+            for payload in payloads:
+                a.sendall(server.send(payload))
+
+            a.shutdown(socket.SHUT_WR)
+
+            for thread in threads:
+                thread.join()
+
+        # Frames can be appended out of order by the threads, but none is lost or corrupted
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(frames), sorted(payloads))
+
+    def test_recv_into(self):
+        for protocol in TAGS:
+            codec = tgcrypto.ObfuscatedCodec(protocol, 1024)
+            server = Server(codec.header, protocol)
+            payloads = [os.urandom(size) for size in (4, 2000, 12, 40000)]
+            a, b = socket.socketpair()
+
+            with a, b:
+                a.sendall(server.send(*payloads))
+                a.close()
+
+                frames = []
+
+                while True:
+                    received = codec.recv_into(b)
+
+                    if received is None:
+                        break
+
+                    frames += [bytes(frame) for frame in received]
+
+            self.assertEqual(frames, payloads)
+
+    def test_recv_into_keywords(self):
+        codec = tgcrypto.ObfuscatedCodec()
+        a, b = socket.socketpair()
+
+        with a, b:
+            a.close()
+            self.assertIsNone(codec.recv_into(sock=b))
+
+    def test_invalid_length(self):
+        for protocol, invalid in (("abridged", b"\x80"), ("intermediate", (16 * 1024 * 1024 + 4).to_bytes(4, "little"))):
+            codec = tgcrypto.ObfuscatedCodec(protocol)
+            server = Server(codec.header, protocol)
+            data = server.send(b"abcd") + server.encryptor.update(invalid + bytes(4))
+
+            codec.recv_buffer()[:len(data)] = data
+
+            # The complete frames come first, the error with the next read
+            self.assertEqual([bytes(frame) for frame in codec.feed(len(data))], [b"abcd"])
+
+            codec.recv_buffer()
+
+            with self.assertRaisesRegex(ValueError, r"Invalid frame length"):
+                codec.feed(0)
+
+    def test_feed_invalid(self):
+        codec = tgcrypto.ObfuscatedCodec(buffer_size=64)
+        codec.recv_buffer()
+
+        for size in (-1, 65):
+            with self.assertRaisesRegex(ValueError, r"Size must be in the range \[0, 64\]"):
+                codec.feed(size)
+
+        with self.assertRaises(TypeError):
+            codec.feed("1")
+
+        self.assertEqual(codec.feed(0), [])
+
+    def test_invalid_args(self):
+        with self.assertRaisesRegex(ValueError, r"Protocol must be \"abridged\" or \"intermediate\""):
+            tgcrypto.ObfuscatedCodec("padded")
+
+        with self.assertRaisesRegex(ValueError, r"Buffer size must be at least 64 bytes"):
+            tgcrypto.ObfuscatedCodec(buffer_size=63)
+
+        with self.assertRaisesRegex(ValueError, r"Prefetch size must be in the range \[0, 16777216\]"):
+            tgcrypto.ObfuscatedCodec(prefetch=-1)
+
+        with self.assertRaises(TypeError):
+            tgcrypto.ObfuscatedCodec(1)
+
+    def test_header_read_only(self):
+        codec = tgcrypto.ObfuscatedCodec()
+
+        with self.assertRaises(AttributeError):
+            codec.header = bytes(64)
+
+
+if __name__ == "__main__":
+    unittest.main()
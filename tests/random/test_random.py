@@ -0,0 +1,153 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import threading
+import unittest
+
+import tgcrypto
+from tgcrypto import _binding
+
+
+class TestCTRDRBG(unittest.TestCase):
+    # NIST CAVP drbgvectors_no_reseed, CTR_DRBG AES-256 no df, PredictionResistance = False, COUNT = 0
+    ENTROPY = bytes.fromhex(
+        "df5d73faa468649edda33b5cca79b0b05600419ccb7a879d"
+        "dfec9db32ee494e5531b51de16a30f769262474c73bec010"
+    )
+    RETURNED = bytes.fromhex(
+        "d1c07cd95af8a7f11012c84ce48bb8cb87189e99d40fccb1771c619bdf82ab22"
+        "80b1dc2f2581f39164f7ac0c510494b3a43c41b7db17514c87b107ae793e01c5"
+    )
+
+    def test_known_answer(self):
+        self.assertEqual(_binding._ctr_drbg(self.ENTROPY, 64), self.RETURNED)
+
+    def test_invalid_entropy(self):
+        with self.assertRaisesRegex(ValueError, r"^Entropy must be 48 bytes and length at most 65536$"):
+            _binding._ctr_drbg(self.ENTROPY[:32], 64)
+
+
+class TestRandomBytes(unittest.TestCase):
+    def test_length(self):
+        for n in (0, 1, 15, 16, 17, 63, 64, 65, 1000):
+            with self.subTest(n=n):
+                self.assertEqual(len(tgcrypto.random_bytes(n)), n)
+
+    def test_type(self):
+        self.assertIsInstance(tgcrypto.random_bytes(16), bytes)
+
+    def test_distinct(self):
+        outputs = {tgcrypto.random_bytes(16) for _ in range(1000)}
+        self.assertEqual(len(outputs), 1000)
+
+    def test_large(self):
+        # Longer than a single request and longer than the reseed interval
+        data = tgcrypto.random_bytes(3 * 1024 * 1024 + 5)
+
+        self.assertEqual(len(data), 3 * 1024 * 1024 + 5)
+        self.assertNotEqual(data[:16], data[65536:65536 + 16])
+        self.assertNotEqual(data[-16:], bytes(16))
+
+    def test_distribution(self):
+        data = tgcrypto.random_bytes(65536)
+        counts = [0] * 256
+
+        for b in data:
+            counts[b] += 1
+
+        # 256 expected per value; a wildly skewed generator would fail this, a correct one essentially never does
+        self.assertTrue(all(128 < c < 400 for c in counts))
+
+    def test_negative(self):
+        with self.assertRaisesRegex(ValueError, r"^Size must not be negative$"):
+            tgcrypto.random_bytes(-1)
+
+    def test_not_integer(self):
+        with self.assertRaisesRegex(TypeError, r"^Size must be an integer$"):
+            tgcrypto.random_bytes(1.5)
+
+
+class TestRandomInto(unittest.TestCase):
+    def test_fill(self):
+        buffer = bytearray(100)
+
+        self.assertEqual(tgcrypto.random_into(buffer), 100)
+        self.assertNotEqual(buffer, bytearray(100))
+
+    def test_memoryview_slice(self):
+        buffer = bytearray(64)
+
+        self.assertEqual(tgcrypto.random_into(memoryview(buffer)[16:48]), 32)
+        self.assertEqual(buffer[:16], bytearray(16))
+        self.assertEqual(buffer[48:], bytearray(16))
+
+    def test_empty(self):
+        self.assertEqual(tgcrypto.random_into(bytearray()), 0)
+
+    def test_readonly(self):
+        with self.assertRaisesRegex(TypeError, r"^argument 1 must be read-write bytes-like object, not bytes$"):
+            tgcrypto.random_into(bytes(16))
+
+
+class TestRandomThreads(unittest.TestCase):
+    def test_independent(self):
+        outputs = []
+        lock = threading.Lock()
+
+        def worker():
+            data = [tgcrypto.random_bytes(32) for _ in range(100)]
+
+            with lock:
+                outputs.extend(data)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(set(outputs)), 800)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+class TestRandomFork(unittest.TestCase):
+    def test_child_reseeds(self):
+        tgcrypto.random_bytes(16)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, tgcrypto.random_bytes(32))
+            os._exit(0)
+
+        os.close(write_fd)
+        parent = tgcrypto.random_bytes(32)
+        child = os.read(read_fd, 32)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(child), 32)
+        self.assertNotEqual(parent, child)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import unittest
+
+import tgcrypto
+
+PATH = os.path.dirname(os.path.dirname(os.path.abspath(tgcrypto.__file__)))
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        tgcrypto.reset_stats()
+        tgcrypto.enable_stats()
+
+    def tearDown(self):
+        tgcrypto.disable_stats()
+        tgcrypto.reset_stats()
+
+    def test_stats_structure(self):
+        stats = tgcrypto.stats()
+
+        self.assertEqual(set(stats), {"ige", "ctr", "cbc", "mtproto2"})
+
+        for directions in stats.values():
+            self.assertEqual(set(directions), {"encrypt", "decrypt"})
+
+            for counters in directions.values():
+                self.assertEqual(counters["calls"], 0)
+                self.assertEqual(counters["bytes"], 0)
+                self.assertEqual(counters["ns"], 0)
+                self.assertEqual(
+                    list(counters["sizes"]), ["64", "256", "1K", "4K", "16K", "64K", "256K", "1M", "1M+"]
+                )
+
+    def test_stats_count(self):
+        key = os.urandom(32)
+
+        tgcrypto.ige256_encrypt(os.urandom(64), key, os.urandom(32))
+        tgcrypto.ige256_encrypt(os.urandom(1024), key, os.urandom(32))
+        tgcrypto.ige256_decrypt(os.urandom(2048), key, os.urandom(32))
+
+        stats = tgcrypto.stats()["ige"]
+
+        self.assertEqual(stats["encrypt"]["calls"], 2)
+        self.assertEqual(stats["encrypt"]["bytes"], 64 + 1024)
+        self.assertGreater(stats["encrypt"]["ns"], 0)
+        self.assertEqual(stats["encrypt"]["sizes"]["64"], 1)
+        self.assertEqual(stats["encrypt"]["sizes"]["1K"], 1)
+        self.assertEqual(stats["decrypt"]["calls"], 1)
+        self.assertEqual(stats["decrypt"]["sizes"]["4K"], 1)
+
+    def test_stats_modes(self):
+        key = os.urandom(32)
+
+        tgcrypto.ctr256_decrypt(os.urandom(10), key, bytearray(16), bytes(1))
+        tgcrypto.cbc256_encrypt(os.urandom(32), key, bytearray(16))
+        tgcrypto.IGE256(key).decrypt(os.urandom(16), os.urandom(32))
+        tgcrypto.mtproto2_encrypt(os.urandom(256), os.urandom(8), os.urandom(100), True)
+
+        stats = tgcrypto.stats()
+
+        self.assertEqual(stats["ctr"]["decrypt"]["bytes"], 10)
+        self.assertEqual(stats["cbc"]["encrypt"]["bytes"], 32)
+        self.assertEqual(stats["ige"]["decrypt"]["bytes"], 16)
+        self.assertEqual(stats["mtproto2"]["encrypt"]["bytes"], 100)
+        self.assertEqual(stats["ctr"]["encrypt"]["calls"], 0)
+
+    def test_stats_large(self):
+        tgcrypto.ctr256_encrypt(bytes(2 * 1024 * 1024), os.urandom(32), bytearray(16), bytes(1))
+
+        self.assertEqual(tgcrypto.stats()["ctr"]["encrypt"]["sizes"]["1M+"], 1)
+
+    def test_stats_disabled(self):
+        tgcrypto.disable_stats()
+        tgcrypto.ige256_encrypt(os.urandom(16), os.urandom(32), os.urandom(32))
+
+        self.assertEqual(tgcrypto.stats()["ige"]["encrypt"]["calls"], 0)
+
+    def test_reset_stats(self):
+        tgcrypto.ige256_encrypt(os.urandom(16), os.urandom(32), os.urandom(32))
+        tgcrypto.reset_stats()
+
+        self.assertEqual(tgcrypto.stats()["ige"]["encrypt"]["calls"], 0)
+
+    def test_stats_environment(self):
+        script = "import os, tgcrypto; tgcrypto.ige256_encrypt(bytes(16), bytes(32), bytes(32)); " \
+                 "print(tgcrypto.stats()['ige']['encrypt']['calls'])"
+
+        for value, calls in (("1", "1"), ("0", "0")):
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=PATH,
+                env=dict(os.environ, PYTHONPATH=PATH, TGCRYPTO_STATS=value),
+                stdout=subprocess.PIPE,
+                check=True,
+                universal_newlines=True
+            )
+
+            self.assertEqual(result.stdout.strip(), calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
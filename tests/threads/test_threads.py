@@ -0,0 +1,179 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import sysconfig
+import threading
+import unittest
+
+import tgcrypto
+
+try:
+    import _interpreters
+
+    run_string = _interpreters.exec
+except ImportError:
+    try:
+        import _xxsubinterpreters as _interpreters
+
+        run_string = _interpreters.run_string
+    except ImportError:
+        _interpreters = None
+
+PATH = os.path.dirname(os.path.dirname(os.path.abspath(tgcrypto.__file__)))
+
+# CFFI modules declare neither per-interpreter GIL support nor GIL-free operation, only the C-API extension does
+CFFI = tgcrypto._binding.__name__ == "tgcrypto._cffi"
+
+SCRIPT = """
+import sys
+
+sys.path.insert(0, {path!r})
+
+import tgcrypto
+
+key = bytes(range(32))
+iv = bytes(range(32, 64))
+data = bytes(range(256))
+
+assert tgcrypto.ige256_decrypt(tgcrypto.ige256_encrypt(data, key, iv), key, iv) == data
+assert tgcrypto.IGE256(key).encrypt(data, iv) == tgcrypto.ige256_encrypt(data, key, iv)
+"""
+
+PENDING_SCRIPT = """
+import sys
+
+sys.path.insert(0, {path!r})
+
+import tgcrypto
+
+key = bytes(range(32))
+iv = bytes(range(32, 64))
+data = bytes(4 * 1024 * 1024)
+
+if tgcrypto._binding._completion_fd() is not None:
+    for i in range(16):
+        tgcrypto._binding._submit("ige256_encrypt", i, data, key, iv)
+"""
+
+
+def run_threads(target, count=8):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        barrier.wait()
+
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    return errors
+
+
+class TestThreads(unittest.TestCase):
+    def test_stateless_concurrent(self):
+        key, iv = os.urandom(32), os.urandom(32)
+        data = os.urandom(4096)
+        expected = tgcrypto.ige256_encrypt(data, key, iv)
+
+        def target():
+            for _ in range(200):
+                assert tgcrypto.ige256_encrypt(data, key, iv) == expected
+
+        self.assertEqual(run_threads(target), [])
+
+    def test_shared_context_concurrent(self):
+        key, iv = os.urandom(32), os.urandom(32)
+        data = os.urandom(4096)
+        ige = tgcrypto.IGE256(key)
+        expected = tgcrypto.ige256_encrypt(data, key, iv)
+
+        def target():
+            for _ in range(200):
+                assert ige.encrypt(data, iv) == expected
+
+        self.assertEqual(run_threads(target), [])
+
+    def test_shared_ctr_concurrent(self):
+        key, iv = os.urandom(32), os.urandom(16)
+        ctr = tgcrypto.AES256CTR(key, iv)
+        chunks = []
+
+        # Chunks may be taken in any order, but each must come from a distinct, whole part of the keystream
+        def target():
+            for _ in range(100):
+                chunks.append(ctr.update(bytes(48)))
+
+        self.assertEqual(run_threads(target), [])
+
+        keystream = tgcrypto.ctr256_encrypt(bytes(48 * len(chunks)), key, bytearray(iv), bytes(1))
+        parts = {keystream[i:i + 48] for i in range(0, len(keystream), 48)}
+
+        self.assertEqual(set(chunks), parts)
+
+    @unittest.skipIf(_interpreters is None, "subinterpreters are not available")
+    @unittest.skipIf(CFFI, "the CFFI binding is in use")
+    def test_subinterpreters(self):
+        for _ in range(2):
+            interpreter = _interpreters.create()
+
+            try:
+                self.assertIsNone(run_string(interpreter, SCRIPT.format(path=PATH)))
+            finally:
+                _interpreters.destroy(interpreter)
+
+    @unittest.skipIf(_interpreters is None, "subinterpreters are not available")
+    @unittest.skipIf(CFFI, "the CFFI binding is in use")
+    def test_subinterpreter_pending_jobs(self):
+        # Jobs still running when the interpreter goes away are waited for, then released along with it
+        interpreter = _interpreters.create()
+
+        try:
+            self.assertIsNone(run_string(interpreter, PENDING_SCRIPT.format(path=PATH)))
+        finally:
+            _interpreters.destroy(interpreter)
+
+    @unittest.skipUnless(sysconfig.get_config_var("Py_GIL_DISABLED"), "not a free-threaded build")
+    @unittest.skipIf(CFFI, "the CFFI binding is in use")
+    def test_gil_not_enabled(self):
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, tgcrypto, tgcrypto.aio; print(sys._is_gil_enabled())"],
+            cwd=PATH,
+            env=dict(os.environ, PYTHONPATH=PATH),
+            stdout=subprocess.PIPE,
+            check=True,
+            universal_newlines=True
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# PyPy can only load the C-API extension through its cpyext emulation layer, where crossing into C costs more than
+# encrypting a small message, so there the same C engines are called through CFFI instead. Set TGCRYPTO_BINDING to
+# "capi" or "cffi" to force either one
+def _load():
+    import os
+    import sys
+
+    requested = os.environ.get("TGCRYPTO_BINDING")
+
+    if requested == "cffi" or (requested != "capi" and sys.implementation.name == "pypy"):
+        try:
+            from . import _cffi
+            return _cffi
+        except ImportError:
+            if requested == "cffi":
+                raise
+
+    from . import _tgcrypto
+    return _tgcrypto
+
+
+_binding = _load()
+
+__doc__ = _binding.__doc__
+__all__ = getattr(_binding, "__all__", None) or [name for name in dir(_binding) if not name.startswith("_")]
+
+globals().update((name, getattr(_binding, name)) for name in __all__)
@@ -0,0 +1,1236 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# CFFI binding of the C engines, with the same functions, classes and errors as the C-API extension tgcrypto._tgcrypto.
+# It is used on PyPy, where the C-API goes through the slow cpyext layer. Buffers are passed with ffi.from_buffer, so
+# data is never copied on the way in; results returned as bytes are copied once out of the C array they are computed
+# into, the _into variants write straight into the given buffer. Every call is a single C call, which releases the GIL
+
+import operator
+import os
+import sys
+import threading
+
+from ._tgcrypto_cffi import ffi, lib
+
+__doc__ = (
+    "Fast and Portable Cryptography Extension Library for Pyrogram\n"
+    "TgCrypto is part of Pyrogram, a Telegram MTProto library for Python\n"
+    "You can learn more about Pyrogram here: https://pyrogram.org\n"
+)
+
+__all__ = [
+    "ige256_encrypt", "ige256_decrypt", "ctr256_encrypt", "ctr256_decrypt", "cbc256_encrypt", "cbc256_decrypt",
+    "ige256_encrypt_into", "ige256_decrypt_into", "ctr256_encrypt_into", "ctr256_decrypt_into",
+    "cbc256_encrypt_into", "cbc256_decrypt_into", "ctr256_encrypt_at", "ctr256_decrypt_at",
+    "ctr256_decrypt_verify", "ctr256_decrypt_verify_into",
+    "ige256_encrypt_many", "ige256_decrypt_many", "mtproto2_encrypt", "mtproto2_decrypt", "factorize",
+    "random_bytes", "random_into", "encrypt_file", "decrypt_file", "backend", "set_threads", "get_threads",
+    "set_key_cache_size", "get_key_cache_size", "key_cache_stats", "clear_key_cache", "stats", "reset_stats", "enable_stats", "disable_stats",
+    "AES256CTR", "IGE256", "CBC256", "AES256IGE", "AES256CBC", "ObfuscatedCodec"
+]
+
+FILE_CHUNK_SIZE = 16 * 1024 * 1024
+
+_IGE, _CTR, _CBC = lib.BINDING_IGE, lib.BINDING_CTR, lib.BINDING_CBC
+
+_MODES = {"ige": _IGE, "ctr": _CTR, "cbc": _CBC}
+
+_STATS_MODES = {"ige": _IGE, "ctr": _CTR, "cbc": _CBC, "mtproto2": lib.STATS_MTPROTO2}
+
+_STATS_BUCKETS = ("64", "256", "1K", "4K", "16K", "64K", "256K", "1M", "1M+")
+
+_CRYPT_KEYWORDS = ("data", "key", "iv", "out")
+_CTR_KEYWORDS = ("data", "key", "iv", "state", "out")
+_CTR_AT_KEYWORDS = ("data", "key", "iv", "offset")
+_UPDATE_KEYWORDS = ("data", "out")
+_PROTOCOLS = {"abridged": lib.OBFUSCATED_ABRIDGED, "intermediate": lib.OBFUSCATED_INTERMEDIATE}
+_SCHEDULE_KEYWORDS = ("data", "iv", "out")
+
+# Output arrays are always fully written, clearing them first would be wasted work
+_new = ffi.new_allocator(should_clear_after_alloc=False)
+_from_buffer = ffi.from_buffer
+_missing = object()
+
+lib.binding_init()
+
+
+def _parse(name, keywords, count, args, kwargs):
+    """The first count arguments named in keywords, by position or by name, with the errors of parse_args()."""
+    given = len(args) + len(kwargs)
+
+    if given != count or len(args) > count:
+        raise TypeError("function takes exactly {} argument{} ({} given)".format(count, "" if count == 1 else "s", given))
+
+    values = list(args) + [_missing] * (count - len(args))
+
+    for keyword, value in kwargs.items():
+        try:
+            i = keywords.index(keyword, 0, count)
+        except ValueError:
+            raise TypeError("{}() got an unexpected keyword argument '{}'".format(name, keyword)) from None
+
+        if values[i] is not _missing:
+            raise TypeError("argument for {}() given by name ('{}') and position ({})".format(name, keyword, i + 1))
+
+        values[i] = value
+
+    return values
+
+
+def _buffer(obj):
+    try:
+        return _from_buffer("uint8_t[]", obj)
+    except TypeError:
+        raise TypeError("a bytes-like object is required, not '{}'".format(type(obj).__name__)) from None
+
+
+def _writable(obj, position):
+    try:
+        return _from_buffer("uint8_t[]", obj, True)
+    except (TypeError, BufferError):
+        raise TypeError(
+            "argument {} must be read-write bytes-like object, not {}".format(position, type(obj).__name__)
+        ) from None
+
+
+def _uint64(value, name):
+    if not isinstance(value, int):
+        raise TypeError("{} must be an integer".format(name))
+
+    if value < 0:
+        raise ValueError("{} must not be negative".format(name))
+
+    if value >> 64:
+        raise OverflowError("{} must fit in 64 bits".format(name))
+
+    return value
+
+
+def _bytes(buf):
+    return ffi.buffer(buf)[:]
+
+
+def _check_args(mode, data, key, iv, state=None):
+    if len(data) == 0:
+        raise ValueError("Data must not be empty")
+
+    if mode != _CTR and len(data) % 16 != 0:
+        raise ValueError("Data size must match a multiple of 16 bytes")
+
+    if len(key) != 32:
+        raise ValueError("Key size must be exactly 32 bytes")
+
+    if mode == _IGE and len(iv) != 32:
+        raise ValueError("IV size must be exactly 32 bytes")
+
+    if mode != _IGE and len(iv) != 16:
+        raise ValueError("IV size must be exactly 16 bytes")
+
+    if mode == _CTR:
+        if len(state) != 1:
+            raise ValueError("State size must be exactly 1 byte")
+
+        if state[0] > 15:
+            raise ValueError("State value must be in the range [0, 15]")
+
+
+def _check_output(data, out):
+    if len(out) < len(data):
+        raise ValueError("Output buffer must be at least as large as data")
+
+    if lib.binding_overlaps(data, len(data), out, len(data)):
+        raise ValueError("Output buffer must not partially overlap data")
+
+
+def _crypt(mode, name, encrypt, into, args, kwargs):
+    count = 4 if into else 3
+
+    if kwargs or len(args) != count:
+        args = _parse(name, _CRYPT_KEYWORDS, count, args, kwargs)
+
+    data, key, iv = _buffer(args[0]), _buffer(args[1]), _buffer(args[2])
+    out = _writable(args[3], 4) if into else None
+    function = lib.binding_ige256 if mode == _IGE else lib.binding_cbc256
+
+    _check_args(mode, data, key, iv)
+
+    if into:
+        _check_output(data, out)
+        function(data, out, len(data), key, iv, encrypt)
+
+        return len(data)
+
+    buf = _new("uint8_t[]", len(data))
+    function(data, buf, len(data), key, iv, encrypt)
+
+    return _bytes(buf)
+
+
+def _ctr(name, encrypt, into, args, kwargs):
+    count = 5 if into else 4
+
+    if kwargs or len(args) != count:
+        args = _parse(name, _CTR_KEYWORDS, count, args, kwargs)
+
+    data, key, iv, state = _buffer(args[0]), _buffer(args[1]), _buffer(args[2]), _buffer(args[3])
+    out = _writable(args[4], 5) if into else None
+
+    _check_args(_CTR, data, key, iv, state)
+
+    if into:
+        _check_output(data, out)
+        lib.binding_ctr256(data, out, len(data), key, iv, state, encrypt)
+
+        return len(data)
+
+    buf = _new("uint8_t[]", len(data))
+    lib.binding_ctr256(data, buf, len(data), key, iv, state, encrypt)
+
+    return _bytes(buf)
+
+
+def _ctr_at(name, encrypt, args, kwargs):
+    if kwargs or len(args) != 4:
+        args = _parse(name, _CTR_AT_KEYWORDS, 4, args, kwargs)
+
+    offset = _uint64(args[3], "Offset")
+    data, key, iv = _buffer(args[0]), _buffer(args[1]), _buffer(args[2])
+
+    if len(data) == 0:
+        raise ValueError("Data must not be empty")
+
+    if len(key) != 32:
+        raise ValueError("Key size must be exactly 32 bytes")
+
+    if len(iv) != 16:
+        raise ValueError("IV size must be exactly 16 bytes")
+
+    buf = _new("uint8_t[]", len(data))
+    lib.binding_ctr256_at(data, buf, len(data), key, iv, offset, encrypt)
+
+    return _bytes(buf)
+
+
+def ige256_encrypt(*args, **kwargs):
+    """AES-256-IGE Encryption"""
+    return _crypt(_IGE, "ige256_encrypt", 1, False, args, kwargs)
+
+
+def ige256_decrypt(*args, **kwargs):
+    """AES-256-IGE Decryption"""
+    return _crypt(_IGE, "ige256_decrypt", 0, False, args, kwargs)
+
+
+def ctr256_encrypt(*args, **kwargs):
+    """AES-256-CTR Encryption"""
+    return _ctr("ctr256_encrypt", 1, False, args, kwargs)
+
+
+def ctr256_decrypt(*args, **kwargs):
+    """AES-256-CTR Decryption"""
+    return _ctr("ctr256_decrypt", 0, False, args, kwargs)
+
+
+def cbc256_encrypt(*args, **kwargs):
+    """AES-256-CBC Encryption"""
+    return _crypt(_CBC, "cbc256_encrypt", 1, False, args, kwargs)
+
+
+def cbc256_decrypt(*args, **kwargs):
+    """AES-256-CBC Decryption"""
+    return _crypt(_CBC, "cbc256_decrypt", 0, False, args, kwargs)
+
+
+def ige256_encrypt_into(*args, **kwargs):
+    """AES-256-IGE Encryption into a writable buffer, out may be data itself"""
+    return _crypt(_IGE, "ige256_encrypt_into", 1, True, args, kwargs)
+
+
+def ige256_decrypt_into(*args, **kwargs):
+    """AES-256-IGE Decryption into a writable buffer, out may be data itself"""
+    return _crypt(_IGE, "ige256_decrypt_into", 0, True, args, kwargs)
+
+
+def ctr256_encrypt_into(*args, **kwargs):
+    """AES-256-CTR Encryption into a writable buffer, out may be data itself"""
+    return _ctr("ctr256_encrypt_into", 1, True, args, kwargs)
+
+
+def ctr256_decrypt_into(*args, **kwargs):
+    """AES-256-CTR Decryption into a writable buffer, out may be data itself"""
+    return _ctr("ctr256_decrypt_into", 0, True, args, kwargs)
+
+
+def cbc256_encrypt_into(*args, **kwargs):
+    """AES-256-CBC Encryption into a writable buffer, out may be data itself"""
+    return _crypt(_CBC, "cbc256_encrypt_into", 1, True, args, kwargs)
+
+
+def cbc256_decrypt_into(*args, **kwargs):
+    """AES-256-CBC Decryption into a writable buffer, out may be data itself"""
+    return _crypt(_CBC, "cbc256_decrypt_into", 0, True, args, kwargs)
+
+
+def ctr256_encrypt_at(*args, **kwargs):
+    """AES-256-CTR Encryption of data found at a byte offset of the stream started by iv"""
+    return _ctr_at("ctr256_encrypt_at", 1, args, kwargs)
+
+
+def ctr256_decrypt_at(*args, **kwargs):
+    """AES-256-CTR Decryption of data found at a byte offset of the stream started by iv"""
+    return _ctr_at("ctr256_decrypt_at", 0, args, kwargs)
+
+
+def _hashes(hashes, count):
+    try:
+        hashes = list(hashes)
+    except TypeError:
+        raise TypeError("Hashes must be a sequence of 32-byte digests") from None
+
+    if len(hashes) != count:
+        raise ValueError("Hashes count must be exactly {} for this data size".format(count))
+
+    buf = _new("uint8_t[]", count * lib.CDN256_HASH_SIZE)
+
+    for i, value in enumerate(hashes):
+        value = _buffer(value)
+
+        if len(value) != lib.CDN256_HASH_SIZE:
+            raise ValueError("Hash size must be exactly 32 bytes")
+
+        ffi.memmove(buf + i * lib.CDN256_HASH_SIZE, value, lib.CDN256_HASH_SIZE)
+
+    return buf
+
+
+def _ctr_verify(data, key, iv, offset, hashes, out, hash_chunk):
+    offset = _uint64(offset, "Offset")
+    data, key, iv = _buffer(data), _buffer(key), _buffer(iv)
+
+    if len(data) == 0:
+        raise ValueError("Data must not be empty")
+
+    if len(key) != 32:
+        raise ValueError("Key size must be exactly 32 bytes")
+
+    if len(iv) != 16:
+        raise ValueError("IV size must be exactly 16 bytes")
+
+    if hash_chunk <= 0:
+        raise ValueError("Hash chunk size must be greater than 0")
+
+    hashes = _hashes(hashes, lib.cdn256_hash_count(len(data), hash_chunk))
+
+    if out is not None:
+        _check_output(data, out)
+
+    buf = out if out is not None else _new("uint8_t[]", len(data))
+    mismatch = _new("size_t *")
+
+    if lib.binding_cdn256(data, buf, len(data), key, iv, offset, hashes, hash_chunk, mismatch) != lib.CDN256_OK:
+        first = offset + mismatch[0] * hash_chunk
+        last = offset + min(len(data), (mismatch[0] + 1) * hash_chunk)
+
+        raise ValueError("Hash mismatch for bytes [{}, {})".format(first, last))
+
+    return len(data) if out is not None else _bytes(buf)
+
+
+def ctr256_decrypt_verify(data, key, iv, offset, hashes, hash_chunk=lib.CDN256_DEFAULT_CHUNK):
+    """AES-256-CTR Decryption of data found at a byte offset, checked against the SHA-256 of every hash_chunk bytes
+
+    Each range is hashed while its plaintext is still in cache, with the GIL released.
+    Raises ValueError with the byte range of the first hash that does not match.
+    """
+    return _ctr_verify(data, key, iv, offset, hashes, None, hash_chunk)
+
+
+def ctr256_decrypt_verify_into(data, key, iv, offset, hashes, out, hash_chunk=lib.CDN256_DEFAULT_CHUNK):
+    """Same as ctr256_decrypt_verify, writing into out and returning the number of bytes written
+
+    The content of out is unspecified when a hash does not match.
+    """
+    return _ctr_verify(data, key, iv, offset, hashes, _writable(out, 6), hash_chunk)
+
+
+def _sequence(obj, message):
+    if isinstance(obj, (list, tuple)):
+        return obj
+
+    try:
+        return list(obj)
+    except TypeError:
+        raise TypeError(message) from None
+
+
+def _ige_many(encrypt, items, out):
+    items = _sequence(items, "Items must be a sequence of (data, key, iv) tuples")
+    outs = None if out is None else _sequence(out, "Out must be a sequence of writable buffers")
+    count = len(items)
+
+    if outs is not None and len(outs) != count:
+        raise ValueError("Out must contain exactly one buffer per item")
+
+    jobs = ffi.new("ige256_job[]", count + 1)
+    keys = ffi.new("const uint8_t *[]", count + 1)
+    # The jobs only hold pointers, the buffers they point into must stay alive until the call returns
+    buffers, results = [], []
+
+    for i, item in enumerate(items):
+        if not isinstance(item, tuple):
+            raise TypeError("Items must be a sequence of (data, key, iv) tuples")
+
+        if len(item) != 3:
+            raise TypeError("function takes exactly 3 arguments ({} given)".format(len(item)))
+
+        data, key, iv = _buffer(item[0]), _buffer(item[1]), _buffer(item[2])
+
+        if len(data) == 0:
+            raise ValueError("Data must not be empty")
+
+        if len(data) % 16 != 0:
+            raise ValueError("Data size must match a multiple of 16 bytes")
+
+        if len(key) != 32:
+            raise ValueError("Key size must be exactly 32 bytes")
+
+        if len(iv) != 32:
+            raise ValueError("IV size must be exactly 32 bytes")
+
+        if outs is not None:
+            buf = _writable(outs[i], i + 1)
+            _check_output(data, buf)
+            results.append(len(data))
+        else:
+            buf = _new("uint8_t[]", len(data))
+            results.append(buf)
+
+        buffers += (data, key, iv, buf)
+        jobs[i].out = buf
+        jobs[i].length = len(data)
+        jobs[i].iv = iv
+        keys[i] = key
+        # in is a Python keyword
+        setattr(jobs[i], "in", data)
+
+    lib.binding_ige256_many(jobs, keys, _new("uint32_t[][60]", count + 1), count, encrypt)
+
+    return results if outs is not None else [_bytes(buf) for buf in results]
+
+
+def ige256_encrypt_many(items, out=None):
+    """AES-256-IGE Encryption of many independent (data, key, iv) messages at once
+
+    Returns a list of ciphertexts or, when out is a sequence of writable buffers (one per item),
+    writes into them and returns the number of bytes written for each one.
+    """
+    return _ige_many(1, items, out)
+
+
+def ige256_decrypt_many(items, out=None):
+    """AES-256-IGE Decryption of many independent (data, key, iv) messages at once
+
+    Returns a list of plaintexts or, when out is a sequence of writable buffers (one per item),
+    writes into them and returns the number of bytes written for each one.
+    """
+    return _ige_many(0, items, out)
+
+
+_MTPROTO2_ERRORS = {
+    lib.MTPROTO2_AUTH_KEY_ID_MISMATCH: "Auth key id mismatch",
+    lib.MTPROTO2_MSG_KEY_MISMATCH: "Msg key mismatch"
+}
+
+
+def _mtproto2(encrypt, args, kwargs):
+    name = "mtproto2_encrypt" if encrypt else "mtproto2_decrypt"
+
+    if kwargs or len(args) != 4:
+        keywords = ("auth_key", "auth_key_id", "payload" if encrypt else "packet", "is_client")
+        args = _parse(name, keywords, 4, args, kwargs)
+
+    is_client = bool(args[3])
+    auth_key, auth_key_id, data = _buffer(args[0]), _buffer(args[1]), _buffer(args[2])
+
+    if len(auth_key) != 256:
+        raise ValueError("Auth key size must be exactly 256 bytes")
+
+    if len(auth_key_id) != 8:
+        raise ValueError("Auth key id size must be exactly 8 bytes")
+
+    if encrypt:
+        if len(data) == 0:
+            raise ValueError("Data must not be empty")
+
+        size = lib.mtproto2_packet_size(len(data))
+    else:
+        if len(data) <= lib.MTPROTO2_HEADER_SIZE or (len(data) - lib.MTPROTO2_HEADER_SIZE) % 16 != 0:
+            raise ValueError("Packet size must be 24 bytes plus a multiple of 16 bytes")
+
+        size = len(data) - lib.MTPROTO2_HEADER_SIZE
+
+    buf = _new("uint8_t[]", size)
+    status = lib.binding_mtproto2(auth_key, auth_key_id, data, len(data), buf, is_client, encrypt)
+
+    if status == lib.MTPROTO2_RANDOM_ERROR:
+        raise OSError("Failed to read random bytes from the operating system")
+
+    if status != lib.MTPROTO2_OK:
+        raise ValueError(_MTPROTO2_ERRORS.get(status, "Message length mismatch"))
+
+    return _bytes(buf)
+
+
+def mtproto2_encrypt(*args, **kwargs):
+    """MTProto 2.0 Encryption
+
+    Pads the payload, computes msg_key and the AES key and IV from auth_key, encrypts with AES-256-IGE
+    and returns auth_key_id + msg_key + encrypted data.
+    """
+    return _mtproto2(1, args, kwargs)
+
+
+def mtproto2_decrypt(*args, **kwargs):
+    """MTProto 2.0 Decryption
+
+    Checks auth_key_id, decrypts with AES-256-IGE, verifies msg_key and the padding length
+    and returns the plaintext message, padding included.
+    """
+    return _mtproto2(0, args, kwargs)
+
+
+def factorize(pq):
+    """Split the 64-bit pq of resPQ into its two prime factors (p, q), with p <= q
+
+    Raises ValueError unless pq is a product of exactly two primes.
+    """
+    factors = ffi.new("uint64_t[2]")
+    status = lib.factorize(_uint64(pq, "PQ"), factors, factors + 1)
+
+    if status == lib.FACTORIZE_NOT_COMPOSITE:
+        raise ValueError("PQ must be a composite number")
+
+    if status == lib.FACTORIZE_NOT_SEMIPRIME:
+        raise ValueError("PQ must be a product of two primes")
+
+    return factors[0], factors[1]
+
+
+def random_bytes(n):
+    """Random bytes from a per-thread AES-256 CTR_DRBG seeded by the operating system"""
+    if not isinstance(n, int):
+        raise TypeError("Size must be an integer")
+
+    if n < 0:
+        raise ValueError("Size must not be negative")
+
+    if n > sys.maxsize:
+        raise OverflowError("Python int too large to convert to C ssize_t")
+
+    buf = _new("uint8_t[]", n)
+
+    if lib.drbg_generate(buf, n) < 0:
+        raise OSError("Failed to read random bytes from the operating system")
+
+    return _bytes(buf)
+
+
+def random_into(buffer):
+    """Fill a writable buffer with random bytes, returning the number of bytes written"""
+    buf = _writable(buffer, 1)
+
+    if lib.drbg_generate(buf, len(buf)) < 0:
+        raise OSError("Failed to read random bytes from the operating system")
+
+    return len(buf)
+
+
+def _ctr_drbg(entropy, length):
+    entropy, length = _buffer(entropy), operator.index(length)
+
+    if len(entropy) != lib.DRBG_SEED_SIZE or length < 0 or length > lib.DRBG_MAX_REQUEST:
+        raise ValueError("Entropy must be 48 bytes and length at most 65536")
+
+    buf = _new("uint8_t[]", length)
+    lib.binding_ctr_drbg(entropy, buf, length)
+
+    return _bytes(buf)
+
+
+def _file_error(path):
+    if sys.platform == "win32":
+        code, message = ffi.getwinerror()
+        return OSError(None, message, path, code)
+
+    return OSError(ffi.errno, os.strerror(ffi.errno), path)
+
+
+def _crypt_file(name, encrypt, mode, src_path, dst_path, key, iv, chunk_size):
+    if not isinstance(mode, str):
+        raise TypeError("{}() argument 1 must be str, not {}".format(name, type(mode).__name__))
+
+    key, iv, chunk_size = _buffer(key), _buffer(iv), operator.index(chunk_size)
+
+    if mode not in _MODES:
+        raise ValueError("Mode must be one of 'ige', 'ctr' or 'cbc'")
+
+    mode = _MODES[mode]
+
+    if len(key) != 32:
+        raise ValueError("Key size must be exactly 32 bytes")
+
+    if mode == _IGE and len(iv) != 32:
+        raise ValueError("IV size must be exactly 32 bytes")
+
+    if mode != _IGE and len(iv) != 16:
+        raise ValueError("IV size must be exactly 16 bytes")
+
+    if chunk_size <= 0 or chunk_size % 16 != 0:
+        raise ValueError("Chunk size must be a positive multiple of 16 bytes")
+
+    convert = os.fsdecode if sys.platform == "win32" else os.fsencode
+    src_chars, dst_chars = convert(src_path), convert(dst_path)
+    src, dst = ffi.new("filemap *"), ffi.new("filemap *")
+
+    if lib.filemap_open_read(src_chars, src) < 0:
+        error = _file_error(src_path)
+        lib.filemap_close(src)
+        raise error
+
+    try:
+        if src.size == 0:
+            raise ValueError("Data must not be empty")
+
+        if mode != _CTR and src.size % 16 != 0:
+            raise ValueError("Data size must match a multiple of 16 bytes")
+
+        status = lib.filemap_open_write(dst_chars, src.size, src, dst)
+
+        if status < 0:
+            error = (
+                ValueError("Source and destination must be different files")
+                if status == lib.FILEMAP_SAME_FILE else _file_error(dst_path)
+            )
+            lib.filemap_close(dst)
+            raise error
+
+        # The source is read into the destination mapping and processed there in place. The chaining state is
+        # carried from one chunk to the next, so chunking does not change the result. Signals are handled between
+        # chunks
+        stream = ffi.new("binding_stream *")
+        done = False
+
+        try:
+            start = lib.stats_start()
+            lib.binding_stream_init(stream, key, iv, mode, encrypt)
+
+            for offset in range(0, src.size, chunk_size):
+                n = min(src.size - offset, chunk_size)
+                status = lib.filemap_read(src, offset, dst.data + offset, n)
+
+                if status == lib.FILEMAP_TRUNCATED:
+                    raise OSError("Source file was truncated while being read")
+
+                if status < 0:
+                    raise _file_error(src_path)
+
+                lib.binding_stream_chunk(stream, dst.data + offset, dst.data + offset, n)
+
+            lib.stats_record(mode, encrypt, src.size, start)
+            done = True
+
+            return src.size
+        finally:
+            lib.binding_stream_clear(stream)
+            lib.filemap_close(dst)
+
+            # An interrupted or failed run would leave a full-size file that is only partly written
+            if not done:
+                lib.filemap_remove(dst_chars)
+    finally:
+        lib.filemap_close(src)
+
+def encrypt_file(mode, src_path, dst_path, key, iv, chunk_size=FILE_CHUNK_SIZE):
+    """AES-256 Encryption of a whole file into another one, mode is "ige", "ctr" or "cbc"
+
+    The source is read chunk_size bytes at a time into the memory-mapped destination and processed there with the
+    GIL released. The destination is deleted when the call fails or is interrupted.
+    Returns the number of bytes written.
+    """
+    return _crypt_file("encrypt_file", 1, mode, src_path, dst_path, key, iv, chunk_size)
+
+
+def decrypt_file(mode, src_path, dst_path, key, iv, chunk_size=FILE_CHUNK_SIZE):
+    """AES-256 Decryption of a whole file into another one, mode is "ige", "ctr" or "cbc"
+
+    The source is read chunk_size bytes at a time into the memory-mapped destination and processed there with the
+    GIL released. The destination is deleted when the call fails or is interrupted.
+    Returns the number of bytes written.
+    """
+    return _crypt_file("decrypt_file", 0, mode, src_path, dst_path, key, iv, chunk_size)
+
+
+def _completion_fd():
+    # There is no worker pool in this binding, tgcrypto.aio falls back to the default executor
+    return None
+
+
+def backend():
+    """Name of the active AES-256 implementation: "aesni", "ssse3" or "portable"
+
+    Set the TGCRYPTO_BACKEND environment variable to "ssse3" before import to skip AES-NI, or to "portable" to force the
+    T-table implementation.
+    """
+    return ffi.string(lib.aes256_backend()).decode()
+
+
+def set_threads(threads):
+    """Set how many threads large buffers may be split across, 0 means one per CPU and 1 disables threading"""
+    threads = operator.index(threads)
+
+    if threads > 0x7FFFFFFF:
+        raise OverflowError("signed integer is greater than maximum")
+
+    if threads < 0:
+        raise ValueError("Threads count must not be negative")
+
+    lib.parallel_set_threads(threads)
+
+
+def get_threads():
+    """Number of threads large buffers may be split across"""
+    return lib.parallel_get_threads()
+
+
+def set_key_cache_size(size):
+    """Set how many keys the stateless functions keep the expanded schedules of, 0 disables the cache
+
+    The cache is emptied, and the schedules it held are wiped."""
+    size = operator.index(size)
+
+    if size > 0x7FFFFFFF:
+        raise OverflowError("signed integer is greater than maximum")
+
+    if not 0 <= size <= lib.KEYCACHE_MAX_SIZE:
+        raise ValueError("Key cache size must be in the range [0, {}]".format(lib.KEYCACHE_MAX_SIZE))
+
+    lib.keycache_set_size(size)
+
+
+def get_key_cache_size():
+    """Number of keys the stateless functions keep the expanded schedules of"""
+    return lib.keycache_get_size()
+
+
+def key_cache_stats():
+    """Size, entries in use, hits and misses of the key schedule cache"""
+    counters = ffi.new("keycache_counters *")
+    lib.keycache_get(counters)
+
+    return {"size": counters.size, "entries": counters.entries, "hits": counters.hits, "misses": counters.misses}
+
+
+def clear_key_cache():
+    """Wipe the cached key schedules and set the hits and misses back to zero"""
+    lib.keycache_clear()
+
+
+def _stats_entry(mode, encrypt):
+    counters = ffi.new("stats_counters *")
+    lib.stats_get(mode, encrypt, counters)
+
+    return {
+        "calls": counters.calls,
+        "bytes": counters.bytes,
+        "ns": counters.ns,
+        "sizes": dict(zip(_STATS_BUCKETS, counters.sizes))
+    }
+
+
+def stats():
+    """Calls, bytes, nanoseconds and payload size histogram for each mode and direction"""
+    return {
+        name: {"encrypt": _stats_entry(mode, 1), "decrypt": _stats_entry(mode, 0)}
+        for name, mode in _STATS_MODES.items()
+    }
+
+
+def reset_stats():
+    """Set all the counters back to zero"""
+    lib.stats_reset()
+
+
+def enable_stats():
+    """Start counting calls, also done at import time when TGCRYPTO_STATS is set"""
+    lib.binding_set_stats(1)
+
+
+def disable_stats():
+    """Stop counting calls, the counters are kept"""
+    lib.binding_set_stats(0)
+
+
+def _prefetch(prefetch):
+    """Ring of prefetch bytes of keystream computed ahead of use, NULL when prefetching is disabled"""
+    prefetch = operator.index(prefetch)
+
+    if prefetch < 0 or prefetch > lib.CTR256_MAX_PREFETCH:
+        raise ValueError("Prefetch size must be in the range [0, {}]".format(lib.CTR256_MAX_PREFETCH))
+
+    return _new("uint8_t[]", prefetch) if prefetch else ffi.NULL
+
+
+class AES256CTR:
+    """AES-256-CTR stream with a precomputed key schedule
+
+    The counter and the keystream offset are kept inside the object,
+    so consecutive updates continue the same keystream. Up to prefetch bytes
+    of keystream can be computed ahead of the updates by refill().
+    """
+
+    __slots__ = ("_ctr", "_ring", "_lock")
+
+    def __init__(self, key, iv, prefetch=0):
+        key, iv = _buffer(key), _buffer(iv)
+
+        if len(key) != 32:
+            raise ValueError("Key size must be exactly 32 bytes")
+
+        if len(iv) != 16:
+            raise ValueError("IV size must be exactly 16 bytes")
+
+        self._ring = _prefetch(prefetch)
+        self._ctr = ffi.new("binding_ctr *")
+        self._lock = threading.Lock()
+        lib.binding_ctr_init(self._ctr, key, iv, self._ring, prefetch)
+
+    def update(self, *args, **kwargs):
+        """AES-256-CTR Encryption/Decryption"""
+        if kwargs or len(args) != 1:
+            args = _parse("update", _UPDATE_KEYWORDS, 1, args, kwargs)
+
+        data = _buffer(args[0])
+        buf = _new("uint8_t[]", len(data))
+
+        with self._lock:
+            lib.binding_ctr_update(self._ctr, data, buf, len(data))
+
+        return _bytes(buf)
+
+    def update_into(self, *args, **kwargs):
+        """AES-256-CTR Encryption/Decryption into a writable buffer"""
+        if kwargs or len(args) != 2:
+            args = _parse("update_into", _UPDATE_KEYWORDS, 2, args, kwargs)
+
+        data, out = _buffer(args[0]), _writable(args[1], 2)
+        _check_output(data, out)
+
+        with self._lock:
+            lib.binding_ctr_update(self._ctr, data, out, len(data))
+
+        return len(data)
+
+    def seek(self, *args, **kwargs):
+        """Move the keystream to a byte offset from the start of the stream"""
+        if kwargs or len(args) != 1:
+            args = _parse("seek", ("offset",), 1, args, kwargs)
+
+        offset = _uint64(args[0], "Offset")
+
+        with self._lock:
+            lib.binding_ctr_seek(self._ctr, offset)
+
+    def refill(self):
+        """Precompute keystream for the next updates, returning the number of bytes computed"""
+        with self._lock:
+            return lib.binding_ctr_refill(self._ctr)
+
+
+class _AES256Schedule:
+    # Precomputed encryption and decryption key schedules, shared by IGE256 and CBC256
+    __slots__ = ("_schedule",)
+
+    _iv_size = 0
+    _function = None
+
+    def __init__(self, key):
+        key = _buffer(key)
+
+        if len(key) != 32:
+            raise ValueError("Key size must be exactly 32 bytes")
+
+        self._schedule = ffi.new("binding_schedule *")
+        lib.binding_schedule_init(self._schedule, key)
+
+    def _crypt(self, name, encrypt, into, args, kwargs):
+        count = 3 if into else 2
+
+        if kwargs or len(args) != count:
+            args = _parse(name, _SCHEDULE_KEYWORDS, count, args, kwargs)
+
+        data, iv = _buffer(args[0]), _buffer(args[1])
+        out = _writable(args[2], 3) if into else None
+
+        if len(data) == 0:
+            raise ValueError("Data must not be empty")
+
+        if len(data) % 16 != 0:
+            raise ValueError("Data size must match a multiple of 16 bytes")
+
+        if len(iv) != self._iv_size:
+            raise ValueError("IV size must be exactly {} bytes".format(self._iv_size))
+
+        if into:
+            _check_output(data, out)
+            self._function(self._schedule, data, out, len(data), iv, encrypt)
+
+            return len(data)
+
+        buf = _new("uint8_t[]", len(data))
+        self._function(self._schedule, data, buf, len(data), iv, encrypt)
+
+        return _bytes(buf)
+
+
+class IGE256(_AES256Schedule):
+    """AES-256-IGE context holding precomputed encryption and decryption key schedules"""
+
+    __slots__ = ()
+
+    _iv_size = 32
+    _function = staticmethod(lib.binding_schedule_ige256)
+
+    def encrypt(self, *args, **kwargs):
+        """AES-256-IGE Encryption"""
+        return self._crypt("encrypt", 1, False, args, kwargs)
+
+    def decrypt(self, *args, **kwargs):
+        """AES-256-IGE Decryption"""
+        return self._crypt("decrypt", 0, False, args, kwargs)
+
+    def encrypt_into(self, *args, **kwargs):
+        """AES-256-IGE Encryption into a writable buffer"""
+        return self._crypt("encrypt_into", 1, True, args, kwargs)
+
+    def decrypt_into(self, *args, **kwargs):
+        """AES-256-IGE Decryption into a writable buffer"""
+        return self._crypt("decrypt_into", 0, True, args, kwargs)
+
+
+class CBC256(_AES256Schedule):
+    """AES-256-CBC context holding precomputed encryption and decryption key schedules
+
+    Unlike cbc256_encrypt and cbc256_decrypt, the IV passed in is left untouched.
+    """
+
+    __slots__ = ()
+
+    _iv_size = 16
+    _function = staticmethod(lib.binding_schedule_cbc256)
+
+    def encrypt(self, *args, **kwargs):
+        """AES-256-CBC Encryption"""
+        return self._crypt("encrypt", 1, False, args, kwargs)
+
+    def decrypt(self, *args, **kwargs):
+        """AES-256-CBC Decryption"""
+        return self._crypt("decrypt", 0, False, args, kwargs)
+
+    def encrypt_into(self, *args, **kwargs):
+        """AES-256-CBC Encryption into a writable buffer"""
+        return self._crypt("encrypt_into", 1, True, args, kwargs)
+
+    def decrypt_into(self, *args, **kwargs):
+        """AES-256-CBC Decryption into a writable buffer"""
+        return self._crypt("decrypt_into", 0, True, args, kwargs)
+
+
+class _AES256Stream:
+    # Chaining IV and the bytes of an incomplete block, shared by AES256IGE and AES256CBC
+    __slots__ = ("_stream", "_lock", "_finalized")
+
+    _mode = _IGE
+
+    def __init__(self, key, iv, encrypt=True):
+        key, iv = _buffer(key), _buffer(iv)
+
+        if len(key) != 32:
+            raise ValueError("Key size must be exactly 32 bytes")
+
+        if self._mode == _IGE and len(iv) != 32:
+            raise ValueError("IV size must be exactly 32 bytes")
+
+        if self._mode == _CBC and len(iv) != 16:
+            raise ValueError("IV size must be exactly 16 bytes")
+
+        # The key schedule and the chaining state are wiped once the stream is garbage collected
+        self._stream = ffi.gc(ffi.new("binding_stream *"), lib.binding_stream_clear)
+        self._lock = threading.Lock()
+        self._finalized = False
+        lib.binding_stream_init(self._stream, key, iv, self._mode, bool(encrypt))
+
+    def _update(self, into, args, kwargs):
+        count = 2 if into else 1
+
+        if kwargs or len(args) != count:
+            args = _parse("update_into" if into else "update", _UPDATE_KEYWORDS, count, args, kwargs)
+
+        data = _buffer(args[0])
+        out = _writable(args[1], 2) if into else None
+
+        with self._lock:
+            if self._finalized:
+                raise ValueError("Context was already finalized")
+
+            blocks = (self._stream.buffered + len(data)) // 16 * 16
+
+            if into:
+                if len(out) < blocks:
+                    raise ValueError("Output buffer must be at least {} bytes".format(blocks))
+
+                if lib.binding_overlaps(data, len(data), out, blocks):
+                    raise ValueError("Output buffer must not partially overlap data")
+
+                lib.binding_stream_update(self._stream, data, len(data), out, blocks)
+
+                return blocks
+
+            buf = _new("uint8_t[]", blocks)
+            lib.binding_stream_update(self._stream, data, len(data), buf, blocks)
+
+            return _bytes(buf)
+
+    def update(self, *args, **kwargs):
+        """Process data, returning all the complete blocks available so far"""
+        return self._update(False, args, kwargs)
+
+    def update_into(self, *args, **kwargs):
+        """Process data into a writable buffer, returning the number of bytes written"""
+        return self._update(True, args, kwargs)
+
+    def finalize(self):
+        """Finish the stream, the total data size must match a multiple of 16 bytes"""
+        with self._lock:
+            if self._finalized:
+                raise ValueError("Context was already finalized")
+
+            if self._stream.buffered:
+                raise ValueError("Data size must match a multiple of 16 bytes")
+
+            lib.binding_stream_clear(self._stream)
+            self._finalized = True
+
+            return b""
+
+
+class AES256IGE(_AES256Stream):
+    """AES-256-IGE stream with a precomputed key schedule
+
+    The chaining IV is kept inside the object, so data can be fed in chunks of any size
+    and the result is the same as a single ige256_encrypt or ige256_decrypt call.
+    """
+
+    __slots__ = ()
+
+    _mode = _IGE
+
+
+class AES256CBC(_AES256Stream):
+    """AES-256-CBC stream with a precomputed key schedule
+
+    The chaining IV is kept inside the object, so data can be fed in chunks of any size
+    and the result is the same as a single cbc256_encrypt or cbc256_decrypt call.
+    """
+
+    __slots__ = ()
+
+    _mode = _CBC
+
+
+class ObfuscatedCodec:
+    """Client side of the MTProto obfuscated transport, protocol is "abridged" or "intermediate"
+
+    The init header and both AES-256-CTR streams are generated on creation. Received bytes are
+    decrypted in place inside a buffer of buffer_size bytes, which grows to fit larger frames,
+    and complete frames are returned as views of it, valid until the next read. Up to prefetch
+    bytes of keystream for the frames to send can be computed ahead by refill().
+    """
+
+    # Like in tgcrypto.c, the receive buffer stays exported through _storage so that it can't be resized through the
+    # views, and the views handed out are released by the next read, which may move or overwrite their bytes. Reads
+    # are serialized by _recv_lock, held across the socket read, so that a thread waiting for data never holds up encode
+    __slots__ = ("_codec", "_ring", "_header", "_buffer", "_storage", "_views", "_lock", "_recv_lock")
+
+    def __init__(self, protocol="abridged", buffer_size=lib.OBFUSCATED_BUFFER_SIZE, prefetch=0):
+        if not isinstance(protocol, str):
+            raise TypeError("ObfuscatedCodec() argument 1 must be str, not {}".format(type(protocol).__name__))
+
+        if protocol not in _PROTOCOLS:
+            raise ValueError('Protocol must be "abridged" or "intermediate"')
+
+        buffer_size = operator.index(buffer_size)
+
+        if buffer_size < lib.OBFUSCATED_MIN_BUFFER_SIZE:
+            raise ValueError("Buffer size must be at least {} bytes".format(lib.OBFUSCATED_MIN_BUFFER_SIZE))
+
+        header = _new("uint8_t[]", lib.OBFUSCATED_HEADER_SIZE)
+        self._ring = _prefetch(prefetch)
+        self._codec = ffi.new("obfuscated_codec *")
+
+        if lib.binding_obfuscated_init(self._codec, header, _PROTOCOLS[protocol], self._ring, prefetch) < 0:
+            raise OSError("Failed to read random bytes from the operating system")
+
+        self._header = _bytes(header)
+        self._buffer = bytearray(buffer_size)
+        self._storage = _from_buffer("uint8_t[]", self._buffer, True)
+        self._views = []
+        self._lock = threading.Lock()
+        self._recv_lock = threading.Lock()
+
+    @property
+    def header(self):
+        """The 64 bytes to send before anything else"""
+        return self._header
+
+    def _view(self, offset, size):
+        view = memoryview(self._buffer)[offset:offset + size]
+        self._views.append(view)
+
+        return view
+
+    def _resize(self, size):
+        # Frames still exported by the caller keep the bytearray from being resized, the received bytes are moved to a
+        # new one instead
+        buffer = bytearray(size)
+        buffer[:self._codec.end] = ffi.buffer(self._storage, self._codec.end)
+        ffi.release(self._storage)
+        self._buffer = buffer
+        self._storage = _from_buffer("uint8_t[]", self._buffer, True)
+
+    def _free_space(self):
+        with self._lock:
+            # A view the caller still exports can't be released, it is only dropped: its memory stays valid, but the
+            # bytes it points to may be overwritten like those of any other frame
+            for view in self._views:
+                try:
+                    view.release()
+                except BufferError:
+                    pass
+
+            del self._views[:]
+
+            needed = lib.obfuscated_compact(self._codec, self._storage)
+
+            if needed > len(self._buffer):
+                self._resize(needed)
+
+            return self._view(self._codec.end, len(self._buffer) - self._codec.end)
+
+    def _frames(self, size):
+        offset, length = ffi.new("size_t *"), ffi.new("size_t *")
+        frames = []
+
+        with self._lock:
+            free = len(self._buffer) - self._codec.end
+
+            if size < 0 or size > free:
+                raise ValueError("Size must be in the range [0, {}]".format(free))
+
+            if size:
+                lib.binding_obfuscated_decode(self._codec, self._storage, size)
+
+            while True:
+                status = lib.obfuscated_next(self._codec, self._storage, offset, length)
+
+                if status <= 0:
+                    break
+
+                frames.append(self._view(offset[0], length[0]))
+
+            # The frames before an invalid length are still returned, the error comes with the next call
+            if status < 0 and not frames:
+                raise ValueError("Invalid frame length")
+
+            return frames
+
+    def encode(self, *args, **kwargs):
+        """Prepend the frame length to data and encrypt both, returning the bytes to send"""
+        if kwargs or len(args) != 1:
+            args = _parse("encode", ("data",), 1, args, kwargs)
+
+        data = _buffer(args[0])
+
+        if len(data) == 0:
+            raise ValueError("Data must not be empty")
+
+        if len(data) % 4 != 0:
+            raise ValueError("Data size must match a multiple of 4 bytes")
+
+        if len(data) > lib.OBFUSCATED_MAX_FRAME:
+            raise ValueError("Data size must be at most {} bytes".format(lib.OBFUSCATED_MAX_FRAME))
+
+        buf = _new("uint8_t[]", lib.obfuscated_frame_size(self._codec, len(data)))
+
+        with self._lock:
+            lib.binding_obfuscated_encode(self._codec, data, len(data), buf)
+
+        return _bytes(buf)
+
+    def refill(self):
+        """Precompute keystream for the next frames to send, returning the number of bytes computed"""
+        with self._lock:
+            return lib.obfuscated_refill(self._codec)
+
+    def recv_buffer(self):
+        """Writable view of the free space of the receive buffer, to be filled by socket.recv_into
+
+        The frames returned so far are released. A recv_buffer() and feed() pair must not be interleaved
+        with another read.
+        """
+        with self._recv_lock:
+            return self._free_space()
+
+    def feed(self, *args, **kwargs):
+        """Decrypt the size bytes received into recv_buffer(), returning the frames completed as views"""
+        if kwargs or len(args) != 1:
+            args = _parse("feed", ("size",), 1, args, kwargs)
+
+        size = operator.index(args[0])
+
+        with self._recv_lock:
+            return self._frames(size)
+
+    def recv_into(self, *args, **kwargs):
+        """Receive from sock into the buffer and decrypt, returning the frames completed as views
+
+        Returns None once the connection is closed. Concurrent calls are serialized.
+        """
+        if kwargs or len(args) != 1:
+            args = _parse("recv_into", ("sock",), 1, args, kwargs)
+
+        # Held until the frames are decoded, another thread would otherwise be handed the same free space
+        with self._recv_lock:
+            view = self._free_space()
+            size = operator.index(args[0].recv_into(view))
+
+            # The connection was closed by the other side
+            if size == 0:
+                return None
+
+            return self._frames(size)
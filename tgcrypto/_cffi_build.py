@@ -0,0 +1,212 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""CFFI build script of tgcrypto._tgcrypto_cffi, the binding used on PyPy.
+
+setup.py builds it through cffi_modules on PyPy. Elsewhere, e.g. to test the binding on CPython, run it directly to
+build the module in place: python tgcrypto/_cffi_build.py
+"""
+
+import os
+import shutil
+import sys
+
+from cffi import FFI
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SOURCES = [
+    "binding.c",
+    "aes256.c",
+    "aesni256.c",
+    "ssse3256.c",
+    "ige256.c",
+    "ctr256.c",
+    "cbc256.c",
+    "parallel.c",
+    "sha256.c",
+    "urandom.c",
+    "drbg.c",
+    "mtproto2.c",
+    "factorize.c",
+    "filemap.c",
+    "stats.c",
+    "keycache.c",
+    "obfuscated.c",
+    "cdn256.c"
+]
+
+CDEF = """
+#define EXPANDED_KEY_SIZE ...
+#define STATS_BUCKETS ...
+#define DRBG_SEED_SIZE ...
+#define DRBG_MAX_REQUEST ...
+#define FACTORIZE_NOT_COMPOSITE ...
+#define FACTORIZE_NOT_SEMIPRIME ...
+#define FILEMAP_SAME_FILE ...
+#define FILEMAP_TRUNCATED ...
+#define MTPROTO2_OK ...
+#define MTPROTO2_RANDOM_ERROR ...
+#define MTPROTO2_AUTH_KEY_ID_MISMATCH ...
+#define MTPROTO2_MSG_KEY_MISMATCH ...
+#define MTPROTO2_HEADER_SIZE ...
+#define BINDING_IGE ...
+#define BINDING_CTR ...
+#define BINDING_CBC ...
+#define STATS_MTPROTO2 ...
+#define KEYCACHE_MAX_SIZE ...
+#define CTR256_MAX_PREFETCH ...
+#define CDN256_HASH_SIZE ...
+#define CDN256_DEFAULT_CHUNK ...
+#define CDN256_OK ...
+#define OBFUSCATED_HEADER_SIZE ...
+#define OBFUSCATED_ABRIDGED ...
+#define OBFUSCATED_INTERMEDIATE ...
+#define OBFUSCATED_MAX_FRAME ...
+#define OBFUSCATED_BUFFER_SIZE ...
+#define OBFUSCATED_MIN_BUFFER_SIZE ...
+
+typedef struct {
+    const uint8_t *in;
+    uint8_t *out;
+    size_t length;
+    const uint32_t *expandedKey;
+    const uint8_t *iv;
+} ige256_job;
+
+typedef struct {
+    uint64_t calls;
+    uint64_t bytes;
+    uint64_t ns;
+    uint64_t sizes[...];
+} stats_counters;
+
+typedef struct {
+    size_t size;
+    size_t entries;
+    uint64_t hits;
+    uint64_t misses;
+} keycache_counters;
+
+typedef struct {
+    uint8_t *data;
+    size_t size;
+    ...;
+} filemap;
+
+typedef struct { ...; } binding_schedule;
+typedef struct { ...; } binding_ctr;
+
+typedef struct {
+    uint8_t buffered;
+    ...;
+} binding_stream;
+
+typedef struct {
+    size_t end;
+    ...;
+} obfuscated_codec;
+
+const char *aes256_backend(void);
+
+void parallel_set_threads(uint32_t threads);
+uint32_t parallel_get_threads(void);
+
+uint64_t stats_start(void);
+void stats_record(int mode, int encrypt, size_t length, uint64_t start);
+void stats_get(int mode, int encrypt, stats_counters *counters);
+void stats_reset(void);
+
+void keycache_set_size(size_t size);
+size_t keycache_get_size(void);
+void keycache_get(keycache_counters *counters);
+void keycache_clear(void);
+
+size_t mtproto2_packet_size(size_t length);
+int factorize(uint64_t n, uint64_t *p, uint64_t *q);
+int drbg_generate(uint8_t buf[], size_t length);
+
+int filemap_open_read(const filemap_char *path, filemap *map);
+int filemap_open_write(const filemap_char *path, size_t size, const filemap *source, filemap *map);
+int filemap_read(const filemap *map, size_t offset, uint8_t buf[], size_t length);
+void filemap_close(filemap *map);
+int filemap_remove(const filemap_char *path);
+
+void binding_init(void);
+void binding_set_stats(int enabled);
+int binding_overlaps(const uint8_t in[], size_t inLength, const uint8_t out[], size_t outLength);
+
+void binding_ige256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[32], int encrypt);
+void binding_ctr256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], uint8_t *state, int encrypt);
+void binding_ctr256_at(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset, int encrypt);
+size_t cdn256_hash_count(size_t length, size_t chunk);
+int binding_cdn256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset, const uint8_t hashes[], size_t chunk, size_t *mismatch);
+void binding_cbc256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], int encrypt);
+void binding_ige256_many(ige256_job jobs[], const uint8_t *const keys[], uint32_t expandedKeys[][60], size_t count, int encrypt);
+int binding_mtproto2(const uint8_t authKey[], const uint8_t authKeyId[], const uint8_t in[], size_t length, uint8_t out[], int isClient, int encrypt);
+void binding_ctr_drbg(const uint8_t entropy[], uint8_t out[], size_t length);
+
+void binding_schedule_init(binding_schedule *schedule, const uint8_t key[32]);
+void binding_schedule_ige256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[32], int encrypt);
+void binding_schedule_cbc256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[16], int encrypt);
+
+void binding_ctr_init(binding_ctr *ctr, const uint8_t key[32], const uint8_t iv[16], uint8_t ring[], size_t prefetch);
+void binding_ctr_update(binding_ctr *ctr, const uint8_t in[], uint8_t out[], size_t length);
+void binding_ctr_seek(binding_ctr *ctr, uint64_t offset);
+size_t binding_ctr_refill(binding_ctr *ctr);
+
+void binding_stream_init(binding_stream *stream, const uint8_t key[32], const uint8_t iv[], int mode, int encrypt);
+void binding_stream_update(binding_stream *stream, const uint8_t in[], size_t length, uint8_t out[], size_t blocks);
+void binding_stream_chunk(binding_stream *stream, const uint8_t in[], uint8_t out[], size_t length);
+void binding_stream_clear(binding_stream *stream);
+
+size_t obfuscated_frame_size(const obfuscated_codec *codec, size_t length);
+int obfuscated_next(obfuscated_codec *codec, const uint8_t buf[], size_t *offset, size_t *size);
+size_t obfuscated_compact(obfuscated_codec *codec, uint8_t buf[]);
+size_t obfuscated_refill(obfuscated_codec *codec);
+
+int binding_obfuscated_init(obfuscated_codec *codec, uint8_t header[], uint8_t protocol, uint8_t ring[], size_t prefetch);
+void binding_obfuscated_encode(obfuscated_codec *codec, const uint8_t in[], size_t length, uint8_t out[]);
+void binding_obfuscated_decode(obfuscated_codec *codec, uint8_t buf[], size_t length);
+"""
+
+# Paths are wide strings on Windows, like in tgcrypto.c
+FILEMAP_CHAR = "typedef wchar_t filemap_char;" if sys.platform == "win32" else "typedef char filemap_char;"
+
+ffi = FFI()
+ffi.cdef(FILEMAP_CHAR + CDEF)
+ffi.set_source(
+    "tgcrypto._tgcrypto_cffi",
+    """
+    #include "binding.h"
+    #include "cdn256.h"
+    #include "drbg.h"
+    #include "factorize.h"
+    #include "filemap.h"
+    #include "keycache.h"
+    #include "mtproto2.h"
+    #include "obfuscated.h"
+    #include "parallel.h"
+    #include "stats.h"
+    """,
+    sources=[os.path.join(HERE, source) for source in SOURCES],
+    include_dirs=[HERE]
+)
+
+if __name__ == "__main__":
+    shutil.copy(ffi.compile(tmpdir=os.path.join(os.path.dirname(HERE), "build", "cffi")), HERE)
@@ -19,6 +19,15 @@
  */
 
 #include "aes256.h"
+#include "aesni256.h"
+#include "ssse3256.h"
+#include "utils.h"
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#endif
 
 #define LROTL(x) (((x) << 8) | ((x) >> 24))
 #define LROTR(x) (((x) >> 8) | ((x) << 24))
@@ -358,7 +367,7 @@ uint32_t sub_word(uint32_t word) {
     );
 }
 
-void aes256_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+static void portable_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
     uint32_t Nb = 4, Nr = 14, Nk = 8, i, tmp;
 
     for (i = 0; i < Nk; ++i)
@@ -381,10 +390,10 @@ void aes256_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60])
     }
 }
 
-void aes256_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+static void portable_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
     uint32_t i, j, k, tmp;
 
-    aes256_set_encryption_key(key, expandedKey);
+    portable_set_encryption_key(key, expandedKey);
 
     for (i = 0, j = 56; i < j; i += 4, j -= 4)
         for (k = 0; k < 4; ++k) {
@@ -403,7 +412,7 @@ void aes256_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60])
             );
 }
 
-void aes256_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60]) {
+static void portable_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60]) {
     uint32_t s0, s1, s2, s3, t0, t1, t2, t3;
 
     s0 = GET(in) ^ key[0];
@@ -517,7 +526,7 @@ void aes256_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60
     PUT(out + 12, s3);
 }
 
-void aes256_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60]) {
+static void portable_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60]) {
     uint32_t s0, s1, s2, s3, t0, t1, t2, t3;
 
     s0 = GET(in) ^ key[0];
@@ -630,3 +639,110 @@ void aes256_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t key[60
 
     PUT(out + 12, s3);
 }
+
+// The T-table rounds already issue 16 independent lookups each, interleaving blocks on top of that
+// only adds register pressure, so blocks simply go through one at a time
+static void portable_encrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t key[60]) {
+    for (; blocks > 0; --blocks) {
+        portable_encrypt(in, out, key);
+
+        in += AES_BLOCK_SIZE;
+        out += AES_BLOCK_SIZE;
+    }
+}
+
+static void portable_decrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t key[60]) {
+    for (; blocks > 0; --blocks) {
+        portable_decrypt(in, out, key);
+
+        in += AES_BLOCK_SIZE;
+        out += AES_BLOCK_SIZE;
+    }
+}
+
+static void portable_encrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const keys[], size_t lanes) {
+    size_t i;
+
+    for (i = 0; i < lanes; ++i)
+        portable_encrypt(&in[i * AES_BLOCK_SIZE], &out[i * AES_BLOCK_SIZE], keys[i]);
+}
+
+static void portable_decrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const keys[], size_t lanes) {
+    size_t i;
+
+    for (i = 0; i < lanes; ++i)
+        portable_decrypt(&in[i * AES_BLOCK_SIZE], &out[i * AES_BLOCK_SIZE], keys[i]);
+}
+
+void (*aes256_set_encryption_key)(const uint8_t key[32], uint32_t expandedKey[60]) = portable_set_encryption_key;
+void (*aes256_set_decryption_key)(const uint8_t key[32], uint32_t expandedKey[60]) = portable_set_decryption_key;
+void (*aes256_encrypt)(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) = portable_encrypt;
+void (*aes256_decrypt)(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) = portable_decrypt;
+void (*aes256_encrypt_blocks)(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) = portable_encrypt_blocks;
+void (*aes256_decrypt_blocks)(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) = portable_decrypt_blocks;
+void (*aes256_encrypt_lanes)(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) = portable_encrypt_lanes;
+void (*aes256_decrypt_lanes)(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) = portable_decrypt_lanes;
+
+static const char *backend = NULL;
+
+static void aes256_select(void) {
+    backend = "portable";
+
+    if (backend_forced("portable"))
+        return;
+
+#ifdef HAVE_AESNI
+    if (!backend_forced("ssse3") && aesni_supported()) {
+        aes256_set_encryption_key = aesni_set_encryption_key;
+        aes256_set_decryption_key = aesni_set_decryption_key;
+        aes256_encrypt = aesni_encrypt;
+        aes256_decrypt = aesni_decrypt;
+        aes256_encrypt_blocks = aesni_encrypt_blocks;
+        aes256_decrypt_blocks = aesni_decrypt_blocks;
+        aes256_encrypt_lanes = aesni_encrypt_lanes;
+        aes256_decrypt_lanes = aesni_decrypt_lanes;
+        backend = "aesni";
+        return;
+    }
+#endif
+
+#ifdef HAVE_SSSE3
+    if (ssse3_supported()) {
+        aes256_set_encryption_key = ssse3_set_encryption_key;
+        aes256_set_decryption_key = ssse3_set_decryption_key;
+        aes256_encrypt = ssse3_encrypt;
+        aes256_decrypt = ssse3_decrypt;
+        aes256_encrypt_blocks = ssse3_encrypt_blocks;
+        aes256_decrypt_blocks = ssse3_decrypt_blocks;
+        aes256_encrypt_lanes = ssse3_encrypt_lanes;
+        aes256_decrypt_lanes = ssse3_decrypt_lanes;
+        backend = "ssse3";
+    }
+#endif
+}
+
+#ifdef _WIN32
+static INIT_ONCE once = INIT_ONCE_STATIC_INIT;
+
+static BOOL CALLBACK aes256_select_once(PINIT_ONCE initOnce, PVOID parameter, PVOID *context) {
+    aes256_select();
+
+    return TRUE;
+}
+#else
+static pthread_once_t once = PTHREAD_ONCE_INIT;
+#endif
+
+// The backend is chosen only once: expanded keys are not portable between backends. Interpreters importing the
+// module concurrently wait for the first one to finish, so none of them can see the function pointers change
+void aes256_init(void) {
+#ifdef _WIN32
+    InitOnceExecuteOnce(&once, aes256_select_once, NULL, NULL);
+#else
+    pthread_once(&once, aes256_select);
+#endif
+}
+
+const char *aes256_backend(void) {
+    return backend != NULL ? backend : "portable";
+}
@@ -28,12 +28,30 @@
 #define AES_BLOCK_SIZE 16
 #define EXPANDED_KEY_SIZE 60
 
-void aes256_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]);
+// Implementations are selected at runtime by aes256_init(): AES-NI when available, then the constant time SSSE3 vector
+// permute code, T-tables otherwise. TGCRYPTO_BACKEND=ssse3 skips AES-NI and TGCRYPTO_BACKEND=portable forces T-tables
+extern void (*aes256_set_encryption_key)(const uint8_t key[32], uint32_t expandedKey[60]);
 
-void aes256_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]);
+extern void (*aes256_set_decryption_key)(const uint8_t key[32], uint32_t expandedKey[60]);
 
-void aes256_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
+extern void (*aes256_encrypt)(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
 
-void aes256_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
+extern void (*aes256_decrypt)(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
+
+// Encrypt/decrypt consecutive independent blocks, backends may interleave several of them through the rounds at once
+extern void (*aes256_encrypt_blocks)(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]);
+
+extern void (*aes256_decrypt_blocks)(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]);
+
+// Encrypt/decrypt one block for each of up to AES256_MAX_LANES independent streams, each with its own key
+#define AES256_MAX_LANES 8
+
+extern void (*aes256_encrypt_lanes)(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes);
+
+extern void (*aes256_decrypt_lanes)(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes);
+
+void aes256_init(void);
+
+const char *aes256_backend(void);
 
 #endif  // AES256_H
@@ -0,0 +1,251 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "aesni256.h"
+
+#ifdef HAVE_AESNI
+
+#include <wmmintrin.h>
+#include <emmintrin.h>
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#define TARGET_AESNI
+#else
+#include <cpuid.h>
+#define TARGET_AESNI __attribute__((target("aes,sse2")))
+#endif
+
+// Round keys are stored as 15 consecutive 16-byte blocks inside the 60-word expanded key
+#define LOAD(k, i) _mm_loadu_si128((const __m128i *) (k) + (i))
+#define STORE(k, i, v) _mm_storeu_si128((__m128i *) (k) + (i), (v))
+
+#define PARALLEL_BLOCKS 8
+
+int aesni_supported(void) {
+#ifdef _MSC_VER
+    int info[4];
+
+    __cpuid(info, 1);
+
+    return (info[2] >> 25) & 1;
+#else
+    unsigned int eax, ebx, ecx, edx;
+
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx))
+        return 0;
+
+    return (ecx >> 25) & 1;
+#endif
+}
+
+TARGET_AESNI
+static __m128i expand_even(__m128i key, __m128i assist) {
+    assist = _mm_shuffle_epi32(assist, 0xff);
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+
+    return _mm_xor_si128(key, assist);
+}
+
+TARGET_AESNI
+static __m128i expand_odd(__m128i key, __m128i assist) {
+    assist = _mm_shuffle_epi32(assist, 0xaa);
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+    key = _mm_xor_si128(key, _mm_slli_si128(key, 4));
+
+    return _mm_xor_si128(key, assist);
+}
+
+#define EXPAND(rk, i, rcon) \
+    rk[i] = expand_even(rk[i - 2], _mm_aeskeygenassist_si128(rk[i - 1], rcon)); \
+    rk[i + 1] = expand_odd(rk[i - 1], _mm_aeskeygenassist_si128(rk[i], 0x00))
+
+TARGET_AESNI
+static void expand_key(const uint8_t key[32], __m128i rk[15]) {
+    rk[0] = _mm_loadu_si128((const __m128i *) key);
+    rk[1] = _mm_loadu_si128((const __m128i *) (key + 16));
+
+    EXPAND(rk, 2, 0x01);
+    EXPAND(rk, 4, 0x02);
+    EXPAND(rk, 6, 0x04);
+    EXPAND(rk, 8, 0x08);
+    EXPAND(rk, 10, 0x10);
+    EXPAND(rk, 12, 0x20);
+
+    rk[14] = expand_even(rk[12], _mm_aeskeygenassist_si128(rk[13], 0x40));
+}
+
+TARGET_AESNI
+void aesni_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+    __m128i rk[15];
+    int i;
+
+    expand_key(key, rk);
+
+    for (i = 0; i < 15; ++i)
+        STORE(expandedKey, i, rk[i]);
+}
+
+TARGET_AESNI
+void aesni_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+    __m128i rk[15];
+    int i;
+
+    expand_key(key, rk);
+
+    STORE(expandedKey, 0, rk[14]);
+
+    for (i = 1; i < 14; ++i)
+        STORE(expandedKey, i, _mm_aesimc_si128(rk[14 - i]));
+
+    STORE(expandedKey, 14, rk[0]);
+}
+
+TARGET_AESNI
+void aesni_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) {
+    __m128i s = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in), LOAD(expandedKey, 0));
+    int i;
+
+    for (i = 1; i < 14; ++i)
+        s = _mm_aesenc_si128(s, LOAD(expandedKey, i));
+
+    _mm_storeu_si128((__m128i *) out, _mm_aesenclast_si128(s, LOAD(expandedKey, 14)));
+}
+
+TARGET_AESNI
+void aesni_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) {
+    __m128i s = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in), LOAD(expandedKey, 0));
+    int i;
+
+    for (i = 1; i < 14; ++i)
+        s = _mm_aesdec_si128(s, LOAD(expandedKey, i));
+
+    _mm_storeu_si128((__m128i *) out, _mm_aesdeclast_si128(s, LOAD(expandedKey, 14)));
+}
+
+TARGET_AESNI
+void aesni_encrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) {
+    __m128i s[PARALLEL_BLOCKS], k;
+    int b, i;
+
+    for (; blocks >= PARALLEL_BLOCKS; blocks -= PARALLEL_BLOCKS) {
+        k = LOAD(expandedKey, 0);
+
+        for (b = 0; b < PARALLEL_BLOCKS; ++b)
+            s[b] = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in + b), k);
+
+        for (i = 1; i < 14; ++i) {
+            k = LOAD(expandedKey, i);
+
+            for (b = 0; b < PARALLEL_BLOCKS; ++b)
+                s[b] = _mm_aesenc_si128(s[b], k);
+        }
+
+        k = LOAD(expandedKey, 14);
+
+        for (b = 0; b < PARALLEL_BLOCKS; ++b)
+            _mm_storeu_si128((__m128i *) out + b, _mm_aesenclast_si128(s[b], k));
+
+        in += PARALLEL_BLOCKS * 16;
+        out += PARALLEL_BLOCKS * 16;
+    }
+
+    for (; blocks > 0; --blocks) {
+        aesni_encrypt(in, out, expandedKey);
+
+        in += 16;
+        out += 16;
+    }
+}
+
+TARGET_AESNI
+void aesni_decrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) {
+    __m128i s[PARALLEL_BLOCKS], k;
+    int b, i;
+
+    for (; blocks >= PARALLEL_BLOCKS; blocks -= PARALLEL_BLOCKS) {
+        k = LOAD(expandedKey, 0);
+
+        for (b = 0; b < PARALLEL_BLOCKS; ++b)
+            s[b] = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in + b), k);
+
+        for (i = 1; i < 14; ++i) {
+            k = LOAD(expandedKey, i);
+
+            for (b = 0; b < PARALLEL_BLOCKS; ++b)
+                s[b] = _mm_aesdec_si128(s[b], k);
+        }
+
+        k = LOAD(expandedKey, 14);
+
+        for (b = 0; b < PARALLEL_BLOCKS; ++b)
+            _mm_storeu_si128((__m128i *) out + b, _mm_aesdeclast_si128(s[b], k));
+
+        in += PARALLEL_BLOCKS * 16;
+        out += PARALLEL_BLOCKS * 16;
+    }
+
+    for (; blocks > 0; --blocks) {
+        aesni_decrypt(in, out, expandedKey);
+
+        in += 16;
+        out += 16;
+    }
+}
+
+// Same round interleaving as the *_blocks functions, but every lane reads its round keys from its own schedule
+TARGET_AESNI
+void aesni_encrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) {
+    __m128i s[PARALLEL_BLOCKS];
+    size_t b;
+    int i;
+
+    for (b = 0; b < lanes; ++b)
+        s[b] = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in + b), LOAD(expandedKeys[b], 0));
+
+    for (i = 1; i < 14; ++i)
+        for (b = 0; b < lanes; ++b)
+            s[b] = _mm_aesenc_si128(s[b], LOAD(expandedKeys[b], i));
+
+    for (b = 0; b < lanes; ++b)
+        _mm_storeu_si128((__m128i *) out + b, _mm_aesenclast_si128(s[b], LOAD(expandedKeys[b], 14)));
+}
+
+TARGET_AESNI
+void aesni_decrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) {
+    __m128i s[PARALLEL_BLOCKS];
+    size_t b;
+    int i;
+
+    for (b = 0; b < lanes; ++b)
+        s[b] = _mm_xor_si128(_mm_loadu_si128((const __m128i *) in + b), LOAD(expandedKeys[b], 0));
+
+    for (i = 1; i < 14; ++i)
+        for (b = 0; b < lanes; ++b)
+            s[b] = _mm_aesdec_si128(s[b], LOAD(expandedKeys[b], i));
+
+    for (b = 0; b < lanes; ++b)
+        _mm_storeu_si128((__m128i *) out + b, _mm_aesdeclast_si128(s[b], LOAD(expandedKeys[b], 14)));
+}
+
+#endif  // HAVE_AESNI
@@ -0,0 +1,155 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Awaitable versions of the stateless IGE, CTR and CBC functions.
+
+Large inputs are handed to a pool of native threads owned by the extension, which signals completions through an
+eventfd (or a pipe) watched by the event loop, so no Python thread and no executor are involved. Inputs smaller than
+the inline threshold are processed right away on the event loop thread, where the thread handoff would cost more than
+the cipher itself. Event loops that can't watch file descriptors (e.g. the proactor loop on Windows) fall back to the
+default executor.
+"""
+
+import asyncio
+import threading
+import weakref
+
+from . import _binding
+
+__all__ = [
+    "ige256_encrypt", "ige256_decrypt",
+    "ctr256_encrypt", "ctr256_decrypt",
+    "cbc256_encrypt", "cbc256_decrypt",
+    "set_inline_threshold", "get_inline_threshold"
+]
+
+_inline_threshold = 16 * 1024
+
+# Event loops already watching the completion file descriptor, and those unable to. Loops running in different
+# threads may register at the same time, which free-threaded builds don't serialize
+_watching = weakref.WeakSet()
+_unsupported = weakref.WeakSet()
+_watch_lock = threading.Lock()
+
+
+def set_inline_threshold(size: int) -> None:
+    """Set the data size, in bytes, below which functions run inline on the event loop thread."""
+    global _inline_threshold
+
+    if size < 0:
+        raise ValueError("Inline threshold must not be negative")
+
+    _inline_threshold = size
+
+
+def get_inline_threshold() -> int:
+    """Data size, in bytes, below which functions run inline on the event loop thread."""
+    return _inline_threshold
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _drain():
+    loop = asyncio.get_running_loop()
+
+    # The descriptor is shared by all event loops, completions of other loops are handed over to them. A loop can
+    # be closed in the meantime, nobody is left to await its futures then
+    for future, result in _binding._completed():
+        other = future.get_loop()
+
+        if other is loop:
+            _set_result(future, result)
+        elif not other.is_closed():
+            try:
+                other.call_soon_threadsafe(_set_result, future, result)
+            except RuntimeError:
+                pass
+
+
+def _watch(loop) -> bool:
+    with _watch_lock:
+        if loop in _watching:
+            return True
+
+        if loop in _unsupported:
+            return False
+
+        fd = _binding._completion_fd()
+
+        try:
+            if fd is None:
+                raise NotImplementedError
+
+            loop.add_reader(fd, _drain)
+        except NotImplementedError:
+            _unsupported.add(loop)
+            return False
+
+        _watching.add(loop)
+
+        return True
+
+
+async def _run(name, data, *args):
+    function = getattr(_binding, name)
+
+    if memoryview(data).nbytes < _inline_threshold:
+        return function(data, *args)
+
+    loop = asyncio.get_running_loop()
+
+    if not _watch(loop):
+        return await loop.run_in_executor(None, function, data, *args)
+
+    future = loop.create_future()
+    _binding._submit(name, future, data, *args)
+
+    return await future
+
+
+async def ige256_encrypt(data, key, iv) -> bytes:
+    """AES-256-IGE Encryption"""
+    return await _run("ige256_encrypt", data, key, iv)
+
+
+async def ige256_decrypt(data, key, iv) -> bytes:
+    """AES-256-IGE Decryption"""
+    return await _run("ige256_decrypt", data, key, iv)
+
+
+async def ctr256_encrypt(data, key, iv, state) -> bytes:
+    """AES-256-CTR Encryption"""
+    return await _run("ctr256_encrypt", data, key, iv, state)
+
+
+async def ctr256_decrypt(data, key, iv, state) -> bytes:
+    """AES-256-CTR Decryption"""
+    return await _run("ctr256_decrypt", data, key, iv, state)
+
+
+async def cbc256_encrypt(data, key, iv) -> bytes:
+    """AES-256-CBC Encryption"""
+    return await _run("cbc256_encrypt", data, key, iv)
+
+
+async def cbc256_decrypt(data, key, iv) -> bytes:
+    """AES-256-CBC Decryption"""
+    return await _run("cbc256_decrypt", data, key, iv)
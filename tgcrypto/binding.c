@@ -0,0 +1,267 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "binding.h"
+#include "cbc256.h"
+#include "cdn256.h"
+#include "ctr256.h"
+#include "drbg.h"
+#include "keycache.h"
+#include "mtproto2.h"
+#include "sha256.h"
+#include "stats.h"
+#include "utils.h"
+
+void binding_init(void) {
+    aes256_init();
+    sha256_init_backend();
+    stats_init();
+    drbg_init();
+    keycache_init();
+}
+
+void binding_set_stats(int enabled) {
+    stats_enabled = enabled != 0;
+}
+
+int binding_overlaps(const uint8_t in[], size_t inLength, const uint8_t out[], size_t outLength) {
+    return in != out && in < out + outLength && out < in + inLength;
+}
+
+void binding_ige256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[32], int encrypt) {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint64_t start = stats_start();
+
+    keycache_expand(key, expandedKey, encrypt);
+    ige256_crypt(in, out, length, expandedKey, iv, (uint8_t) encrypt);
+    stats_record(STATS_IGE, encrypt, length, start);
+}
+
+void binding_ctr256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], uint8_t *state, int encrypt) {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint64_t start = stats_start();
+
+    keycache_expand(key, expandedKey, 1);
+    ctr256_crypt(in, out, length, expandedKey, iv, state);
+    stats_record(STATS_CTR, encrypt, length, start);
+}
+
+void binding_ctr256_at(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset, int encrypt) {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t counter[AES_BLOCK_SIZE], state;
+    uint64_t start = stats_start();
+
+    memcpy(counter, iv, AES_BLOCK_SIZE);
+    keycache_expand(key, expandedKey, 1);
+    ctr256_seek(counter, &state, offset);
+    ctr256_crypt(in, out, length, expandedKey, counter, &state);
+    stats_record(STATS_CTR, encrypt, length, start);
+}
+
+int binding_cdn256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset,
+                   const uint8_t hashes[], size_t chunk, size_t *mismatch) {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint64_t start = stats_start();
+    int status;
+
+    keycache_expand(key, expandedKey, 1);
+    status = cdn256_decrypt_verify(in, out, length, expandedKey, iv, offset, hashes, chunk, mismatch);
+    stats_record(STATS_CTR, 0, length, start);
+
+    return status;
+}
+
+void binding_cbc256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], int encrypt) {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint64_t start = stats_start();
+
+    keycache_expand(key, expandedKey, encrypt);
+    cbc256_crypt(in, out, length, expandedKey, iv, (uint8_t) encrypt);
+    stats_record(STATS_CBC, encrypt, length, start);
+}
+
+void binding_ige256_many(ige256_job jobs[], const uint8_t *const keys[], uint32_t expandedKeys[][EXPANDED_KEY_SIZE], size_t count, int encrypt) {
+    uint64_t start = stats_start();
+    size_t i;
+
+    for (i = 0; i < count; ++i) {
+        keycache_expand(keys[i], expandedKeys[i], encrypt);
+        jobs[i].expandedKey = expandedKeys[i];
+    }
+
+    ige256_crypt_many(jobs, count, (uint8_t) encrypt);
+
+    // Each message is a call of its own, the time is only known for the whole batch
+    if (start != 0) {
+        for (i = 0; i < count; ++i)
+            stats_count(STATS_IGE, encrypt, jobs[i].length);
+
+        stats_time(STATS_IGE, encrypt, start);
+    }
+}
+
+int binding_mtproto2(const uint8_t authKey[], const uint8_t authKeyId[], const uint8_t in[], size_t length, uint8_t out[], int isClient, int encrypt) {
+    uint64_t start = stats_start();
+    int status = encrypt
+        ? mtproto2_encrypt(authKey, authKeyId, in, length, out, (uint8_t) isClient)
+        : mtproto2_decrypt(authKey, authKeyId, in, length, out, (uint8_t) isClient);
+
+    stats_record(STATS_MTPROTO2, encrypt, length, start);
+
+    return status;
+}
+
+void binding_ctr_drbg(const uint8_t entropy[], uint8_t out[], size_t length) {
+    drbg_state state;
+
+    drbg_instantiate(&state, entropy);
+    drbg_request(&state, out, length);
+    drbg_request(&state, out, length);
+}
+
+void binding_schedule_init(binding_schedule *schedule, const uint8_t key[32]) {
+    aes256_set_encryption_key(key, schedule->encryptionKey);
+    aes256_set_decryption_key(key, schedule->decryptionKey);
+}
+
+void binding_schedule_ige256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[32], int encrypt) {
+    uint64_t start = stats_start();
+
+    ige256_crypt(in, out, length, encrypt ? schedule->encryptionKey : schedule->decryptionKey, iv, (uint8_t) encrypt);
+    stats_record(STATS_IGE, encrypt, length, start);
+}
+
+void binding_schedule_cbc256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[16], int encrypt) {
+    uint8_t ivCopy[AES_BLOCK_SIZE];
+    uint64_t start = stats_start();
+
+    memcpy(ivCopy, iv, AES_BLOCK_SIZE);
+    cbc256_crypt(in, out, length, encrypt ? schedule->encryptionKey : schedule->decryptionKey, ivCopy, (uint8_t) encrypt);
+    stats_record(STATS_CBC, encrypt, length, start);
+}
+
+void binding_ctr_init(binding_ctr *ctr, const uint8_t key[32], const uint8_t iv[16], uint8_t ring[], size_t prefetch) {
+    aes256_set_encryption_key(key, ctr->expandedKey);
+    memcpy(ctr->start, iv, AES_BLOCK_SIZE);
+    memcpy(ctr->iv, iv, AES_BLOCK_SIZE);
+    ctr->state = 0;
+    ctr256_prefetch_init(&ctr->prefetch, ring, prefetch);
+}
+
+void binding_ctr_update(binding_ctr *ctr, const uint8_t in[], uint8_t out[], size_t length) {
+    uint64_t start = stats_start();
+
+    ctr256_prefetch_crypt(&ctr->prefetch, in, out, length, ctr->expandedKey, ctr->iv, &ctr->state);
+    // Encryption and decryption are the same operation, the stream doesn't know which one it does
+    stats_record(STATS_CTR, 1, length, start);
+}
+
+void binding_ctr_seek(binding_ctr *ctr, uint64_t offset) {
+    ctr256_prefetch_clear(&ctr->prefetch);
+    memcpy(ctr->iv, ctr->start, AES_BLOCK_SIZE);
+    ctr256_seek(ctr->iv, &ctr->state, offset);
+}
+
+size_t binding_ctr_refill(binding_ctr *ctr) {
+    return ctr256_prefetch_refill(&ctr->prefetch, ctr->expandedKey, ctr->iv, &ctr->state);
+}
+
+void binding_stream_init(binding_stream *stream, const uint8_t key[32], const uint8_t iv[], int mode, int encrypt) {
+    if (mode == BINDING_CTR || encrypt)
+        aes256_set_encryption_key(key, stream->expandedKey);
+    else
+        aes256_set_decryption_key(key, stream->expandedKey);
+
+    memcpy(stream->iv, iv, mode == BINDING_IGE ? 2 * AES_BLOCK_SIZE : AES_BLOCK_SIZE);
+    stream->buffered = 0;
+    stream->mode = (uint8_t) mode;
+    stream->encrypt = (uint8_t) encrypt;
+    stream->state = 0;
+}
+
+// Same as AES256Stream_process in tgcrypto.c: when bytes are buffered the output is shifted ahead of the input, so the
+// input is moved into out first and processed in place, which works even when out is in itself
+void binding_stream_update(binding_stream *stream, const uint8_t in[], size_t length, uint8_t out[], size_t blocks) {
+    uint8_t pending[AES_BLOCK_SIZE];
+    size_t tail = stream->buffered + length - blocks;
+    uint64_t start;
+
+    if (blocks == 0) {
+        memcpy(stream->buffer + stream->buffered, in, length);
+        stream->buffered = (uint8_t) tail;
+        return;
+    }
+
+    memcpy(pending, in + length - tail, tail);
+
+    if (stream->buffered) {
+        memmove(out + stream->buffered, in, blocks - stream->buffered);
+        memcpy(out, stream->buffer, stream->buffered);
+        in = out;
+    }
+
+    start = stats_start();
+    binding_stream_chunk(stream, in, out, blocks);
+    stats_record(stream->mode, stream->encrypt, blocks, start);
+
+    memcpy(stream->buffer, pending, tail);
+    stream->buffered = (uint8_t) tail;
+}
+
+void binding_stream_chunk(binding_stream *stream, const uint8_t in[], uint8_t out[], size_t length) {
+    switch (stream->mode) {
+        case BINDING_IGE:
+            ige256_update(in, out, length, stream->expandedKey, stream->iv, stream->encrypt);
+            break;
+        case BINDING_CTR:
+            ctr256_crypt(in, out, length, stream->expandedKey, stream->iv, &stream->state);
+            break;
+        default:
+            cbc256_crypt(in, out, length, stream->expandedKey, stream->iv, stream->encrypt);
+    }
+}
+
+// Nothing is left to process, the key schedule and the chaining state are not needed anymore
+void binding_stream_clear(binding_stream *stream) {
+    secure_zero(stream->expandedKey, sizeof(stream->expandedKey));
+    secure_zero(stream->iv, sizeof(stream->iv));
+    secure_zero(stream->buffer, sizeof(stream->buffer));
+}
+
+int binding_obfuscated_init(obfuscated_codec *codec, uint8_t header[], uint8_t protocol, uint8_t ring[], size_t prefetch) {
+    ctr256_prefetch_init(&codec->prefetch, ring, prefetch);
+
+    return obfuscated_init(codec, header, protocol);
+}
+
+void binding_obfuscated_encode(obfuscated_codec *codec, const uint8_t in[], size_t length, uint8_t out[]) {
+    uint64_t start = stats_start();
+    size_t size = obfuscated_frame_size(codec, length);
+
+    obfuscated_encode(codec, in, length, out);
+    stats_record(STATS_CTR, 1, size, start);
+}
+
+void binding_obfuscated_decode(obfuscated_codec *codec, uint8_t buf[], size_t length) {
+    uint64_t start = stats_start();
+
+    obfuscated_decode(codec, buf, length);
+    stats_record(STATS_CTR, 0, length, start);
+}
@@ -0,0 +1,115 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "aes256.h"
+#include "ctr256.h"
+#include "ige256.h"
+#include "obfuscated.h"
+#include "stats.h"
+
+#ifndef BINDING_H
+#define BINDING_H
+
+// Entry points of the CFFI binding used on PyPy, where the C-API extension goes through the slow cpyext layer.
+// Each one does the work tgcrypto.c does with the GIL released, so that a Python call is a single C call.
+// Arguments are checked on the Python side, in tgcrypto/_cffi.py
+
+enum {
+    BINDING_IGE = STATS_IGE,
+    BINDING_CTR = STATS_CTR,
+    BINDING_CBC = STATS_CBC
+};
+
+// Precomputed encryption and decryption key schedules of IGE256 and CBC256
+typedef struct {
+    uint32_t encryptionKey[EXPANDED_KEY_SIZE];
+    uint32_t decryptionKey[EXPANDED_KEY_SIZE];
+} binding_schedule;
+
+// AES256CTR: the counter and keystream offset carried between updates, start being the IV seek() counts from.
+// The prefetch ring is a cdata array kept alive by the Python object
+typedef struct {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t start[AES_BLOCK_SIZE];
+    uint8_t iv[AES_BLOCK_SIZE];
+    uint8_t state;
+    ctr256_prefetch prefetch;
+} binding_ctr;
+
+// AES256IGE and AES256CBC, also used for the chunks of encrypt_file and decrypt_file, whose sizes are multiples of
+// 16 bytes except in CTR mode, where the counter and keystream offset are carried instead of the IV
+typedef struct {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t iv[2 * AES_BLOCK_SIZE];
+    uint8_t buffer[AES_BLOCK_SIZE];
+    uint8_t buffered;
+    uint8_t mode;
+    uint8_t encrypt;
+    uint8_t state;
+} binding_stream;
+
+void binding_init(void);
+
+void binding_set_stats(int enabled);
+
+// Nonzero when out partially overlaps in, in-place operation (out is in) being allowed
+int binding_overlaps(const uint8_t in[], size_t inLength, const uint8_t out[], size_t outLength);
+
+void binding_ige256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[32], int encrypt);
+void binding_ctr256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], uint8_t *state, int encrypt);
+void binding_ctr256_at(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset, int encrypt);
+
+// Fused CTR decryption and SHA-256 check of every chunk bytes, see cdn256_decrypt_verify
+int binding_cdn256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], const uint8_t iv[16], uint64_t offset,
+                   const uint8_t hashes[], size_t chunk, size_t *mismatch);
+void binding_cbc256(const uint8_t in[], uint8_t out[], size_t length, const uint8_t key[32], uint8_t iv[16], int encrypt);
+
+// jobs are filled in but for their expanded keys, which are computed from keys into expandedKeys
+void binding_ige256_many(ige256_job jobs[], const uint8_t *const keys[], uint32_t expandedKeys[][EXPANDED_KEY_SIZE], size_t count, int encrypt);
+
+int binding_mtproto2(const uint8_t authKey[], const uint8_t authKeyId[], const uint8_t in[], size_t length, uint8_t out[], int isClient, int encrypt);
+
+void binding_ctr_drbg(const uint8_t entropy[], uint8_t out[], size_t length);
+
+void binding_schedule_init(binding_schedule *schedule, const uint8_t key[32]);
+void binding_schedule_ige256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[32], int encrypt);
+void binding_schedule_cbc256(const binding_schedule *schedule, const uint8_t in[], uint8_t out[], size_t length, const uint8_t iv[16], int encrypt);
+
+void binding_ctr_init(binding_ctr *ctr, const uint8_t key[32], const uint8_t iv[16], uint8_t ring[], size_t prefetch);
+void binding_ctr_update(binding_ctr *ctr, const uint8_t in[], uint8_t out[], size_t length);
+void binding_ctr_seek(binding_ctr *ctr, uint64_t offset);
+size_t binding_ctr_refill(binding_ctr *ctr);
+
+void binding_stream_init(binding_stream *stream, const uint8_t key[32], const uint8_t iv[], int mode, int encrypt);
+// Processes the buffered bytes followed by in, blocks being the size of the complete blocks written to out
+void binding_stream_update(binding_stream *stream, const uint8_t in[], size_t length, uint8_t out[], size_t blocks);
+// Processes one chunk of a file, stats are recorded once for the whole file by the caller
+void binding_stream_chunk(binding_stream *stream, const uint8_t in[], uint8_t out[], size_t length);
+void binding_stream_clear(binding_stream *stream);
+
+// ObfuscatedCodec, whose receive buffer is a bytearray on the Python side
+int binding_obfuscated_init(obfuscated_codec *codec, uint8_t header[], uint8_t protocol, uint8_t ring[], size_t prefetch);
+void binding_obfuscated_encode(obfuscated_codec *codec, const uint8_t in[], size_t length, uint8_t out[]);
+void binding_obfuscated_decode(obfuscated_codec *codec, uint8_t buf[], size_t length);
+
+#endif  // BINDING_H
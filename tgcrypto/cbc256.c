@@ -19,38 +19,89 @@
  */
 
 #include "aes256.h"
+#include "parallel.h"
+#include "utils.h"
 
-uint8_t *cbc256(const uint8_t in[], uint32_t length, const uint8_t key[32], uint8_t iv[16], uint8_t encrypt) {
-    uint8_t *out = (uint8_t *) malloc(length * sizeof(uint8_t));
-    uint8_t nextIv[AES_BLOCK_SIZE];
-    uint32_t expandedKey[EXPANDED_KEY_SIZE];
-    uint32_t i, j;
+#define CBC_BLOCKS 8
 
-    memcpy(out, in, length);
+typedef struct {
+    const uint8_t *in;
+    uint8_t *out;
+    size_t length;
+    const uint32_t *expandedKey;
+    uint8_t iv[AES_BLOCK_SIZE];
+} cbc256_segment;
 
-    if (encrypt) {
-        aes256_set_encryption_key(key, expandedKey);
+// Decryption has no dependency between blocks: decrypt CBC_BLOCKS of them together, then XOR each with the
+// previous ciphertext. Ciphertext is copied aside first so that in and out may be the same buffer.
+static void cbc256_decrypt_segment(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16]) {
+    uint8_t chunk[CBC_BLOCKS * AES_BLOCK_SIZE];
+    size_t i, n;
 
-        for (i = 0; i < length; i += AES_BLOCK_SIZE) {
-            for (j = 0; j < AES_BLOCK_SIZE; ++j)
-                out[i + j] ^= iv[j];
+    for (i = 0; i < length; i += n) {
+        n = MIN(length - i, sizeof(chunk));
 
-            aes256_encrypt(&out[i], &out[i], expandedKey);
-            memcpy(iv, &out[i], AES_BLOCK_SIZE);
-        }
-    } else {
-        aes256_set_decryption_key(key, expandedKey);
+        memcpy(chunk, &in[i], n);
+        aes256_decrypt_blocks(chunk, &out[i], n / AES_BLOCK_SIZE, expandedKey);
 
-        for (i = 0; i < length; i += AES_BLOCK_SIZE) {
-            memcpy(nextIv, &out[i], AES_BLOCK_SIZE);
-            aes256_decrypt(&out[i], &out[i], expandedKey);
+        xor_bytes(&out[i], &out[i], iv, AES_BLOCK_SIZE);
+        xor_bytes(&out[i + AES_BLOCK_SIZE], &out[i + AES_BLOCK_SIZE], chunk, n - AES_BLOCK_SIZE);
 
-            for (j = 0; j < AES_BLOCK_SIZE; ++j)
-                out[i + j] ^= iv[j];
+        memcpy(iv, &chunk[n - AES_BLOCK_SIZE], AES_BLOCK_SIZE);
+    }
+}
+
+static void cbc256_decrypt_task(void *arg) {
+    cbc256_segment *segment = (cbc256_segment *) arg;
+
+    cbc256_decrypt_segment(segment->in, segment->out, segment->length, segment->expandedKey, segment->iv);
+}
+
+// Large buffers are split across threads. Each segment starts from the ciphertext block preceding it,
+// which is captured before any thread runs, since in-place decryption overwrites it.
+static void cbc256_decrypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16]) {
+    cbc256_segment segments[PARALLEL_MAX_THREADS];
+    uint8_t lastIv[AES_BLOCK_SIZE];
+    uint32_t count = parallel_segments(length), k;
+    size_t blocks = length / AES_BLOCK_SIZE, start = 0;
+
+    if (count < 2) {
+        cbc256_decrypt_segment(in, out, length, expandedKey, iv);
+        return;
+    }
+
+    for (k = 0; k < count; ++k) {
+        segments[k].in = &in[start];
+        segments[k].out = &out[start];
+        segments[k].length = (blocks / count + (k < blocks % count)) * AES_BLOCK_SIZE;
+        segments[k].expandedKey = expandedKey;
+        memcpy(segments[k].iv, k == 0 ? iv : &in[start - AES_BLOCK_SIZE], AES_BLOCK_SIZE);
 
-            memcpy(iv, nextIv, AES_BLOCK_SIZE);
-        }
+        start += segments[k].length;
     }
 
-    return out;
+    memcpy(lastIv, &in[length - AES_BLOCK_SIZE], AES_BLOCK_SIZE);
+    parallel_run(cbc256_decrypt_task, segments, sizeof(cbc256_segment), count);
+    memcpy(iv, lastIv, AES_BLOCK_SIZE);
+}
+
+void cbc256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t encrypt) {
+    size_t i;
+    uint8_t j;
+
+    if (!encrypt) {
+        cbc256_decrypt(in, out, length, expandedKey, iv);
+        return;
+    }
+
+    if (in != out)
+        memcpy(out, in, length);
+
+    for (i = 0; i < length; i += AES_BLOCK_SIZE) {
+        for (j = 0; j < AES_BLOCK_SIZE; ++j)
+            out[i + j] ^= iv[j];
+
+        aes256_encrypt(&out[i], &out[i], expandedKey);
+        memcpy(iv, &out[i], AES_BLOCK_SIZE);
+    }
 }
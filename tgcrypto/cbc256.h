@@ -21,6 +21,6 @@
 #ifndef CBC256_H
 #define CBC256_H
 
-uint8_t *cbc256(const uint8_t in[], uint32_t length, const uint8_t key[32], uint8_t iv[16], uint8_t encrypt);
+void cbc256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t encrypt);
 
 #endif  // CBC256_H
@@ -0,0 +1,131 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <string.h>
+
+#include "aes256.h"
+#include "cdn256.h"
+#include "ctr256.h"
+#include "parallel.h"
+#include "sha256.h"
+
+// Plaintext is hashed right after being decrypted, a piece at a time, while it is still in L1
+#define PIECE_SIZE (16 * 1024)
+
+typedef struct {
+    const uint8_t *in;
+    uint8_t *out;
+    size_t length;
+    const uint32_t *expandedKey;
+    uint8_t iv[AES_BLOCK_SIZE];
+    uint8_t state;
+    const uint8_t *hashes;
+    size_t chunk;
+    size_t first;
+    size_t mismatch;
+    int result;
+} cdn256_segment;
+
+size_t cdn256_hash_count(size_t length, size_t chunk) {
+    return length / chunk + (length % chunk != 0);
+}
+
+static void cdn256_serial(cdn256_segment *segment) {
+    uint8_t digest[SHA256_DIGEST_SIZE];
+    size_t index = segment->first, done = 0, size, piece, k;
+    sha256_ctx ctx;
+
+    segment->result = CDN256_OK;
+
+    while (done < segment->length) {
+        size = segment->length - done < segment->chunk ? segment->length - done : segment->chunk;
+
+        sha256_init(&ctx);
+
+        for (k = 0; k < size; k += piece) {
+            piece = size - k < PIECE_SIZE ? size - k : PIECE_SIZE;
+
+            ctr256_crypt(&segment->in[done + k], &segment->out[done + k], piece, segment->expandedKey,
+                         segment->iv, &segment->state);
+            sha256_update(&ctx, &segment->out[done + k], piece);
+        }
+
+        sha256_final(&ctx, digest);
+
+        if (memcmp(digest, &segment->hashes[index * CDN256_HASH_SIZE], CDN256_HASH_SIZE) != 0) {
+            segment->mismatch = index;
+            segment->result = CDN256_HASH_MISMATCH;
+            return;
+        }
+
+        done += size;
+        ++index;
+    }
+}
+
+static void cdn256_task(void *arg) {
+    cdn256_serial((cdn256_segment *) arg);
+}
+
+// Each hashed range can be decrypted on its own from a counter derived from the IV, so large parts are split into
+// segments made of whole ranges and processed on separate threads, the same way ctr256_crypt splits its buffers
+int cdn256_decrypt_verify(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60],
+                          const uint8_t iv[16], uint64_t offset, const uint8_t hashes[], size_t chunk,
+                          size_t *mismatch) {
+    cdn256_segment segments[PARALLEL_MAX_THREADS];
+    size_t count = cdn256_hash_count(length, chunk), start, end;
+    uint32_t segmentCount = parallel_segments(length), k;
+
+    if (segmentCount > count)
+        segmentCount = (uint32_t) count;
+
+    if (segmentCount < 1)
+        segmentCount = 1;
+
+    for (k = 0; k < segmentCount; ++k) {
+        start = count * k / segmentCount;
+        end = count * (k + 1) / segmentCount;
+
+        segments[k].in = &in[start * chunk];
+        segments[k].out = &out[start * chunk];
+        segments[k].length = (k == segmentCount - 1 ? length : end * chunk) - start * chunk;
+        segments[k].expandedKey = expandedKey;
+        segments[k].hashes = hashes;
+        segments[k].chunk = chunk;
+        segments[k].first = start;
+        memcpy(segments[k].iv, iv, AES_BLOCK_SIZE);
+        ctr256_seek(segments[k].iv, &segments[k].state, offset + start * chunk);
+    }
+
+    if (segmentCount < 2)
+        cdn256_serial(&segments[0]);
+    else
+        parallel_run(cdn256_task, segments, sizeof(cdn256_segment), segmentCount);
+
+    // Segments are in order, the first one reporting a mismatch holds the first range that does not match
+    for (k = 0; k < segmentCount; ++k) {
+        if (segments[k].result != CDN256_OK) {
+            *mismatch = segments[k].mismatch;
+            return CDN256_HASH_MISMATCH;
+        }
+    }
+
+    return CDN256_OK;
+}
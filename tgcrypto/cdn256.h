@@ -0,0 +1,45 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef CDN256_H
+#define CDN256_H
+
+#define CDN256_HASH_SIZE 32
+
+// Ranges hashed by the CDN file_hash objects of upload.getCdnFileHashes
+#define CDN256_DEFAULT_CHUNK (128 * 1024)
+
+#define CDN256_OK 0
+#define CDN256_HASH_MISMATCH -1
+
+// Number of hashes covering length bytes split in ranges of chunk bytes
+size_t cdn256_hash_count(size_t length, size_t chunk);
+
+// Decrypts length bytes of the CTR keystream starting at offset and checks the SHA-256 of every chunk bytes of
+// plaintext against the matching one of the concatenated hashes. On a mismatch the index of the first range that
+// does not match is stored in mismatch and the output is not fully decrypted
+int cdn256_decrypt_verify(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60],
+                          const uint8_t iv[16], uint64_t offset, const uint8_t hashes[], size_t chunk,
+                          size_t *mismatch);
+
+#endif  // CDN256_H
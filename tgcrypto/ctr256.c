@@ -19,36 +19,198 @@
  */
 
 #include "aes256.h"
+#include "ctr256.h"
+#include "parallel.h"
+#include "utils.h"
 
-#define MIN(a, b) (((a) < (b)) ? (a) : (b))
+#define CTR_BLOCKS 8
 
-uint8_t *ctr256(const uint8_t in[], uint32_t length, const uint8_t key[32], uint8_t iv[16], uint8_t *state) {
-    uint8_t *out = (uint8_t *) malloc(length * sizeof(uint8_t));
-    uint8_t chunk[AES_BLOCK_SIZE];
-    uint32_t expandedKey[EXPANDED_KEY_SIZE];
-    uint32_t i, j, k;
+static void increment(uint8_t iv[16]) {
+    uint32_t k = AES_BLOCK_SIZE;
 
-    memcpy(out, in, length);
-    aes256_set_encryption_key(key, expandedKey);
+    while (k--)
+        if (++iv[k])
+            break;
+}
+
+// Adds blocks to the 128-bit big-endian counter
+void ctr256_add(uint8_t iv[16], uint64_t blocks) {
+    uint32_t k = AES_BLOCK_SIZE, sum;
+
+    while (k-- && blocks) {
+        sum = iv[k] + (uint32_t) (blocks & 0xff);
+        iv[k] = (uint8_t) sum;
+        blocks = (blocks >> 8) + (sum >> 8);
+    }
+}
+
+// Moves the counter and the keystream position to any byte offset from the given IV
+void ctr256_seek(uint8_t iv[16], uint8_t *state, uint64_t offset) {
+    ctr256_add(iv, offset / AES_BLOCK_SIZE);
+    *state = (uint8_t) (offset % AES_BLOCK_SIZE);
+}
 
-    aes256_encrypt(iv, chunk, expandedKey);
+static void ctr256_serial(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state) {
+    uint8_t counters[CTR_BLOCKS * AES_BLOCK_SIZE], stream[CTR_BLOCKS * AES_BLOCK_SIZE];
+    size_t i, n, blocks;
 
-    for (i = 0; i < length; i += AES_BLOCK_SIZE)
-        for (j = 0; j < MIN(length - i, AES_BLOCK_SIZE); ++j) {
-            out[i + j] ^= chunk[(*state)++];
+    // Finish the keystream block left partially consumed by the previous call
+    if (*state) {
+        aes256_encrypt(iv, stream, expandedKey);
 
-            if (*state >= AES_BLOCK_SIZE)
-                *state = 0;
+        n = MIN(length, (size_t) (AES_BLOCK_SIZE - *state));
+        xor_bytes(out, in, stream + *state, n);
 
-            if (*state == 0) {
-                k = AES_BLOCK_SIZE;
-                while(k--)
-                    if (++iv[k])
-                        break;
+        *state += n;
+        in += n;
+        out += n;
+        length -= n;
 
-                aes256_encrypt(iv, chunk, expandedKey);
-            }
+        if (*state < AES_BLOCK_SIZE)
+            return;
+
+        *state = 0;
+        increment(iv);
+    }
+
+    while (length >= AES_BLOCK_SIZE) {
+        blocks = MIN(length / AES_BLOCK_SIZE, CTR_BLOCKS);
+
+        for (i = 0; i < blocks; ++i) {
+            memcpy(&counters[i * AES_BLOCK_SIZE], iv, AES_BLOCK_SIZE);
+            increment(iv);
         }
 
-    return out;
+        aes256_encrypt_blocks(counters, stream, blocks, expandedKey);
+
+        n = blocks * AES_BLOCK_SIZE;
+        xor_bytes(out, in, stream, n);
+
+        in += n;
+        out += n;
+        length -= n;
+    }
+
+    // Keep the remaining keystream position for the next call
+    if (length) {
+        aes256_encrypt(iv, stream, expandedKey);
+        xor_bytes(out, in, stream, length);
+
+        *state = (uint8_t) length;
+    }
+}
+
+typedef struct {
+    const uint8_t *in;
+    uint8_t *out;
+    size_t length;
+    const uint32_t *expandedKey;
+    uint8_t iv[AES_BLOCK_SIZE];
+    uint8_t state;
+} ctr256_segment;
+
+static void ctr256_task(void *arg) {
+    ctr256_segment *segment = (ctr256_segment *) arg;
+
+    ctr256_serial(segment->in, segment->out, segment->length, segment->expandedKey, segment->iv, &segment->state);
+}
+
+// Any keystream position can be derived from the IV, so large buffers are split into segments, each one starting
+// from its own counter, and processed on separate threads. Segment boundaries fall on keystream block boundaries.
+void ctr256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state) {
+    ctr256_segment segments[PARALLEL_MAX_THREADS];
+    uint32_t count = parallel_segments(length), k;
+    size_t blocks, start = 0, end;
+
+    if (count < 2) {
+        ctr256_serial(in, out, length, expandedKey, iv, state);
+        return;
+    }
+
+    blocks = (*state + length) / AES_BLOCK_SIZE;
+
+    for (k = 0; k < count; ++k) {
+        end = k == count - 1 ? length : (blocks * (k + 1) / count) * AES_BLOCK_SIZE - *state;
+
+        segments[k].in = &in[start];
+        segments[k].out = &out[start];
+        segments[k].length = end - start;
+        segments[k].expandedKey = expandedKey;
+        segments[k].state = (uint8_t) ((*state + start) % AES_BLOCK_SIZE);
+        memcpy(segments[k].iv, iv, AES_BLOCK_SIZE);
+        ctr256_add(segments[k].iv, (*state + start) / AES_BLOCK_SIZE);
+
+        start = end;
+    }
+
+    parallel_run(ctr256_task, segments, sizeof(ctr256_segment), count);
+
+    ctr256_add(iv, blocks);
+    *state = (uint8_t) ((*state + length) % AES_BLOCK_SIZE);
+}
+
+void ctr256_prefetch_init(ctr256_prefetch *prefetch, uint8_t ring[], size_t size) {
+    prefetch->ring = ring;
+    prefetch->size = ring != NULL ? size : 0;
+    prefetch->head = 0;
+    prefetch->filled = 0;
+}
+
+// Takes up to length bytes of keystream from the ring, returning how many were used. The consumed bytes are wiped
+static size_t prefetch_take(ctr256_prefetch *prefetch, const uint8_t in[], uint8_t out[], size_t length) {
+    size_t taken = 0, n;
+
+    while (taken < length && prefetch->filled) {
+        n = MIN(MIN(length - taken, prefetch->filled), prefetch->size - prefetch->head);
+
+        xor_bytes(out + taken, in + taken, prefetch->ring + prefetch->head, n);
+        secure_zero(prefetch->ring + prefetch->head, n);
+
+        taken += n;
+        prefetch->filled -= n;
+        prefetch->head = (prefetch->head + n) % prefetch->size;
+    }
+
+    return taken;
+}
+
+void ctr256_prefetch_crypt(ctr256_prefetch *prefetch, const uint8_t in[], uint8_t out[], size_t length,
+                           const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state) {
+    size_t taken = prefetch->filled ? prefetch_take(prefetch, in, out, length) : 0;
+
+    // The ring is empty by now, so the counter is right where the keystream continues
+    if (taken < length)
+        ctr256_crypt(in + taken, out + taken, length - taken, expandedKey, iv, state);
+}
+
+// Keystream is what encrypting zeros gives. The free part of the ring is at most two runs, after the available bytes
+// and from the start of the ring
+size_t ctr256_prefetch_refill(ctr256_prefetch *prefetch, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state) {
+    size_t missing = prefetch->size - prefetch->filled, tail, n;
+
+    if (missing == 0)
+        return 0;
+
+    tail = (prefetch->head + prefetch->filled) % prefetch->size;
+    n = MIN(missing, prefetch->size - tail);
+
+    memset(prefetch->ring + tail, 0, n);
+    ctr256_crypt(prefetch->ring + tail, prefetch->ring + tail, n, expandedKey, iv, state);
+
+    if (n < missing) {
+        memset(prefetch->ring, 0, missing - n);
+        ctr256_crypt(prefetch->ring, prefetch->ring, missing - n, expandedKey, iv, state);
+    }
+
+    prefetch->filled = prefetch->size;
+
+    return missing;
+}
+
+void ctr256_prefetch_clear(ctr256_prefetch *prefetch) {
+    if (prefetch->ring != NULL)
+        secure_zero(prefetch->ring, prefetch->size);
+
+    prefetch->head = 0;
+    prefetch->filled = 0;
 }
@@ -21,6 +21,34 @@
 #ifndef CTR256_H
 #define CTR256_H
 
-uint8_t *ctr256(const uint8_t in[], uint32_t length, const uint8_t key[32], uint8_t iv[16], uint8_t *state);
+// Largest keystream a stream may compute ahead of use
+#define CTR256_MAX_PREFETCH (16 * 1024 * 1024)
+
+// Keystream computed ahead of use: filled bytes of the ring of size bytes are available from head. The counter and
+// the keystream offset of a stream using it point to the first byte not computed yet
+typedef struct {
+    uint8_t *ring;
+    size_t size;
+    size_t head;
+    size_t filled;
+} ctr256_prefetch;
+
+void ctr256_add(uint8_t iv[16], uint64_t blocks);
+
+void ctr256_seek(uint8_t iv[16], uint8_t *state, uint64_t offset);
+
+void ctr256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state);
+
+void ctr256_prefetch_init(ctr256_prefetch *prefetch, uint8_t ring[], size_t size);
+
+// Same as ctr256_crypt, using the prefetched keystream first. With an empty ring it is ctr256_crypt
+void ctr256_prefetch_crypt(ctr256_prefetch *prefetch, const uint8_t in[], uint8_t out[], size_t length,
+                           const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state);
+
+// Computes keystream until the ring is full, returning the number of bytes computed
+size_t ctr256_prefetch_refill(ctr256_prefetch *prefetch, const uint32_t expandedKey[60], uint8_t iv[16], uint8_t *state);
+
+// Wipes and drops the prefetched keystream, to be done before moving the counter elsewhere
+void ctr256_prefetch_clear(ctr256_prefetch *prefetch);
 
 #endif  // CTR256_H
@@ -0,0 +1,161 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "drbg.h"
+#include "urandom.h"
+#include "utils.h"
+
+#ifdef _WIN32
+#define THREAD_LOCAL __declspec(thread)
+#else
+#include <pthread.h>
+
+#define THREAD_LOCAL __thread
+#endif
+
+// Each thread has its own generator, so generating never takes a lock
+static THREAD_LOCAL drbg_state drbg;
+
+// Bumped in forked children, whose copy of the generator is then reseeded before use
+static volatile uint32_t generation = 0;
+
+static void increment(uint8_t v[AES_BLOCK_SIZE]) {
+    uint32_t k = AES_BLOCK_SIZE;
+
+    while (k--)
+        if (++v[k])
+            break;
+}
+
+// CTR_DRBG_Update: the next 48 bytes of keystream, xored with the provided data if any, become the new key and V
+static void drbg_update(drbg_state *state, const uint8_t provided[DRBG_SEED_SIZE]) {
+    uint8_t temp[DRBG_SEED_SIZE];
+    size_t i;
+
+    for (i = 0; i < DRBG_SEED_SIZE; i += AES_BLOCK_SIZE) {
+        increment(state->v);
+        memcpy(temp + i, state->v, AES_BLOCK_SIZE);
+    }
+
+    aes256_encrypt_blocks(temp, temp, DRBG_SEED_SIZE / AES_BLOCK_SIZE, state->expandedKey);
+
+    if (provided != NULL)
+        for (i = 0; i < DRBG_SEED_SIZE; ++i)
+            temp[i] ^= provided[i];
+
+    aes256_set_encryption_key(temp, state->expandedKey);
+    memcpy(state->v, temp + 32, AES_BLOCK_SIZE);
+    secure_zero(temp, sizeof(temp));
+}
+
+void drbg_instantiate(drbg_state *state, const uint8_t entropy[DRBG_SEED_SIZE]) {
+    uint8_t zero[32] = {0};
+
+    aes256_set_encryption_key(zero, state->expandedKey);
+    memset(state->v, 0, AES_BLOCK_SIZE);
+    drbg_update(state, entropy);
+
+    state->bytes = 0;
+    state->seeded = 1;
+}
+
+void drbg_reseed(drbg_state *state, const uint8_t entropy[DRBG_SEED_SIZE]) {
+    drbg_update(state, entropy);
+    state->bytes = 0;
+}
+
+void drbg_request(drbg_state *state, uint8_t buf[], size_t length) {
+    uint8_t block[AES_BLOCK_SIZE];
+    size_t blocks = length / AES_BLOCK_SIZE, i;
+
+    // The counter blocks are laid out in buf and encrypted in place
+    for (i = 0; i < blocks; ++i) {
+        increment(state->v);
+        memcpy(buf + i * AES_BLOCK_SIZE, state->v, AES_BLOCK_SIZE);
+    }
+
+    aes256_encrypt_blocks(buf, buf, blocks, state->expandedKey);
+
+    if (length % AES_BLOCK_SIZE) {
+        increment(state->v);
+        aes256_encrypt(state->v, block, state->expandedKey);
+        memcpy(buf + blocks * AES_BLOCK_SIZE, block, length % AES_BLOCK_SIZE);
+        secure_zero(block, sizeof(block));
+    }
+
+    // Backtracking resistance: the key that produced this output is gone once the request completes
+    drbg_update(state, NULL);
+    state->bytes += length;
+}
+
+// Instantiates the thread's generator on first use, reseeds it afterwards
+static int drbg_seed(drbg_state *state) {
+    uint8_t entropy[DRBG_SEED_SIZE];
+
+    if (urandom(entropy, sizeof(entropy)) < 0)
+        return -1;
+
+    if (state->seeded)
+        drbg_reseed(state, entropy);
+    else
+        drbg_instantiate(state, entropy);
+
+    secure_zero(entropy, sizeof(entropy));
+    state->generation = generation;
+
+    return 0;
+}
+
+#ifndef _WIN32
+static void drbg_after_fork(void) {
+    ++generation;
+}
+
+static void drbg_register(void) {
+    pthread_atfork(NULL, NULL, drbg_after_fork);
+}
+
+static pthread_once_t once = PTHREAD_ONCE_INIT;
+#endif
+
+void drbg_init(void) {
+#ifndef _WIN32
+    pthread_once(&once, drbg_register);
+#endif
+}
+
+int drbg_generate(uint8_t buf[], size_t length) {
+    drbg_state *state = &drbg;
+    size_t n;
+
+    while (length > 0) {
+        if (!state->seeded || state->generation != generation || state->bytes >= DRBG_RESEED_BYTES)
+            if (drbg_seed(state) < 0)
+                return -1;
+
+        n = MIN(length, (size_t) DRBG_MAX_REQUEST);
+        drbg_request(state, buf, n);
+
+        buf += n;
+        length -= n;
+    }
+
+    return 0;
+}
@@ -0,0 +1,61 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "aes256.h"
+
+#ifndef DRBG_H
+#define DRBG_H
+
+// NIST SP 800-90A CTR_DRBG with AES-256 and no derivation function: 32 bytes of key and 16 bytes of V
+#define DRBG_SEED_SIZE 48
+
+// Largest single generate request allowed by SP 800-90A (2^19 bits), longer outputs are split into several
+#define DRBG_MAX_REQUEST (64 * 1024)
+
+// Output after which the generator is reseeded from the operating system
+#define DRBG_RESEED_BYTES (1024 * 1024)
+
+typedef struct {
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t v[AES_BLOCK_SIZE];
+    uint64_t bytes;
+    uint32_t generation;
+    uint8_t seeded;
+} drbg_state;
+
+// The SP 800-90A functions on an explicit state, drbg_generate() is what uses them with the operating system entropy
+void drbg_instantiate(drbg_state *state, const uint8_t entropy[DRBG_SEED_SIZE]);
+
+void drbg_reseed(drbg_state *state, const uint8_t entropy[DRBG_SEED_SIZE]);
+
+// At most DRBG_MAX_REQUEST bytes
+void drbg_request(drbg_state *state, uint8_t buf[], size_t length);
+
+// Registers the fork handler, which makes children reseed instead of repeating the parent's output
+void drbg_init(void);
+
+// Fills buf from the calling thread's generator, seeding it first when needed. Returns 0 on success and -1 when the
+// operating system CSPRNG failed
+int drbg_generate(uint8_t buf[], size_t length);
+
+#endif  // DRBG_H
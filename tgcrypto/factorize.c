@@ -0,0 +1,224 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "factorize.h"
+
+#if defined(_MSC_VER) && defined(_M_X64)
+#include <intrin.h>
+#endif
+
+// Values are kept in Montgomery form x * 2^64 mod n, which turns every modular multiplication into two 64x64 bit
+// multiplications and no division
+typedef struct {
+    uint64_t n;
+    uint64_t inverse;  // n^-1 mod 2^64
+    uint64_t one;      // 2^64 mod n
+    uint64_t r2;       // 2^128 mod n
+} montgomery;
+
+static inline uint64_t mul128(uint64_t a, uint64_t b, uint64_t *high) {
+#if defined(__SIZEOF_INT128__)
+    unsigned __int128 r = (unsigned __int128) a * b;
+
+    *high = (uint64_t) (r >> 64);
+
+    return (uint64_t) r;
+#elif defined(_MSC_VER) && defined(_M_X64)
+    return _umul128(a, b, high);
+#else
+    uint64_t aLow = (uint32_t) a, aHigh = a >> 32, bLow = (uint32_t) b, bHigh = b >> 32;
+    uint64_t ll = aLow * bLow, lh = aLow * bHigh, hl = aHigh * bLow, hh = aHigh * bHigh;
+    uint64_t middle = (ll >> 32) + (uint32_t) lh + (uint32_t) hl;
+
+    *high = hh + (lh >> 32) + (hl >> 32) + (middle >> 32);
+
+    return (middle << 32) | (uint32_t) ll;
+#endif
+}
+
+// (a - b) mod n for a, b < n, without overflowing when n is above 2^63
+static inline uint64_t sub_mod(uint64_t a, uint64_t b, uint64_t n) {
+    return a >= b ? a - b : a - b + n;
+}
+
+static inline uint64_t add_mod(uint64_t a, uint64_t b, uint64_t n) {
+    return sub_mod(a, n - b, n);
+}
+
+// a * b * 2^-64 mod n. Since m * n has the same low half as a * b, the difference is exactly the high halves
+static inline uint64_t mont_mul(const montgomery *mont, uint64_t a, uint64_t b) {
+    uint64_t high, mHigh;
+    uint64_t m = mul128(a, b, &high) * mont->inverse;
+
+    mul128(m, mont->n, &mHigh);
+
+    return sub_mod(high, mHigh, mont->n);
+}
+
+static void mont_init(montgomery *mont, uint64_t n) {
+    uint64_t inverse = n, r;
+    int i;
+
+    // Newton's iteration, each step doubles the correct low bits starting from 3 (n * n = 1 mod 8 for odd n)
+    for (i = 0; i < 5; ++i)
+        inverse *= 2 - n * inverse;
+
+    mont->n = n;
+    mont->inverse = inverse;
+    mont->one = (0 - n) % n;
+
+    for (r = mont->one, i = 0; i < 64; ++i)
+        r = add_mod(r, r, n);
+
+    mont->r2 = r;
+}
+
+static inline uint64_t mont_from(const montgomery *mont, uint64_t x) {
+    return mont_mul(mont, x % mont->n, mont->r2);
+}
+
+static uint64_t mont_pow(const montgomery *mont, uint64_t base, uint64_t exponent) {
+    uint64_t result = mont->one;
+
+    for (; exponent; exponent >>= 1) {
+        if (exponent & 1)
+            result = mont_mul(mont, result, base);
+
+        base = mont_mul(mont, base, base);
+    }
+
+    return result;
+}
+
+static uint64_t gcd(uint64_t a, uint64_t b) {
+    uint64_t t;
+
+    while (b) {
+        t = a % b;
+        a = b;
+        b = t;
+    }
+
+    return a;
+}
+
+static const uint64_t bases[] = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37};
+
+#define BASES (sizeof(bases) / sizeof(bases[0]))
+
+int factorize_is_prime(uint64_t n) {
+    montgomery mont;
+    uint64_t d, x, minusOne;
+    size_t i;
+    int s, j;
+
+    if (n < 2)
+        return 0;
+
+    for (i = 0; i < BASES; ++i)
+        if (n % bases[i] == 0)
+            return n == bases[i];
+
+    for (d = n - 1, s = 0; (d & 1) == 0; d >>= 1, ++s);
+
+    mont_init(&mont, n);
+    minusOne = n - mont.one;
+
+    for (i = 0; i < BASES; ++i) {
+        x = mont_pow(&mont, mont_from(&mont, bases[i]), d);
+
+        if (x == mont.one || x == minusOne)
+            continue;
+
+        for (j = 1; j < s && x != minusOne; ++j)
+            x = mont_mul(&mont, x, x);
+
+        if (x != minusOne)
+            return 0;
+    }
+
+    return 1;
+}
+
+#define BRENT_BATCH 128
+
+// One run of Brent's cycle finding on x -> x^2 + c, with gcds taken on batches of products. Returns n on failure
+static uint64_t brent(const montgomery *mont, uint64_t c) {
+    uint64_t n = mont->n, x, y = mont_from(mont, 2), ys = y, q = mont->one, g = 1;
+    uint64_t r, i, k, steps;
+
+    for (r = 1; g == 1; r <<= 1) {
+        x = y;
+
+        for (i = 0; i < r; ++i)
+            y = add_mod(mont_mul(mont, y, y), c, n);
+
+        for (k = 0; k < r && g == 1; k += BRENT_BATCH) {
+            ys = y;
+            steps = r - k < BRENT_BATCH ? r - k : BRENT_BATCH;
+
+            for (i = 0; i < steps; ++i) {
+                y = add_mod(mont_mul(mont, y, y), c, n);
+                q = mont_mul(mont, q, sub_mod(x, y, n));
+            }
+
+            g = gcd(q, n);
+        }
+    }
+
+    // The batch overshot, possibly up to a product of 0: walk it again one step at a time
+    if (g == n)
+        do {
+            ys = add_mod(mont_mul(mont, ys, ys), c, n);
+            g = gcd(sub_mod(x, ys, n), n);
+        } while (g == 1);
+
+    return g;
+}
+
+int factorize(uint64_t n, uint64_t *p, uint64_t *q) {
+    montgomery mont;
+    uint64_t g = n, c;
+    size_t i;
+
+    if (n < 4 || factorize_is_prime(n))
+        return FACTORIZE_NOT_COMPOSITE;
+
+    // Small factors are found right away, which also leaves Montgomery form with the odd modulus it needs
+    for (i = 0; i < BASES && g == n; ++i)
+        if (n % bases[i] == 0)
+            g = bases[i];
+
+    if (g == n) {
+        mont_init(&mont, n);
+
+        for (c = 1; g == n; ++c)
+            g = brent(&mont, mont_from(&mont, c));
+    }
+
+    *p = g < n / g ? g : n / g;
+    *q = n / *p;
+
+    // The factor found is not necessarily the smallest one, any other split means there are more than two primes
+    if (!factorize_is_prime(*p) || !factorize_is_prime(*q))
+        return FACTORIZE_NOT_SEMIPRIME;
+
+    return 0;
+}
@@ -0,0 +1,37 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef FACTORIZE_H
+#define FACTORIZE_H
+
+// Deterministic Miller-Rabin, exact for every 64-bit number
+int factorize_is_prime(uint64_t n);
+
+#define FACTORIZE_NOT_COMPOSITE -1
+#define FACTORIZE_NOT_SEMIPRIME -2
+
+// Splits n, the pq of resPQ, into its two primes p <= q using Pollard-Brent rho. Returns FACTORIZE_NOT_COMPOSITE when
+// n is below 4 or prime, and FACTORIZE_NOT_SEMIPRIME when n has more than two prime factors
+int factorize(uint64_t n, uint64_t *p, uint64_t *q);
+
+#endif  // FACTORIZE_H
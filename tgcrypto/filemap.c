@@ -0,0 +1,300 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "filemap.h"
+
+#ifdef _WIN32
+#include <string.h>
+#include <windows.h>
+
+// ReadFile takes a 32-bit length
+#define MAX_READ (1024 * 1024 * 1024)
+
+static int filemap_map(filemap *map) {
+    map->data = NULL;
+    map->mapping = NULL;
+
+    if (map->size == 0)
+        return 0;
+
+    map->mapping = CreateFileMappingW(
+        map->file, NULL, PAGE_READWRITE, (DWORD) ((uint64_t) map->size >> 32), (DWORD) map->size, NULL
+    );
+
+    if (map->mapping == NULL)
+        return -1;
+
+    map->data = MapViewOfFile(map->mapping, FILE_MAP_WRITE, 0, 0, map->size);
+
+    return map->data == NULL ? -1 : 0;
+}
+
+int filemap_open_read(const filemap_char *path, filemap *map) {
+    LARGE_INTEGER size;
+
+    map->data = NULL;
+    map->mapping = NULL;
+    map->file = CreateFileW(path, GENERIC_READ, FILE_SHARE_READ, NULL, OPEN_EXISTING, FILE_FLAG_SEQUENTIAL_SCAN, NULL);
+
+    if (map->file == INVALID_HANDLE_VALUE)
+        return -1;
+
+    if (!GetFileSizeEx(map->file, &size))
+        return -1;
+
+    if ((uint64_t) size.QuadPart > SIZE_MAX) {
+        SetLastError(ERROR_FILE_TOO_LARGE);
+        return -1;
+    }
+
+    map->size = (size_t) size.QuadPart;
+
+    return 0;
+}
+
+int filemap_open_write(const filemap_char *path, size_t size, const filemap *source, filemap *map) {
+    BY_HANDLE_FILE_INFORMATION a, b;
+    LARGE_INTEGER end;
+
+    map->data = NULL;
+    map->mapping = NULL;
+    map->size = size;
+    map->file = CreateFileW(path, GENERIC_READ | GENERIC_WRITE, 0, NULL, OPEN_ALWAYS, FILE_ATTRIBUTE_NORMAL, NULL);
+
+    if (map->file == INVALID_HANDLE_VALUE)
+        return -1;
+
+    if (GetFileInformationByHandle(source->file, &a) && GetFileInformationByHandle(map->file, &b) &&
+        a.dwVolumeSerialNumber == b.dwVolumeSerialNumber &&
+        a.nFileIndexHigh == b.nFileIndexHigh && a.nFileIndexLow == b.nFileIndexLow)
+        return FILEMAP_SAME_FILE;
+
+    // Files are not sparse by default, moving the end of file allocates the clusters right away
+    end.QuadPart = (LONGLONG) size;
+
+    if (!SetFilePointerEx(map->file, end, NULL, FILE_BEGIN) || !SetEndOfFile(map->file))
+        return -1;
+
+    return filemap_map(map);
+}
+
+int filemap_read(const filemap *map, size_t offset, uint8_t buf[], size_t length) {
+    OVERLAPPED position;
+    DWORD n;
+
+    while (length) {
+        memset(&position, 0, sizeof(position));
+        position.Offset = (DWORD) offset;
+        position.OffsetHigh = (DWORD) ((uint64_t) offset >> 32);
+
+        if (!ReadFile(map->file, buf, (DWORD) (length < MAX_READ ? length : MAX_READ), &n, &position)) {
+            if (GetLastError() == ERROR_HANDLE_EOF)
+                return FILEMAP_TRUNCATED;
+
+            return -1;
+        }
+
+        if (n == 0)
+            return FILEMAP_TRUNCATED;
+
+        buf += n;
+        offset += n;
+        length -= n;
+    }
+
+    return 0;
+}
+
+void filemap_close(filemap *map) {
+    if (map->data != NULL)
+        UnmapViewOfFile(map->data);
+
+    if (map->mapping != NULL)
+        CloseHandle(map->mapping);
+
+    if (map->file != INVALID_HANDLE_VALUE)
+        CloseHandle(map->file);
+}
+
+int filemap_remove(const filemap_char *path) {
+    return DeleteFileW(path) ? 0 : -1;
+}
+#else
+#include <errno.h>
+#include <fcntl.h>
+#include <limits.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#ifndef O_CLOEXEC
+#define O_CLOEXEC 0
+#endif
+
+// pread takes at most SSIZE_MAX bytes, and Linux stops at about 2 GiB anyway
+#define MAX_READ (1024 * 1024 * 1024)
+
+static int filemap_map(filemap *map) {
+    map->data = NULL;
+
+    if (map->size == 0)
+        return 0;
+
+    map->data = mmap(NULL, map->size, PROT_READ | PROT_WRITE, MAP_SHARED, map->fd, 0);
+
+    if (map->data == MAP_FAILED) {
+        map->data = NULL;
+        return -1;
+    }
+
+#ifdef MADV_SEQUENTIAL
+    madvise(map->data, map->size, MADV_SEQUENTIAL);
+#endif
+
+    return 0;
+}
+
+// ftruncate alone only makes a sparse file, whose blocks are allocated by the page faults of the mapping
+static int filemap_reserve(int fd, size_t size) {
+#ifdef __APPLE__
+    fstore_t store = {F_ALLOCATECONTIG, F_PEOFPOSMODE, 0, (off_t) size, 0};
+
+    if (size == 0)
+        return 0;
+
+    if (fcntl(fd, F_PREALLOCATE, &store) < 0) {
+        store.fst_flags = F_ALLOCATEALL;
+
+        if (fcntl(fd, F_PREALLOCATE, &store) < 0)
+            return -1;
+    }
+
+    return 0;
+#else
+    int error;
+
+    if (size == 0)
+        return 0;
+
+    do
+        error = posix_fallocate(fd, 0, (off_t) size);
+    while (error == EINTR);
+
+    // File systems that can't reserve blocks keep the sparse file
+    if (error == EINVAL || error == EOPNOTSUPP)
+        return 0;
+
+    errno = error;
+
+    return error ? -1 : 0;
+#endif
+}
+
+int filemap_open_read(const filemap_char *path, filemap *map) {
+    struct stat st;
+
+    map->data = NULL;
+    map->fd = open(path, O_RDONLY | O_CLOEXEC);
+
+    if (map->fd < 0)
+        return -1;
+
+    if (fstat(map->fd, &st) < 0)
+        return -1;
+
+    if ((uint64_t) st.st_size > SIZE_MAX) {
+        errno = EFBIG;
+        return -1;
+    }
+
+    map->size = (size_t) st.st_size;
+
+#ifdef POSIX_FADV_SEQUENTIAL
+    posix_fadvise(map->fd, 0, 0, POSIX_FADV_SEQUENTIAL);
+#endif
+
+    return 0;
+}
+
+int filemap_open_write(const filemap_char *path, size_t size, const filemap *source, filemap *map) {
+    struct stat a, b;
+    int error;
+
+    map->data = NULL;
+    map->size = size;
+    map->fd = open(path, O_RDWR | O_CREAT | O_CLOEXEC, 0666);
+
+    if (map->fd < 0)
+        return -1;
+
+    if (fstat(source->fd, &a) == 0 && fstat(map->fd, &b) == 0 && a.st_dev == b.st_dev && a.st_ino == b.st_ino)
+        return FILEMAP_SAME_FILE;
+
+    // The previous content is dropped first, so that only the new size has to be reserved
+    if (ftruncate(map->fd, 0) < 0)
+        return -1;
+
+    if (filemap_reserve(map->fd, size) < 0 || ftruncate(map->fd, (off_t) size) < 0) {
+        error = errno;
+        ftruncate(map->fd, 0);
+        errno = error;
+
+        return -1;
+    }
+
+    return filemap_map(map);
+}
+
+int filemap_read(const filemap *map, size_t offset, uint8_t buf[], size_t length) {
+    ssize_t n;
+
+    while (length) {
+        n = pread(map->fd, buf, length < MAX_READ ? length : MAX_READ, (off_t) offset);
+
+        if (n < 0) {
+            if (errno == EINTR)
+                continue;
+
+            return -1;
+        }
+
+        if (n == 0)
+            return FILEMAP_TRUNCATED;
+
+        buf += n;
+        offset += (size_t) n;
+        length -= (size_t) n;
+    }
+
+    return 0;
+}
+
+void filemap_close(filemap *map) {
+    if (map->data != NULL)
+        munmap(map->data, map->size);
+
+    if (map->fd >= 0)
+        close(map->fd);
+}
+
+int filemap_remove(const filemap_char *path) {
+    return unlink(path);
+}
+#endif
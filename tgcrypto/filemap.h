@@ -0,0 +1,66 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef FILEMAP_H
+#define FILEMAP_H
+
+#ifdef _WIN32
+#include <wchar.h>
+
+typedef wchar_t filemap_char;
+#else
+typedef char filemap_char;
+#endif
+
+typedef struct {
+    uint8_t *data;
+    size_t size;
+#ifdef _WIN32
+    void *file;
+    void *mapping;
+#else
+    int fd;
+#endif
+} filemap;
+
+#define FILEMAP_SAME_FILE -2
+#define FILEMAP_TRUNCATED -3
+
+// Both return 0 on success and -1 on failure, with errno (or GetLastError on Windows) describing the error.
+// The source is opened for reading only, it is never mapped: a file truncated by someone else while mapped faults on
+// access (SIGBUS) instead of failing. Its data is NULL
+int filemap_open_read(const filemap_char *path, filemap *map);
+
+// Creates or truncates the file to size, unless it is the one already mapped by source (FILEMAP_SAME_FILE). The blocks
+// are reserved before mapping, so a full disk fails here rather than faulting on a write through the mapping
+int filemap_open_write(const filemap_char *path, size_t size, const filemap *source, filemap *map);
+
+// Reads length bytes found at offset, FILEMAP_TRUNCATED when the file ends before
+int filemap_read(const filemap *map, size_t offset, uint8_t buf[], size_t length);
+
+void filemap_close(filemap *map);
+
+// Deletes a destination left incomplete, once closed
+int filemap_remove(const filemap_char *path);
+
+#endif  // FILEMAP_H
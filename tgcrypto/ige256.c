@@ -19,17 +19,18 @@
  */
 
 #include "aes256.h"
+#include "ige256.h"
+#include "utils.h"
 
-uint8_t *ige256(const uint8_t in[], uint32_t length, const uint8_t key[32], const uint8_t iv[32], uint8_t encrypt) {
-    uint8_t *out = (uint8_t *) malloc(length * sizeof(uint8_t));
+// Like ige256_crypt, but iv is updated with the last ciphertext and plaintext blocks, ready for the next chunk
+void ige256_update(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[32], uint8_t encrypt) {
     uint8_t iv1[AES_BLOCK_SIZE], iv2[AES_BLOCK_SIZE];
     uint8_t chunk[AES_BLOCK_SIZE], buffer[AES_BLOCK_SIZE];
-    uint32_t expandedKey[EXPANDED_KEY_SIZE];
-    uint32_t i, j;
+    size_t i;
+    uint8_t j;
 
-    memcpy(encrypt ? iv1 : iv2, (uint8_t *) iv, AES_BLOCK_SIZE);
-    memcpy(encrypt ? iv2 : iv1, (uint8_t *) iv + AES_BLOCK_SIZE, AES_BLOCK_SIZE);
-    (encrypt ? aes256_set_encryption_key : aes256_set_decryption_key)(key, expandedKey);
+    memcpy(encrypt ? iv1 : iv2, iv, AES_BLOCK_SIZE);
+    memcpy(encrypt ? iv2 : iv1, iv + AES_BLOCK_SIZE, AES_BLOCK_SIZE);
 
     for (i = 0; i < length; i += AES_BLOCK_SIZE) {
         memcpy(chunk, &in[i], AES_BLOCK_SIZE);
@@ -46,5 +47,83 @@ uint8_t *ige256(const uint8_t in[], uint32_t length, const uint8_t key[32], cons
         memcpy(iv2, chunk, AES_BLOCK_SIZE);
     }
 
-    return out;
+    memcpy(iv, encrypt ? iv1 : iv2, AES_BLOCK_SIZE);
+    memcpy(iv + AES_BLOCK_SIZE, encrypt ? iv2 : iv1, AES_BLOCK_SIZE);
+}
+
+void ige256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], const uint8_t iv[32], uint8_t encrypt) {
+    uint8_t ivCopy[2 * AES_BLOCK_SIZE];
+
+    memcpy(ivCopy, iv, sizeof(ivCopy));
+    ige256_update(in, out, length, expandedKey, ivCopy, encrypt);
+}
+
+typedef struct {
+    const ige256_job *job;
+    size_t position;
+    uint8_t iv1[AES_BLOCK_SIZE];
+    uint8_t iv2[AES_BLOCK_SIZE];
+} ige256_lane;
+
+static void ige256_lane_start(ige256_lane *lane, const ige256_job *job, uint8_t encrypt) {
+    lane->job = job;
+    lane->position = 0;
+
+    memcpy(encrypt ? lane->iv1 : lane->iv2, job->iv, AES_BLOCK_SIZE);
+    memcpy(encrypt ? lane->iv2 : lane->iv1, job->iv + AES_BLOCK_SIZE, AES_BLOCK_SIZE);
+}
+
+// A single IGE stream is serial, so independent messages are advanced side by side instead: each step feeds one
+// block of every active message through the AES rounds together. Finished lanes are refilled with pending jobs.
+void ige256_crypt_many(const ige256_job jobs[], size_t count, uint8_t encrypt) {
+    ige256_lane lanes[AES256_MAX_LANES];
+    const uint32_t *keys[AES256_MAX_LANES];
+    uint8_t buffer[AES256_MAX_LANES * AES_BLOCK_SIZE], result[AES256_MAX_LANES * AES_BLOCK_SIZE];
+    uint8_t chunks[AES256_MAX_LANES * AES_BLOCK_SIZE];
+    size_t active = 0, next = 0, l;
+    ige256_lane *lane;
+
+    for (;;) {
+        while (active < AES256_MAX_LANES && next < count) {
+            if (jobs[next].length > 0)
+                ige256_lane_start(&lanes[active++], &jobs[next], encrypt);
+
+            ++next;
+        }
+
+        if (active == 0)
+            break;
+
+        for (l = 0; l < active; ++l) {
+            lane = &lanes[l];
+
+            memcpy(&chunks[l * AES_BLOCK_SIZE], &lane->job->in[lane->position], AES_BLOCK_SIZE);
+            xor_bytes(&buffer[l * AES_BLOCK_SIZE], &chunks[l * AES_BLOCK_SIZE], lane->iv1, AES_BLOCK_SIZE);
+            keys[l] = lane->job->expandedKey;
+        }
+
+        (encrypt ? aes256_encrypt_lanes : aes256_decrypt_lanes)(buffer, result, keys, active);
+
+        for (l = 0; l < active;) {
+            lane = &lanes[l];
+
+            xor_bytes(&lane->job->out[lane->position], &result[l * AES_BLOCK_SIZE], lane->iv2, AES_BLOCK_SIZE);
+            memcpy(lane->iv1, &lane->job->out[lane->position], AES_BLOCK_SIZE);
+            memcpy(lane->iv2, &chunks[l * AES_BLOCK_SIZE], AES_BLOCK_SIZE);
+
+            lane->position += AES_BLOCK_SIZE;
+
+            if (lane->position < lane->job->length) {
+                ++l;
+                continue;
+            }
+
+            // Move the last active lane into the finished slot, together with its saved input block
+            if (--active != l) {
+                lanes[l] = lanes[active];
+                memcpy(&chunks[l * AES_BLOCK_SIZE], &chunks[active * AES_BLOCK_SIZE], AES_BLOCK_SIZE);
+                memcpy(&result[l * AES_BLOCK_SIZE], &result[active * AES_BLOCK_SIZE], AES_BLOCK_SIZE);
+            }
+        }
+    }
 }
@@ -21,6 +21,18 @@
 #ifndef IGE256_H
 #define IGE256_H
 
-uint8_t *ige256(const uint8_t in[], uint32_t length, const uint8_t key[32], const uint8_t iv[32], uint8_t encrypt);
+void ige256_update(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], uint8_t iv[32], uint8_t encrypt);
+
+void ige256_crypt(const uint8_t in[], uint8_t out[], size_t length, const uint32_t expandedKey[60], const uint8_t iv[32], uint8_t encrypt);
+
+typedef struct {
+    const uint8_t *in;
+    uint8_t *out;
+    size_t length;
+    const uint32_t *expandedKey;
+    const uint8_t *iv;
+} ige256_job;
+
+void ige256_crypt_many(const ige256_job jobs[], size_t count, uint8_t encrypt);
 
 #endif  // IGE256_H
@@ -0,0 +1,412 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "keycache.h"
+#include "urandom.h"
+#include "utils.h"
+
+#include <stdlib.h>
+
+#ifdef _WIN32
+#include <windows.h>
+
+typedef SRWLOCK keycache_lock;
+
+#define LOCK(shard) AcquireSRWLockExclusive(&(shard)->lock)
+#define UNLOCK(shard) ReleaseSRWLockExclusive(&(shard)->lock)
+#else
+#include <pthread.h>
+
+typedef pthread_mutex_t keycache_lock;
+
+#define LOCK(shard) pthread_mutex_lock(&(shard)->lock)
+#define UNLOCK(shard) pthread_mutex_unlock(&(shard)->lock)
+#endif
+
+#ifdef _MSC_VER
+#define ATOMIC_LOAD(p) ((uint32_t) InterlockedCompareExchange((volatile LONG *) (p), 0, 0))
+#define ATOMIC_STORE(p, v) InterlockedExchange((volatile LONG *) (p), (LONG) (v))
+#else
+#define ATOMIC_LOAD(p) __atomic_load_n((p), __ATOMIC_RELAXED)
+#define ATOMIC_STORE(p, v) __atomic_store_n((p), (v), __ATOMIC_RELAXED)
+#endif
+
+#define NONE (-1)
+
+// Keys are spread over up to KEYCACHE_SHARDS independently locked shards, each with its own LRU list, so that threads
+// using different keys rarely wait for each other. Small caches use fewer shards, each keeping at least this many
+// entries, so that an uneven spread of a few keys does not evict them early
+#define SHARD_MIN_SIZE 4
+
+typedef struct {
+    uint8_t key[32];
+    uint32_t schedules[2][EXPANDED_KEY_SIZE];  // Indexed by encrypt: the decryption schedule, then the encryption one
+    uint8_t valid[2];
+    int32_t chain;  // Next entry in the same bucket
+    int32_t prev, next;  // Neighbours in the recency list, most recently used first
+} keycache_entry;
+
+// Everything but the lock is only touched with the lock held. The entries are allocated on first use, with twice as
+// many buckets rounded up to a power of two
+typedef struct {
+    keycache_lock lock;
+    keycache_entry *entries;
+    int32_t *buckets;
+    uint32_t bucketBits;
+    size_t capacity, used;
+    int32_t head, tail;
+    uint64_t hits, misses;
+} keycache_shard;
+
+static keycache_shard shards[KEYCACHE_SHARDS];
+
+// Only changed with every shard locked, so reading them with any one shard locked is safe. The shard count is a
+// power of two, also read without a lock to pick the shard to lock
+static volatile uint32_t shardCount = 1;
+static size_t capacity = KEYCACHE_DEFAULT_SIZE;
+
+// Random, so that which keys share a shard or a bucket, hence the lookup time, says nothing about the cached keys.
+// Set once, the cache stays disabled if the operating system could not provide it
+static uint64_t salt[4];
+static uint8_t salted = 0;
+
+static void expand(const uint8_t key[32], uint32_t expandedKey[EXPANDED_KEY_SIZE], int encrypt) {
+    (encrypt ? aes256_set_encryption_key : aes256_set_decryption_key)(key, expandedKey);
+}
+
+// The top bits pick the bucket, bits from the middle pick the shard
+static uint64_t hash(const uint8_t key[32]) {
+    uint64_t h = 0, word;
+    int i;
+
+    for (i = 0; i < 4; ++i) {
+        memcpy(&word, key + i * 8, 8);
+        h = (h ^ word ^ salt[i]) * 0x9E3779B97F4A7C15;
+    }
+
+    return h;
+}
+
+static uint32_t bucket_of(const keycache_shard *shard, uint64_t h) {
+    return (uint32_t) (h >> (64 - shard->bucketBits));
+}
+
+static keycache_shard *shard_of(uint64_t h, uint32_t count) {
+    return &shards[(uint32_t) (h >> 32) & (count - 1)];
+}
+
+// Constant-time, an early exit would tell how many leading bytes of a cached key were guessed right
+static int equal(const uint8_t a[32], const uint8_t b[32]) {
+    uint8_t diff = 0;
+    int i;
+
+    for (i = 0; i < 32; ++i)
+        diff |= a[i] ^ b[i];
+
+    return diff == 0;
+}
+
+static int allocate(keycache_shard *shard) {
+    size_t count = 2, i;
+
+    for (shard->bucketBits = 1; count < shard->capacity * 2; ++shard->bucketBits)
+        count <<= 1;
+
+    shard->entries = calloc(shard->capacity, sizeof(keycache_entry));
+    shard->buckets = malloc(count * sizeof(int32_t));
+
+    if (shard->entries == NULL || shard->buckets == NULL) {
+        free(shard->entries);
+        free(shard->buckets);
+        shard->entries = NULL;
+        shard->buckets = NULL;
+        return -1;
+    }
+
+    for (i = 0; i < count; ++i)
+        shard->buckets[i] = NONE;
+
+    return 0;
+}
+
+static void release(keycache_shard *shard) {
+    if (shard->entries != NULL)
+        secure_zero(shard->entries, shard->capacity * sizeof(keycache_entry));
+
+    free(shard->entries);
+    free(shard->buckets);
+    shard->entries = NULL;
+    shard->buckets = NULL;
+    shard->used = 0;
+    shard->head = shard->tail = NONE;
+}
+
+static int32_t find(const keycache_shard *shard, const uint8_t key[32], uint32_t bucket) {
+    int32_t i;
+
+    for (i = shard->buckets[bucket]; i != NONE; i = shard->entries[i].chain)
+        if (equal(shard->entries[i].key, key))
+            return i;
+
+    return NONE;
+}
+
+static void unlink_entry(keycache_shard *shard, int32_t i) {
+    keycache_entry *entries = shard->entries, *entry = &entries[i];
+
+    if (entry->prev != NONE)
+        entries[entry->prev].next = entry->next;
+    else if (shard->head == i)
+        shard->head = entry->next;
+
+    if (entry->next != NONE)
+        entries[entry->next].prev = entry->prev;
+    else if (shard->tail == i)
+        shard->tail = entry->prev;
+
+    entry->prev = entry->next = NONE;
+}
+
+static void touch(keycache_shard *shard, int32_t i) {
+    unlink_entry(shard, i);
+
+    shard->entries[i].next = shard->head;
+
+    if (shard->head != NONE)
+        shard->entries[shard->head].prev = i;
+
+    shard->head = i;
+
+    if (shard->tail == NONE)
+        shard->tail = i;
+}
+
+// Takes a free entry or evicts the least recently used one, whose key and schedules are wiped
+static int32_t insert(keycache_shard *shard, const uint8_t key[32], uint32_t bucket) {
+    keycache_entry *entries = shard->entries;
+    int32_t i, *link;
+
+    if (shard->used < shard->capacity)
+        i = (int32_t) shard->used++;
+    else {
+        i = shard->tail;
+        unlink_entry(shard, i);
+
+        for (link = &shard->buckets[bucket_of(shard, hash(entries[i].key))]; *link != i; link = &entries[*link].chain);
+
+        *link = entries[i].chain;
+        secure_zero(&entries[i], sizeof(keycache_entry));
+    }
+
+    memcpy(entries[i].key, key, 32);
+    entries[i].valid[0] = entries[i].valid[1] = 0;
+    entries[i].chain = shard->buckets[bucket];
+    entries[i].prev = entries[i].next = NONE;
+    shard->buckets[bucket] = i;
+
+    return i;
+}
+
+static void lock_all(void) {
+    uint32_t i;
+
+    for (i = 0; i < KEYCACHE_SHARDS; ++i)
+        LOCK(&shards[i]);
+}
+
+static void unlock_all(void) {
+    uint32_t i;
+
+    for (i = KEYCACHE_SHARDS; i > 0; --i)
+        UNLOCK(&shards[i - 1]);
+}
+
+// Must be called with every shard locked. Empties the cache and splits size over as many shards as it allows
+static void configure(size_t size) {
+    uint32_t count = 1, i;
+
+    while (count < KEYCACHE_SHARDS && count * 2 * SHARD_MIN_SIZE <= size)
+        count *= 2;
+
+    for (i = 0; i < KEYCACHE_SHARDS; ++i) {
+        release(&shards[i]);
+        shards[i].capacity = i < count ? size / count + (i < size % count) : 0;
+    }
+
+    capacity = size;
+    ATOMIC_STORE(&shardCount, count);
+}
+
+static void keycache_setup(void) {
+    uint32_t i;
+
+    for (i = 0; i < KEYCACHE_SHARDS; ++i) {
+#ifndef _WIN32
+        pthread_mutex_init(&shards[i].lock, NULL);
+#endif
+        shards[i].head = shards[i].tail = NONE;
+    }
+
+    salted = urandom((uint8_t *) salt, sizeof(salt)) == 0;
+    configure(KEYCACHE_DEFAULT_SIZE);
+
+#ifndef _WIN32
+    pthread_atfork(lock_all, unlock_all, unlock_all);
+#endif
+}
+
+#ifdef _WIN32
+static INIT_ONCE once = INIT_ONCE_STATIC_INIT;
+
+static BOOL CALLBACK keycache_setup_once(PINIT_ONCE initOnce, PVOID parameter, PVOID *context) {
+    keycache_setup();
+
+    return TRUE;
+}
+#else
+static pthread_once_t once = PTHREAD_ONCE_INIT;
+#endif
+
+void keycache_init(void) {
+#ifdef _WIN32
+    InitOnceExecuteOnce(&once, keycache_setup_once, NULL, NULL);
+#else
+    pthread_once(&once, keycache_setup);
+#endif
+}
+
+// Locks the shard of a key. The shard count read beforehand may have changed meanwhile, which is checked again with
+// the shard locked, resizing needs every lock
+static keycache_shard *lock_shard(uint64_t h) {
+    keycache_shard *shard;
+    uint32_t count;
+
+    for (;;) {
+        count = ATOMIC_LOAD(&shardCount);
+        shard = shard_of(h, count);
+        LOCK(shard);
+
+        if (shardCount == count)
+            return shard;
+
+        UNLOCK(shard);
+    }
+}
+
+void keycache_expand(const uint8_t key[32], uint32_t expandedKey[EXPANDED_KEY_SIZE], int encrypt) {
+    keycache_shard *shard;
+    uint64_t h;
+    uint32_t bucket;
+    int32_t i;
+
+    encrypt = encrypt != 0;
+
+    if (!salted) {
+        expand(key, expandedKey, encrypt);
+        return;
+    }
+
+    h = hash(key);
+    shard = lock_shard(h);
+
+    if (shard->capacity == 0 || (shard->entries == NULL && allocate(shard) < 0)) {
+        UNLOCK(shard);
+        expand(key, expandedKey, encrypt);
+        return;
+    }
+
+    i = find(shard, key, bucket_of(shard, h));
+
+    if (i != NONE && shard->entries[i].valid[encrypt]) {
+        memcpy(expandedKey, shard->entries[i].schedules[encrypt], EXPANDED_KEY_SIZE * sizeof(uint32_t));
+        touch(shard, i);
+        ++shard->hits;
+        UNLOCK(shard);
+        return;
+    }
+
+    ++shard->misses;
+    UNLOCK(shard);
+
+    // Expanded without the lock, meanwhile the cache may be resized or cleared, or get the same key from another thread
+    expand(key, expandedKey, encrypt);
+
+    shard = lock_shard(h);
+
+    if (shard->entries != NULL) {
+        bucket = bucket_of(shard, h);
+        i = find(shard, key, bucket);
+
+        if (i == NONE)
+            i = insert(shard, key, bucket);
+
+        memcpy(shard->entries[i].schedules[encrypt], expandedKey, EXPANDED_KEY_SIZE * sizeof(uint32_t));
+        shard->entries[i].valid[encrypt] = 1;
+        touch(shard, i);
+    }
+
+    UNLOCK(shard);
+}
+
+void keycache_set_size(size_t size) {
+    lock_all();
+    configure(MIN(size, (size_t) KEYCACHE_MAX_SIZE));
+    unlock_all();
+}
+
+size_t keycache_get_size(void) {
+    size_t size;
+
+    LOCK(&shards[0]);
+    size = capacity;
+    UNLOCK(&shards[0]);
+
+    return size;
+}
+
+void keycache_get(keycache_counters *counters) {
+    uint32_t i;
+
+    lock_all();
+    counters->size = capacity;
+    counters->entries = 0;
+    counters->hits = counters->misses = 0;
+
+    for (i = 0; i < KEYCACHE_SHARDS; ++i) {
+        counters->entries += shards[i].used;
+        counters->hits += shards[i].hits;
+        counters->misses += shards[i].misses;
+    }
+
+    unlock_all();
+}
+
+void keycache_clear(void) {
+    uint32_t i;
+
+    lock_all();
+
+    for (i = 0; i < KEYCACHE_SHARDS; ++i) {
+        release(&shards[i]);
+        shards[i].hits = shards[i].misses = 0;
+    }
+
+    unlock_all();
+}
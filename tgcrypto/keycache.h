@@ -0,0 +1,62 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "aes256.h"
+
+#ifndef KEYCACHE_H
+#define KEYCACHE_H
+
+// Number of keys whose schedules are kept by default, and at most
+#define KEYCACHE_DEFAULT_SIZE 16
+#define KEYCACHE_MAX_SIZE 4096
+
+// Independently locked parts the cache is split into, at most
+#define KEYCACHE_SHARDS 16
+
+typedef struct {
+    size_t size;
+    size_t entries;
+    uint64_t hits;
+    uint64_t misses;
+} keycache_counters;
+
+// Sets the cache up once, registering the fork handlers, which keep a child from inheriting a lock held by another
+// thread. Must be called before any other function
+void keycache_init(void);
+
+// Expands key into expandedKey, the encryption schedule when encrypt is nonzero and the decryption one otherwise,
+// copying it from the cache when the same key was expanded recently. Thread-safe, and never fails: when the cache is
+// disabled or cannot be allocated the key is simply expanded
+void keycache_expand(const uint8_t key[32], uint32_t expandedKey[EXPANDED_KEY_SIZE], int encrypt);
+
+// Empties the cache, whose entries are then allocated again on first use. A size of 0 disables it
+void keycache_set_size(size_t size);
+
+size_t keycache_get_size(void);
+
+void keycache_get(keycache_counters *counters);
+
+// Wipes all the entries and sets the counters back to zero
+void keycache_clear(void);
+
+#endif  // KEYCACHE_H
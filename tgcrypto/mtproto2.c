@@ -0,0 +1,147 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <string.h>
+
+#include "aes256.h"
+#include "drbg.h"
+#include "ige256.h"
+#include "mtproto2.h"
+#include "sha256.h"
+
+// https://core.telegram.org/mtproto/description
+
+#define MIN_PADDING 12
+#define MAX_PADDING 1024
+
+// salt + session_id + msg_id + seq_no + message_data_length
+#define MESSAGE_HEADER_SIZE 32
+
+static void msg_key(const uint8_t authKey[], uint8_t x, const uint8_t plaintext[], size_t length, uint8_t msgKey[16]) {
+    uint8_t digest[SHA256_DIGEST_SIZE];
+    sha256_ctx ctx;
+
+    sha256_init(&ctx);
+    sha256_update(&ctx, authKey + 88 + x, 32);
+    sha256_update(&ctx, plaintext, length);
+    sha256_final(&ctx, digest);
+
+    memcpy(msgKey, digest + 8, MTPROTO2_MSG_KEY_SIZE);
+}
+
+static void kdf(const uint8_t authKey[], uint8_t x, const uint8_t msgKey[16], uint8_t aesKey[32], uint8_t aesIv[32]) {
+    uint8_t a[SHA256_DIGEST_SIZE], b[SHA256_DIGEST_SIZE];
+    sha256_ctx ctx;
+
+    sha256_init(&ctx);
+    sha256_update(&ctx, msgKey, MTPROTO2_MSG_KEY_SIZE);
+    sha256_update(&ctx, authKey + x, 36);
+    sha256_final(&ctx, a);
+
+    sha256_init(&ctx);
+    sha256_update(&ctx, authKey + 40 + x, 36);
+    sha256_update(&ctx, msgKey, MTPROTO2_MSG_KEY_SIZE);
+    sha256_final(&ctx, b);
+
+    memcpy(aesKey, a, 8);
+    memcpy(aesKey + 8, b + 8, 16);
+    memcpy(aesKey + 24, a + 24, 8);
+
+    memcpy(aesIv, b, 8);
+    memcpy(aesIv + 8, a + 8, 16);
+    memcpy(aesIv + 24, b + 24, 8);
+}
+
+static int equal(const uint8_t a[], const uint8_t b[], size_t length) {
+    uint8_t diff = 0;
+    size_t i;
+
+    for (i = 0; i < length; ++i)
+        diff |= a[i] ^ b[i];
+
+    return diff == 0;
+}
+
+size_t mtproto2_packet_size(size_t length) {
+    return MTPROTO2_HEADER_SIZE + length + MIN_PADDING + (16 - (length + MIN_PADDING) % 16) % 16;
+}
+
+// Messages sent by the client use x = 0, messages sent by the server x = 8
+int mtproto2_encrypt(const uint8_t authKey[MTPROTO2_AUTH_KEY_SIZE], const uint8_t authKeyId[MTPROTO2_AUTH_KEY_ID_SIZE],
+                     const uint8_t payload[], size_t length, uint8_t out[], uint8_t isClient) {
+    uint32_t expandedKey[60];
+    uint8_t aesKey[32], aesIv[32];
+    uint8_t x = isClient ? 0 : 8;
+    uint8_t *plaintext = out + MTPROTO2_HEADER_SIZE;
+    size_t size = mtproto2_packet_size(length) - MTPROTO2_HEADER_SIZE;
+
+    memmove(plaintext, payload, length);
+
+    if (drbg_generate(plaintext + length, size - length) < 0)
+        return MTPROTO2_RANDOM_ERROR;
+
+    memcpy(out, authKeyId, MTPROTO2_AUTH_KEY_ID_SIZE);
+    msg_key(authKey, x, plaintext, size, out + MTPROTO2_AUTH_KEY_ID_SIZE);
+    kdf(authKey, x, out + MTPROTO2_AUTH_KEY_ID_SIZE, aesKey, aesIv);
+
+    aes256_set_encryption_key(aesKey, expandedKey);
+    ige256_crypt(plaintext, plaintext, size, expandedKey, aesIv, 1);
+
+    return MTPROTO2_OK;
+}
+
+// Decrypts a packet received from the other side and checks msg_key and the padding length. Messages received by the
+// client were sent by the server, hence x = 8
+int mtproto2_decrypt(const uint8_t authKey[MTPROTO2_AUTH_KEY_SIZE], const uint8_t authKeyId[MTPROTO2_AUTH_KEY_ID_SIZE],
+                     const uint8_t packet[], size_t length, uint8_t out[], uint8_t isClient) {
+    uint32_t expandedKey[60];
+    uint8_t aesKey[32], aesIv[32], expected[MTPROTO2_MSG_KEY_SIZE];
+    uint8_t x = isClient ? 8 : 0;
+    const uint8_t *msgKey = packet + MTPROTO2_AUTH_KEY_ID_SIZE;
+    size_t size = length - MTPROTO2_HEADER_SIZE, dataLength, padding;
+
+    if (!equal(packet, authKeyId, MTPROTO2_AUTH_KEY_ID_SIZE))
+        return MTPROTO2_AUTH_KEY_ID_MISMATCH;
+
+    kdf(authKey, x, msgKey, aesKey, aesIv);
+
+    aes256_set_decryption_key(aesKey, expandedKey);
+    ige256_crypt(packet + MTPROTO2_HEADER_SIZE, out, size, expandedKey, aesIv, 0);
+
+    msg_key(authKey, x, out, size, expected);
+
+    if (!equal(msgKey, expected, MTPROTO2_MSG_KEY_SIZE))
+        return MTPROTO2_MSG_KEY_MISMATCH;
+
+    if (size < MESSAGE_HEADER_SIZE + MIN_PADDING)
+        return MTPROTO2_LENGTH_MISMATCH;
+
+    dataLength = (size_t) out[28] | (size_t) out[29] << 8 | (size_t) out[30] << 16 | (size_t) out[31] << 24;
+
+    if (dataLength > size - MESSAGE_HEADER_SIZE)
+        return MTPROTO2_LENGTH_MISMATCH;
+
+    padding = size - MESSAGE_HEADER_SIZE - dataLength;
+
+    if (padding < MIN_PADDING || padding > MAX_PADDING)
+        return MTPROTO2_LENGTH_MISMATCH;
+
+    return MTPROTO2_OK;
+}
@@ -0,0 +1,47 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef MTPROTO2_H
+#define MTPROTO2_H
+
+#define MTPROTO2_AUTH_KEY_SIZE 256
+#define MTPROTO2_AUTH_KEY_ID_SIZE 8
+#define MTPROTO2_MSG_KEY_SIZE 16
+#define MTPROTO2_HEADER_SIZE (MTPROTO2_AUTH_KEY_ID_SIZE + MTPROTO2_MSG_KEY_SIZE)
+
+#define MTPROTO2_OK 0
+#define MTPROTO2_RANDOM_ERROR -1
+#define MTPROTO2_AUTH_KEY_ID_MISMATCH -2
+#define MTPROTO2_MSG_KEY_MISMATCH -3
+#define MTPROTO2_LENGTH_MISMATCH -4
+
+// Size of the encrypted packet carrying a payload of the given length
+size_t mtproto2_packet_size(size_t length);
+
+int mtproto2_encrypt(const uint8_t authKey[MTPROTO2_AUTH_KEY_SIZE], const uint8_t authKeyId[MTPROTO2_AUTH_KEY_ID_SIZE],
+                     const uint8_t payload[], size_t length, uint8_t out[], uint8_t isClient);
+
+int mtproto2_decrypt(const uint8_t authKey[MTPROTO2_AUTH_KEY_SIZE], const uint8_t authKeyId[MTPROTO2_AUTH_KEY_ID_SIZE],
+                     const uint8_t packet[], size_t length, uint8_t out[], uint8_t isClient);
+
+#endif  // MTPROTO2_H
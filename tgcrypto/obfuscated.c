@@ -0,0 +1,197 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "obfuscated.h"
+#include "drbg.h"
+#include "utils.h"
+
+// The first 4 bytes of the init payload, read as a little-endian word, must not look like another protocol a
+// middlebox could recognize: HTTP methods, a TLS record and the plain intermediate transports
+static const uint32_t reserved[] = {
+    0x44414548, 0x54534f50, 0x20544547, 0x4954504f, 0x02010316, 0xdddddddd, 0xeeeeeeee
+};
+
+static uint32_t load32(const uint8_t p[4]) {
+    return (uint32_t) p[0] | (uint32_t) p[1] << 8 | (uint32_t) p[2] << 16 | (uint32_t) p[3] << 24;
+}
+
+static int is_valid(const uint8_t header[OBFUSCATED_HEADER_SIZE]) {
+    uint32_t first = load32(header);
+    size_t i;
+
+    // 0xef alone would announce the plain abridged transport
+    if (header[0] == OBFUSCATED_ABRIDGED || load32(header + 4) == 0)
+        return 0;
+
+    for (i = 0; i < sizeof(reserved) / sizeof(reserved[0]); ++i)
+        if (first == reserved[i])
+            return 0;
+
+    return 1;
+}
+
+// Bytes 8-55 of the payload are the key and IV of the client to server stream, the same bytes reversed those of the
+// server to client one. The payload is then sent encrypted with the first stream but for bytes 0-55, so that the
+// server can derive both streams too and check the protocol tag
+int obfuscated_init(obfuscated_codec *codec, uint8_t header[OBFUSCATED_HEADER_SIZE], uint8_t protocol) {
+    uint8_t reversed[48], encrypted[OBFUSCATED_HEADER_SIZE];
+    size_t i;
+
+    do {
+        if (drbg_generate(header, OBFUSCATED_HEADER_SIZE) < 0)
+            return OBFUSCATED_RANDOM_ERROR;
+    } while (!is_valid(header));
+
+    memset(header + 56, protocol, 4);
+
+    for (i = 0; i < sizeof(reversed); ++i)
+        reversed[i] = header[55 - i];
+
+    aes256_set_encryption_key(header + 8, codec->encryptKey);
+    memcpy(codec->encryptIv, header + 40, AES_BLOCK_SIZE);
+    codec->encryptState = 0;
+
+    aes256_set_encryption_key(reversed, codec->decryptKey);
+    memcpy(codec->decryptIv, reversed + 32, AES_BLOCK_SIZE);
+    codec->decryptState = 0;
+
+    ctr256_crypt(header, encrypted, OBFUSCATED_HEADER_SIZE, codec->encryptKey, codec->encryptIv, &codec->encryptState);
+    memcpy(header + 56, encrypted + 56, OBFUSCATED_HEADER_SIZE - 56);
+
+    codec->protocol = protocol;
+    codec->start = 0;
+    codec->end = 0;
+
+    secure_zero(reversed, sizeof(reversed));
+    secure_zero(encrypted, sizeof(encrypted));
+
+    return OBFUSCATED_OK;
+}
+
+// Abridged lengths count 4-byte words in 1 byte, or in 3 bytes after 0x7f; intermediate ones count bytes in 4
+static size_t prefix_size(const obfuscated_codec *codec, size_t length) {
+    if (codec->protocol == OBFUSCATED_INTERMEDIATE)
+        return 4;
+
+    return length / 4 < 0x7f ? 1 : 4;
+}
+
+size_t obfuscated_frame_size(const obfuscated_codec *codec, size_t length) {
+    return prefix_size(codec, length) + length;
+}
+
+void obfuscated_encode(obfuscated_codec *codec, const uint8_t in[], size_t length, uint8_t out[]) {
+    size_t prefix = prefix_size(codec, length), words = length / 4;
+
+    if (codec->protocol == OBFUSCATED_INTERMEDIATE) {
+        out[0] = (uint8_t) length;
+        out[1] = (uint8_t) (length >> 8);
+        out[2] = (uint8_t) (length >> 16);
+        out[3] = (uint8_t) (length >> 24);
+    } else if (prefix == 1) {
+        out[0] = (uint8_t) words;
+    } else {
+        out[0] = 0x7f;
+        out[1] = (uint8_t) words;
+        out[2] = (uint8_t) (words >> 8);
+        out[3] = (uint8_t) (words >> 16);
+    }
+
+    memcpy(out + prefix, in, length);
+    ctr256_prefetch_crypt(&codec->prefetch, out, out, prefix + length, codec->encryptKey, codec->encryptIv, &codec->encryptState);
+}
+
+size_t obfuscated_refill(obfuscated_codec *codec) {
+    return ctr256_prefetch_refill(&codec->prefetch, codec->encryptKey, codec->encryptIv, &codec->encryptState);
+}
+
+void obfuscated_decode(obfuscated_codec *codec, uint8_t buf[], size_t length) {
+    ctr256_crypt(buf + codec->end, buf + codec->end, length, codec->decryptKey, codec->decryptIv, &codec->decryptState);
+    codec->end += length;
+}
+
+// Size of the length prefix of the frame starting at buf, and through length that of the frame. Returns 0 when fewer
+// bytes than the prefix are available. The most significant bit flags quick acks, which are never requested
+static int parse(uint8_t protocol, const uint8_t buf[], size_t available, size_t *length) {
+    if (protocol == OBFUSCATED_INTERMEDIATE) {
+        if (available < 4)
+            return 0;
+
+        *length = load32(buf);
+
+        if (*length > OBFUSCATED_MAX_FRAME)
+            return OBFUSCATED_INVALID_LENGTH;
+
+        return 4;
+    }
+
+    if (available < 1)
+        return 0;
+
+    if (buf[0] < 0x7f) {
+        *length = (size_t) buf[0] * 4;
+        return 1;
+    }
+
+    if (buf[0] > 0x7f)
+        return OBFUSCATED_INVALID_LENGTH;
+
+    if (available < 4)
+        return 0;
+
+    *length = ((size_t) buf[1] | (size_t) buf[2] << 8 | (size_t) buf[3] << 16) * 4;
+
+    if (*length > OBFUSCATED_MAX_FRAME)
+        return OBFUSCATED_INVALID_LENGTH;
+
+    return 4;
+}
+
+int obfuscated_next(obfuscated_codec *codec, const uint8_t buf[], size_t *offset, size_t *size) {
+    size_t length;
+    int prefix = parse(codec->protocol, buf + codec->start, codec->end - codec->start, &length);
+
+    if (prefix <= 0)
+        return prefix;
+
+    if (codec->end - codec->start - prefix < length)
+        return 0;
+
+    *offset = codec->start + prefix;
+    *size = length;
+    codec->start = *offset + length;
+
+    return 1;
+}
+
+size_t obfuscated_compact(obfuscated_codec *codec, uint8_t buf[]) {
+    size_t pending = codec->end - codec->start, length;
+    int prefix;
+
+    if (codec->start) {
+        memmove(buf, buf + codec->start, pending);
+        codec->start = 0;
+        codec->end = pending;
+    }
+
+    prefix = parse(codec->protocol, buf, pending, &length);
+
+    return prefix > 0 ? prefix + length : 0;
+}
@@ -0,0 +1,88 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "aes256.h"
+#include "ctr256.h"
+
+#ifndef OBFUSCATED_H
+#define OBFUSCATED_H
+
+// Size of the init payload a client sends before anything else
+#define OBFUSCATED_HEADER_SIZE 64
+
+// Protocol tags, repeated 4 times at bytes 56-59 of the init payload
+#define OBFUSCATED_ABRIDGED 0xef
+#define OBFUSCATED_INTERMEDIATE 0xee
+
+// Largest frame accepted, Telegram never sends more than about 1 MB at once
+#define OBFUSCATED_MAX_FRAME (16 * 1024 * 1024)
+
+// Receive buffer size by default, and at least. It grows to fit larger frames
+#define OBFUSCATED_BUFFER_SIZE (256 * 1024)
+#define OBFUSCATED_MIN_BUFFER_SIZE 64
+
+#define OBFUSCATED_OK 0
+#define OBFUSCATED_RANDOM_ERROR -1
+#define OBFUSCATED_INVALID_LENGTH -2
+
+// Client side of the MTProto obfuscated transport: one CTR stream per direction and the bounds of the received bytes
+// not handed out yet, start being the first byte of the frame in progress and end the first free byte of the buffer.
+// The keystream prefetched for sending is set up by the caller, with ctr256_prefetch_init()
+typedef struct {
+    uint32_t encryptKey[EXPANDED_KEY_SIZE];
+    uint32_t decryptKey[EXPANDED_KEY_SIZE];
+    uint8_t encryptIv[AES_BLOCK_SIZE];
+    uint8_t decryptIv[AES_BLOCK_SIZE];
+    uint8_t encryptState;
+    uint8_t decryptState;
+    uint8_t protocol;
+    ctr256_prefetch prefetch;
+    size_t start;
+    size_t end;
+} obfuscated_codec;
+
+// Generates the init payload into header and derives both CTR streams from it. Returns OBFUSCATED_OK or
+// OBFUSCATED_RANDOM_ERROR when the operating system CSPRNG failed
+int obfuscated_init(obfuscated_codec *codec, uint8_t header[OBFUSCATED_HEADER_SIZE], uint8_t protocol);
+
+// Size of the outgoing frame carrying length bytes, length prefix included
+size_t obfuscated_frame_size(const obfuscated_codec *codec, size_t length);
+
+// Writes the length prefix and data into out and encrypts them, out being obfuscated_frame_size() bytes
+void obfuscated_encode(obfuscated_codec *codec, const uint8_t in[], size_t length, uint8_t out[]);
+
+// Computes keystream for the next frames to send until the prefetch ring is full, returning the number of bytes computed
+size_t obfuscated_refill(obfuscated_codec *codec);
+
+// Decrypts in place the length bytes received at buf + end
+void obfuscated_decode(obfuscated_codec *codec, uint8_t buf[], size_t length);
+
+// Takes the next complete frame out of buf, returning 1 with its offset and size, 0 when no frame is complete yet and
+// OBFUSCATED_INVALID_LENGTH when its length prefix is not valid
+int obfuscated_next(obfuscated_codec *codec, const uint8_t buf[], size_t *offset, size_t *size);
+
+// Moves the bytes of the frame in progress to the front of buf, returning the buffer size needed to receive it whole,
+// or 0 when its length is not known yet
+size_t obfuscated_compact(obfuscated_codec *codec, uint8_t buf[]);
+
+#endif  // OBFUSCATED_H
@@ -0,0 +1,146 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "parallel.h"
+
+#ifdef _WIN32
+#include <windows.h>
+#include <process.h>
+#else
+#include <pthread.h>
+#include <unistd.h>
+#endif
+
+static volatile uint32_t threads = 0;
+
+static volatile uint32_t cpus = 0;
+
+// Looking the CPU count up is a system call, or even a file read, so it is done only once
+static uint32_t cpu_count(void) {
+    uint32_t count = cpus;
+
+    if (count == 0) {
+#ifdef _WIN32
+        SYSTEM_INFO info;
+
+        GetSystemInfo(&info);
+        count = info.dwNumberOfProcessors;
+#else
+        long online = sysconf(_SC_NPROCESSORS_ONLN);
+
+        count = online > 0 ? (uint32_t) online : 1;
+#endif
+        cpus = count;
+    }
+
+    return count;
+}
+
+void parallel_set_threads(uint32_t count) {
+    threads = count > PARALLEL_MAX_THREADS ? PARALLEL_MAX_THREADS : count;
+}
+
+uint32_t parallel_get_threads(void) {
+    uint32_t count = threads;
+
+    if (count == 0) {
+        count = cpu_count();
+
+        if (count > PARALLEL_MAX_THREADS)
+            count = PARALLEL_MAX_THREADS;
+    }
+
+    return count;
+}
+
+uint32_t parallel_segments(size_t length) {
+    size_t count = length / PARALLEL_MIN_SEGMENT;
+    uint32_t limit;
+
+    if (count < 2)
+        return 1;
+
+    limit = parallel_get_threads();
+
+    return count < limit ? (uint32_t) count : limit;
+}
+
+typedef struct {
+    parallel_task task;
+    void *arg;
+} parallel_job;
+
+#ifdef _WIN32
+static unsigned __stdcall parallel_entry(void *job) {
+    ((parallel_job *) job)->task(((parallel_job *) job)->arg);
+    return 0;
+}
+#else
+static void *parallel_entry(void *job) {
+    ((parallel_job *) job)->task(((parallel_job *) job)->arg);
+    return NULL;
+}
+#endif
+
+// Runs task once for each of the count consecutive arguments, the first one on the calling thread.
+// If a thread can't be started its argument is processed on the calling thread instead.
+void parallel_run(parallel_task task, void *args, size_t argSize, uint32_t count) {
+    parallel_job jobs[PARALLEL_MAX_THREADS];
+#ifdef _WIN32
+    HANDLE handles[PARALLEL_MAX_THREADS];
+#else
+    pthread_t handles[PARALLEL_MAX_THREADS];
+#endif
+    uint8_t started[PARALLEL_MAX_THREADS];
+    uint32_t i;
+
+    if (count > PARALLEL_MAX_THREADS)
+        count = PARALLEL_MAX_THREADS;
+
+    for (i = 1; i < count; ++i) {
+        jobs[i].task = task;
+        jobs[i].arg = (uint8_t *) args + i * argSize;
+
+#ifdef _WIN32
+        handles[i] = (HANDLE) _beginthreadex(NULL, 0, parallel_entry, &jobs[i], 0, NULL);
+        started[i] = handles[i] != 0;
+#else
+        started[i] = pthread_create(&handles[i], NULL, parallel_entry, &jobs[i]) == 0;
+#endif
+
+        if (!started[i])
+            task(jobs[i].arg);
+    }
+
+    if (count > 0)
+        task(args);
+
+    for (i = 1; i < count; ++i) {
+        if (!started[i])
+            continue;
+
+#ifdef _WIN32
+        WaitForSingleObject(handles[i], INFINITE);
+        CloseHandle(handles[i]);
+#else
+        pthread_join(handles[i], NULL);
+#endif
+    }
+}
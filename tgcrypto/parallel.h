@@ -0,0 +1,42 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef PARALLEL_H
+#define PARALLEL_H
+
+// Buffers are only split across threads when every thread gets at least this many bytes
+#define PARALLEL_MIN_SEGMENT (512 * 1024)
+
+#define PARALLEL_MAX_THREADS 64
+
+typedef void (*parallel_task)(void *arg);
+
+void parallel_set_threads(uint32_t threads);
+
+uint32_t parallel_get_threads(void);
+
+uint32_t parallel_segments(size_t length);
+
+void parallel_run(parallel_task task, void *args, size_t argSize, uint32_t count);
+
+#endif  // PARALLEL_H
@@ -0,0 +1,334 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "parallel.h"
+#include "pool.h"
+
+#include <stdlib.h>
+
+#ifdef POOL_SUPPORTED
+#include <errno.h>
+#include <fcntl.h>
+#include <pthread.h>
+#include <unistd.h>
+
+#ifdef __linux__
+#include <sys/eventfd.h>
+#endif
+
+struct pool_queue {
+    pool_job *done;
+    size_t pending;
+    int readFd, writeFd;
+    pool_queue *prev, *next;
+};
+
+static pthread_mutex_t mutex = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t cond = PTHREAD_COND_INITIALIZER;
+static pthread_cond_t drained = PTHREAD_COND_INITIALIZER;
+
+static pool_job *queueHead = NULL, *queueTail = NULL;
+static pool_queue *queues = NULL;
+static uint8_t started = 0, forkHandler = 0;
+
+// An eventfd counter is written 8 bytes at a time, a pipe accepts the same
+static void pool_notify(pool_queue *queue) {
+    uint64_t one = 1;
+
+    while (write(queue->writeFd, &one, sizeof(one)) < 0 && errno == EINTR);
+}
+
+static void pool_clear(pool_queue *queue) {
+    uint64_t buffer[8];
+    ssize_t n;
+
+    for (;;) {
+        n = read(queue->readFd, buffer, sizeof(buffer));
+
+        if (n > 0 || (n < 0 && errno == EINTR))
+            continue;
+
+        break;
+    }
+}
+
+static void pool_close(pool_queue *queue) {
+    if (queue->readFd >= 0)
+        close(queue->readFd);
+
+    if (queue->writeFd >= 0 && queue->writeFd != queue->readFd)
+        close(queue->writeFd);
+
+    queue->readFd = queue->writeFd = -1;
+}
+
+// Must be called with the mutex held
+static void pool_release(pool_queue *queue) {
+    if (queue->prev != NULL)
+        queue->prev->next = queue->next;
+    else
+        queues = queue->next;
+
+    if (queue->next != NULL)
+        queue->next->prev = queue->prev;
+
+    pool_close(queue);
+    free(queue);
+}
+
+static void *pool_worker(void *arg) {
+    pool_queue *queue;
+    pool_job *job;
+
+    for (;;) {
+        pthread_mutex_lock(&mutex);
+
+        while (queueHead == NULL)
+            pthread_cond_wait(&cond, &mutex);
+
+        job = queueHead;
+        queueHead = job->next;
+
+        if (queueHead == NULL)
+            queueTail = NULL;
+
+        pthread_mutex_unlock(&mutex);
+
+        job->run(job);
+
+        pthread_mutex_lock(&mutex);
+
+        queue = job->queue;
+
+        // Only the first completion since the last pool_completed() call needs to wake the event loop up.
+        // The queue could be released right after unlocking, so this is done with the mutex held
+        if (queue->done == NULL)
+            pool_notify(queue);
+
+        job->next = queue->done;
+        queue->done = job;
+
+        if (--queue->pending == 0)
+            pthread_cond_broadcast(&drained);
+
+        pthread_mutex_unlock(&mutex);
+    }
+
+    return NULL;
+}
+
+// Threads are not inherited by forked children, the pool is started again on first use. Jobs that were running
+// are lost, and the queues get new file descriptors so that the parent and the child do not wake each other up
+static void pool_after_fork(void) {
+    pool_queue *queue, *next;
+
+    pthread_mutex_init(&mutex, NULL);
+    pthread_cond_init(&cond, NULL);
+    pthread_cond_init(&drained, NULL);
+
+    for (queue = queues; queue != NULL; queue = next) {
+        next = queue->next;
+        queue->pending = 0;
+        pool_close(queue);
+        queue->done = NULL;
+    }
+
+    queueHead = queueTail = NULL;
+    started = 0;
+}
+
+static int pool_open(pool_queue *queue) {
+#ifdef __linux__
+    queue->readFd = queue->writeFd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+
+    return queue->readFd < 0 ? -1 : 0;
+#else
+    int fds[2], i;
+
+    if (pipe(fds) < 0)
+        return -1;
+
+    for (i = 0; i < 2; ++i) {
+        fcntl(fds[i], F_SETFL, fcntl(fds[i], F_GETFL) | O_NONBLOCK);
+        fcntl(fds[i], F_SETFD, fcntl(fds[i], F_GETFD) | FD_CLOEXEC);
+    }
+
+    queue->readFd = fds[0];
+    queue->writeFd = fds[1];
+
+    return 0;
+#endif
+}
+
+// Must be called with the mutex held
+static int pool_start(pool_queue *queue) {
+    pthread_t thread;
+    uint32_t threads, i, running = 0;
+
+    if (queue->readFd < 0 && pool_open(queue) < 0)
+        return -1;
+
+    if (started)
+        return 0;
+
+    threads = parallel_get_threads();
+
+    for (i = 0; i < threads; ++i)
+        if (pthread_create(&thread, NULL, pool_worker, NULL) == 0) {
+            pthread_detach(thread);
+            ++running;
+        }
+
+    if (running == 0)
+        return -1;
+
+    started = 1;
+
+    return 0;
+}
+
+pool_queue *pool_queue_new(void) {
+    pool_queue *queue = calloc(1, sizeof(pool_queue));
+
+    if (queue == NULL)
+        return NULL;
+
+    queue->readFd = queue->writeFd = -1;
+
+    pthread_mutex_lock(&mutex);
+
+    if (!forkHandler) {
+        pthread_atfork(NULL, NULL, pool_after_fork);
+        forkHandler = 1;
+    }
+
+    queue->next = queues;
+
+    if (queues != NULL)
+        queues->prev = queue;
+
+    queues = queue;
+
+    pthread_mutex_unlock(&mutex);
+
+    return queue;
+}
+
+void pool_queue_free(pool_queue *queue) {
+    pthread_mutex_lock(&mutex);
+    pool_release(queue);
+    pthread_mutex_unlock(&mutex);
+}
+
+void pool_wait(pool_queue *queue) {
+    pthread_mutex_lock(&mutex);
+
+    while (queue->pending > 0)
+        pthread_cond_wait(&drained, &mutex);
+
+    pthread_mutex_unlock(&mutex);
+}
+
+int pool_fd(pool_queue *queue) {
+    int fd;
+
+    pthread_mutex_lock(&mutex);
+    fd = pool_start(queue) < 0 ? -1 : queue->readFd;
+    pthread_mutex_unlock(&mutex);
+
+    return fd;
+}
+
+int pool_submit(pool_queue *queue, pool_job *job) {
+    pthread_mutex_lock(&mutex);
+
+    if (pool_start(queue) < 0) {
+        pthread_mutex_unlock(&mutex);
+        return -1;
+    }
+
+    job->queue = queue;
+    job->next = NULL;
+    ++queue->pending;
+
+    if (queueTail == NULL)
+        queueHead = job;
+    else
+        queueTail->next = job;
+
+    queueTail = job;
+
+    pthread_cond_signal(&cond);
+    pthread_mutex_unlock(&mutex);
+
+    return 0;
+}
+
+pool_job *pool_completed(pool_queue *queue) {
+    pool_job *jobs, *ordered = NULL, *next;
+
+    pthread_mutex_lock(&mutex);
+
+    // Clear the notification first: a job completing from now on is either taken below or notifies again
+    if (queue->readFd >= 0)
+        pool_clear(queue);
+
+    jobs = queue->done;
+    queue->done = NULL;
+
+    pthread_mutex_unlock(&mutex);
+
+    for (; jobs != NULL; jobs = next) {
+        next = jobs->next;
+        jobs->next = ordered;
+        ordered = jobs;
+    }
+
+    return ordered;
+}
+#else
+// Only there so that each interpreter still gets a distinct queue to hold on to
+struct pool_queue {
+    uint8_t unused;
+};
+
+pool_queue *pool_queue_new(void) {
+    return calloc(1, sizeof(pool_queue));
+}
+
+void pool_queue_free(pool_queue *queue) {
+    free(queue);
+}
+
+void pool_wait(pool_queue *queue) {
+}
+
+int pool_fd(pool_queue *queue) {
+    return -1;
+}
+
+int pool_submit(pool_queue *queue, pool_job *job) {
+    return -1;
+}
+
+pool_job *pool_completed(pool_queue *queue) {
+    return NULL;
+}
+#endif
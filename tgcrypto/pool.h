@@ -0,0 +1,64 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef POOL_H
+#define POOL_H
+
+// Jobs completion is signalled through a file descriptor, which is what event loops can wait on
+#ifndef _WIN32
+#define POOL_SUPPORTED
+#endif
+
+typedef struct pool_job pool_job;
+
+// Jobs complete into the queue they were submitted to, each interpreter owns one so it never sees another
+// interpreter's objects. The worker threads are shared by all the queues
+typedef struct pool_queue pool_queue;
+
+struct pool_job {
+    void (*run)(pool_job *job);
+    pool_queue *queue;
+    pool_job *next;
+};
+
+// Returns NULL on failure
+pool_queue *pool_queue_new(void);
+
+// No job may still be pending, which pool_wait() ensures. Completed jobs not taken yet are left to the caller, which
+// should call pool_completed() first
+void pool_queue_free(pool_queue *queue);
+
+// Blocks until every job submitted to queue has completed, they can then be taken with pool_completed()
+void pool_wait(pool_queue *queue);
+
+// File descriptor that becomes readable when jobs complete into queue, the worker threads are started on first use.
+// Returns -1 on failure or where the pool is not supported
+int pool_fd(pool_queue *queue);
+
+// Queues a job to be run by one of the worker threads, returns 0 on success and -1 on failure
+int pool_submit(pool_queue *queue, pool_job *job);
+
+// Takes all the jobs completed into queue so far, in completion order, and resets its file descriptor
+pool_job *pool_completed(pool_queue *queue);
+
+#endif  // POOL_H
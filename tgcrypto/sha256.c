@@ -0,0 +1,319 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <string.h>
+
+#include "sha256.h"
+#include "utils.h"
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#endif
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+#define HAVE_SHANI
+
+#include <immintrin.h>
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#define TARGET_SHANI
+#else
+#include <cpuid.h>
+#define TARGET_SHANI __attribute__((target("sha,sse4.1,ssse3")))
+#endif
+#endif
+
+static const uint32_t K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+};
+
+#define ROTR(x, n) (((x) >> (n)) | ((x) << (32 - (n))))
+
+#define CH(x, y, z) (((x) & (y)) ^ (~(x) & (z)))
+#define MAJ(x, y, z) (((x) & (y)) ^ ((x) & (z)) ^ ((y) & (z)))
+
+#define S0(x) (ROTR(x, 2) ^ ROTR(x, 13) ^ ROTR(x, 22))
+#define S1(x) (ROTR(x, 6) ^ ROTR(x, 11) ^ ROTR(x, 25))
+#define G0(x) (ROTR(x, 7) ^ ROTR(x, 18) ^ ((x) >> 3))
+#define G1(x) (ROTR(x, 17) ^ ROTR(x, 19) ^ ((x) >> 10))
+
+static void sha256_compress(uint32_t state[8], const uint8_t block[64]) {
+    uint32_t w[64], a, b, c, d, e, f, g, h, t1, t2;
+    uint8_t i;
+
+    for (i = 0; i < 16; ++i)
+        w[i] = ((uint32_t) block[4 * i] << 24) | ((uint32_t) block[4 * i + 1] << 16) |
+               ((uint32_t) block[4 * i + 2] << 8) | (uint32_t) block[4 * i + 3];
+
+    for (i = 16; i < 64; ++i)
+        w[i] = G1(w[i - 2]) + w[i - 7] + G0(w[i - 15]) + w[i - 16];
+
+    a = state[0];
+    b = state[1];
+    c = state[2];
+    d = state[3];
+    e = state[4];
+    f = state[5];
+    g = state[6];
+    h = state[7];
+
+    for (i = 0; i < 64; ++i) {
+        t1 = h + S1(e) + CH(e, f, g) + K[i] + w[i];
+        t2 = S0(a) + MAJ(a, b, c);
+        h = g;
+        g = f;
+        f = e;
+        e = d + t1;
+        d = c;
+        c = b;
+        b = a;
+        a = t1 + t2;
+    }
+
+    state[0] += a;
+    state[1] += b;
+    state[2] += c;
+    state[3] += d;
+    state[4] += e;
+    state[5] += f;
+    state[6] += g;
+    state[7] += h;
+}
+
+#ifdef HAVE_SHANI
+// SHA-NI needs SSSE3 and SSE4.1 for the byte swaps and the state shuffles around it
+static int shani_supported(void) {
+#ifdef _MSC_VER
+    int info[4];
+
+    __cpuid(info, 0);
+
+    if (info[0] < 7)
+        return 0;
+
+    __cpuid(info, 1);
+
+    if (!((info[2] >> 9) & 1) || !((info[2] >> 19) & 1))
+        return 0;
+
+    __cpuidex(info, 7, 0);
+
+    return (info[1] >> 29) & 1;
+#else
+    unsigned int eax, ebx, ecx, edx;
+
+    if (__get_cpuid_max(0, NULL) < 7 || !__get_cpuid(1, &eax, &ebx, &ecx, &edx))
+        return 0;
+
+    if (!((ecx >> 9) & 1) || !((ecx >> 19) & 1))
+        return 0;
+
+    __cpuid_count(7, 0, eax, ebx, ecx, edx);
+
+    return (ebx >> 29) & 1;
+#endif
+}
+
+// Message words of the group of four rounds g + 4, from the groups g to g + 3
+#define SCHEDULE(m0, m1, m2, m3) \
+    _mm_sha256msg2_epu32(_mm_add_epi32(_mm_sha256msg1_epu32(m0, m1), _mm_alignr_epi8(m3, m2, 4)), m3)
+
+// Four rounds: two sha256rnds2, each one taking the two words in the low half of its input
+#define ROUNDS(m, g) \
+    do { \
+        msg = _mm_add_epi32(m, _mm_loadu_si128((const __m128i *) &K[4 * (g)])); \
+        state1 = _mm_sha256rnds2_epu32(state1, state0, msg); \
+        state0 = _mm_sha256rnds2_epu32(state0, state1, _mm_shuffle_epi32(msg, 0x0e)); \
+    } while (0)
+
+TARGET_SHANI
+static void shani_compress(uint32_t state[8], const uint8_t data[], size_t blocks) {
+    const __m128i mask = _mm_set_epi64x(0x0c0d0e0f08090a0bULL, 0x0405060700010203ULL);
+    __m128i state0, state1, abef, cdgh, msg, m0, m1, m2, m3, tmp;
+
+    // The instructions work on the state as ABEF and CDGH
+    tmp = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *) &state[0]), 0xb1);
+    state1 = _mm_shuffle_epi32(_mm_loadu_si128((const __m128i *) &state[4]), 0x1b);
+    state0 = _mm_alignr_epi8(tmp, state1, 8);
+    state1 = _mm_blend_epi16(state1, tmp, 0xf0);
+
+    for (; blocks; --blocks, data += 64) {
+        abef = state0;
+        cdgh = state1;
+
+        m0 = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *) data), mask);
+        m1 = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *) (data + 16)), mask);
+        m2 = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *) (data + 32)), mask);
+        m3 = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i *) (data + 48)), mask);
+
+        ROUNDS(m0, 0);
+        ROUNDS(m1, 1);
+        ROUNDS(m2, 2);
+        ROUNDS(m3, 3);
+
+        m0 = SCHEDULE(m0, m1, m2, m3);
+        ROUNDS(m0, 4);
+        m1 = SCHEDULE(m1, m2, m3, m0);
+        ROUNDS(m1, 5);
+        m2 = SCHEDULE(m2, m3, m0, m1);
+        ROUNDS(m2, 6);
+        m3 = SCHEDULE(m3, m0, m1, m2);
+        ROUNDS(m3, 7);
+
+        m0 = SCHEDULE(m0, m1, m2, m3);
+        ROUNDS(m0, 8);
+        m1 = SCHEDULE(m1, m2, m3, m0);
+        ROUNDS(m1, 9);
+        m2 = SCHEDULE(m2, m3, m0, m1);
+        ROUNDS(m2, 10);
+        m3 = SCHEDULE(m3, m0, m1, m2);
+        ROUNDS(m3, 11);
+
+        m0 = SCHEDULE(m0, m1, m2, m3);
+        ROUNDS(m0, 12);
+        m1 = SCHEDULE(m1, m2, m3, m0);
+        ROUNDS(m1, 13);
+        m2 = SCHEDULE(m2, m3, m0, m1);
+        ROUNDS(m2, 14);
+        m3 = SCHEDULE(m3, m0, m1, m2);
+        ROUNDS(m3, 15);
+
+        state0 = _mm_add_epi32(state0, abef);
+        state1 = _mm_add_epi32(state1, cdgh);
+    }
+
+    tmp = _mm_shuffle_epi32(state0, 0x1b);
+    state1 = _mm_shuffle_epi32(state1, 0xb1);
+    _mm_storeu_si128((__m128i *) &state[0], _mm_blend_epi16(tmp, state1, 0xf0));
+    _mm_storeu_si128((__m128i *) &state[4], _mm_alignr_epi8(state1, tmp, 8));
+}
+#endif  // HAVE_SHANI
+
+static void portable_compress(uint32_t state[8], const uint8_t data[], size_t blocks) {
+    for (; blocks; --blocks, data += 64)
+        sha256_compress(state, data);
+}
+
+static void (*sha256_compress_blocks)(uint32_t state[8], const uint8_t data[], size_t blocks) = portable_compress;
+
+static void sha256_select(void) {
+#ifdef HAVE_SHANI
+    if (!backend_forced("portable") && shani_supported())
+        sha256_compress_blocks = shani_compress;
+#endif
+}
+
+#ifdef _WIN32
+static INIT_ONCE once = INIT_ONCE_STATIC_INIT;
+
+static BOOL CALLBACK sha256_select_once(PINIT_ONCE initOnce, PVOID parameter, PVOID *context) {
+    sha256_select();
+
+    return TRUE;
+}
+#else
+static pthread_once_t once = PTHREAD_ONCE_INIT;
+#endif
+
+void sha256_init_backend(void) {
+#ifdef _WIN32
+    InitOnceExecuteOnce(&once, sha256_select_once, NULL, NULL);
+#else
+    pthread_once(&once, sha256_select);
+#endif
+}
+
+void sha256_init(sha256_ctx *ctx) {
+    static const uint32_t H[8] = {
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    };
+
+    memcpy(ctx->state, H, sizeof(H));
+    ctx->length = 0;
+    ctx->used = 0;
+}
+
+void sha256_update(sha256_ctx *ctx, const uint8_t data[], size_t length) {
+    size_t n;
+
+    ctx->length += length;
+
+    if (ctx->used) {
+        n = 64 - ctx->used < length ? 64 - ctx->used : length;
+        memcpy(ctx->buffer + ctx->used, data, n);
+        ctx->used += n;
+        data += n;
+        length -= n;
+
+        if (ctx->used < 64)
+            return;
+
+        sha256_compress_blocks(ctx->state, ctx->buffer, 1);
+        ctx->used = 0;
+    }
+
+    sha256_compress_blocks(ctx->state, data, length / 64);
+    data += length / 64 * 64;
+    length %= 64;
+
+    memcpy(ctx->buffer, data, length);
+    ctx->used = length;
+}
+
+void sha256_final(sha256_ctx *ctx, uint8_t digest[SHA256_DIGEST_SIZE]) {
+    uint64_t bits = ctx->length * 8;
+    uint8_t i;
+
+    ctx->buffer[ctx->used++] = 0x80;
+
+    if (ctx->used > 56) {
+        memset(ctx->buffer + ctx->used, 0, 64 - ctx->used);
+        sha256_compress_blocks(ctx->state, ctx->buffer, 1);
+        ctx->used = 0;
+    }
+
+    memset(ctx->buffer + ctx->used, 0, 56 - ctx->used);
+
+    for (i = 0; i < 8; ++i)
+        ctx->buffer[63 - i] = (uint8_t) (bits >> (8 * i));
+
+    sha256_compress_blocks(ctx->state, ctx->buffer, 1);
+
+    for (i = 0; i < 32; ++i)
+        digest[i] = (uint8_t) (ctx->state[i / 4] >> (24 - 8 * (i % 4)));
+}
+
+void sha256(const uint8_t data[], size_t length, uint8_t digest[SHA256_DIGEST_SIZE]) {
+    sha256_ctx ctx;
+
+    sha256_init(&ctx);
+    sha256_update(&ctx, data, length);
+    sha256_final(&ctx, digest);
+}
@@ -0,0 +1,48 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef SHA256_H
+#define SHA256_H
+
+#define SHA256_DIGEST_SIZE 32
+
+typedef struct {
+    uint32_t state[8];
+    uint64_t length;
+    uint8_t buffer[64];
+    size_t used;
+} sha256_ctx;
+
+// Selects the implementation once, like aes256_init() does for AES: the SHA extensions when the CPU has them, unless
+// TGCRYPTO_BACKEND=portable. Must be called before hashing anything
+void sha256_init_backend(void);
+
+void sha256_init(sha256_ctx *ctx);
+
+void sha256_update(sha256_ctx *ctx, const uint8_t data[], size_t length);
+
+void sha256_final(sha256_ctx *ctx, uint8_t digest[SHA256_DIGEST_SIZE]);
+
+void sha256(const uint8_t data[], size_t length, uint8_t digest[SHA256_DIGEST_SIZE]);
+
+#endif  // SHA256_H
@@ -0,0 +1,399 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "ssse3256.h"
+
+#ifdef HAVE_SSSE3
+
+#include <string.h>
+#include <tmmintrin.h>
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#define TARGET_SSSE3
+#else
+#include <cpuid.h>
+#define TARGET_SSSE3 __attribute__((target("ssse3")))
+#endif
+
+/*
+ * Vector permute AES, after Mike Hamburg's "Accelerating AES with Vector Permute Instructions" (CHES 2009). Every
+ * lookup is a pshufb of a 16-entry table indexed by the nibbles of the state, so there are no secret dependent memory
+ * accesses: unlike the T-tables, the timings do not depend on the key or the data.
+ *
+ * Between rounds the state is kept in another basis of GF(2^8), seen as GF(16)[s] with s^2 + c*s + c = 0 (c = 0x0c
+ * and s = 0x34 in the AES field, nibbles coded on the GF(16) basis 0x01, 0x0c, 0x50, 0xb0). A byte x = i*s + k, with
+ * i its high nibble and k its low nibble, has inverse (1/jo + (1 + c)/io)/c^2 * s + 1/io, where j = i + k,
+ * io = j + 1/(1/i + c/k) and jo = i + 1/(1/j + c/k). A zero 1/0 is coded as 0x80, for which pshufb returns zero, and
+ * that carries through the xors: the formula then still holds, x = 0 included.
+ *
+ * The output tables are indexed by io and jo and already apply what follows the inversion, the affine map of SubBytes
+ * and the change back to the state basis, with the MixColumns multipliers; the 0x63 of SubBytes and the InvSubBytes
+ * input transform are folded into the round keys.
+ */
+
+// State basis from the AES one, indexed by the low and high nibble
+static const uint8_t IPT_LO[16] = {0x00, 0x01, 0x37, 0x36, 0xd0, 0xd1, 0xe7, 0xe6, 0xd2, 0xd3, 0xe5, 0xe4, 0x02, 0x03, 0x35, 0x34};
+static const uint8_t IPT_HI[16] = {0x00, 0xbb, 0x7b, 0xc0, 0xbf, 0x04, 0xc4, 0x7f, 0xc8, 0x73, 0xb3, 0x08, 0x77, 0xcc, 0x0c, 0xb7};
+
+// 1/x in GF(16) and c/x, 0x80 for a zero divisor
+static const uint8_t INV[16] = {0x80, 0x01, 0x08, 0x0d, 0x0f, 0x06, 0x05, 0x0e, 0x02, 0x0c, 0x0b, 0x0a, 0x09, 0x03, 0x07, 0x04};
+static const uint8_t INVA[16] = {0x80, 0x02, 0x01, 0x0c, 0x08, 0x0b, 0x0d, 0x0a, 0x04, 0x0e, 0x07, 0x05, 0x03, 0x06, 0x09, 0x0f};
+
+// Encryption: SubBytes and 2 * SubBytes in the state basis for the inner rounds, SubBytes in the AES basis for the last
+static const uint8_t SB1_O[16] = {0x00, 0x52, 0x21, 0x11, 0xec, 0x9f, 0x30, 0xbe, 0xfd, 0x43, 0x8e, 0xdc, 0x73, 0xaf, 0xcd, 0x62};
+static const uint8_t SB1_T[16] = {0x00, 0xc9, 0x98, 0xa0, 0xb4, 0xe5, 0x38, 0x7d, 0x14, 0x69, 0x45, 0x8c, 0x51, 0xdd, 0x2c, 0xf1};
+static const uint8_t SB2_O[16] = {0x00, 0x38, 0x1c, 0x21, 0xc7, 0xe3, 0x3d, 0xff, 0xe6, 0x19, 0xc2, 0xfa, 0x24, 0xde, 0xdb, 0x05};
+static const uint8_t SB2_T[16] = {0x00, 0x68, 0x0e, 0xa8, 0x0d, 0x6b, 0xa6, 0x65, 0xa5, 0xc0, 0xc3, 0xab, 0x66, 0xcd, 0x03, 0xce};
+static const uint8_t SBO_O[16] = {0x00, 0xfa, 0x6a, 0x35, 0xbb, 0x2b, 0x5f, 0x41, 0x8e, 0xcf, 0x1e, 0xe4, 0x90, 0x74, 0xd1, 0xa5};
+static const uint8_t SBO_T[16] = {0x00, 0x81, 0x76, 0x99, 0xfd, 0x0a, 0xef, 0x7c, 0x64, 0x18, 0x93, 0x12, 0xf7, 0xe5, 0x8b, 0x6e};
+
+// Decryption: the state basis is taken after InvSubBytes' affine map, then inverses times 9, 13, 11 and 14 for
+// InvMixColumns, plain inverses in the AES basis for the last round
+static const uint8_t DIPT_LO[16] = {0x00, 0x5a, 0xa3, 0xf9, 0xa8, 0xf2, 0x0b, 0x51, 0x33, 0x69, 0x90, 0xca, 0x9b, 0xc1, 0x38, 0x62};
+static const uint8_t DIPT_HI[16] = {0x00, 0x63, 0x6c, 0x0f, 0x44, 0x27, 0x28, 0x4b, 0xaa, 0xc9, 0xc6, 0xa5, 0xee, 0x8d, 0x82, 0xe1};
+static const uint8_t DSB9_O[16] = {0x00, 0x63, 0x13, 0x6a, 0x84, 0xf4, 0x79, 0xe7, 0xee, 0x09, 0x9e, 0xfd, 0x70, 0x8d, 0x97, 0x1a};
+static const uint8_t DSB9_T[16] = {0x00, 0x9f, 0x99, 0xce, 0x5b, 0x5d, 0x57, 0xc4, 0x95, 0x51, 0x93, 0x0c, 0x06, 0x0a, 0xc2, 0xc8};
+static const uint8_t DSBD_O[16] = {0x00, 0x2c, 0xf0, 0x52, 0x4e, 0x92, 0xa2, 0x62, 0x1c, 0x7e, 0xc0, 0xec, 0xdc, 0x30, 0xbe, 0x8e};
+static const uint8_t DSBD_T[16] = {0x00, 0x08, 0x07, 0x4a, 0xaf, 0xa0, 0x4d, 0xa7, 0xe5, 0x42, 0xea, 0xe2, 0x0f, 0xed, 0xa8, 0x45};
+static const uint8_t DSBB_O[16] = {0x00, 0xf6, 0x8c, 0x3b, 0x1d, 0x67, 0xb7, 0xeb, 0x26, 0xcd, 0x5c, 0xaa, 0x7a, 0xd0, 0x91, 0x41};
+static const uint8_t DSBB_T[16] = {0x00, 0x2a, 0x32, 0xcb, 0xdd, 0xc5, 0xf9, 0xf7, 0x16, 0xe1, 0x0e, 0x24, 0x18, 0x3c, 0xef, 0xd3};
+static const uint8_t DSBE_O[16] = {0x00, 0xeb, 0xcd, 0x91, 0x3b, 0x1d, 0x5c, 0xd0, 0xaa, 0x7a, 0x8c, 0x67, 0x26, 0x41, 0xf6, 0xb7};
+static const uint8_t DSBE_T[16] = {0x00, 0xf7, 0xe1, 0xef, 0xcb, 0xdd, 0x0e, 0x3c, 0x24, 0x18, 0x32, 0xc5, 0x16, 0xd3, 0x2a, 0xf9};
+static const uint8_t DSBO_O[16] = {0x00, 0x9c, 0x1d, 0x8e, 0x44, 0xc5, 0x93, 0xd8, 0xca, 0x12, 0x4b, 0xd7, 0x81, 0x56, 0x59, 0x0f};
+static const uint8_t DSBO_T[16] = {0x00, 0x6f, 0xc2, 0x99, 0x6b, 0xc6, 0x5b, 0x04, 0xf2, 0xf6, 0x5f, 0x30, 0xad, 0x9d, 0xa9, 0x34};
+
+// Round keys are stored as 15 consecutive 16-byte blocks inside the 60-word expanded key
+#define LOAD(k, i) _mm_loadu_si128((const __m128i *) (k) + (i))
+#define STORE(k, i, v) _mm_storeu_si128((__m128i *) (k) + (i), (v))
+#define TABLE(t) _mm_loadu_si128((const __m128i *) (t))
+
+#define PARALLEL_BLOCKS 8
+
+int ssse3_supported(void) {
+#ifdef _MSC_VER
+    int info[4];
+
+    __cpuid(info, 1);
+
+    return (info[2] >> 9) & 1;
+#else
+    unsigned int eax, ebx, ecx, edx;
+
+    if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx))
+        return 0;
+
+    return (ecx >> 9) & 1;
+#endif
+}
+
+// Byte permutations of the state, which is stored column by column
+#define SHIFT_ROWS _mm_setr_epi8(0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11)
+#define INV_SHIFT_ROWS _mm_setr_epi8(0, 13, 10, 7, 4, 1, 14, 11, 8, 5, 2, 15, 12, 9, 6, 3)
+#define ROTATE_1 _mm_setr_epi8(1, 2, 3, 0, 5, 6, 7, 4, 9, 10, 11, 8, 13, 14, 15, 12)
+#define ROTATE_2 _mm_setr_epi8(2, 3, 0, 1, 6, 7, 4, 5, 10, 11, 8, 9, 14, 15, 12, 13)
+
+TARGET_SSSE3
+static inline __m128i lookup(const uint8_t lo[16], const uint8_t hi[16], __m128i x) {
+    __m128i mask = _mm_set1_epi8(0x0f);
+
+    return _mm_xor_si128(
+        _mm_shuffle_epi8(TABLE(lo), _mm_and_si128(x, mask)),
+        _mm_shuffle_epi8(TABLE(hi), _mm_and_si128(_mm_srli_epi16(x, 4), mask))
+    );
+}
+
+TARGET_SSSE3
+static inline void invert(__m128i x, __m128i *io, __m128i *jo) {
+    __m128i mask = _mm_set1_epi8(0x0f), inv = TABLE(INV);
+    __m128i i = _mm_and_si128(_mm_srli_epi16(x, 4), mask), k = _mm_and_si128(x, mask), j = _mm_xor_si128(i, k);
+    __m128i a = _mm_shuffle_epi8(TABLE(INVA), k);
+
+    *io = _mm_xor_si128(_mm_shuffle_epi8(inv, _mm_xor_si128(_mm_shuffle_epi8(inv, i), a)), j);
+    *jo = _mm_xor_si128(_mm_shuffle_epi8(inv, _mm_xor_si128(_mm_shuffle_epi8(inv, j), a)), i);
+}
+
+TARGET_SSSE3
+static inline __m128i output(const uint8_t o[16], const uint8_t t[16], __m128i io, __m128i jo) {
+    return _mm_xor_si128(_mm_shuffle_epi8(TABLE(o), io), _mm_shuffle_epi8(TABLE(t), jo));
+}
+
+TARGET_SSSE3
+static inline __m128i encrypt_first(__m128i x, __m128i key) {
+    return _mm_xor_si128(lookup(IPT_LO, IPT_HI, x), key);
+}
+
+// SubBytes, ShiftRows, MixColumns and AddRoundKey, the state and the round key being in the state basis
+TARGET_SSSE3
+static inline __m128i encrypt_round(__m128i x, __m128i key) {
+    __m128i io, jo, a, a2, b;
+
+    invert(_mm_shuffle_epi8(x, SHIFT_ROWS), &io, &jo);
+
+    a = output(SB1_O, SB1_T, io, jo);
+    a2 = output(SB2_O, SB2_T, io, jo);
+    b = _mm_xor_si128(a, _mm_shuffle_epi8(a, ROTATE_1));
+
+    // 2 * a[r] + 3 * a[r + 1] + a[r + 2] + a[r + 3]
+    x = _mm_xor_si128(a2, _mm_shuffle_epi8(_mm_xor_si128(a2, a), ROTATE_1));
+
+    return _mm_xor_si128(_mm_xor_si128(x, _mm_shuffle_epi8(b, ROTATE_2)), key);
+}
+
+TARGET_SSSE3
+static inline __m128i encrypt_last(__m128i x, __m128i key) {
+    __m128i io, jo;
+
+    invert(_mm_shuffle_epi8(x, SHIFT_ROWS), &io, &jo);
+
+    return _mm_xor_si128(output(SBO_O, SBO_T, io, jo), key);
+}
+
+TARGET_SSSE3
+static inline __m128i decrypt_first(__m128i x, __m128i key) {
+    return _mm_xor_si128(lookup(DIPT_LO, DIPT_HI, x), key);
+}
+
+// InvShiftRows, InvSubBytes, AddRoundKey and InvMixColumns, the latter two swapped by transforming the round key
+TARGET_SSSE3
+static inline __m128i decrypt_round(__m128i x, __m128i key) {
+    __m128i io, jo;
+
+    invert(_mm_shuffle_epi8(x, INV_SHIFT_ROWS), &io, &jo);
+
+    // 14 * v[r] + 11 * v[r + 1] + 13 * v[r + 2] + 9 * v[r + 3], Horner style
+    x = output(DSB9_O, DSB9_T, io, jo);
+    x = _mm_xor_si128(_mm_shuffle_epi8(x, ROTATE_1), output(DSBD_O, DSBD_T, io, jo));
+    x = _mm_xor_si128(_mm_shuffle_epi8(x, ROTATE_1), output(DSBB_O, DSBB_T, io, jo));
+    x = _mm_xor_si128(_mm_shuffle_epi8(x, ROTATE_1), output(DSBE_O, DSBE_T, io, jo));
+
+    return _mm_xor_si128(x, key);
+}
+
+TARGET_SSSE3
+static inline __m128i decrypt_last(__m128i x, __m128i key) {
+    __m128i io, jo;
+
+    invert(_mm_shuffle_epi8(x, INV_SHIFT_ROWS), &io, &jo);
+
+    return _mm_xor_si128(output(DSBO_O, DSBO_T, io, jo), key);
+}
+
+// SubWord of the key schedule, through the same constant time S-box
+TARGET_SSSE3
+static uint32_t sub_word(uint32_t word) {
+    __m128i io, jo;
+
+    invert(lookup(IPT_LO, IPT_HI, _mm_cvtsi32_si128((int) word)), &io, &jo);
+
+    return (uint32_t) _mm_cvtsi128_si32(output(SBO_O, SBO_T, io, jo)) ^ 0x63636363;
+}
+
+// Plain FIPS-197 key expansion, words are read little-endian so RotWord is a right rotation
+TARGET_SSSE3
+static void expand_key(const uint8_t key[32], __m128i rk[15]) {
+    uint32_t w[60], t, rcon = 0x01;
+    int i;
+
+    memcpy(w, key, 32);
+
+    for (i = 8; i < 60; ++i) {
+        t = w[i - 1];
+
+        if (i % 8 == 0) {
+            t = sub_word((t >> 8) | (t << 24)) ^ rcon;
+            rcon <<= 1;
+        } else if (i % 8 == 4)
+            t = sub_word(t);
+
+        w[i] = w[i - 8] ^ t;
+    }
+
+    for (i = 0; i < 15; ++i)
+        rk[i] = _mm_loadu_si128((const __m128i *) &w[i * 4]);
+}
+
+TARGET_SSSE3
+static __m128i xtime(__m128i x) {
+    __m128i carry = _mm_and_si128(_mm_cmplt_epi8(x, _mm_setzero_si128()), _mm_set1_epi8(0x1b));
+
+    return _mm_xor_si128(_mm_add_epi8(x, x), carry);
+}
+
+TARGET_SSSE3
+static __m128i inv_mix_columns(__m128i x) {
+    __m128i x2 = xtime(x), x4 = xtime(x2), x8 = xtime(x4), x9 = _mm_xor_si128(x8, x);
+    __m128i r = x9;
+
+    r = _mm_xor_si128(_mm_shuffle_epi8(r, ROTATE_1), _mm_xor_si128(x9, x4));
+    r = _mm_xor_si128(_mm_shuffle_epi8(r, ROTATE_1), _mm_xor_si128(x9, x2));
+
+    return _mm_xor_si128(_mm_shuffle_epi8(r, ROTATE_1), _mm_xor_si128(_mm_xor_si128(x8, x4), x2));
+}
+
+TARGET_SSSE3
+void ssse3_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+    __m128i rk[15], s63 = _mm_set1_epi8(0x63);
+    int i;
+
+    expand_key(key, rk);
+
+    STORE(expandedKey, 0, lookup(IPT_LO, IPT_HI, rk[0]));
+
+    for (i = 1; i < 14; ++i)
+        STORE(expandedKey, i, lookup(IPT_LO, IPT_HI, _mm_xor_si128(rk[i], s63)));
+
+    STORE(expandedKey, 14, _mm_xor_si128(rk[14], s63));
+}
+
+TARGET_SSSE3
+void ssse3_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]) {
+    __m128i rk[15], s63 = _mm_set1_epi8(0x63);
+    int i;
+
+    expand_key(key, rk);
+
+    STORE(expandedKey, 0, lookup(DIPT_LO, DIPT_HI, _mm_xor_si128(rk[14], s63)));
+
+    for (i = 1; i < 14; ++i)
+        STORE(expandedKey, i, lookup(DIPT_LO, DIPT_HI, _mm_xor_si128(inv_mix_columns(rk[14 - i]), s63)));
+
+    STORE(expandedKey, 14, rk[0]);
+}
+
+TARGET_SSSE3
+void ssse3_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) {
+    __m128i s = encrypt_first(_mm_loadu_si128((const __m128i *) in), LOAD(expandedKey, 0));
+    int i;
+
+    for (i = 1; i < 14; ++i)
+        s = encrypt_round(s, LOAD(expandedKey, i));
+
+    _mm_storeu_si128((__m128i *) out, encrypt_last(s, LOAD(expandedKey, 14)));
+}
+
+TARGET_SSSE3
+void ssse3_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]) {
+    __m128i s = decrypt_first(_mm_loadu_si128((const __m128i *) in), LOAD(expandedKey, 0));
+    int i;
+
+    for (i = 1; i < 14; ++i)
+        s = decrypt_round(s, LOAD(expandedKey, i));
+
+    _mm_storeu_si128((__m128i *) out, decrypt_last(s, LOAD(expandedKey, 14)));
+}
+
+// Up to PARALLEL_BLOCKS blocks go through each round together, their lookups being independent of each other
+TARGET_SSSE3
+void ssse3_encrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) {
+    __m128i s[PARALLEL_BLOCKS], k;
+    size_t b, n;
+    int i;
+
+    for (; blocks > 0; blocks -= n) {
+        n = blocks < PARALLEL_BLOCKS ? blocks : PARALLEL_BLOCKS;
+        k = LOAD(expandedKey, 0);
+
+        for (b = 0; b < n; ++b)
+            s[b] = encrypt_first(_mm_loadu_si128((const __m128i *) in + b), k);
+
+        for (i = 1; i < 14; ++i) {
+            k = LOAD(expandedKey, i);
+
+            for (b = 0; b < n; ++b)
+                s[b] = encrypt_round(s[b], k);
+        }
+
+        k = LOAD(expandedKey, 14);
+
+        for (b = 0; b < n; ++b)
+            _mm_storeu_si128((__m128i *) out + b, encrypt_last(s[b], k));
+
+        in += n * 16;
+        out += n * 16;
+    }
+}
+
+TARGET_SSSE3
+void ssse3_decrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]) {
+    __m128i s[PARALLEL_BLOCKS], k;
+    size_t b, n;
+    int i;
+
+    for (; blocks > 0; blocks -= n) {
+        n = blocks < PARALLEL_BLOCKS ? blocks : PARALLEL_BLOCKS;
+        k = LOAD(expandedKey, 0);
+
+        for (b = 0; b < n; ++b)
+            s[b] = decrypt_first(_mm_loadu_si128((const __m128i *) in + b), k);
+
+        for (i = 1; i < 14; ++i) {
+            k = LOAD(expandedKey, i);
+
+            for (b = 0; b < n; ++b)
+                s[b] = decrypt_round(s[b], k);
+        }
+
+        k = LOAD(expandedKey, 14);
+
+        for (b = 0; b < n; ++b)
+            _mm_storeu_si128((__m128i *) out + b, decrypt_last(s[b], k));
+
+        in += n * 16;
+        out += n * 16;
+    }
+}
+
+// Same round interleaving as the *_blocks functions, but every lane reads its round keys from its own schedule
+TARGET_SSSE3
+void ssse3_encrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) {
+    __m128i s[PARALLEL_BLOCKS];
+    size_t b;
+    int i;
+
+    for (b = 0; b < lanes; ++b)
+        s[b] = encrypt_first(_mm_loadu_si128((const __m128i *) in + b), LOAD(expandedKeys[b], 0));
+
+    for (i = 1; i < 14; ++i)
+        for (b = 0; b < lanes; ++b)
+            s[b] = encrypt_round(s[b], LOAD(expandedKeys[b], i));
+
+    for (b = 0; b < lanes; ++b)
+        _mm_storeu_si128((__m128i *) out + b, encrypt_last(s[b], LOAD(expandedKeys[b], 14)));
+}
+
+TARGET_SSSE3
+void ssse3_decrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes) {
+    __m128i s[PARALLEL_BLOCKS];
+    size_t b;
+    int i;
+
+    for (b = 0; b < lanes; ++b)
+        s[b] = decrypt_first(_mm_loadu_si128((const __m128i *) in + b), LOAD(expandedKeys[b], 0));
+
+    for (i = 1; i < 14; ++i)
+        for (b = 0; b < lanes; ++b)
+            s[b] = decrypt_round(s[b], LOAD(expandedKeys[b], i));
+
+    for (b = 0; b < lanes; ++b)
+        _mm_storeu_si128((__m128i *) out + b, decrypt_last(s[b], LOAD(expandedKeys[b], 14)));
+}
+
+#endif  // HAVE_SSSE3
@@ -0,0 +1,53 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef SSSE3256_H
+#define SSSE3256_H
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+#define HAVE_SSSE3
+#endif
+
+#ifdef HAVE_SSSE3
+
+int ssse3_supported(void);
+
+void ssse3_set_encryption_key(const uint8_t key[32], uint32_t expandedKey[60]);
+
+void ssse3_set_decryption_key(const uint8_t key[32], uint32_t expandedKey[60]);
+
+void ssse3_encrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
+
+void ssse3_decrypt(const uint8_t in[16], uint8_t out[16], const uint32_t expandedKey[60]);
+
+void ssse3_encrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]);
+
+void ssse3_decrypt_blocks(const uint8_t in[], uint8_t out[], size_t blocks, const uint32_t expandedKey[60]);
+
+void ssse3_encrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes);
+
+void ssse3_decrypt_lanes(const uint8_t in[], uint8_t out[], const uint32_t *const expandedKeys[], size_t lanes);
+
+#endif  // HAVE_SSSE3
+
+#endif  // SSSE3256_H
@@ -0,0 +1,131 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stdlib.h>
+#include <string.h>
+
+#include "stats.h"
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#endif
+
+#ifdef _MSC_VER
+#define ATOMIC_ADD(p, v) InterlockedExchangeAdd64((volatile LONG64 *) (p), (LONG64) (v))
+#define ATOMIC_LOAD(p) ((uint64_t) InterlockedCompareExchange64((volatile LONG64 *) (p), 0, 0))
+#define ATOMIC_STORE(p, v) InterlockedExchange64((volatile LONG64 *) (p), (LONG64) (v))
+#else
+#define ATOMIC_ADD(p, v) __atomic_fetch_add((p), (v), __ATOMIC_RELAXED)
+#define ATOMIC_LOAD(p) __atomic_load_n((p), __ATOMIC_RELAXED)
+#define ATOMIC_STORE(p, v) __atomic_store_n((p), (v), __ATOMIC_RELAXED)
+#endif
+
+volatile uint32_t stats_enabled = 0;
+
+static volatile uint32_t initialized = 0;
+
+static stats_counters counters[STATS_MODES][2];
+
+void stats_init(void) {
+    const char *value;
+
+    if (initialized)
+        return;
+
+    initialized = 1;
+    value = getenv(STATS_ENV);
+
+    if (value != NULL && *value != '\0' && strcmp(value, "0") != 0)
+        stats_enabled = 1;
+}
+
+uint64_t stats_now(void) {
+#ifdef _WIN32
+    static LARGE_INTEGER frequency;
+    LARGE_INTEGER now;
+
+    if (frequency.QuadPart == 0)
+        QueryPerformanceFrequency(&frequency);
+
+    QueryPerformanceCounter(&now);
+
+    return (uint64_t) ((double) now.QuadPart * 1e9 / (double) frequency.QuadPart) + 1;
+#else
+    struct timespec now;
+
+    clock_gettime(CLOCK_MONOTONIC, &now);
+
+    // Never 0, which stats_start() uses to tell that the counters were disabled
+    return (uint64_t) now.tv_sec * 1000000000 + (uint64_t) now.tv_nsec + 1;
+#endif
+}
+
+static int stats_bucket(size_t length) {
+    size_t limit = 64;
+    int i;
+
+    for (i = 0; i < STATS_BUCKETS - 1; ++i, limit *= 4)
+        if (length <= limit)
+            return i;
+
+    return STATS_BUCKETS - 1;
+}
+
+void stats_count(int mode, int encrypt, size_t length) {
+    stats_counters *c = &counters[mode][encrypt != 0];
+
+    ATOMIC_ADD(&c->calls, 1);
+    ATOMIC_ADD(&c->bytes, (uint64_t) length);
+    ATOMIC_ADD(&c->sizes[stats_bucket(length)], 1);
+}
+
+void stats_time(int mode, int encrypt, uint64_t start) {
+    ATOMIC_ADD(&counters[mode][encrypt != 0].ns, stats_now() - start);
+}
+
+void stats_get(int mode, int encrypt, stats_counters *out) {
+    stats_counters *c = &counters[mode][encrypt != 0];
+    int i;
+
+    out->calls = ATOMIC_LOAD(&c->calls);
+    out->bytes = ATOMIC_LOAD(&c->bytes);
+    out->ns = ATOMIC_LOAD(&c->ns);
+
+    for (i = 0; i < STATS_BUCKETS; ++i)
+        out->sizes[i] = ATOMIC_LOAD(&c->sizes[i]);
+}
+
+void stats_reset(void) {
+    int mode, encrypt, i;
+
+    for (mode = 0; mode < STATS_MODES; ++mode)
+        for (encrypt = 0; encrypt < 2; ++encrypt) {
+            stats_counters *c = &counters[mode][encrypt];
+
+            ATOMIC_STORE(&c->calls, 0);
+            ATOMIC_STORE(&c->bytes, 0);
+            ATOMIC_STORE(&c->ns, 0);
+
+            for (i = 0; i < STATS_BUCKETS; ++i)
+                ATOMIC_STORE(&c->sizes[i], 0);
+        }
+}
@@ -0,0 +1,76 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifndef STATS_H
+#define STATS_H
+
+#define STATS_ENV "TGCRYPTO_STATS"
+
+enum {
+    STATS_IGE,
+    STATS_CTR,
+    STATS_CBC,
+    STATS_MTPROTO2,
+    STATS_MODES
+};
+
+// Payload sizes are counted in buckets up to 64, 256, 1K, 4K, 16K, 64K, 256K, 1M bytes and above
+#define STATS_BUCKETS 9
+
+typedef struct {
+    uint64_t calls;
+    uint64_t bytes;
+    uint64_t ns;
+    uint64_t sizes[STATS_BUCKETS];
+} stats_counters;
+
+extern volatile uint32_t stats_enabled;
+
+// Enables the counters when the environment variable is set to anything but "0", only on the first call
+void stats_init(void);
+
+uint64_t stats_now(void);
+
+void stats_count(int mode, int encrypt, size_t length);
+
+void stats_time(int mode, int encrypt, uint64_t start);
+
+// Copies the counters of a mode and direction, each one is read atomically but not all of them at once
+void stats_get(int mode, int encrypt, stats_counters *counters);
+
+void stats_reset(void);
+
+// Nonzero only when the counters are enabled, so that disabled calls cost a single load and branch
+static inline uint64_t stats_start(void) {
+    return stats_enabled ? stats_now() : 0;
+}
+
+static inline void stats_record(int mode, int encrypt, size_t length, uint64_t start) {
+    if (start == 0)
+        return;
+
+    stats_count(mode, encrypt, length);
+    stats_time(mode, encrypt, start);
+}
+
+#endif  // STATS_H
@@ -26,218 +26,3216 @@
 #include "ige256.h"
 #include "ctr256.h"
 #include "cbc256.h"
+#include "cdn256.h"
+#include "drbg.h"
+#include "factorize.h"
+#include "filemap.h"
+#include "keycache.h"
+#include "mtproto2.h"
+#include "obfuscated.h"
+#include "parallel.h"
+#include "pool.h"
+#include "sha256.h"
+#include "stats.h"
+#include "utils.h"
+
+#define FILE_CHUNK_SIZE (16 * 1024 * 1024)
+
+enum {
+    MODE_IGE = STATS_IGE,
+    MODE_CTR = STATS_CTR,
+    MODE_CBC = STATS_CBC
+};
+
+// Heap types are mutable unless told otherwise, the static types they replaced never were
+#ifdef Py_TPFLAGS_IMMUTABLETYPE
+#define TYPE_FLAGS (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE)
+#else
+#define TYPE_FLAGS Py_TPFLAGS_DEFAULT
+#endif
+
+// Since Python 3.8 instances hold a reference to their heap type, which the type's tp_dealloc must release
+#if PY_VERSION_HEX >= 0x03080000
+#define RELEASE_TYPE(type) Py_DECREF(type)
+#else
+#define RELEASE_TYPE(type)
+#endif
+
+// Per-interpreter state: completions of the jobs an interpreter submits never reach another one
+typedef struct {
+    pool_queue *queue;
+} module_state;
+
+#define GET_QUEUE(module) (((module_state *) PyModule_GetState(module))->queue)
 
 #define DESCRIPTION "Fast and Portable Cryptography Extension Library for Pyrogram\n" \
     "TgCrypto is part of Pyrogram, a Telegram MTProto library for Python\n" \
     "You can learn more about Pyrogram here: https://pyrogram.org\n"
 
-static PyObject *ige(PyObject *args, uint8_t encrypt) {
-    Py_buffer data, key, iv;
-    uint8_t *buf;
-    PyObject *out;
+// In-place operation is allowed (out is data), any other overlap between the two buffers is not
+static int check_output(Py_buffer *data, Py_buffer *out) {
+    const uint8_t *in = data->buf, *buf = out->buf;
 
-    if (!PyArg_ParseTuple(args, "y*y*y*", &data, &key, &iv))
-        return NULL;
+    if (out->len < data->len) {
+        PyErr_SetString(PyExc_ValueError, "Output buffer must be at least as large as data");
+        return -1;
+    }
 
-    if (data.len == 0) {
+    if (in != buf && in < buf + data->len && buf < in + data->len) {
+        PyErr_SetString(PyExc_ValueError, "Output buffer must not partially overlap data");
+        return -1;
+    }
+
+    return 0;
+}
+
+// Creates the result: either a new bytes object to be filled or, for the _into variants, the number of bytes written
+static PyObject *prepare_output(Py_buffer *data, Py_buffer *out, uint8_t **buf) {
+    PyObject *result;
+
+    if (out->obj != NULL) {
+        if (check_output(data, out) < 0)
+            return NULL;
+
+        *buf = out->buf;
+
+        return PyLong_FromSsize_t(data->len);
+    }
+
+    result = PyBytes_FromStringAndSize(NULL, data->len);
+
+    if (result != NULL)
+        *buf = (uint8_t *) PyBytes_AS_STRING(result);
+
+    return result;
+}
+
+// Argument checks shared by the stateless IGE, CTR and CBC functions, state is only used by CTR
+static int check_args(uint8_t mode, Py_buffer *data, Py_buffer *key, Py_buffer *iv, Py_buffer *state) {
+    if (data->len == 0) {
         PyErr_SetString(PyExc_ValueError, "Data must not be empty");
-        return NULL;
+        return -1;
     }
 
-    if (data.len % 16 != 0) {
+    if (mode != MODE_CTR && data->len % 16 != 0) {
         PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
-        return NULL;
+        return -1;
     }
 
-    if (key.len != 32) {
+    if (key->len != 32) {
         PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
-        return NULL;
+        return -1;
     }
 
-    if (iv.len != 32) {
+    if (mode == MODE_IGE && iv->len != 32) {
         PyErr_SetString(PyExc_ValueError, "IV size must be exactly 32 bytes");
-        return NULL;
+        return -1;
     }
 
+    if (mode != MODE_IGE && iv->len != 16) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
+        return -1;
+    }
+
+    if (mode == MODE_CTR) {
+        if (state->len != 1) {
+            PyErr_SetString(PyExc_ValueError, "State size must be exactly 1 byte");
+            return -1;
+        }
+
+        if (*(uint8_t *) state->buf > 15) {
+            PyErr_SetString(PyExc_ValueError, "State value must be in the range [0, 15]");
+            return -1;
+        }
+    }
+
+    return 0;
+}
+
+#define MAX_ARGS 8
+
+// METH_FASTCALL | METH_KEYWORDS argument handling, cheaper than building a tuple and running PyArg_ParseTuple on
+// every call. values receives the count arguments in the order of keywords, whether they were given by position or
+// by name; the ones after the first required are optional and left NULL when missing. Errors keep the wording of
+// PyArg_ParseTupleAndKeywords
+static int parse_optional_args(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name,
+                               const char *const keywords[], Py_ssize_t required, Py_ssize_t count, PyObject *values[]) {
+    Py_ssize_t given = nargs + (kwnames != NULL ? PyTuple_GET_SIZE(kwnames) : 0), i, j;
+    PyObject *keyword;
+
+    if (given > count) {
+        PyErr_Format(
+            PyExc_TypeError, "%s() takes at most %zd argument%s (%zd given)", name, count, count == 1 ? "" : "s", given
+        );
+        return -1;
+    }
+
+    for (i = 0; i < nargs; ++i)
+        values[i] = args[i];
+
+    for (; i < count; ++i)
+        values[i] = NULL;
+
+    for (i = 0; i < given - nargs; ++i) {
+        keyword = PyTuple_GET_ITEM(kwnames, i);
+
+        for (j = 0; j < count; ++j)
+            if (PyUnicode_CompareWithASCIIString(keyword, keywords[j]) == 0)
+                break;
+
+        if (j == count) {
+            PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%U'", name, keyword);
+            return -1;
+        }
+
+        if (values[j] != NULL) {
+            PyErr_Format(PyExc_TypeError, "argument for %s() given by name ('%U') and position (%zd)", name, keyword, j + 1);
+            return -1;
+        }
+
+        values[j] = args[nargs + i];
+    }
+
+    for (i = 0; i < required; ++i)
+        if (values[i] == NULL) {
+            PyErr_Format(PyExc_TypeError, "%s() missing required argument '%s' (pos %zd)", name, keywords[i], i + 1);
+            return -1;
+        }
+
+    return 0;
+}
+
+// Same as parse_optional_args for functions without optional arguments, keeping the wording of PyArg_ParseTuple
+static int parse_args(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name,
+                      const char *const keywords[], Py_ssize_t count, PyObject *values[]) {
+    Py_ssize_t given = nargs + (kwnames != NULL ? PyTuple_GET_SIZE(kwnames) : 0);
+
+    if (given != count) {
+        PyErr_Format(
+            PyExc_TypeError, "function takes exactly %zd argument%s (%zd given)", count, count == 1 ? "" : "s", given
+        );
+        return -1;
+    }
+
+    return parse_optional_args(args, nargs, kwnames, name, keywords, count, count, values);
+}
+
+static int get_buffer(PyObject *obj, Py_buffer *view, Py_ssize_t position, uint8_t writable) {
+    if (!writable)
+        return PyObject_GetBuffer(obj, view, PyBUF_SIMPLE);
+
+    if (PyObject_GetBuffer(obj, view, PyBUF_WRITABLE) < 0) {
+        PyErr_Clear();
+        PyErr_Format(
+            PyExc_TypeError, "argument %zd must be read-write bytes-like object, not %.50s", position, Py_TYPE(obj)->tp_name
+        );
+        return -1;
+    }
+
+    return 0;
+}
+
+// Parses count buffer arguments into views, the last one must be writable when into is set.
+// On failure the buffers acquired so far are released
+static int parse_buffers(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name,
+                         const char *const keywords[], Py_ssize_t count, Py_buffer *const views[], uint8_t into) {
+    PyObject *values[MAX_ARGS];
+    Py_ssize_t i;
+
+    if (parse_args(args, nargs, kwnames, name, keywords, count, values) < 0)
+        return -1;
+
+    for (i = 0; i < count; ++i)
+        if (get_buffer(values[i], views[i], i + 1, into && i == count - 1) < 0) {
+            while (i--)
+                PyBuffer_Release(views[i]);
+
+            return -1;
+        }
+
+    return 0;
+}
+
+static const char *const crypt_keywords[] = {"data", "key", "iv", "out"};
+
+static const char *const ctr_keywords[] = {"data", "key", "iv", "state", "out"};
+
+static PyObject *ige(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt, uint8_t into) {
+    Py_buffer data, key, iv, out = {NULL};
+    Py_buffer *const views[] = {&data, &key, &iv, &out};
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    PyObject *result = NULL;
+    uint8_t *buf;
+    uint64_t start;
+
+    if (parse_buffers(args, nargs, kwnames, name, crypt_keywords, into ? 4 : 3, views, into) < 0)
+        return NULL;
+
+    if (check_args(MODE_IGE, &data, &key, &iv, NULL) < 0)
+        goto exit;
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result == NULL)
+        goto exit;
+
     Py_BEGIN_ALLOW_THREADS
-        buf = ige256(data.buf, data.len, key.buf, iv.buf, encrypt);
+        start = stats_start();
+        keycache_expand(key.buf, expandedKey, encrypt);
+        ige256_crypt(data.buf, buf, data.len, expandedKey, iv.buf, encrypt);
+        stats_record(STATS_IGE, encrypt, data.len, start);
     Py_END_ALLOW_THREADS
 
+    exit:
     PyBuffer_Release(&data);
     PyBuffer_Release(&key);
     PyBuffer_Release(&iv);
+    PyBuffer_Release(&out);
 
-    out = Py_BuildValue("y#", buf, data.len);
-    free(buf);
+    return result;
+}
 
-    return out;
+static PyObject *ige256_encrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige(args, nargs, kwnames, "ige256_encrypt", 1, 0);
 }
 
-static PyObject *ige256_encrypt(PyObject *self, PyObject *args) {
-    return ige(args, 1);
+static PyObject *ige256_decrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige(args, nargs, kwnames, "ige256_decrypt", 0, 0);
 }
 
-static PyObject *ige256_decrypt(PyObject *self, PyObject *args) {
-    return ige(args, 0);
+static PyObject *ige256_encrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige(args, nargs, kwnames, "ige256_encrypt_into", 1, 1);
 }
 
-static PyObject *ctr256_encrypt(PyObject *self, PyObject *args) {
-    Py_buffer data, key, iv, state;
+static PyObject *ige256_decrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige(args, nargs, kwnames, "ige256_decrypt_into", 0, 1);
+}
+
+// Every item owns four buffers (data, key, iv and the optional output), zero-initialized so that all of them can be
+// released unconditionally, whether acquired or not
+static PyObject *ige_many(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt) {
+    static const char *const keywords[] = {"items", "out"};
+    PyObject *values[2], *outs, *itemsSeq, *outsSeq = NULL, *result = NULL, *item, *value;
+    Py_buffer *buffers = NULL, *b;
+    uint32_t (*expandedKeys)[EXPANDED_KEY_SIZE] = NULL;
+    ige256_job *jobs = NULL;
+    Py_ssize_t count, i;
+    uint64_t start;
+
+    if (parse_optional_args(args, nargs, kwnames, name, keywords, 1, 2, values) < 0)
+        return NULL;
+
+    outs = values[1] != NULL ? values[1] : Py_None;
+    itemsSeq = PySequence_Fast(values[0], "Items must be a sequence of (data, key, iv) tuples");
+
+    if (itemsSeq == NULL)
+        return NULL;
+
+    count = PySequence_Fast_GET_SIZE(itemsSeq);
+
+    if (outs != Py_None) {
+        outsSeq = PySequence_Fast(outs, "Out must be a sequence of writable buffers");
+
+        if (outsSeq == NULL)
+            goto exit;
+
+        if (PySequence_Fast_GET_SIZE(outsSeq) != count) {
+            PyErr_SetString(PyExc_ValueError, "Out must contain exactly one buffer per item");
+            goto exit;
+        }
+    }
+
+    buffers = PyMem_Calloc(count * 4 + 1, sizeof(Py_buffer));
+    expandedKeys = PyMem_Malloc((count + 1) * sizeof(*expandedKeys));
+    jobs = PyMem_Malloc((count + 1) * sizeof(ige256_job));
+    result = PyList_New(count);
+
+    if (buffers == NULL || expandedKeys == NULL || jobs == NULL) {
+        PyErr_NoMemory();
+        Py_CLEAR(result);
+    }
+
+    if (result == NULL)
+        goto exit;
+
+    for (i = 0; i < count; ++i) {
+        item = PySequence_Fast_GET_ITEM(itemsSeq, i);
+        b = &buffers[i * 4];
+
+        if (!PyTuple_Check(item)) {
+            PyErr_SetString(PyExc_TypeError, "Items must be a sequence of (data, key, iv) tuples");
+            goto error;
+        }
+
+        if (!PyArg_ParseTuple(item, "y*y*y*", &b[0], &b[1], &b[2]))
+            goto error;
+
+        if (b[0].len == 0) {
+            PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+            goto error;
+        }
+
+        if (b[0].len % 16 != 0) {
+            PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+            goto error;
+        }
+
+        if (b[1].len != 32) {
+            PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
+            goto error;
+        }
+
+        if (b[2].len != 32) {
+            PyErr_SetString(PyExc_ValueError, "IV size must be exactly 32 bytes");
+            goto error;
+        }
+
+        if (outsSeq != NULL && PyObject_GetBuffer(PySequence_Fast_GET_ITEM(outsSeq, i), &b[3], PyBUF_WRITABLE) < 0)
+            goto error;
+
+        value = prepare_output(&b[0], &b[3], &jobs[i].out);
+
+        if (value == NULL)
+            goto error;
+
+        PyList_SET_ITEM(result, i, value);
+
+        jobs[i].in = b[0].buf;
+        jobs[i].length = b[0].len;
+        jobs[i].expandedKey = expandedKeys[i];
+        jobs[i].iv = b[2].buf;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+
+        for (i = 0; i < count; ++i)
+            keycache_expand(buffers[i * 4 + 1].buf, expandedKeys[i], encrypt);
+
+        ige256_crypt_many(jobs, count, encrypt);
+
+        // Each message is a call of its own, the time is only known for the whole batch
+        if (start != 0) {
+            for (i = 0; i < count; ++i)
+                stats_count(STATS_IGE, encrypt, jobs[i].length);
+
+            stats_time(STATS_IGE, encrypt, start);
+        }
+    Py_END_ALLOW_THREADS
+
+    goto exit;
+
+    error:
+    Py_CLEAR(result);
+
+    exit:
+    if (buffers != NULL)
+        for (i = 0; i < count * 4; ++i)
+            PyBuffer_Release(&buffers[i]);
+
+    PyMem_Free(buffers);
+    PyMem_Free(expandedKeys);
+    PyMem_Free(jobs);
+    Py_XDECREF(outsSeq);
+    Py_DECREF(itemsSeq);
+
+    return result;
+}
+
+static PyObject *ige256_encrypt_many(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige_many(args, nargs, kwnames, "ige256_encrypt_many", 1);
+}
+
+static PyObject *ige256_decrypt_many(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ige_many(args, nargs, kwnames, "ige256_decrypt_many", 0);
+}
+
+static PyObject *ctr(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt, uint8_t into) {
+    Py_buffer data, key, iv, state, out = {NULL};
+    Py_buffer *const views[] = {&data, &key, &iv, &state, &out};
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    PyObject *result = NULL;
     uint8_t *buf;
-    PyObject *out;
+    uint64_t start;
+
+    if (parse_buffers(args, nargs, kwnames, name, ctr_keywords, into ? 5 : 4, views, into) < 0)
+        return NULL;
+
+    if (check_args(MODE_CTR, &data, &key, &iv, &state) < 0)
+        goto exit;
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result == NULL)
+        goto exit;
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        keycache_expand(key.buf, expandedKey, 1);
+        ctr256_crypt(data.buf, buf, data.len, expandedKey, iv.buf, state.buf);
+        stats_record(STATS_CTR, encrypt, data.len, start);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+    PyBuffer_Release(&state);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *ctr256_encrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr(args, nargs, kwnames, "ctr256_encrypt", 1, 0);
+}
+
+static PyObject *ctr256_decrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr(args, nargs, kwnames, "ctr256_decrypt", 0, 0);
+}
+
+static PyObject *ctr256_encrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr(args, nargs, kwnames, "ctr256_encrypt_into", 1, 1);
+}
+
+static PyObject *ctr256_decrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr(args, nargs, kwnames, "ctr256_decrypt_into", 0, 1);
+}
+
+static int parse_uint64(PyObject *arg, const char *name, uint64_t *result) {
+    unsigned long long value;
+    long long sign;
+    int overflow;
+
+    if (!PyLong_Check(arg)) {
+        PyErr_Format(PyExc_TypeError, "%s must be an integer", name);
+        return 0;
+    }
+
+    value = PyLong_AsUnsignedLongLong(arg);
+
+    if (value == (unsigned long long) -1 && PyErr_Occurred()) {
+        PyErr_Clear();
+
+        sign = PyLong_AsLongLongAndOverflow(arg, &overflow);
+
+        if (overflow < 0 || (overflow == 0 && sign < 0))
+            PyErr_Format(PyExc_ValueError, "%s must not be negative", name);
+        else
+            PyErr_Format(PyExc_OverflowError, "%s must fit in 64 bits", name);
+
+        return 0;
+    }
 
-    if (!PyArg_ParseTuple(args, "y*y*y*y*", &data, &key, &iv, &state))
+    *result = value;
+
+    return 1;
+}
+
+static int parse_offset(PyObject *arg, uint64_t *offset) {
+    return parse_uint64(arg, "Offset", offset);
+}
+
+static PyObject *ctr_at(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt) {
+    static const char *const keywords[] = {"data", "key", "iv", "offset"};
+    Py_buffer data, key, iv;
+    Py_buffer *const views[] = {&data, &key, &iv};
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t counter[AES_BLOCK_SIZE], state;
+    PyObject *values[4], *result = NULL;
+    uint64_t offset;
+    uint64_t start;
+
+    if (parse_args(args, nargs, kwnames, name, keywords, 4, values) < 0 || !parse_offset(values[3], &offset))
+        return NULL;
+
+    // The offset is the last argument, the buffers are parsed again from the already ordered values
+    if (parse_buffers(values, 3, NULL, name, keywords, 3, views, 0) < 0)
         return NULL;
 
     if (data.len == 0) {
         PyErr_SetString(PyExc_ValueError, "Data must not be empty");
-        return NULL;
+        goto exit;
     }
 
     if (key.len != 32) {
         PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
-        return NULL;
+        goto exit;
     }
 
     if (iv.len != 16) {
         PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
-        return NULL;
+        goto exit;
     }
 
-    if (state.len != 1) {
-        PyErr_SetString(PyExc_ValueError, "State size must be exactly 1 byte");
-        return NULL;
-    }
+    result = PyBytes_FromStringAndSize(NULL, data.len);
 
-    if (*(uint8_t *) state.buf > 15) {
-        PyErr_SetString(PyExc_ValueError, "State value must be in the range [0, 15]");
-        return NULL;
-    }
+    if (result == NULL)
+        goto exit;
+
+    memcpy(counter, iv.buf, AES_BLOCK_SIZE);
 
     Py_BEGIN_ALLOW_THREADS
-        buf = ctr256(data.buf, data.len, key.buf, iv.buf, state.buf);
+        start = stats_start();
+        keycache_expand(key.buf, expandedKey, 1);
+        ctr256_seek(counter, &state, offset);
+        ctr256_crypt(data.buf, (uint8_t *) PyBytes_AS_STRING(result), data.len, expandedKey, counter, &state);
+        stats_record(STATS_CTR, encrypt, data.len, start);
     Py_END_ALLOW_THREADS
 
+    exit:
     PyBuffer_Release(&data);
     PyBuffer_Release(&key);
     PyBuffer_Release(&iv);
 
-    out = Py_BuildValue("y#", buf, data.len);
-    free(buf);
+    return result;
+}
 
-    return out;
+static PyObject *ctr256_encrypt_at(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr_at(args, nargs, kwnames, "ctr256_encrypt_at", 1);
 }
 
-static PyObject *cbc(PyObject *args, uint8_t encrypt) {
-    Py_buffer data, key, iv;
-    uint8_t *buf;
-    PyObject *out;
+static PyObject *ctr256_decrypt_at(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr_at(args, nargs, kwnames, "ctr256_decrypt_at", 0);
+}
 
-    if (!PyArg_ParseTuple(args, "y*y*y*", &data, &key, &iv))
-        return NULL;
+// Hashes are copied into one contiguous array so that the whole check can run with the GIL released
+static uint8_t *parse_hashes(PyObject *hashes, size_t count) {
+    PyObject *seq = PySequence_Fast(hashes, "Hashes must be a sequence of 32-byte digests");
+    uint8_t *result = NULL;
+    Py_buffer hash;
+    Py_ssize_t i;
 
-    if (data.len == 0) {
-        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+    if (seq == NULL)
         return NULL;
+
+    if ((size_t) PySequence_Fast_GET_SIZE(seq) != count) {
+        PyErr_Format(PyExc_ValueError, "Hashes count must be exactly %zu for this data size", count);
+        goto exit;
     }
 
-    if (data.len % 16 != 0) {
-        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+    result = PyMem_Malloc(count * CDN256_HASH_SIZE);
+
+    if (result == NULL) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+
+    for (i = 0; i < (Py_ssize_t) count; ++i) {
+        if (PyObject_GetBuffer(PySequence_Fast_GET_ITEM(seq, i), &hash, PyBUF_SIMPLE) < 0)
+            goto error;
+
+        if (hash.len != CDN256_HASH_SIZE) {
+            PyBuffer_Release(&hash);
+            PyErr_SetString(PyExc_ValueError, "Hash size must be exactly 32 bytes");
+            goto error;
+        }
+
+        memcpy(&result[i * CDN256_HASH_SIZE], hash.buf, CDN256_HASH_SIZE);
+        PyBuffer_Release(&hash);
+    }
+
+    goto exit;
+
+    error:
+    PyMem_Free(result);
+    result = NULL;
+
+    exit:
+    Py_DECREF(seq);
+
+    return result;
+}
+
+static PyObject *ctr_verify(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t into) {
+    static const char *const keywords[] = {"data", "key", "iv", "offset", "hashes", "hash_chunk"};
+    static const char *const intoKeywords[] = {"data", "key", "iv", "offset", "hashes", "out", "hash_chunk"};
+    Py_buffer data = {NULL}, key = {NULL}, iv = {NULL}, out = {NULL};
+    Py_buffer *const views[] = {&data, &key, &iv};
+    PyObject *values[7], *result = NULL;
+    Py_ssize_t hashChunk = CDN256_DEFAULT_CHUNK, count = into ? 7 : 6, i;
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t *hashes = NULL, *buf;
+    size_t mismatch, size;
+    uint64_t offset, first;
+    uint64_t start;
+    int status;
+
+    if (parse_optional_args(args, nargs, kwnames, name, into ? intoKeywords : keywords, count - 1, count, values) < 0)
         return NULL;
+
+    if (!parse_offset(values[3], &offset))
+        return NULL;
+
+    if (values[count - 1] != NULL) {
+        hashChunk = PyNumber_AsSsize_t(values[count - 1], PyExc_OverflowError);
+
+        if (hashChunk == -1 && PyErr_Occurred())
+            return NULL;
+    }
+
+    for (i = 0; i < 3; ++i)
+        if (get_buffer(values[i], views[i], i + 1, 0) < 0)
+            goto exit;
+
+    if (into && get_buffer(values[5], &out, 6, 1) < 0)
+        goto exit;
+
+    if (data.len == 0) {
+        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+        goto exit;
     }
 
     if (key.len != 32) {
         PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
-        return NULL;
+        goto exit;
     }
 
     if (iv.len != 16) {
         PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
-        return NULL;
+        goto exit;
     }
 
+    if (hashChunk <= 0) {
+        PyErr_SetString(PyExc_ValueError, "Hash chunk size must be greater than 0");
+        goto exit;
+    }
+
+    hashes = parse_hashes(values[4], cdn256_hash_count(data.len, hashChunk));
+
+    if (hashes == NULL)
+        goto exit;
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result == NULL)
+        goto exit;
+
     Py_BEGIN_ALLOW_THREADS
-        buf = cbc256(data.buf, data.len, key.buf, iv.buf, encrypt);
+        start = stats_start();
+        keycache_expand(key.buf, expandedKey, 1);
+        status = cdn256_decrypt_verify(data.buf, buf, data.len, expandedKey, iv.buf, offset, hashes, hashChunk, &mismatch);
+        stats_record(STATS_CTR, 0, data.len, start);
     Py_END_ALLOW_THREADS
 
+    if (status != CDN256_OK) {
+        first = mismatch * hashChunk;
+        size = data.len - first < (size_t) hashChunk ? data.len - first : (size_t) hashChunk;
+
+        PyErr_Format(
+            PyExc_ValueError, "Hash mismatch for bytes [%llu, %llu)",
+            (unsigned long long) (offset + first), (unsigned long long) (offset + first + size)
+        );
+        Py_CLEAR(result);
+    }
+
+    exit:
+    PyMem_Free(hashes);
     PyBuffer_Release(&data);
     PyBuffer_Release(&key);
     PyBuffer_Release(&iv);
+    PyBuffer_Release(&out);
 
-    out = Py_BuildValue("y#", buf, data.len);
-    free(buf);
-
-    return out;
+    return result;
 }
 
-static PyObject *cbc256_encrypt(PyObject *self, PyObject *args) {
-    return cbc(args, 1);
+static PyObject *ctr256_decrypt_verify(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr_verify(args, nargs, kwnames, "ctr256_decrypt_verify", 0);
 }
 
-static PyObject *cbc256_decrypt(PyObject *self, PyObject *args) {
-    return cbc(args, 0);
+static PyObject *ctr256_decrypt_verify_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return ctr_verify(args, nargs, kwnames, "ctr256_decrypt_verify_into", 1);
 }
 
-PyDoc_STRVAR(
-    ige256_encrypt_docs,
-    "ige256_encrypt(data, key, iv)\n"
-    "--\n\n"
-    "AES-256-IGE Encryption"
-);
+static PyObject *cbc(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt, uint8_t into) {
+    Py_buffer data, key, iv, out = {NULL};
+    Py_buffer *const views[] = {&data, &key, &iv, &out};
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    PyObject *result = NULL;
+    uint8_t *buf;
+    uint64_t start;
 
-PyDoc_STRVAR(
-    ige256_decrypt_docs,
-    "ige256_decrypt(data, key, iv)\n"
-    "--\n\n"
-    "AES-256-IGE Decryption"
-);
+    if (parse_buffers(args, nargs, kwnames, name, crypt_keywords, into ? 4 : 3, views, into) < 0)
+        return NULL;
 
-PyDoc_STRVAR(
-    ctr256_encrypt_docs,
-    "ctr256_encrypt(data, key, iv, state)\n"
-    "--\n\n"
-    "AES-256-CTR Encryption"
-);
+    if (check_args(MODE_CBC, &data, &key, &iv, NULL) < 0)
+        goto exit;
 
-PyDoc_STRVAR(
-    ctr256_decrypt_docs,
-    "ctr256_decrypt(data, key, iv, state)\n"
-    "--\n\n"
-    "AES-256-CTR Decryption"
-);
+    result = prepare_output(&data, &out, &buf);
 
-PyDoc_STRVAR(
-    cbc256_encrypt_docs,
-    "cbc256_encrypt(data, key, iv)\n"
-    "--\n\n"
-    "AES-256-CBC Encryption"
-);
+    if (result == NULL)
+        goto exit;
 
-PyDoc_STRVAR(
-    cbc256_decrypt_docs,
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        keycache_expand(key.buf, expandedKey, encrypt);
+        cbc256_crypt(data.buf, buf, data.len, expandedKey, iv.buf, encrypt);
+        stats_record(STATS_CBC, encrypt, data.len, start);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *cbc256_encrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return cbc(args, nargs, kwnames, "cbc256_encrypt", 1, 0);
+}
+
+static PyObject *cbc256_decrypt(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return cbc(args, nargs, kwnames, "cbc256_decrypt", 0, 0);
+}
+
+static PyObject *cbc256_encrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return cbc(args, nargs, kwnames, "cbc256_encrypt_into", 1, 1);
+}
+
+static PyObject *cbc256_decrypt_into(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return cbc(args, nargs, kwnames, "cbc256_decrypt_into", 0, 1);
+}
+
+static PyObject *mtproto2(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, uint8_t encrypt) {
+    static const char *const encryptKeywords[] = {"auth_key", "auth_key_id", "payload", "is_client"};
+    static const char *const decryptKeywords[] = {"auth_key", "auth_key_id", "packet", "is_client"};
+    const char *const *keywords = encrypt ? encryptKeywords : decryptKeywords;
+    const char *name = encrypt ? "mtproto2_encrypt" : "mtproto2_decrypt";
+    Py_buffer authKey, authKeyId, data;
+    Py_buffer *const views[] = {&authKey, &authKeyId, &data};
+    PyObject *values[4], *result = NULL;
+    Py_ssize_t size;
+    uint64_t start;
+    int isClient, status;
+
+    if (parse_args(args, nargs, kwnames, name, keywords, 4, values) < 0)
+        return NULL;
+
+    if ((isClient = PyObject_IsTrue(values[3])) < 0)
+        return NULL;
+
+    if (parse_buffers(values, 3, NULL, name, keywords, 3, views, 0) < 0)
+        return NULL;
+
+    if (authKey.len != MTPROTO2_AUTH_KEY_SIZE) {
+        PyErr_SetString(PyExc_ValueError, "Auth key size must be exactly 256 bytes");
+        goto exit;
+    }
+
+    if (authKeyId.len != MTPROTO2_AUTH_KEY_ID_SIZE) {
+        PyErr_SetString(PyExc_ValueError, "Auth key id size must be exactly 8 bytes");
+        goto exit;
+    }
+
+    if (encrypt) {
+        if (data.len == 0) {
+            PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+            goto exit;
+        }
+
+        size = mtproto2_packet_size(data.len);
+    } else {
+        if (data.len <= MTPROTO2_HEADER_SIZE || (data.len - MTPROTO2_HEADER_SIZE) % 16 != 0) {
+            PyErr_SetString(PyExc_ValueError, "Packet size must be 24 bytes plus a multiple of 16 bytes");
+            goto exit;
+        }
+
+        size = data.len - MTPROTO2_HEADER_SIZE;
+    }
+
+    result = PyBytes_FromStringAndSize(NULL, size);
+
+    if (result == NULL)
+        goto exit;
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        status = encrypt
+            ? mtproto2_encrypt(authKey.buf, authKeyId.buf, data.buf, data.len, (uint8_t *) PyBytes_AS_STRING(result), isClient)
+            : mtproto2_decrypt(authKey.buf, authKeyId.buf, data.buf, data.len, (uint8_t *) PyBytes_AS_STRING(result), isClient);
+        stats_record(STATS_MTPROTO2, encrypt, data.len, start);
+    Py_END_ALLOW_THREADS
+
+    if (status != MTPROTO2_OK) {
+        switch (status) {
+            case MTPROTO2_RANDOM_ERROR:
+                PyErr_SetString(PyExc_OSError, "Failed to read random bytes from the operating system");
+                break;
+            case MTPROTO2_AUTH_KEY_ID_MISMATCH:
+                PyErr_SetString(PyExc_ValueError, "Auth key id mismatch");
+                break;
+            case MTPROTO2_MSG_KEY_MISMATCH:
+                PyErr_SetString(PyExc_ValueError, "Msg key mismatch");
+                break;
+            default:
+                PyErr_SetString(PyExc_ValueError, "Message length mismatch");
+        }
+
+        Py_CLEAR(result);
+    }
+
+    exit:
+    PyBuffer_Release(&authKey);
+    PyBuffer_Release(&authKeyId);
+    PyBuffer_Release(&data);
+
+    return result;
+}
+
+static PyObject *mtproto2_encrypt_message(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return mtproto2(args, nargs, kwnames, 1);
+}
+
+static PyObject *mtproto2_decrypt_message(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return mtproto2(args, nargs, kwnames, 0);
+}
+
+static PyObject *factorize_pq(PyObject *self, PyObject *arg) {
+    uint64_t pq, p, q;
+    int status;
+
+    if (!parse_uint64(arg, "PQ", &pq))
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+        status = factorize(pq, &p, &q);
+    Py_END_ALLOW_THREADS
+
+    if (status == FACTORIZE_NOT_COMPOSITE) {
+        PyErr_SetString(PyExc_ValueError, "PQ must be a composite number");
+        return NULL;
+    }
+
+    if (status == FACTORIZE_NOT_SEMIPRIME) {
+        PyErr_SetString(PyExc_ValueError, "PQ must be a product of two primes");
+        return NULL;
+    }
+
+    return Py_BuildValue("(KK)", (unsigned long long) p, (unsigned long long) q);
+}
+
+static PyObject *random_bytes(PyObject *self, PyObject *arg) {
+    PyObject *result;
+    Py_ssize_t size;
+    int status;
+
+    if (!PyLong_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "Size must be an integer");
+        return NULL;
+    }
+
+    size = PyLong_AsSsize_t(arg);
+
+    if (size == -1 && PyErr_Occurred())
+        return NULL;
+
+    if (size < 0) {
+        PyErr_SetString(PyExc_ValueError, "Size must not be negative");
+        return NULL;
+    }
+
+    result = PyBytes_FromStringAndSize(NULL, size);
+
+    if (result == NULL)
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+        status = drbg_generate((uint8_t *) PyBytes_AS_STRING(result), size);
+    Py_END_ALLOW_THREADS
+
+    if (status < 0) {
+        Py_DECREF(result);
+        PyErr_SetString(PyExc_OSError, "Failed to read random bytes from the operating system");
+        return NULL;
+    }
+
+    return result;
+}
+
+static PyObject *random_into(PyObject *self, PyObject *arg) {
+    Py_buffer out;
+    int status;
+
+    if (get_buffer(arg, &out, 1, 1) < 0)
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+        status = drbg_generate(out.buf, out.len);
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&out);
+
+    if (status < 0) {
+        PyErr_SetString(PyExc_OSError, "Failed to read random bytes from the operating system");
+        return NULL;
+    }
+
+    return PyLong_FromSsize_t(out.len);
+}
+
+// _ctr_drbg(entropy, length) instantiates a generator from the given entropy and returns its second output of length
+// bytes, which is how the NIST CAVP known-answer tests of CTR_DRBG without reseeding are laid out
+static PyObject *ctr_drbg(PyObject *self, PyObject *args) {
+    Py_buffer entropy;
+    PyObject *result = NULL;
+    drbg_state state;
+    Py_ssize_t length;
+
+    if (!PyArg_ParseTuple(args, "y*n", &entropy, &length))
+        return NULL;
+
+    if (entropy.len != DRBG_SEED_SIZE || length < 0 || length > DRBG_MAX_REQUEST) {
+        PyErr_SetString(PyExc_ValueError, "Entropy must be 48 bytes and length at most 65536");
+        goto exit;
+    }
+
+    result = PyBytes_FromStringAndSize(NULL, length);
+
+    if (result == NULL)
+        goto exit;
+
+    drbg_instantiate(&state, entropy.buf);
+    drbg_request(&state, (uint8_t *) PyBytes_AS_STRING(result), length);
+    drbg_request(&state, (uint8_t *) PyBytes_AS_STRING(result), length);
+
+    exit:
+    PyBuffer_Release(&entropy);
+
+    return result;
+}
+
+static void set_file_error(PyObject *path) {
+#ifdef _WIN32
+    PyErr_SetExcFromWindowsErrWithFilenameObject(PyExc_OSError, 0, path);
+#else
+    PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+#endif
+}
+
+// On Windows paths are kept as str and passed to the wide API, elsewhere they are encoded to bytes
+static const filemap_char *file_path(PyObject *path) {
+#ifdef _WIN32
+    return PyUnicode_AsWideCharString(path, NULL);
+#else
+    return PyBytes_AS_STRING(path);
+#endif
+}
+
+static void free_file_path(const filemap_char *path) {
+#ifdef _WIN32
+    PyMem_Free((void *) path);
+#endif
+}
+
+#ifdef _WIN32
+#define PATH_CONVERTER PyUnicode_FSDecoder
+#else
+#define PATH_CONVERTER PyUnicode_FSConverter
+#endif
+
+// The destination is mapped with its blocks reserved, then filled a chunk at a time from the source and processed
+// in place with the GIL released. The chaining state (IV, counter and keystream offset) is carried from one chunk
+// to the next, so chunking does not change the result
+static PyObject *crypt_file(PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, const char *name, uint8_t encrypt) {
+    static const char *const keywords[] = {"mode", "src_path", "dst_path", "key", "iv", "chunk_size"};
+    PyObject *values[6], *srcArg, *dstArg, *srcPath = NULL, *dstPath = NULL, *result = NULL;
+    const filemap_char *srcChars = NULL, *dstChars = NULL;
+    const char *modeName;
+    Py_buffer key = {NULL}, iv = {NULL};
+    Py_ssize_t chunkSize = FILE_CHUNK_SIZE;
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t ivCopy[32], state = 0;
+    filemap src, dst;
+    size_t offset, n;
+    int mode, status;
+    uint64_t start;
+
+    if (parse_optional_args(args, nargs, kwnames, name, keywords, 5, 6, values) < 0)
+        return NULL;
+
+    if (!PyUnicode_Check(values[0])) {
+        PyErr_Format(PyExc_TypeError, "%s() argument 1 must be str, not %.50s", name, Py_TYPE(values[0])->tp_name);
+        return NULL;
+    }
+
+    modeName = PyUnicode_AsUTF8(values[0]);
+    srcArg = values[1];
+    dstArg = values[2];
+
+    if (modeName == NULL)
+        return NULL;
+
+    if (values[5] != NULL) {
+        chunkSize = PyNumber_AsSsize_t(values[5], PyExc_OverflowError);
+
+        if (chunkSize == -1 && PyErr_Occurred())
+            return NULL;
+    }
+
+    if (get_buffer(values[3], &key, 4, 0) < 0)
+        return NULL;
+
+    if (get_buffer(values[4], &iv, 5, 0) < 0)
+        goto exit;
+
+    if (strcmp(modeName, "ige") == 0)
+        mode = MODE_IGE;
+    else if (strcmp(modeName, "ctr") == 0)
+        mode = MODE_CTR;
+    else if (strcmp(modeName, "cbc") == 0)
+        mode = MODE_CBC;
+    else {
+        PyErr_SetString(PyExc_ValueError, "Mode must be one of 'ige', 'ctr' or 'cbc'");
+        goto exit;
+    }
+
+    if (key.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
+        goto exit;
+    }
+
+    if (mode == MODE_IGE && iv.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 32 bytes");
+        goto exit;
+    }
+
+    if (mode != MODE_IGE && iv.len != 16) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
+        goto exit;
+    }
+
+    if (chunkSize <= 0 || chunkSize % 16 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Chunk size must be a positive multiple of 16 bytes");
+        goto exit;
+    }
+
+    if (!PATH_CONVERTER(srcArg, &srcPath) || !PATH_CONVERTER(dstArg, &dstPath))
+        goto exit;
+
+    srcChars = file_path(srcPath);
+    dstChars = file_path(dstPath);
+
+    if (srcChars == NULL || dstChars == NULL)
+        goto exit;
+
+    Py_BEGIN_ALLOW_THREADS
+        status = filemap_open_read(srcChars, &src);
+    Py_END_ALLOW_THREADS
+
+    if (status < 0) {
+        set_file_error(srcArg);
+        filemap_close(&src);
+        goto exit;
+    }
+
+    if (src.size == 0) {
+        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+        filemap_close(&src);
+        goto exit;
+    }
+
+    if (mode != MODE_CTR && src.size % 16 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+        filemap_close(&src);
+        goto exit;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+        status = filemap_open_write(dstChars, src.size, &src, &dst);
+    Py_END_ALLOW_THREADS
+
+    if (status < 0) {
+        if (status == FILEMAP_SAME_FILE)
+            PyErr_SetString(PyExc_ValueError, "Source and destination must be different files");
+        else
+            set_file_error(dstArg);
+
+        filemap_close(&dst);
+        filemap_close(&src);
+        goto exit;
+    }
+
+    memcpy(ivCopy, iv.buf, iv.len);
+    start = stats_start();
+
+    Py_BEGIN_ALLOW_THREADS
+        if (mode == MODE_CTR || encrypt)
+            aes256_set_encryption_key(key.buf, expandedKey);
+        else
+            aes256_set_decryption_key(key.buf, expandedKey);
+    Py_END_ALLOW_THREADS
+
+    // Each chunk of the source is read into the destination mapping, then processed there in place
+    for (offset = 0; offset < src.size; offset += n) {
+        n = MIN(src.size - offset, (size_t) chunkSize);
+
+        Py_BEGIN_ALLOW_THREADS
+            status = filemap_read(&src, offset, dst.data + offset, n);
+
+            if (status == 0) {
+                switch (mode) {
+                    case MODE_IGE:
+                        ige256_update(dst.data + offset, dst.data + offset, n, expandedKey, ivCopy, encrypt);
+                        break;
+                    case MODE_CTR:
+                        ctr256_crypt(dst.data + offset, dst.data + offset, n, expandedKey, ivCopy, &state);
+                        break;
+                    default:
+                        cbc256_crypt(dst.data + offset, dst.data + offset, n, expandedKey, ivCopy, encrypt);
+                }
+            }
+        Py_END_ALLOW_THREADS
+
+        if (status == FILEMAP_TRUNCATED) {
+            PyErr_SetString(PyExc_OSError, "Source file was truncated while being read");
+            break;
+        }
+
+        if (status < 0) {
+            set_file_error(srcArg);
+            break;
+        }
+
+        if (PyErr_CheckSignals() < 0)
+            break;
+    }
+
+    if (offset >= src.size) {
+        stats_record(mode, encrypt, src.size, start);
+        result = PyLong_FromSize_t(src.size);
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+        filemap_close(&dst);
+        filemap_close(&src);
+
+        // An interrupted or failed run would leave a full-size file that is only partly written
+        if (offset < src.size)
+            filemap_remove(dstChars);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    if (srcChars != NULL)
+        free_file_path(srcChars);
+
+    if (dstChars != NULL)
+        free_file_path(dstChars);
+
+    Py_XDECREF(srcPath);
+    Py_XDECREF(dstPath);
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+    secure_zero(expandedKey, sizeof(expandedKey));
+    secure_zero(ivCopy, sizeof(ivCopy));
+
+    return result;
+}
+
+static PyObject *encrypt_file(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return crypt_file(args, nargs, kwnames, "encrypt_file", 1);
+}
+
+static PyObject *decrypt_file(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return crypt_file(args, nargs, kwnames, "decrypt_file", 0);
+}
+
+typedef struct {
+    pool_job base;
+    PyObject *token;
+    PyObject *result;
+    Py_buffer data, key, iv, state;
+    uint8_t mode;
+    uint8_t encrypt;
+} aio_job;
+
+static void aio_run(pool_job *job) {
+    aio_job *self = (aio_job *) job;
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t *out = (uint8_t *) PyBytes_AS_STRING(self->result);
+    uint64_t start = stats_start();
+
+    keycache_expand(self->key.buf, expandedKey, self->mode == MODE_CTR || self->encrypt);
+
+    switch (self->mode) {
+        case MODE_IGE:
+            ige256_crypt(self->data.buf, out, self->data.len, expandedKey, self->iv.buf, self->encrypt);
+            break;
+        case MODE_CTR:
+            ctr256_crypt(self->data.buf, out, self->data.len, expandedKey, self->iv.buf, self->state.buf);
+            break;
+        default:
+            cbc256_crypt(self->data.buf, out, self->data.len, expandedKey, self->iv.buf, self->encrypt);
+    }
+
+    stats_record(self->mode, self->encrypt, self->data.len, start);
+}
+
+static void aio_job_free(aio_job *job) {
+    PyBuffer_Release(&job->data);
+    PyBuffer_Release(&job->key);
+    PyBuffer_Release(&job->iv);
+    PyBuffer_Release(&job->state);
+    Py_XDECREF(job->token);
+    Py_XDECREF(job->result);
+    PyMem_Free(job);
+}
+
+// _submit(name, token, *args) queues one of the six stateless functions, name being e.g. "ige256_encrypt", on the
+// worker pool. Arguments are checked right away, the result is later returned by _completed() along with token
+static PyObject *aio_submit(PyObject *self, PyObject *args) {
+    static const struct {
+        const char *name;
+        const char *format;
+        uint8_t mode;
+        uint8_t encrypt;
+    } functions[] = {
+        {"ige256_encrypt", "y*y*y*:ige256_encrypt", MODE_IGE, 1},
+        {"ige256_decrypt", "y*y*y*:ige256_decrypt", MODE_IGE, 0},
+        {"ctr256_encrypt", "y*y*y*y*:ctr256_encrypt", MODE_CTR, 1},
+        {"ctr256_decrypt", "y*y*y*y*:ctr256_decrypt", MODE_CTR, 0},
+        {"cbc256_encrypt", "y*y*y*:cbc256_encrypt", MODE_CBC, 1},
+        {"cbc256_decrypt", "y*y*y*:cbc256_decrypt", MODE_CBC, 0}
+    };
+    PyObject *name, *rest;
+    aio_job *job;
+    size_t i;
+    int parsed;
+
+    if (PyTuple_GET_SIZE(args) < 2 || !PyUnicode_Check(name = PyTuple_GET_ITEM(args, 0))) {
+        PyErr_SetString(PyExc_TypeError, "_submit() takes a function name, a token and the function arguments");
+        return NULL;
+    }
+
+    for (i = 0; i < sizeof(functions) / sizeof(functions[0]); ++i)
+        if (PyUnicode_CompareWithASCIIString(name, functions[i].name) == 0)
+            break;
+
+    if (i == sizeof(functions) / sizeof(functions[0])) {
+        PyErr_Format(PyExc_ValueError, "Unknown function %R", name);
+        return NULL;
+    }
+
+    job = PyMem_Calloc(1, sizeof(aio_job));
+
+    if (job == NULL)
+        return PyErr_NoMemory();
+
+    rest = PyTuple_GetSlice(args, 2, PyTuple_GET_SIZE(args));
+
+    if (rest == NULL) {
+        PyMem_Free(job);
+        return NULL;
+    }
+
+    parsed = PyArg_ParseTuple(rest, functions[i].format, &job->data, &job->key, &job->iv, &job->state);
+    Py_DECREF(rest);
+
+    if (!parsed) {
+        PyMem_Free(job);
+        return NULL;
+    }
+
+    job->base.run = aio_run;
+    job->mode = functions[i].mode;
+    job->encrypt = functions[i].encrypt;
+    job->token = PyTuple_GET_ITEM(args, 1);
+    Py_INCREF(job->token);
+
+    if (check_args(job->mode, &job->data, &job->key, &job->iv, &job->state) < 0)
+        goto error;
+
+    job->result = PyBytes_FromStringAndSize(NULL, job->data.len);
+
+    if (job->result == NULL)
+        goto error;
+
+    if (pool_submit(GET_QUEUE(self), &job->base) < 0) {
+        PyErr_SetString(PyExc_RuntimeError, "Could not start the worker threads");
+        goto error;
+    }
+
+    Py_RETURN_NONE;
+
+    error:
+    aio_job_free(job);
+
+    return NULL;
+}
+
+static PyObject *aio_completed(PyObject *self, PyObject *args) {
+    PyObject *list = PyList_New(0), *item;
+    pool_job *jobs = pool_completed(GET_QUEUE(self)), *next;
+    aio_job *job;
+
+    for (; jobs != NULL; jobs = next) {
+        next = jobs->next;
+        job = (aio_job *) jobs;
+
+        if (list != NULL) {
+            item = PyTuple_Pack(2, job->token, job->result);
+
+            if (item == NULL || PyList_Append(list, item) < 0)
+                Py_CLEAR(list);
+
+            Py_XDECREF(item);
+        }
+
+        aio_job_free(job);
+    }
+
+    return list;
+}
+
+static PyObject *aio_completion_fd(PyObject *self, PyObject *args) {
+    int fd = pool_fd(GET_QUEUE(self));
+
+    if (fd < 0)
+        Py_RETURN_NONE;
+
+    return PyLong_FromLong(fd);
+}
+
+static PyObject *backend(PyObject *self, PyObject *args) {
+    return PyUnicode_FromString(aes256_backend());
+}
+
+// Same conversion as the "i" format of PyArg_ParseTuple
+static int parse_int(PyObject *arg, int *result) {
+    PyObject *index = PyNumber_Index(arg);
+    long value;
+
+    if (index == NULL)
+        return 0;
+
+    value = PyLong_AsLong(index);
+    Py_DECREF(index);
+
+    if (value == -1 && PyErr_Occurred())
+        return 0;
+
+    if (value > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "signed integer is greater than maximum");
+        return 0;
+    }
+
+    if (value < INT_MIN) {
+        PyErr_SetString(PyExc_OverflowError, "signed integer is less than minimum");
+        return 0;
+    }
+
+    *result = (int) value;
+
+    return 1;
+}
+
+static PyObject *set_threads(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"threads"};
+    PyObject *value;
+    int threads;
+
+    if (parse_args(args, nargs, kwnames, "set_threads", keywords, 1, &value) < 0 || !parse_int(value, &threads))
+        return NULL;
+
+    if (threads < 0) {
+        PyErr_SetString(PyExc_ValueError, "Threads count must not be negative");
+        return NULL;
+    }
+
+    parallel_set_threads(threads);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *get_threads(PyObject *self, PyObject *args) {
+    return PyLong_FromUnsignedLong(parallel_get_threads());
+}
+
+static PyObject *set_key_cache_size(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"size"};
+    PyObject *value;
+    int size;
+
+    if (parse_args(args, nargs, kwnames, "set_key_cache_size", keywords, 1, &value) < 0 || !parse_int(value, &size))
+        return NULL;
+
+    if (size < 0 || size > KEYCACHE_MAX_SIZE) {
+        PyErr_Format(PyExc_ValueError, "Key cache size must be in the range [0, %d]", KEYCACHE_MAX_SIZE);
+        return NULL;
+    }
+
+    keycache_set_size(size);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *get_key_cache_size(PyObject *self, PyObject *args) {
+    return PyLong_FromSize_t(keycache_get_size());
+}
+
+static PyObject *key_cache_stats(PyObject *self, PyObject *args) {
+    keycache_counters counters;
+
+    keycache_get(&counters);
+
+    return Py_BuildValue(
+        "{snsnsKsK}",
+        "size", (Py_ssize_t) counters.size, "entries", (Py_ssize_t) counters.entries,
+        "hits", counters.hits, "misses", counters.misses
+    );
+}
+
+static PyObject *clear_key_cache(PyObject *self, PyObject *args) {
+    keycache_clear();
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *stats_entry(int mode, int encrypt) {
+    static const char *const buckets[STATS_BUCKETS] = {"64", "256", "1K", "4K", "16K", "64K", "256K", "1M", "1M+"};
+    PyObject *sizes, *value;
+    stats_counters counters;
+    int i;
+
+    stats_get(mode, encrypt, &counters);
+    sizes = PyDict_New();
+
+    if (sizes == NULL)
+        return NULL;
+
+    for (i = 0; i < STATS_BUCKETS; ++i) {
+        value = PyLong_FromUnsignedLongLong(counters.sizes[i]);
+
+        if (value == NULL || PyDict_SetItemString(sizes, buckets[i], value) < 0) {
+            Py_XDECREF(value);
+            Py_DECREF(sizes);
+            return NULL;
+        }
+
+        Py_DECREF(value);
+    }
+
+    return Py_BuildValue("{sKsKsKsN}", "calls", counters.calls, "bytes", counters.bytes, "ns", counters.ns, "sizes", sizes);
+}
+
+static PyObject *stats(PyObject *self, PyObject *args) {
+    static const char *const modes[STATS_MODES] = {"ige", "ctr", "cbc", "mtproto2"};
+    PyObject *result = PyDict_New(), *directions;
+    int mode;
+
+    if (result == NULL)
+        return NULL;
+
+    for (mode = 0; mode < STATS_MODES; ++mode) {
+        directions = Py_BuildValue("{sNsN}", "encrypt", stats_entry(mode, 1), "decrypt", stats_entry(mode, 0));
+
+        if (directions == NULL || PyDict_SetItemString(result, modes[mode], directions) < 0) {
+            Py_XDECREF(directions);
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        Py_DECREF(directions);
+    }
+
+    return result;
+}
+
+static PyObject *reset_stats(PyObject *self, PyObject *args) {
+    stats_reset();
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *enable_stats(PyObject *self, PyObject *args) {
+    stats_enabled = 1;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *disable_stats(PyObject *self, PyObject *args) {
+    stats_enabled = 0;
+
+    Py_RETURN_NONE;
+}
+
+typedef struct {
+    PyObject_HEAD
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t start[AES_BLOCK_SIZE];
+    uint8_t iv[AES_BLOCK_SIZE];
+    uint8_t state;
+    ctr256_prefetch prefetch;
+    PyThread_type_lock lock;
+} AES256CTR;
+
+#define ENTER_LOCK(obj) \
+    if (!PyThread_acquire_lock((obj)->lock, 0)) { \
+        Py_BEGIN_ALLOW_THREADS \
+        PyThread_acquire_lock((obj)->lock, 1); \
+        Py_END_ALLOW_THREADS \
+    }
+
+#define LEAVE_LOCK(obj) PyThread_release_lock((obj)->lock)
+
+// Bytes of keystream to compute ahead of use, 0 disables prefetching
+static int check_prefetch(Py_ssize_t prefetch) {
+    if (prefetch < 0 || prefetch > CTR256_MAX_PREFETCH) {
+        PyErr_Format(PyExc_ValueError, "Prefetch size must be in the range [0, %d]", CTR256_MAX_PREFETCH);
+        return -1;
+    }
+
+    return 0;
+}
+
+static int allocate_prefetch(ctr256_prefetch *prefetch, Py_ssize_t size) {
+    uint8_t *ring = NULL;
+
+    if (size > 0 && (ring = PyMem_Malloc(size)) == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    ctr256_prefetch_init(prefetch, ring, size);
+
+    return 0;
+}
+
+static void free_prefetch(ctr256_prefetch *prefetch) {
+    ctr256_prefetch_clear(prefetch);
+    PyMem_Free(prefetch->ring);
+    prefetch->ring = NULL;
+}
+
+static PyObject *AES256CTR_new(PyTypeObject *type, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"key", "iv", "prefetch", NULL};
+    Py_ssize_t prefetch = 0;
+    Py_buffer key, iv;
+    AES256CTR *self;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*y*|n:AES256CTR", kwlist, &key, &iv, &prefetch))
+        return NULL;
+
+    if (key.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
+        goto error;
+    }
+
+    if (iv.len != 16) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
+        goto error;
+    }
+
+    if (check_prefetch(prefetch) < 0)
+        goto error;
+
+    self = (AES256CTR *) type->tp_alloc(type, 0);
+
+    if (self == NULL)
+        goto error;
+
+    self->lock = PyThread_allocate_lock();
+
+    if (self->lock == NULL) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    if (allocate_prefetch(&self->prefetch, prefetch) < 0) {
+        Py_DECREF(self);
+        goto error;
+    }
+
+    aes256_set_encryption_key(key.buf, self->expandedKey);
+    memcpy(self->start, iv.buf, AES_BLOCK_SIZE);
+    memcpy(self->iv, iv.buf, AES_BLOCK_SIZE);
+    self->state = 0;
+
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+
+    return (PyObject *) self;
+
+    error:
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+
+    return NULL;
+}
+
+static void AES256CTR_dealloc(AES256CTR *self) {
+    PyTypeObject *type = Py_TYPE(self);
+
+    free_prefetch(&self->prefetch);
+    secure_zero(self->expandedKey, sizeof(self->expandedKey));
+    secure_zero(self->start, sizeof(self->start));
+    secure_zero(self->iv, sizeof(self->iv));
+
+    if (self->lock != NULL)
+        PyThread_free_lock(self->lock);
+
+    type->tp_free((PyObject *) self);
+    RELEASE_TYPE(type);
+}
+
+static void AES256CTR_crypt(AES256CTR *self, const uint8_t *in, uint8_t *out, Py_ssize_t length) {
+    uint64_t start;
+
+    ENTER_LOCK(self)
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        ctr256_prefetch_crypt(&self->prefetch, in, out, length, self->expandedKey, self->iv, &self->state);
+        // Encryption and decryption are the same operation, the stream doesn't know which one it does
+        stats_record(STATS_CTR, 1, length, start);
+    Py_END_ALLOW_THREADS
+
+    LEAVE_LOCK(self);
+}
+
+static const char *const update_keywords[] = {"data", "out"};
+
+static PyObject *AES256CTR_update_common(AES256CTR *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, uint8_t into) {
+    Py_buffer data, out = {NULL};
+    Py_buffer *const views[] = {&data, &out};
+    PyObject *result;
+    uint8_t *buf;
+
+    if (parse_buffers(args, nargs, kwnames, into ? "update_into" : "update", update_keywords, into ? 2 : 1, views, into) < 0)
+        return NULL;
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result != NULL)
+        AES256CTR_crypt(self, data.buf, buf, data.len);
+
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *AES256CTR_update(AES256CTR *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return AES256CTR_update_common(self, args, nargs, kwnames, 0);
+}
+
+static PyObject *AES256CTR_update_into(AES256CTR *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return AES256CTR_update_common(self, args, nargs, kwnames, 1);
+}
+
+static PyObject *AES256CTR_seek(AES256CTR *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"offset"};
+    PyObject *value;
+    uint64_t offset;
+
+    if (parse_args(args, nargs, kwnames, "seek", keywords, 1, &value) < 0 || !parse_offset(value, &offset))
+        return NULL;
+
+    ENTER_LOCK(self)
+
+    ctr256_prefetch_clear(&self->prefetch);
+    memcpy(self->iv, self->start, AES_BLOCK_SIZE);
+    ctr256_seek(self->iv, &self->state, offset);
+
+    LEAVE_LOCK(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *AES256CTR_refill(AES256CTR *self, PyObject *args) {
+    size_t computed;
+
+    ENTER_LOCK(self)
+
+    Py_BEGIN_ALLOW_THREADS
+        computed = ctr256_prefetch_refill(&self->prefetch, self->expandedKey, self->iv, &self->state);
+    Py_END_ALLOW_THREADS
+
+    LEAVE_LOCK(self);
+
+    return PyLong_FromSize_t(computed);
+}
+
+PyDoc_STRVAR(
+    AES256CTR_docs,
+    "AES256CTR(key, iv, prefetch=0)\n"
+    "--\n\n"
+    "AES-256-CTR stream with a precomputed key schedule\n\n"
+    "The counter and the keystream offset are kept inside the object,\n"
+    "so consecutive updates continue the same keystream. Up to prefetch bytes\n"
+    "of keystream can be computed ahead of the updates by refill()."
+);
+
+PyDoc_STRVAR(
+    AES256CTR_update_docs,
+    "update(data)\n"
+    "--\n\n"
+    "AES-256-CTR Encryption/Decryption"
+);
+
+PyDoc_STRVAR(
+    AES256CTR_update_into_docs,
+    "update_into(data, out)\n"
+    "--\n\n"
+    "AES-256-CTR Encryption/Decryption into a writable buffer"
+);
+
+PyDoc_STRVAR(
+    AES256CTR_seek_docs,
+    "seek(offset)\n"
+    "--\n\n"
+    "Move the keystream to a byte offset from the start of the stream"
+);
+
+PyDoc_STRVAR(
+    AES256CTR_refill_docs,
+    "refill()\n"
+    "--\n\n"
+    "Precompute keystream for the next updates, returning the number of bytes computed"
+);
+
+static PyMethodDef AES256CTR_methods[] = {
+    {"update", (PyCFunction) (void (*)(void)) AES256CTR_update, METH_FASTCALL | METH_KEYWORDS, AES256CTR_update_docs},
+    {"update_into", (PyCFunction) (void (*)(void)) AES256CTR_update_into, METH_FASTCALL | METH_KEYWORDS, AES256CTR_update_into_docs},
+    {"seek", (PyCFunction) (void (*)(void)) AES256CTR_seek, METH_FASTCALL | METH_KEYWORDS, AES256CTR_seek_docs},
+    {"refill", (PyCFunction) AES256CTR_refill, METH_NOARGS, AES256CTR_refill_docs},
+    {NULL}
+};
+
+static PyType_Slot AES256CTR_slots[] = {
+    {Py_tp_doc, (void *) AES256CTR_docs},
+    {Py_tp_new, AES256CTR_new},
+    {Py_tp_dealloc, AES256CTR_dealloc},
+    {Py_tp_methods, AES256CTR_methods},
+    {0, NULL}
+};
+
+static PyType_Spec AES256CTR_spec = {
+    .name = "tgcrypto.AES256CTR",
+    .basicsize = sizeof(AES256CTR),
+    .flags = TYPE_FLAGS,
+    .slots = AES256CTR_slots
+};
+
+typedef struct {
+    PyObject_HEAD
+    uint32_t encryptionKey[EXPANDED_KEY_SIZE];
+    uint32_t decryptionKey[EXPANDED_KEY_SIZE];
+} AES256Schedule;
+
+static PyObject *AES256Schedule_new(PyTypeObject *type, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"key", NULL};
+    Py_buffer key;
+    AES256Schedule *self;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*", kwlist, &key))
+        return NULL;
+
+    if (key.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
+        PyBuffer_Release(&key);
+        return NULL;
+    }
+
+    self = (AES256Schedule *) type->tp_alloc(type, 0);
+
+    if (self != NULL) {
+        aes256_set_encryption_key(key.buf, self->encryptionKey);
+        aes256_set_decryption_key(key.buf, self->decryptionKey);
+    }
+
+    PyBuffer_Release(&key);
+
+    return (PyObject *) self;
+}
+
+static const char *const schedule_keywords[] = {"data", "iv", "out"};
+
+static PyObject *IGE256_crypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, uint8_t encrypt, uint8_t into) {
+    const char *name = encrypt ? (into ? "encrypt_into" : "encrypt") : (into ? "decrypt_into" : "decrypt");
+    Py_buffer data, iv, out = {NULL};
+    Py_buffer *const views[] = {&data, &iv, &out};
+    PyObject *result = NULL;
+    uint8_t *buf;
+    uint64_t start;
+
+    if (parse_buffers(args, nargs, kwnames, name, schedule_keywords, into ? 3 : 2, views, into) < 0)
+        return NULL;
+
+    if (data.len == 0) {
+        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+        goto exit;
+    }
+
+    if (data.len % 16 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+        goto exit;
+    }
+
+    if (iv.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 32 bytes");
+        goto exit;
+    }
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result == NULL)
+        goto exit;
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        ige256_crypt(data.buf, buf, data.len, encrypt ? self->encryptionKey : self->decryptionKey, iv.buf, encrypt);
+        stats_record(STATS_IGE, encrypt, data.len, start);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&iv);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *IGE256_encrypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return IGE256_crypt(self, args, nargs, kwnames, 1, 0);
+}
+
+static PyObject *IGE256_decrypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return IGE256_crypt(self, args, nargs, kwnames, 0, 0);
+}
+
+static PyObject *IGE256_encrypt_into(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return IGE256_crypt(self, args, nargs, kwnames, 1, 1);
+}
+
+static PyObject *IGE256_decrypt_into(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return IGE256_crypt(self, args, nargs, kwnames, 0, 1);
+}
+
+static PyObject *CBC256_crypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, uint8_t encrypt, uint8_t into) {
+    const char *name = encrypt ? (into ? "encrypt_into" : "encrypt") : (into ? "decrypt_into" : "decrypt");
+    Py_buffer data, iv, out = {NULL};
+    Py_buffer *const views[] = {&data, &iv, &out};
+    uint8_t ivCopy[AES_BLOCK_SIZE];
+    PyObject *result = NULL;
+    uint8_t *buf;
+    uint64_t start;
+
+    if (parse_buffers(args, nargs, kwnames, name, schedule_keywords, into ? 3 : 2, views, into) < 0)
+        return NULL;
+
+    if (data.len == 0) {
+        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+        goto exit;
+    }
+
+    if (data.len % 16 != 0) {
+        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+        goto exit;
+    }
+
+    if (iv.len != 16) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
+        goto exit;
+    }
+
+    result = prepare_output(&data, &out, &buf);
+
+    if (result == NULL)
+        goto exit;
+
+    memcpy(ivCopy, iv.buf, AES_BLOCK_SIZE);
+
+    Py_BEGIN_ALLOW_THREADS
+        start = stats_start();
+        cbc256_crypt(data.buf, buf, data.len, encrypt ? self->encryptionKey : self->decryptionKey, ivCopy, encrypt);
+        stats_record(STATS_CBC, encrypt, data.len, start);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&iv);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *CBC256_encrypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return CBC256_crypt(self, args, nargs, kwnames, 1, 0);
+}
+
+static PyObject *CBC256_decrypt(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return CBC256_crypt(self, args, nargs, kwnames, 0, 0);
+}
+
+static PyObject *CBC256_encrypt_into(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return CBC256_crypt(self, args, nargs, kwnames, 1, 1);
+}
+
+static PyObject *CBC256_decrypt_into(AES256Schedule *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return CBC256_crypt(self, args, nargs, kwnames, 0, 1);
+}
+
+PyDoc_STRVAR(
+    IGE256_docs,
+    "IGE256(key)\n"
+    "--\n\n"
+    "AES-256-IGE context holding precomputed encryption and decryption key schedules"
+);
+
+PyDoc_STRVAR(
+    IGE256_encrypt_docs,
+    "encrypt(data, iv)\n"
+    "--\n\n"
+    "AES-256-IGE Encryption"
+);
+
+PyDoc_STRVAR(
+    IGE256_decrypt_docs,
+    "decrypt(data, iv)\n"
+    "--\n\n"
+    "AES-256-IGE Decryption"
+);
+
+PyDoc_STRVAR(
+    IGE256_encrypt_into_docs,
+    "encrypt_into(data, iv, out)\n"
+    "--\n\n"
+    "AES-256-IGE Encryption into a writable buffer"
+);
+
+PyDoc_STRVAR(
+    IGE256_decrypt_into_docs,
+    "decrypt_into(data, iv, out)\n"
+    "--\n\n"
+    "AES-256-IGE Decryption into a writable buffer"
+);
+
+PyDoc_STRVAR(
+    CBC256_docs,
+    "CBC256(key)\n"
+    "--\n\n"
+    "AES-256-CBC context holding precomputed encryption and decryption key schedules\n\n"
+    "Unlike cbc256_encrypt and cbc256_decrypt, the IV passed in is left untouched."
+);
+
+PyDoc_STRVAR(
+    CBC256_encrypt_docs,
+    "encrypt(data, iv)\n"
+    "--\n\n"
+    "AES-256-CBC Encryption"
+);
+
+PyDoc_STRVAR(
+    CBC256_decrypt_docs,
+    "decrypt(data, iv)\n"
+    "--\n\n"
+    "AES-256-CBC Decryption"
+);
+
+PyDoc_STRVAR(
+    CBC256_encrypt_into_docs,
+    "encrypt_into(data, iv, out)\n"
+    "--\n\n"
+    "AES-256-CBC Encryption into a writable buffer"
+);
+
+PyDoc_STRVAR(
+    CBC256_decrypt_into_docs,
+    "decrypt_into(data, iv, out)\n"
+    "--\n\n"
+    "AES-256-CBC Decryption into a writable buffer"
+);
+
+static PyMethodDef IGE256_methods[] = {
+    {"encrypt", (PyCFunction) (void (*)(void)) IGE256_encrypt, METH_FASTCALL | METH_KEYWORDS, IGE256_encrypt_docs},
+    {"decrypt", (PyCFunction) (void (*)(void)) IGE256_decrypt, METH_FASTCALL | METH_KEYWORDS, IGE256_decrypt_docs},
+    {"encrypt_into", (PyCFunction) (void (*)(void)) IGE256_encrypt_into, METH_FASTCALL | METH_KEYWORDS, IGE256_encrypt_into_docs},
+    {"decrypt_into", (PyCFunction) (void (*)(void)) IGE256_decrypt_into, METH_FASTCALL | METH_KEYWORDS, IGE256_decrypt_into_docs},
+    {NULL}
+};
+
+static PyMethodDef CBC256_methods[] = {
+    {"encrypt", (PyCFunction) (void (*)(void)) CBC256_encrypt, METH_FASTCALL | METH_KEYWORDS, CBC256_encrypt_docs},
+    {"decrypt", (PyCFunction) (void (*)(void)) CBC256_decrypt, METH_FASTCALL | METH_KEYWORDS, CBC256_decrypt_docs},
+    {"encrypt_into", (PyCFunction) (void (*)(void)) CBC256_encrypt_into, METH_FASTCALL | METH_KEYWORDS, CBC256_encrypt_into_docs},
+    {"decrypt_into", (PyCFunction) (void (*)(void)) CBC256_decrypt_into, METH_FASTCALL | METH_KEYWORDS, CBC256_decrypt_into_docs},
+    {NULL}
+};
+
+static PyType_Slot IGE256_slots[] = {
+    {Py_tp_doc, (void *) IGE256_docs},
+    {Py_tp_new, AES256Schedule_new},
+    {Py_tp_methods, IGE256_methods},
+    {0, NULL}
+};
+
+static PyType_Spec IGE256_spec = {
+    .name = "tgcrypto.IGE256",
+    .basicsize = sizeof(AES256Schedule),
+    .flags = TYPE_FLAGS,
+    .slots = IGE256_slots
+};
+
+static PyType_Slot CBC256_slots[] = {
+    {Py_tp_doc, (void *) CBC256_docs},
+    {Py_tp_new, AES256Schedule_new},
+    {Py_tp_methods, CBC256_methods},
+    {0, NULL}
+};
+
+static PyType_Spec CBC256_spec = {
+    .name = "tgcrypto.CBC256",
+    .basicsize = sizeof(AES256Schedule),
+    .flags = TYPE_FLAGS,
+    .slots = CBC256_slots
+};
+
+typedef struct {
+    PyObject_HEAD
+    uint32_t expandedKey[EXPANDED_KEY_SIZE];
+    uint8_t iv[2 * AES_BLOCK_SIZE];
+    uint8_t buffer[AES_BLOCK_SIZE];
+    uint8_t buffered;
+    uint8_t mode;
+    uint8_t encrypt;
+    uint8_t finalized;
+    PyThread_type_lock lock;
+} AES256Stream;
+
+static PyObject *AES256Stream_new(PyTypeObject *type, PyObject *args, PyObject *kwargs, uint8_t mode) {
+    static char *kwlist[] = {"key", "iv", "encrypt", NULL};
+    Py_buffer key, iv;
+    AES256Stream *self;
+    int encrypt = 1;
+
+    if (!PyArg_ParseTupleAndKeywords(
+        args, kwargs, mode == MODE_IGE ? "y*y*|p:AES256IGE" : "y*y*|p:AES256CBC", kwlist, &key, &iv, &encrypt
+    ))
+        return NULL;
+
+    if (key.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "Key size must be exactly 32 bytes");
+        goto error;
+    }
+
+    if (mode == MODE_IGE && iv.len != 32) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 32 bytes");
+        goto error;
+    }
+
+    if (mode == MODE_CBC && iv.len != 16) {
+        PyErr_SetString(PyExc_ValueError, "IV size must be exactly 16 bytes");
+        goto error;
+    }
+
+    self = (AES256Stream *) type->tp_alloc(type, 0);
+
+    if (self == NULL)
+        goto error;
+
+    self->lock = PyThread_allocate_lock();
+
+    if (self->lock == NULL) {
+        Py_DECREF(self);
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    if (encrypt)
+        aes256_set_encryption_key(key.buf, self->expandedKey);
+    else
+        aes256_set_decryption_key(key.buf, self->expandedKey);
+
+    memcpy(self->iv, iv.buf, iv.len);
+    self->mode = mode;
+    self->encrypt = (uint8_t) encrypt;
+
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+
+    return (PyObject *) self;
+
+    error:
+    PyBuffer_Release(&key);
+    PyBuffer_Release(&iv);
+
+    return NULL;
+}
+
+static PyObject *AES256IGE_new(PyTypeObject *type, PyObject *args, PyObject *kwargs) {
+    return AES256Stream_new(type, args, kwargs, MODE_IGE);
+}
+
+static PyObject *AES256CBC_new(PyTypeObject *type, PyObject *args, PyObject *kwargs) {
+    return AES256Stream_new(type, args, kwargs, MODE_CBC);
+}
+
+static void AES256Stream_dealloc(AES256Stream *self) {
+    PyTypeObject *type = Py_TYPE(self);
+
+    if (self->lock != NULL)
+        PyThread_free_lock(self->lock);
+
+    secure_zero(self->expandedKey, sizeof(self->expandedKey));
+    secure_zero(self->iv, sizeof(self->iv));
+    secure_zero(self->buffer, sizeof(self->buffer));
+
+    type->tp_free((PyObject *) self);
+    RELEASE_TYPE(type);
+}
+
+// Processes the complete blocks made of the buffered bytes followed by in, keeping the remainder for the next call.
+// When bytes are buffered the output is shifted ahead of the input, so the input is moved into out first and
+// processed in place, which works even when out is in itself
+static void AES256Stream_process(AES256Stream *self, const uint8_t *in, size_t length, uint8_t *out, size_t blocks) {
+    uint8_t pending[AES_BLOCK_SIZE];
+    size_t tail = self->buffered + length - blocks;
+    uint64_t start;
+
+    if (blocks == 0) {
+        memcpy(self->buffer + self->buffered, in, length);
+        self->buffered = (uint8_t) tail;
+        return;
+    }
+
+    memcpy(pending, in + length - tail, tail);
+
+    if (self->buffered) {
+        memmove(out + self->buffered, in, blocks - self->buffered);
+        memcpy(out, self->buffer, self->buffered);
+        in = out;
+    }
+
+    start = stats_start();
+
+    if (self->mode == MODE_IGE)
+        ige256_update(in, out, blocks, self->expandedKey, self->iv, self->encrypt);
+    else
+        cbc256_crypt(in, out, blocks, self->expandedKey, self->iv, self->encrypt);
+
+    stats_record(self->mode, self->encrypt, blocks, start);
+
+    memcpy(self->buffer, pending, tail);
+    self->buffered = (uint8_t) tail;
+}
+
+static PyObject *AES256Stream_update_common(AES256Stream *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames, uint8_t into) {
+    Py_buffer data, out = {NULL};
+    Py_buffer *const views[] = {&data, &out};
+    PyObject *result = NULL;
+    const uint8_t *in;
+    uint8_t *buf;
+    size_t blocks;
+
+    if (parse_buffers(args, nargs, kwnames, into ? "update_into" : "update", update_keywords, into ? 2 : 1, views, into) < 0)
+        return NULL;
+
+    ENTER_LOCK(self)
+
+    if (self->finalized) {
+        PyErr_SetString(PyExc_ValueError, "Context was already finalized");
+        goto exit;
+    }
+
+    in = data.buf;
+    blocks = (self->buffered + (size_t) data.len) / AES_BLOCK_SIZE * AES_BLOCK_SIZE;
+
+    if (into) {
+        buf = out.buf;
+
+        if ((size_t) out.len < blocks) {
+            PyErr_Format(PyExc_ValueError, "Output buffer must be at least %zu bytes", blocks);
+            goto exit;
+        }
+
+        if (in != buf && in < buf + blocks && buf < in + data.len) {
+            PyErr_SetString(PyExc_ValueError, "Output buffer must not partially overlap data");
+            goto exit;
+        }
+
+        result = PyLong_FromSize_t(blocks);
+    } else
+        result = PyBytes_FromStringAndSize(NULL, blocks);
+
+    if (result == NULL)
+        goto exit;
+
+    if (!into)
+        buf = (uint8_t *) PyBytes_AS_STRING(result);
+
+    Py_BEGIN_ALLOW_THREADS
+        AES256Stream_process(self, in, data.len, buf, blocks);
+    Py_END_ALLOW_THREADS
+
+    exit:
+    LEAVE_LOCK(self);
+
+    PyBuffer_Release(&data);
+    PyBuffer_Release(&out);
+
+    return result;
+}
+
+static PyObject *AES256Stream_update(AES256Stream *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return AES256Stream_update_common(self, args, nargs, kwnames, 0);
+}
+
+static PyObject *AES256Stream_update_into(AES256Stream *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return AES256Stream_update_common(self, args, nargs, kwnames, 1);
+}
+
+static PyObject *AES256Stream_finalize(AES256Stream *self, PyObject *args) {
+    PyObject *result = NULL;
+
+    ENTER_LOCK(self)
+
+    if (self->finalized)
+        PyErr_SetString(PyExc_ValueError, "Context was already finalized");
+    else if (self->buffered)
+        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 16 bytes");
+    else {
+        // Nothing is left to process, the key schedule and the chaining state are not needed anymore
+        secure_zero(self->expandedKey, sizeof(self->expandedKey));
+        secure_zero(self->iv, sizeof(self->iv));
+        self->finalized = 1;
+
+        result = PyBytes_FromStringAndSize(NULL, 0);
+    }
+
+    LEAVE_LOCK(self);
+
+    return result;
+}
+
+PyDoc_STRVAR(
+    AES256IGE_docs,
+    "AES256IGE(key, iv, encrypt=True)\n"
+    "--\n\n"
+    "AES-256-IGE stream with a precomputed key schedule\n\n"
+    "The chaining IV is kept inside the object, so data can be fed in chunks of any size\n"
+    "and the result is the same as a single ige256_encrypt or ige256_decrypt call."
+);
+
+PyDoc_STRVAR(
+    AES256CBC_docs,
+    "AES256CBC(key, iv, encrypt=True)\n"
+    "--\n\n"
+    "AES-256-CBC stream with a precomputed key schedule\n\n"
+    "The chaining IV is kept inside the object, so data can be fed in chunks of any size\n"
+    "and the result is the same as a single cbc256_encrypt or cbc256_decrypt call."
+);
+
+PyDoc_STRVAR(
+    AES256Stream_update_docs,
+    "update(data)\n"
+    "--\n\n"
+    "Process data, returning all the complete blocks available so far"
+);
+
+PyDoc_STRVAR(
+    AES256Stream_update_into_docs,
+    "update_into(data, out)\n"
+    "--\n\n"
+    "Process data into a writable buffer, returning the number of bytes written"
+);
+
+PyDoc_STRVAR(
+    AES256Stream_finalize_docs,
+    "finalize()\n"
+    "--\n\n"
+    "Finish the stream, the total data size must match a multiple of 16 bytes"
+);
+
+static PyMethodDef AES256Stream_methods[] = {
+    {"update", (PyCFunction) (void (*)(void)) AES256Stream_update, METH_FASTCALL | METH_KEYWORDS, AES256Stream_update_docs},
+    {"update_into", (PyCFunction) (void (*)(void)) AES256Stream_update_into, METH_FASTCALL | METH_KEYWORDS, AES256Stream_update_into_docs},
+    {"finalize", (PyCFunction) AES256Stream_finalize, METH_NOARGS, AES256Stream_finalize_docs},
+    {NULL}
+};
+
+static PyType_Slot AES256IGE_slots[] = {
+    {Py_tp_doc, (void *) AES256IGE_docs},
+    {Py_tp_new, AES256IGE_new},
+    {Py_tp_dealloc, AES256Stream_dealloc},
+    {Py_tp_methods, AES256Stream_methods},
+    {0, NULL}
+};
+
+static PyType_Spec AES256IGE_spec = {
+    .name = "tgcrypto.AES256IGE",
+    .basicsize = sizeof(AES256Stream),
+    .flags = TYPE_FLAGS,
+    .slots = AES256IGE_slots
+};
+
+static PyType_Slot AES256CBC_slots[] = {
+    {Py_tp_doc, (void *) AES256CBC_docs},
+    {Py_tp_new, AES256CBC_new},
+    {Py_tp_dealloc, AES256Stream_dealloc},
+    {Py_tp_methods, AES256Stream_methods},
+    {0, NULL}
+};
+
+static PyType_Spec AES256CBC_spec = {
+    .name = "tgcrypto.AES256CBC",
+    .basicsize = sizeof(AES256Stream),
+    .flags = TYPE_FLAGS,
+    .slots = AES256CBC_slots
+};
+
+// Frames are handed out as views of the receive buffer, a bytearray the object keeps exported for its whole life so
+// that nobody can resize it through the views. The views handed out are released by the next read, which may move or
+// overwrite the bytes they point to. Reads are serialized by their own lock, held across the socket read, so that a
+// thread waiting for data never holds up encode()
+typedef struct {
+    PyObject_HEAD
+    obfuscated_codec codec;
+    PyObject *header;
+    PyObject *buffer;
+    Py_buffer storage;
+    PyObject *views;
+    PyThread_type_lock lock;
+    PyThread_type_lock recvLock;
+} ObfuscatedCodec;
+
+static PyObject *ObfuscatedCodec_new(PyTypeObject *type, PyObject *args, PyObject *kwargs) {
+    static char *kwlist[] = {"protocol", "buffer_size", "prefetch", NULL};
+    const char *protocol = "abridged";
+    Py_ssize_t bufferSize = OBFUSCATED_BUFFER_SIZE, prefetch = 0;
+    uint8_t header[OBFUSCATED_HEADER_SIZE], tag;
+    ObfuscatedCodec *self;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|snn:ObfuscatedCodec", kwlist, &protocol, &bufferSize, &prefetch))
+        return NULL;
+
+    if (strcmp(protocol, "abridged") == 0)
+        tag = OBFUSCATED_ABRIDGED;
+    else if (strcmp(protocol, "intermediate") == 0)
+        tag = OBFUSCATED_INTERMEDIATE;
+    else {
+        PyErr_SetString(PyExc_ValueError, "Protocol must be \"abridged\" or \"intermediate\"");
+        return NULL;
+    }
+
+    if (bufferSize < OBFUSCATED_MIN_BUFFER_SIZE) {
+        PyErr_Format(PyExc_ValueError, "Buffer size must be at least %d bytes", OBFUSCATED_MIN_BUFFER_SIZE);
+        return NULL;
+    }
+
+    if (check_prefetch(prefetch) < 0)
+        return NULL;
+
+    self = (ObfuscatedCodec *) type->tp_alloc(type, 0);
+
+    if (self == NULL)
+        return NULL;
+
+    self->lock = PyThread_allocate_lock();
+    self->recvLock = PyThread_allocate_lock();
+
+    if (self->lock == NULL || self->recvLock == NULL) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+
+    if (obfuscated_init(&self->codec, header, tag) < 0) {
+        Py_DECREF(self);
+        PyErr_SetString(PyExc_OSError, "Failed to read random bytes from the operating system");
+        return NULL;
+    }
+
+    if (allocate_prefetch(&self->codec.prefetch, prefetch) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    self->header = PyBytes_FromStringAndSize((const char *) header, OBFUSCATED_HEADER_SIZE);
+    self->buffer = PyByteArray_FromStringAndSize(NULL, bufferSize);
+    self->views = PyList_New(0);
+
+    if (
+        self->header == NULL || self->buffer == NULL || self->views == NULL
+        || PyObject_GetBuffer(self->buffer, &self->storage, PyBUF_WRITABLE) < 0
+    ) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    return (PyObject *) self;
+}
+
+static void ObfuscatedCodec_dealloc(ObfuscatedCodec *self) {
+    PyTypeObject *type = Py_TYPE(self);
+
+    free_prefetch(&self->codec.prefetch);
+    secure_zero(&self->codec, sizeof(self->codec));
+
+    if (self->storage.obj != NULL)
+        PyBuffer_Release(&self->storage);
+
+    Py_XDECREF(self->header);
+    Py_XDECREF(self->buffer);
+    Py_XDECREF(self->views);
+
+    if (self->lock != NULL)
+        PyThread_free_lock(self->lock);
+
+    if (self->recvLock != NULL)
+        PyThread_free_lock(self->recvLock);
+
+    type->tp_free((PyObject *) self);
+    RELEASE_TYPE(type);
+}
+
+static void ObfuscatedCodec_enter_recv(ObfuscatedCodec *self) {
+    if (!PyThread_acquire_lock(self->recvLock, 0)) {
+        Py_BEGIN_ALLOW_THREADS
+        PyThread_acquire_lock(self->recvLock, 1);
+        Py_END_ALLOW_THREADS
+    }
+}
+
+static PyObject *ObfuscatedCodec_view(ObfuscatedCodec *self, size_t offset, size_t size) {
+    PyObject *whole = PyMemoryView_FromObject(self->buffer), *view;
+
+    if (whole == NULL)
+        return NULL;
+
+    view = PySequence_GetSlice(whole, (Py_ssize_t) offset, (Py_ssize_t) (offset + size));
+    Py_DECREF(whole);
+
+    if (view != NULL && PyList_Append(self->views, view) < 0)
+        Py_CLEAR(view);
+
+    return view;
+}
+
+// A view the caller still exports (e.g. through a slice or np.frombuffer) can't be released, it is only dropped: its
+// memory stays valid, but the bytes it points to may be overwritten like those of any other frame
+static int ObfuscatedCodec_release(ObfuscatedCodec *self) {
+    Py_ssize_t count = PyList_GET_SIZE(self->views), i;
+    PyObject *result;
+
+    for (i = 0; i < count; ++i) {
+        result = PyObject_CallMethod(PyList_GET_ITEM(self->views, i), "release", NULL);
+
+        if (result == NULL) {
+            if (!PyErr_ExceptionMatches(PyExc_BufferError))
+                return -1;
+
+            PyErr_Clear();
+        }
+
+        Py_XDECREF(result);
+    }
+
+    return PyList_SetSlice(self->views, 0, count, NULL);
+}
+
+// Frames still exported by the caller keep the bytearray from being resized, so the received bytes are moved to a
+// new one instead. The old one lives on for as long as those exports do
+static int ObfuscatedCodec_resize(ObfuscatedCodec *self, size_t size) {
+    PyObject *buffer = PyByteArray_FromStringAndSize(NULL, (Py_ssize_t) size);
+
+    if (buffer == NULL)
+        return -1;
+
+    memcpy(PyByteArray_AS_STRING(buffer), self->storage.buf, self->codec.end);
+    PyBuffer_Release(&self->storage);
+    Py_DECREF(self->buffer);
+    self->buffer = buffer;
+
+    return PyObject_GetBuffer(self->buffer, &self->storage, PyBUF_WRITABLE);
+}
+
+static PyObject *ObfuscatedCodec_free_space(ObfuscatedCodec *self) {
+    PyObject *result = NULL;
+    size_t needed;
+
+    ENTER_LOCK(self)
+
+    if (ObfuscatedCodec_release(self) == 0) {
+        needed = obfuscated_compact(&self->codec, self->storage.buf);
+
+        if (needed <= (size_t) self->storage.len || ObfuscatedCodec_resize(self, needed) == 0)
+            result = ObfuscatedCodec_view(self, self->codec.end, self->storage.len - self->codec.end);
+    }
+
+    LEAVE_LOCK(self);
+
+    return result;
+}
+
+static PyObject *ObfuscatedCodec_frames(ObfuscatedCodec *self, Py_ssize_t size) {
+    PyObject *frames, *view;
+    size_t offset, length;
+    uint64_t start;
+    int status = 0;
+
+    ENTER_LOCK(self)
+
+    if (size < 0 || size > self->storage.len - (Py_ssize_t) self->codec.end) {
+        PyErr_Format(PyExc_ValueError, "Size must be in the range [0, %zd]", self->storage.len - (Py_ssize_t) self->codec.end);
+        LEAVE_LOCK(self);
+        return NULL;
+    }
+
+    if (size) {
+        Py_BEGIN_ALLOW_THREADS
+            start = stats_start();
+            obfuscated_decode(&self->codec, self->storage.buf, size);
+            stats_record(STATS_CTR, 0, size, start);
+        Py_END_ALLOW_THREADS
+    }
+
+    frames = PyList_New(0);
+
+    while (frames != NULL && (status = obfuscated_next(&self->codec, self->storage.buf, &offset, &length)) > 0) {
+        view = ObfuscatedCodec_view(self, offset, length);
+
+        if (view == NULL || PyList_Append(frames, view) < 0)
+            Py_CLEAR(frames);
+
+        Py_XDECREF(view);
+    }
+
+    // The frames before an invalid length are still returned, the error comes with the next call
+    if (frames != NULL && status < 0 && PyList_GET_SIZE(frames) == 0) {
+        PyErr_SetString(PyExc_ValueError, "Invalid frame length");
+        Py_CLEAR(frames);
+    }
+
+    LEAVE_LOCK(self);
+
+    return frames;
+}
+
+static PyObject *ObfuscatedCodec_encode(ObfuscatedCodec *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"data"};
+    Py_buffer data;
+    Py_buffer *const views[] = {&data};
+    PyObject *result = NULL;
+    uint8_t *out;
+    size_t size;
+    uint64_t start;
+
+    if (parse_buffers(args, nargs, kwnames, "encode", keywords, 1, views, 0) < 0)
+        return NULL;
+
+    if (data.len == 0)
+        PyErr_SetString(PyExc_ValueError, "Data must not be empty");
+    else if (data.len % 4 != 0)
+        PyErr_SetString(PyExc_ValueError, "Data size must match a multiple of 4 bytes");
+    else if (data.len > OBFUSCATED_MAX_FRAME)
+        PyErr_Format(PyExc_ValueError, "Data size must be at most %d bytes", OBFUSCATED_MAX_FRAME);
+    else {
+        size = obfuscated_frame_size(&self->codec, data.len);
+        result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) size);
+
+        if (result != NULL) {
+            out = (uint8_t *) PyBytes_AS_STRING(result);
+
+            ENTER_LOCK(self)
+
+            Py_BEGIN_ALLOW_THREADS
+                start = stats_start();
+                obfuscated_encode(&self->codec, data.buf, data.len, out);
+                stats_record(STATS_CTR, 1, size, start);
+            Py_END_ALLOW_THREADS
+
+            LEAVE_LOCK(self);
+        }
+    }
+
+    PyBuffer_Release(&data);
+
+    return result;
+}
+
+static PyObject *ObfuscatedCodec_refill(ObfuscatedCodec *self, PyObject *args) {
+    size_t computed;
+
+    ENTER_LOCK(self)
+
+    Py_BEGIN_ALLOW_THREADS
+        computed = obfuscated_refill(&self->codec);
+    Py_END_ALLOW_THREADS
+
+    LEAVE_LOCK(self);
+
+    return PyLong_FromSize_t(computed);
+}
+
+static PyObject *ObfuscatedCodec_recv_buffer(ObfuscatedCodec *self, PyObject *args) {
+    PyObject *result;
+
+    ObfuscatedCodec_enter_recv(self);
+    result = ObfuscatedCodec_free_space(self);
+    PyThread_release_lock(self->recvLock);
+
+    return result;
+}
+
+static PyObject *ObfuscatedCodec_feed(ObfuscatedCodec *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"size"};
+    PyObject *value, *result;
+    Py_ssize_t size;
+
+    if (parse_args(args, nargs, kwnames, "feed", keywords, 1, &value) < 0)
+        return NULL;
+
+    size = PyLong_AsSsize_t(value);
+
+    if (size == -1 && PyErr_Occurred())
+        return NULL;
+
+    ObfuscatedCodec_enter_recv(self);
+    result = ObfuscatedCodec_frames(self, size);
+    PyThread_release_lock(self->recvLock);
+
+    return result;
+}
+
+static PyObject *ObfuscatedCodec_recv_into(ObfuscatedCodec *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    static const char *const keywords[] = {"sock"};
+    PyObject *sock, *view, *received, *result = NULL;
+    Py_ssize_t size;
+
+    if (parse_args(args, nargs, kwnames, "recv_into", keywords, 1, &sock) < 0)
+        return NULL;
+
+    // Held until the frames are decoded, another thread would otherwise be handed the same free space
+    ObfuscatedCodec_enter_recv(self);
+    view = ObfuscatedCodec_free_space(self);
+
+    if (view == NULL)
+        goto exit;
+
+    received = PyObject_CallMethod(sock, "recv_into", "O", view);
+    Py_DECREF(view);
+
+    if (received == NULL)
+        goto exit;
+
+    size = PyLong_AsSsize_t(received);
+    Py_DECREF(received);
+
+    if (size == -1 && PyErr_Occurred())
+        goto exit;
+
+    // The connection was closed by the other side
+    if (size == 0) {
+        Py_INCREF(Py_None);
+        result = Py_None;
+        goto exit;
+    }
+
+    result = ObfuscatedCodec_frames(self, size);
+
+    exit:
+    PyThread_release_lock(self->recvLock);
+
+    return result;
+}
+
+static PyObject *ObfuscatedCodec_get_header(ObfuscatedCodec *self, void *closure) {
+    Py_INCREF(self->header);
+
+    return self->header;
+}
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_docs,
+    "ObfuscatedCodec(protocol=\"abridged\", buffer_size=262144, prefetch=0)\n"
+    "--\n\n"
+    "Client side of the MTProto obfuscated transport, protocol is \"abridged\" or \"intermediate\"\n\n"
+    "The init header and both AES-256-CTR streams are generated on creation. Received bytes are\n"
+    "decrypted in place inside a buffer of buffer_size bytes, which grows to fit larger frames,\n"
+    "and complete frames are returned as views of it, valid until the next read. Up to prefetch\n"
+    "bytes of keystream for the frames to send can be computed ahead by refill()."
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_header_docs,
+    "The 64 bytes to send before anything else"
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_encode_docs,
+    "encode(data)\n"
+    "--\n\n"
+    "Prepend the frame length to data and encrypt both, returning the bytes to send"
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_refill_docs,
+    "refill()\n"
+    "--\n\n"
+    "Precompute keystream for the next frames to send, returning the number of bytes computed"
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_recv_buffer_docs,
+    "recv_buffer()\n"
+    "--\n\n"
+    "Writable view of the free space of the receive buffer, to be filled by socket.recv_into\n\n"
+    "The frames returned so far are released. A recv_buffer() and feed() pair must not be interleaved\n"
+    "with another read."
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_feed_docs,
+    "feed(size)\n"
+    "--\n\n"
+    "Decrypt the size bytes received into recv_buffer(), returning the frames completed as views"
+);
+
+PyDoc_STRVAR(
+    ObfuscatedCodec_recv_into_docs,
+    "recv_into(sock)\n"
+    "--\n\n"
+    "Receive from sock into the buffer and decrypt, returning the frames completed as views\n\n"
+    "Returns None once the connection is closed. Concurrent calls are serialized."
+);
+
+static PyMethodDef ObfuscatedCodec_methods[] = {
+    {"encode", (PyCFunction) (void (*)(void)) ObfuscatedCodec_encode, METH_FASTCALL | METH_KEYWORDS, ObfuscatedCodec_encode_docs},
+    {"refill", (PyCFunction) ObfuscatedCodec_refill, METH_NOARGS, ObfuscatedCodec_refill_docs},
+    {"recv_buffer", (PyCFunction) ObfuscatedCodec_recv_buffer, METH_NOARGS, ObfuscatedCodec_recv_buffer_docs},
+    {"feed", (PyCFunction) (void (*)(void)) ObfuscatedCodec_feed, METH_FASTCALL | METH_KEYWORDS, ObfuscatedCodec_feed_docs},
+    {"recv_into", (PyCFunction) (void (*)(void)) ObfuscatedCodec_recv_into, METH_FASTCALL | METH_KEYWORDS, ObfuscatedCodec_recv_into_docs},
+    {NULL}
+};
+
+static PyGetSetDef ObfuscatedCodec_getset[] = {
+    {"header", (getter) ObfuscatedCodec_get_header, NULL, ObfuscatedCodec_header_docs, NULL},
+    {NULL}
+};
+
+static PyType_Slot ObfuscatedCodec_slots[] = {
+    {Py_tp_doc, (void *) ObfuscatedCodec_docs},
+    {Py_tp_new, ObfuscatedCodec_new},
+    {Py_tp_dealloc, ObfuscatedCodec_dealloc},
+    {Py_tp_methods, ObfuscatedCodec_methods},
+    {Py_tp_getset, ObfuscatedCodec_getset},
+    {0, NULL}
+};
+
+static PyType_Spec ObfuscatedCodec_spec = {
+    .name = "tgcrypto.ObfuscatedCodec",
+    .basicsize = sizeof(ObfuscatedCodec),
+    .flags = TYPE_FLAGS,
+    .slots = ObfuscatedCodec_slots
+};
+
+PyDoc_STRVAR(
+    ige256_encrypt_docs,
+    "ige256_encrypt(data, key, iv)\n"
+    "--\n\n"
+    "AES-256-IGE Encryption"
+);
+
+PyDoc_STRVAR(
+    ige256_decrypt_docs,
+    "ige256_decrypt(data, key, iv)\n"
+    "--\n\n"
+    "AES-256-IGE Decryption"
+);
+
+PyDoc_STRVAR(
+    ctr256_encrypt_docs,
+    "ctr256_encrypt(data, key, iv, state)\n"
+    "--\n\n"
+    "AES-256-CTR Encryption"
+);
+
+PyDoc_STRVAR(
+    ctr256_decrypt_docs,
+    "ctr256_decrypt(data, key, iv, state)\n"
+    "--\n\n"
+    "AES-256-CTR Decryption"
+);
+
+PyDoc_STRVAR(
+    ctr256_encrypt_at_docs,
+    "ctr256_encrypt_at(data, key, iv, offset)\n"
+    "--\n\n"
+    "AES-256-CTR Encryption of data found at a byte offset of the stream started by iv"
+);
+
+PyDoc_STRVAR(
+    ctr256_decrypt_at_docs,
+    "ctr256_decrypt_at(data, key, iv, offset)\n"
+    "--\n\n"
+    "AES-256-CTR Decryption of data found at a byte offset of the stream started by iv"
+);
+
+PyDoc_STRVAR(
+    ctr256_decrypt_verify_docs,
+    "ctr256_decrypt_verify(data, key, iv, offset, hashes, hash_chunk=131072)\n"
+    "--\n\n"
+    "AES-256-CTR Decryption of data found at a byte offset, checked against the SHA-256 of every hash_chunk bytes\n\n"
+    "Each range is hashed while its plaintext is still in cache, with the GIL released.\n"
+    "Raises ValueError with the byte range of the first hash that does not match."
+);
+
+PyDoc_STRVAR(
+    ctr256_decrypt_verify_into_docs,
+    "ctr256_decrypt_verify_into(data, key, iv, offset, hashes, out, hash_chunk=131072)\n"
+    "--\n\n"
+    "Same as ctr256_decrypt_verify, writing into out and returning the number of bytes written\n\n"
+    "The content of out is unspecified when a hash does not match."
+);
+
+PyDoc_STRVAR(
+    cbc256_encrypt_docs,
+    "cbc256_encrypt(data, key, iv)\n"
+    "--\n\n"
+    "AES-256-CBC Encryption"
+);
+
+PyDoc_STRVAR(
+    cbc256_decrypt_docs,
     "cbc256_decrypt(data, key, iv)\n"
     "--\n\n"
     "AES-256-CBC Encryption"
 );
 
+PyDoc_STRVAR(
+    ige256_encrypt_into_docs,
+    "ige256_encrypt_into(data, key, iv, out)\n"
+    "--\n\n"
+    "AES-256-IGE Encryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    ige256_decrypt_into_docs,
+    "ige256_decrypt_into(data, key, iv, out)\n"
+    "--\n\n"
+    "AES-256-IGE Decryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    ctr256_encrypt_into_docs,
+    "ctr256_encrypt_into(data, key, iv, state, out)\n"
+    "--\n\n"
+    "AES-256-CTR Encryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    ctr256_decrypt_into_docs,
+    "ctr256_decrypt_into(data, key, iv, state, out)\n"
+    "--\n\n"
+    "AES-256-CTR Decryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    cbc256_encrypt_into_docs,
+    "cbc256_encrypt_into(data, key, iv, out)\n"
+    "--\n\n"
+    "AES-256-CBC Encryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    cbc256_decrypt_into_docs,
+    "cbc256_decrypt_into(data, key, iv, out)\n"
+    "--\n\n"
+    "AES-256-CBC Decryption into a writable buffer, out may be data itself"
+);
+
+PyDoc_STRVAR(
+    ige256_encrypt_many_docs,
+    "ige256_encrypt_many(items, out=None)\n"
+    "--\n\n"
+    "AES-256-IGE Encryption of many independent (data, key, iv) messages at once\n\n"
+    "Returns a list of ciphertexts or, when out is a sequence of writable buffers (one per item),\n"
+    "writes into them and returns the number of bytes written for each one."
+);
+
+PyDoc_STRVAR(
+    ige256_decrypt_many_docs,
+    "ige256_decrypt_many(items, out=None)\n"
+    "--\n\n"
+    "AES-256-IGE Decryption of many independent (data, key, iv) messages at once\n\n"
+    "Returns a list of plaintexts or, when out is a sequence of writable buffers (one per item),\n"
+    "writes into them and returns the number of bytes written for each one."
+);
+
+PyDoc_STRVAR(
+    mtproto2_encrypt_docs,
+    "mtproto2_encrypt(auth_key, auth_key_id, payload, is_client)\n"
+    "--\n\n"
+    "MTProto 2.0 Encryption\n\n"
+    "Pads the payload, computes msg_key and the AES key and IV from auth_key, encrypts with AES-256-IGE\n"
+    "and returns auth_key_id + msg_key + encrypted data."
+);
+
+PyDoc_STRVAR(
+    mtproto2_decrypt_docs,
+    "mtproto2_decrypt(auth_key, auth_key_id, packet, is_client)\n"
+    "--\n\n"
+    "MTProto 2.0 Decryption\n\n"
+    "Checks auth_key_id, decrypts with AES-256-IGE, verifies msg_key and the padding length\n"
+    "and returns the plaintext message, padding included."
+);
+
+PyDoc_STRVAR(
+    factorize_docs,
+    "factorize(pq)\n"
+    "--\n\n"
+    "Split the 64-bit pq of resPQ into its two prime factors (p, q), with p <= q.\n"
+    "Raises ValueError unless pq is a product of exactly two primes."
+);
+
+PyDoc_STRVAR(
+    random_bytes_docs,
+    "random_bytes(n)\n"
+    "--\n\n"
+    "Random bytes from a per-thread AES-256 CTR_DRBG seeded by the operating system"
+);
+
+PyDoc_STRVAR(
+    random_into_docs,
+    "random_into(buffer)\n"
+    "--\n\n"
+    "Fill a writable buffer with random bytes, returning the number of bytes written"
+);
+
+PyDoc_STRVAR(
+    encrypt_file_docs,
+    "encrypt_file(mode, src_path, dst_path, key, iv, chunk_size=16777216)\n"
+    "--\n\n"
+    "AES-256 Encryption of a whole file into another one, mode is \"ige\", \"ctr\" or \"cbc\"\n\n"
+    "The source is read chunk_size bytes at a time into the memory-mapped destination and processed there with the\n"
+    "GIL released. The destination is deleted when the call fails or is interrupted.\n"
+    "Returns the number of bytes written."
+);
+
+PyDoc_STRVAR(
+    decrypt_file_docs,
+    "decrypt_file(mode, src_path, dst_path, key, iv, chunk_size=16777216)\n"
+    "--\n\n"
+    "AES-256 Decryption of a whole file into another one, mode is \"ige\", \"ctr\" or \"cbc\"\n\n"
+    "The source is read chunk_size bytes at a time into the memory-mapped destination and processed there with the\n"
+    "GIL released. The destination is deleted when the call fails or is interrupted.\n"
+    "Returns the number of bytes written."
+);
+
+PyDoc_STRVAR(
+    backend_docs,
+    "backend()\n"
+    "--\n\n"
+    "Name of the active AES-256 implementation: \"aesni\", \"ssse3\" or \"portable\"\n\n"
+    "Set the TGCRYPTO_BACKEND environment variable to \"ssse3\" before import to skip AES-NI, or to \"portable\" to "
+    "force the T-table implementation."
+);
+
+PyDoc_STRVAR(
+    set_threads_docs,
+    "set_threads(threads)\n"
+    "--\n\n"
+    "Set how many threads large buffers may be split across, 0 means one per CPU and 1 disables threading"
+);
+
+PyDoc_STRVAR(
+    get_threads_docs,
+    "get_threads()\n"
+    "--\n\n"
+    "Number of threads large buffers may be split across"
+);
+
+PyDoc_STRVAR(
+    set_key_cache_size_docs,
+    "set_key_cache_size(size)\n"
+    "--\n\n"
+    "Set how many keys the stateless functions keep the expanded schedules of, 0 disables the cache\n\n"
+    "The cache is emptied, and the schedules it held are wiped."
+);
+
+PyDoc_STRVAR(
+    get_key_cache_size_docs,
+    "get_key_cache_size()\n"
+    "--\n\n"
+    "Number of keys the stateless functions keep the expanded schedules of"
+);
+
+PyDoc_STRVAR(
+    key_cache_stats_docs,
+    "key_cache_stats()\n"
+    "--\n\n"
+    "Size, entries in use, hits and misses of the key schedule cache"
+);
+
+PyDoc_STRVAR(
+    clear_key_cache_docs,
+    "clear_key_cache()\n"
+    "--\n\n"
+    "Wipe the cached key schedules and set the hits and misses back to zero"
+);
+
+PyDoc_STRVAR(
+    stats_docs,
+    "stats()\n"
+    "--\n\n"
+    "Calls, bytes, nanoseconds and payload size histogram for each mode and direction"
+);
+
+PyDoc_STRVAR(
+    reset_stats_docs,
+    "reset_stats()\n"
+    "--\n\n"
+    "Set all the counters back to zero"
+);
+
+PyDoc_STRVAR(
+    enable_stats_docs,
+    "enable_stats()\n"
+    "--\n\n"
+    "Start counting calls, also done at import time when TGCRYPTO_STATS is set"
+);
+
+PyDoc_STRVAR(
+    disable_stats_docs,
+    "disable_stats()\n"
+    "--\n\n"
+    "Stop counting calls, the counters are kept"
+);
+
 static PyMethodDef methods[] = {
-    {"ige256_encrypt", (PyCFunction) ige256_encrypt, METH_VARARGS, ige256_encrypt_docs},
-    {"ige256_decrypt", (PyCFunction) ige256_decrypt, METH_VARARGS, ige256_decrypt_docs},
-    {"ctr256_encrypt", (PyCFunction) ctr256_encrypt, METH_VARARGS, ctr256_encrypt_docs},
-    {"ctr256_decrypt", (PyCFunction) ctr256_encrypt, METH_VARARGS, ctr256_decrypt_docs},
-    {"cbc256_encrypt", (PyCFunction) cbc256_encrypt, METH_VARARGS, cbc256_encrypt_docs},
-    {"cbc256_decrypt", (PyCFunction) cbc256_decrypt, METH_VARARGS, cbc256_decrypt_docs},
+    {"ige256_encrypt", (PyCFunction) (void (*)(void)) ige256_encrypt, METH_FASTCALL | METH_KEYWORDS, ige256_encrypt_docs},
+    {"ige256_decrypt", (PyCFunction) (void (*)(void)) ige256_decrypt, METH_FASTCALL | METH_KEYWORDS, ige256_decrypt_docs},
+    {"ctr256_encrypt", (PyCFunction) (void (*)(void)) ctr256_encrypt, METH_FASTCALL | METH_KEYWORDS, ctr256_encrypt_docs},
+    {"ctr256_decrypt", (PyCFunction) (void (*)(void)) ctr256_decrypt, METH_FASTCALL | METH_KEYWORDS, ctr256_decrypt_docs},
+    {"cbc256_encrypt", (PyCFunction) (void (*)(void)) cbc256_encrypt, METH_FASTCALL | METH_KEYWORDS, cbc256_encrypt_docs},
+    {"cbc256_decrypt", (PyCFunction) (void (*)(void)) cbc256_decrypt, METH_FASTCALL | METH_KEYWORDS, cbc256_decrypt_docs},
+    {"ige256_encrypt_into", (PyCFunction) (void (*)(void)) ige256_encrypt_into, METH_FASTCALL | METH_KEYWORDS, ige256_encrypt_into_docs},
+    {"ige256_decrypt_into", (PyCFunction) (void (*)(void)) ige256_decrypt_into, METH_FASTCALL | METH_KEYWORDS, ige256_decrypt_into_docs},
+    {"ctr256_encrypt_into", (PyCFunction) (void (*)(void)) ctr256_encrypt_into, METH_FASTCALL | METH_KEYWORDS, ctr256_encrypt_into_docs},
+    {"ctr256_decrypt_into", (PyCFunction) (void (*)(void)) ctr256_decrypt_into, METH_FASTCALL | METH_KEYWORDS, ctr256_decrypt_into_docs},
+    {"cbc256_encrypt_into", (PyCFunction) (void (*)(void)) cbc256_encrypt_into, METH_FASTCALL | METH_KEYWORDS, cbc256_encrypt_into_docs},
+    {"cbc256_decrypt_into", (PyCFunction) (void (*)(void)) cbc256_decrypt_into, METH_FASTCALL | METH_KEYWORDS, cbc256_decrypt_into_docs},
+    {"ctr256_encrypt_at", (PyCFunction) (void (*)(void)) ctr256_encrypt_at, METH_FASTCALL | METH_KEYWORDS, ctr256_encrypt_at_docs},
+    {"ctr256_decrypt_at", (PyCFunction) (void (*)(void)) ctr256_decrypt_at, METH_FASTCALL | METH_KEYWORDS, ctr256_decrypt_at_docs},
+    {"ctr256_decrypt_verify", (PyCFunction) (void (*)(void)) ctr256_decrypt_verify, METH_FASTCALL | METH_KEYWORDS, ctr256_decrypt_verify_docs},
+    {"ctr256_decrypt_verify_into", (PyCFunction) (void (*)(void)) ctr256_decrypt_verify_into, METH_FASTCALL | METH_KEYWORDS, ctr256_decrypt_verify_into_docs},
+    {"ige256_encrypt_many", (PyCFunction) (void (*)(void)) ige256_encrypt_many, METH_FASTCALL | METH_KEYWORDS, ige256_encrypt_many_docs},
+    {"ige256_decrypt_many", (PyCFunction) (void (*)(void)) ige256_decrypt_many, METH_FASTCALL | METH_KEYWORDS, ige256_decrypt_many_docs},
+    {"mtproto2_encrypt", (PyCFunction) (void (*)(void)) mtproto2_encrypt_message, METH_FASTCALL | METH_KEYWORDS, mtproto2_encrypt_docs},
+    {"mtproto2_decrypt", (PyCFunction) (void (*)(void)) mtproto2_decrypt_message, METH_FASTCALL | METH_KEYWORDS, mtproto2_decrypt_docs},
+    {"factorize", (PyCFunction) factorize_pq, METH_O, factorize_docs},
+    {"random_bytes", (PyCFunction) random_bytes, METH_O, random_bytes_docs},
+    {"random_into", (PyCFunction) random_into, METH_O, random_into_docs},
+    {"_ctr_drbg", (PyCFunction) ctr_drbg, METH_VARARGS, NULL},
+    {"encrypt_file", (PyCFunction) (void (*)(void)) encrypt_file, METH_FASTCALL | METH_KEYWORDS, encrypt_file_docs},
+    {"decrypt_file", (PyCFunction) (void (*)(void)) decrypt_file, METH_FASTCALL | METH_KEYWORDS, decrypt_file_docs},
+    {"_submit", (PyCFunction) aio_submit, METH_VARARGS, NULL},
+    {"_completed", (PyCFunction) aio_completed, METH_NOARGS, NULL},
+    {"_completion_fd", (PyCFunction) aio_completion_fd, METH_NOARGS, NULL},
+    {"backend", (PyCFunction) backend, METH_NOARGS, backend_docs},
+    {"set_threads", (PyCFunction) (void (*)(void)) set_threads, METH_FASTCALL | METH_KEYWORDS, set_threads_docs},
+    {"get_threads", (PyCFunction) get_threads, METH_NOARGS, get_threads_docs},
+    {"set_key_cache_size", (PyCFunction) (void (*)(void)) set_key_cache_size, METH_FASTCALL | METH_KEYWORDS, set_key_cache_size_docs},
+    {"get_key_cache_size", (PyCFunction) get_key_cache_size, METH_NOARGS, get_key_cache_size_docs},
+    {"key_cache_stats", (PyCFunction) key_cache_stats, METH_NOARGS, key_cache_stats_docs},
+    {"clear_key_cache", (PyCFunction) clear_key_cache, METH_NOARGS, clear_key_cache_docs},
+    {"stats", (PyCFunction) stats, METH_NOARGS, stats_docs},
+    {"reset_stats", (PyCFunction) reset_stats, METH_NOARGS, reset_stats_docs},
+    {"enable_stats", (PyCFunction) enable_stats, METH_NOARGS, enable_stats_docs},
+    {"disable_stats", (PyCFunction) disable_stats, METH_NOARGS, disable_stats_docs},
     {NULL}
 };
 
+static int add_type(PyObject *m, const char *name, PyType_Spec *spec) {
+    PyObject *type = PyType_FromSpec(spec);
+
+    if (type == NULL)
+        return -1;
+
+    if (PyModule_AddObject(m, name, type) < 0) {
+        Py_DECREF(type);
+        return -1;
+    }
+
+    return 0;
+}
+
+// Runs once per interpreter importing the module, each gets its own types and completion queue
+static int module_exec(PyObject *m) {
+    module_state *state = PyModule_GetState(m);
+
+    aes256_init();
+    sha256_init_backend();
+    stats_init();
+    drbg_init();
+    keycache_init();
+
+    state->queue = pool_queue_new();
+
+    if (state->queue == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    if (
+        add_type(m, "AES256CTR", &AES256CTR_spec) < 0
+        || add_type(m, "IGE256", &IGE256_spec) < 0
+        || add_type(m, "CBC256", &CBC256_spec) < 0
+        || add_type(m, "AES256IGE", &AES256IGE_spec) < 0
+        || add_type(m, "AES256CBC", &AES256CBC_spec) < 0
+        || add_type(m, "ObfuscatedCodec", &ObfuscatedCodec_spec) < 0
+    )
+        return -1;
+
+    return 0;
+}
+
+// Jobs still hold buffers and objects of this interpreter, which is still alive here. The running ones are waited
+// for, so that no worker writes into memory the interpreter is about to release
+static void module_free(void *m) {
+    module_state *state = PyModule_GetState((PyObject *) m);
+    pool_job *jobs, *next;
+
+    if (state == NULL || state->queue == NULL)
+        return;
+
+    Py_BEGIN_ALLOW_THREADS
+        pool_wait(state->queue);
+    Py_END_ALLOW_THREADS
+
+    for (jobs = pool_completed(state->queue); jobs != NULL; jobs = next) {
+        next = jobs->next;
+        aio_job_free((aio_job *) jobs);
+    }
+
+    pool_queue_free(state->queue);
+    state->queue = NULL;
+}
+
+static PyModuleDef_Slot module_slots[] = {
+    {Py_mod_exec, module_exec},
+#ifdef Py_mod_multiple_interpreters
+    {Py_mod_multiple_interpreters, Py_MOD_PER_INTERPRETER_GIL_SUPPORTED},
+#endif
+#ifdef Py_mod_gil
+    // The ciphers only touch the buffers they are given, the stateful objects carry their own lock
+    {Py_mod_gil, Py_MOD_GIL_NOT_USED},
+#endif
+    {0, NULL}
+};
+
 static struct PyModuleDef module = {
     PyModuleDef_HEAD_INIT,
-    "TgCrypto",
-    DESCRIPTION,
-    -1,
-    methods
+    .m_name = "tgcrypto._tgcrypto",
+    .m_doc = DESCRIPTION,
+    .m_size = sizeof(module_state),
+    .m_methods = methods,
+    .m_slots = module_slots,
+    .m_free = module_free
 };
 
-PyMODINIT_FUNC PyInit_tgcrypto(void) {
-    return PyModule_Create(&module);
+PyMODINIT_FUNC PyInit__tgcrypto(void) {
+    return PyModuleDef_Init(&module);
 }
@@ -0,0 +1,114 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include "urandom.h"
+
+#if defined(_WIN32)
+#include <windows.h>
+#include <bcrypt.h>
+
+#ifdef _MSC_VER
+#pragma comment(lib, "bcrypt.lib")
+#endif
+
+int urandom(uint8_t buf[], size_t length) {
+    ULONG n;
+
+    while (length) {
+        n = length > 0x7fffffff ? 0x7fffffff : (ULONG) length;
+
+        if (!BCRYPT_SUCCESS(BCryptGenRandom(NULL, buf, n, BCRYPT_USE_SYSTEM_PREFERRED_RNG)))
+            return -1;
+
+        buf += n;
+        length -= n;
+    }
+
+    return 0;
+}
+#elif defined(__APPLE__) || defined(__FreeBSD__) || defined(__OpenBSD__) || defined(__NetBSD__)
+#include <stdlib.h>
+
+int urandom(uint8_t buf[], size_t length) {
+    arc4random_buf(buf, length);
+
+    return 0;
+}
+#else
+#include <errno.h>
+#include <fcntl.h>
+#include <unistd.h>
+
+#ifdef __linux__
+#include <sys/syscall.h>
+#endif
+
+int urandom(uint8_t buf[], size_t length) {
+    ssize_t n;
+    int fd;
+
+#ifdef SYS_getrandom
+    while (length) {
+        n = syscall(SYS_getrandom, buf, length, 0);
+
+        if (n < 0) {
+            if (errno == EINTR)
+                continue;
+
+            // Kernels older than 3.17 lack getrandom, fall back to the device
+            if (errno == ENOSYS)
+                break;
+
+            return -1;
+        }
+
+        buf += n;
+        length -= n;
+    }
+
+    if (!length)
+        return 0;
+#endif
+
+    fd = open("/dev/urandom", O_RDONLY);
+
+    if (fd < 0)
+        return -1;
+
+    while (length) {
+        n = read(fd, buf, length);
+
+        if (n <= 0) {
+            if (n < 0 && errno == EINTR)
+                continue;
+
+            close(fd);
+            return -1;
+        }
+
+        buf += n;
+        length -= n;
+    }
+
+    close(fd);
+
+    return 0;
+}
+#endif
@@ -0,0 +1,63 @@
+/*
+ * Pyrogram - Telegram MTProto API Client Library for Python
+ * Copyright (C) 2017-present Dan <https://github.com/delivrance>
+ *
+ * This file is part of Pyrogram.
+ *
+ * Pyrogram is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published
+ * by the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * Pyrogram is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU Lesser General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifndef UTILS_H
+#define UTILS_H
+
+#define MIN(a, b) (((a) < (b)) ? (a) : (b))
+
+// Read once by each of aes256_init() and sha256_init_backend(): "ssse3" skips AES-NI, "portable" turns every
+// hardware implementation off
+#define BACKEND_ENV "TGCRYPTO_BACKEND"
+
+static inline int backend_forced(const char *name) {
+    const char *forced = getenv(BACKEND_ENV);
+
+    return forced != NULL && strcmp(forced, name) == 0;
+}
+
+static inline void xor_bytes(uint8_t out[], const uint8_t in[], const uint8_t stream[], size_t length) {
+    uint64_t a, b;
+    size_t i;
+
+    for (i = 0; i + 8 <= length; i += 8) {
+        memcpy(&a, &in[i], 8);
+        memcpy(&b, &stream[i], 8);
+        a ^= b;
+        memcpy(&out[i], &a, 8);
+    }
+
+    for (; i < length; ++i)
+        out[i] = in[i] ^ stream[i];
+}
+
+// Called through a volatile pointer, so that clearing memory which is never read again is not optimized away
+static void *(*const volatile secure_memset)(void *, int, size_t) = memset;
+
+static inline void secure_zero(void *p, size_t length) {
+    secure_memset(p, 0, length);
+}
+
+#endif  // UTILS_H